@@ -0,0 +1,244 @@
+"""
+article_consumer.py
+역할: 기사 Stream 참조 consumer — consumer group 배치 읽기 + 처리량·지연 측정
+
+article_publisher가 발행한 REDIS_ARTICLE_STREAM_KEY를 consumer group으로 읽는 기본 구현이다.
+후속 서비스(요약·분류 등)는 consume()에 배치 처리 함수(handler)만 넘겨 쓰면 되고,
+로컬에서는 docker-compose Redis에 대해 크롤링 → 발행 → 소비 전체 지연을 잴 수 있다.
+
+  - XREADGROUP COUNT=CONSUMER_BATCH로 배치 단위로 읽는다 (BLOCK으로 새 항목 대기)
+  - 처리한 배치의 XACK는 다음 XREADGROUP과 같은 pipeline에 실어 보내므로 배치당 왕복 1회
+  - handler가 예외를 던진 배치는 ACK하지 않는다. 이렇게 남은 항목과 죽은 consumer가 남긴 항목은
+    CONSUMER_CLAIM_IDLE_MS 이상 방치되면 XAUTOCLAIM으로 가져와 다시 처리한다 (시작 시 + 주기적으로)
+  - 본문 압축·참조 모드 메시지는 stream_codec.decode_messages로 평문으로 되돌려 handler에 넘긴다.
+    본문 key가 만료돼 복원할 수 없는 메시지는 경고 후 ACK한다 (영원히 재시도되지 않도록)
+
+지연 측정 (consume() 반환값의 latency):
+  published_to_consumed_ms - 기사 publishedAt → handler 처리 완료 (크롤링 지연 포함 전체 파이프라인)
+                             시간대 없는 publishedAt은 ARTICLE_TZ 시각으로 본다
+  stream_to_consumed_ms    - XADD 시각(항목 ID) → handler 처리 완료 (발행 → 소비 구간)
+  reclaimed_stream_to_consumed_ms - XAUTOCLAIM으로 회수해 처리한 항목의 XADD → 처리 완료
+                             (CONSUMER_CLAIM_IDLE_MS 방치 시간이 섞이므로 위 두 분포에서는 뺀다)
+
+환경변수 목록 (Redis 연결·Stream key·ARTICLE_TZ는 article_publisher.py와 같음):
+  REDIS_CONSUMER_GROUP    - consumer group 이름 (기본값: "article-consumers")
+  CONSUMER_NAME           - 이 consumer 이름 (기본값: "<호스트>-<pid>")
+  CONSUMER_BATCH          - XREADGROUP/XAUTOCLAIM 배치 크기 (기본값: 100)
+  CONSUMER_BLOCK_MS       - 새 항목 대기 시간(ms) (기본값: 2000)
+  CONSUMER_CLAIM_IDLE_MS  - 이보다 오래 ACK되지 않은 항목을 가져와 재처리 (기본값: 60000)
+
+실행 (docker-compose Redis):
+  python article_consumer.py --from-start --idle-exit 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import time
+from typing import Callable, Optional
+
+import redis as redis_lib
+
+import metrics
+import stream_codec
+from article_publisher import get_redis_client, published_epoch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GROUP: str = "article-consumers"
+DEFAULT_BATCH: int = 100
+DEFAULT_BLOCK_MS: int = 2_000
+DEFAULT_CLAIM_IDLE_MS: int = 60_000
+CLAIM_INTERVAL_SEC: float = 30.0
+
+# handler는 (항목 ID, 평문 메시지) 목록을 받아 처리한다. 예외를 던지면 그 배치는 ACK하지 않는다
+Handler = Callable[[list[tuple[str, dict]]], None]
+
+
+def ensure_group(redis_client: redis_lib.Redis, stream_key: str, group: str, start_id: str = "$") -> None:
+    """consumer group이 없으면 만든다 (Stream이 없어도 MKSTREAM으로 생성)."""
+    try:
+        redis_client.xgroup_create(stream_key, group, id=start_id, mkstream=True)
+        logger.info(f"consumer group 생성: {group} (시작 ID {start_id})")
+    except redis_lib.ResponseError as exc:
+        if "BUSYGROUP" not in str(exc):
+            raise
+
+
+def _decode(
+    redis_client: redis_lib.Redis, entries: list[tuple[str, dict]]
+) -> tuple[list[tuple[str, dict]], list[str]]:
+    """
+    배치를 평문으로 되돌린다. 배치 단위 복원이 실패하면 한 건씩 다시 시도해
+    (복원한 항목, 복원할 수 없는 항목 ID)를 반환한다.
+    """
+    try:
+        decoded: list[dict] = stream_codec.decode_messages([f for _, f in entries], redis_client)
+        return [(entry_id, fields) for (entry_id, _), fields in zip(entries, decoded)], []
+    except (LookupError, ValueError, RuntimeError):
+        pass
+    ok: list[tuple[str, dict]] = []
+    broken: list[str] = []
+    for entry_id, fields in entries:
+        try:
+            ok.append((entry_id, stream_codec.decode_message(fields, redis_client)))
+        except (LookupError, ValueError, RuntimeError) as exc:
+            logger.warning(f"메시지 복원 실패 (ACK 후 건너뜀) [{entry_id}]: {exc}")
+            broken.append(entry_id)
+    return ok, broken
+
+
+class _ConsumeStats:
+    """처리 건수와 지연 분포 (consume() 반환값)."""
+
+    def __init__(self) -> None:
+        self.started: float = time.monotonic()
+        self.counts: dict[str, int] = {"consumed": 0, "claimed": 0, "undecodable": 0, "failed_batches": 0}
+        self.published_to_consumed_ms: list[float] = []
+        self.stream_to_consumed_ms: list[float] = []
+        self.reclaimed_stream_to_consumed_ms: list[float] = []
+
+    def observe(self, entries: list[tuple[str, dict]], reclaimed: bool = False) -> None:
+        now: float = time.time()
+        for entry_id, message in entries:
+            stream_ms: float = now * 1000 - int(entry_id.partition("-")[0])
+            if reclaimed:
+                self.reclaimed_stream_to_consumed_ms.append(stream_ms)
+                continue
+            self.stream_to_consumed_ms.append(stream_ms)
+            published: Optional[float] = published_epoch(message)
+            if published is not None:
+                self.published_to_consumed_ms.append((now - published) * 1000)
+        self.counts["consumed"] += len(entries)
+
+    def summary(self) -> dict:
+        elapsed: float = time.monotonic() - self.started
+        return {
+            **self.counts,
+            "elapsed_sec": round(elapsed, 3),
+            "messages_per_sec": round(self.counts["consumed"] / elapsed, 1) if elapsed > 0 else 0.0,
+            "latency": {
+                "published_to_consumed_ms": metrics.summarize(self.published_to_consumed_ms),
+                "stream_to_consumed_ms": metrics.summarize(self.stream_to_consumed_ms),
+                "reclaimed_stream_to_consumed_ms": metrics.summarize(self.reclaimed_stream_to_consumed_ms),
+            },
+        }
+
+
+def consume(
+    handler: Optional[Handler] = None,
+    redis_client: Optional[redis_lib.Redis] = None,
+    max_messages: Optional[int] = None,
+    idle_exit_sec: Optional[float] = None,
+    start_id: str = "$",
+) -> dict:
+    """
+    Stream을 consumer group으로 읽어 배치마다 handler를 호출한다 (handler가 None이면 읽고 ACK만 함).
+
+    Args:
+        max_messages: 이만큼 처리하면 멈춘다 (None이면 계속).
+        idle_exit_sec: 이 시간 동안 새 항목이 없으면 멈춘다 (None이면 계속, 측정·테스트용).
+        start_id: group이 없을 때 만들 시작 위치 ("$" = 이후 발행분, "0" = Stream 처음부터).
+
+    반환값: {"consumed", "claimed", "undecodable", "failed_batches", "elapsed_sec",
+             "messages_per_sec",
+             "latency": {"published_to_consumed_ms", "stream_to_consumed_ms", "reclaimed_stream_to_consumed_ms"}}
+    """
+    redis_client = redis_client or get_redis_client()
+    stream_key: str = os.environ["REDIS_ARTICLE_STREAM_KEY"]
+    group: str = os.environ.get("REDIS_CONSUMER_GROUP", DEFAULT_GROUP)
+    consumer: str = os.environ.get("CONSUMER_NAME", f"{socket.gethostname()}-{os.getpid()}")
+    batch: int = int(os.environ.get("CONSUMER_BATCH", str(DEFAULT_BATCH)))
+    block_ms: int = int(os.environ.get("CONSUMER_BLOCK_MS", str(DEFAULT_BLOCK_MS)))
+    claim_idle_ms: int = int(os.environ.get("CONSUMER_CLAIM_IDLE_MS", str(DEFAULT_CLAIM_IDLE_MS)))
+
+    ensure_group(redis_client, stream_key, group, start_id)
+    stats = _ConsumeStats()
+    to_ack: list[str] = []
+    last_claim: Optional[float] = None
+    last_message: float = time.monotonic()
+
+    def process(entries: list[tuple[str, dict]], reclaimed: bool = False) -> None:
+        decoded, broken = _decode(redis_client, entries)
+        to_ack.extend(broken)
+        stats.counts["undecodable"] += len(broken)
+        if not decoded:
+            return
+        try:
+            if handler is not None:
+                handler(decoded)
+        except Exception as exc:
+            # ACK하지 않으면 PEL에 남아 CONSUMER_CLAIM_IDLE_MS 뒤 XAUTOCLAIM으로 재처리된다
+            stats.counts["failed_batches"] += 1
+            logger.warning(f"배치 처리 실패 ({len(decoded)}건, 재처리 대기): {exc}")
+            return
+        stats.observe(decoded, reclaimed)
+        to_ack.extend(entry_id for entry_id, _ in decoded)
+
+    while max_messages is None or stats.counts["consumed"] < max_messages:
+        # 오래 ACK되지 않은 항목 회수 (시작 시 + CLAIM_INTERVAL_SEC마다)
+        if last_claim is None or time.monotonic() - last_claim >= CLAIM_INTERVAL_SEC:
+            last_claim = time.monotonic()
+            claim_start: str = "0-0"
+            while True:
+                # Redis 7은 [다음 시작 ID, 항목, 삭제된 ID], 6.2는 앞의 두 개만 반환한다
+                reply: list = redis_client.xautoclaim(
+                    stream_key, group, consumer, claim_idle_ms, start_id=claim_start, count=batch
+                )
+                claim_start, claimed = reply[0], reply[1]
+                if claimed:
+                    stats.counts["claimed"] += len(claimed)
+                    process(claimed, reclaimed=True)
+                if not claimed or claim_start in ("0-0", b"0-0"):
+                    break
+
+        # 이전 배치 ACK + 다음 배치 읽기를 한 번의 왕복으로
+        pipe = redis_client.pipeline(transaction=False)
+        if to_ack:
+            pipe.xack(stream_key, group, *to_ack)
+        pipe.xreadgroup(group, consumer, {stream_key: ">"}, count=batch, block=block_ms)
+        response: list = pipe.execute()
+        to_ack = []
+        streams = response[-1] or []
+        entries: list[tuple[str, dict]] = streams[0][1] if streams else []
+
+        if not entries:
+            if idle_exit_sec is not None and time.monotonic() - last_message >= idle_exit_sec:
+                break
+            continue
+        last_message = time.monotonic()
+        process(entries)
+
+    if to_ack:
+        redis_client.xack(stream_key, group, *to_ack)
+
+    result: dict = stats.summary()
+    logger.info(
+        f"소비 완료: {result['consumed']}건 ({result['messages_per_sec']}건/초), "
+        f"publishedAt→소비 p50 {result['latency']['published_to_consumed_ms']['p50']}ms, "
+        f"XADD→소비 p50 {result['latency']['stream_to_consumed_ms']['p50']}ms"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기사 Stream 참조 consumer (처리량·지연 측정)")
+    parser.add_argument("--from-start", action="store_true",
+                        help="group이 없으면 Stream 처음부터 읽음 (기본: 이후 발행분만)")
+    parser.add_argument("--max-messages", type=int, default=None, help="이만큼 처리하면 종료")
+    parser.add_argument("--idle-exit", type=float, default=None,
+                        help="이 시간(초) 동안 새 항목이 없으면 종료")
+    args = parser.parse_args()
+
+    result: dict = consume(
+        max_messages=args.max_messages,
+        idle_exit_sec=args.idle_exit,
+        start_id="0" if args.from_start else "$",
+    )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
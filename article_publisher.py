@@ -11,25 +11,79 @@ article_publisher.py
 
   # Redis Stream / 중복 방지
   REDIS_ARTICLE_STREAM_KEY   - 기사 발행 대상 Stream key (필수)
-  REDIS_PUBLISHED_URLS_KEY   - 발행 완료 URL 저장 Set key (필수)
+  REDIS_PUBLISHED_URLS_KEY   - 발행 완료 URL 저장 Set key (필수, 네이버 기사는 url_canon 대표 URL로 저장)
   REDIS_LAST_CRAWL_KEY       - 마지막 크롤링 시각 저장 key (미설정 시 증분 크롤링 비활성화)
+                               출처·섹션 범위별 기준 시각은 "<key>:scopes" Hash에 저장하고,
+                               공통 key는 처음 보는 범위의 기준 시각으로 쓴다.
+                               기준 시각은 실제로 발행된 기사의 publishedAt으로만 올라간다
+  NEAR_DUP_FILTER            - "true"이면 본문 SimHash로 유사 기사를 걸러 발행하지 않음
+                               (기본값: "false", 임계 거리·시간 창은 near_dup.py 참조)
+  STREAM_PAYLOAD_CODEC       - Stream 본문 압축 "none"/"zlib"/"zstd" (기본값: "none", stream_codec.py 참조)
+  STREAM_CONTENT_MODE        - "ref"이면 본문을 내용 해시 key에 한 번만 저장하고 메시지에는 해시만 실음
+                               (기본값: "inline", stream_codec.py 참조)
+  ARTICLE_UPDATE_EVENTS      - "true"이면 이미 발행된 기사가 수정 시각(modifiedAt)과 함께 다시 수집됐을 때
+                               내용이 실제로 바뀐 경우만 event=update 메시지로 재발행 (기본값: "true")
+                               발행 버전(내용 해시|modifiedAt)은 "<REDIS_PUBLISHED_URLS_KEY>:versions" Hash에 저장
+  STREAM_RETENTION_SEC       - 설정하면 Stream을 건수(STREAM_MAXLEN) 대신 시간 기준으로 보존: 실행이 끝날 때
+                               보존 기간을 넘은 항목을 아카이브한 뒤 MINID로 트리밍 (stream_retention.py 참조)
+  STREAM_INDEX_ENABLED       - "true"이면 발행한 기사의 Stream 항목 ID를 언론사·섹션별 Sorted Set(score =
+                               publishedAt)에 색인 (기본값: "true", 조회·보존 기간은 stream_index.py 참조)
+  BACKPRESSURE_*             - consumer group이 밀리면 크롤링 한도 축소·본문 압축·저우선 섹션 미루기
+                               (기본값: 활성화, 기준 backlog 등은 backpressure.py 참조)
+  WATERMARK_OVERLAP_SEC      - 증분 크롤링 시 기준 시각보다 앞당겨 겹쳐 크롤링할 시간(초) (기본값: 600)
+  ARTICLE_TZ                 - 시간대 없는 publishedAt의 시간대, 기사 나이 계산용 (기본값: "Asia/Seoul")
 
   # 크롤러
   OUTPUT_FILE_PATH    - Scrapy 출력 파일 경로 (기본값: /tmp/output.json, Lambda는 /tmp 필수)
-  MAX_ARTICLES        - 최대 크롤링 기사 수 (기본값: 10, naver_crawler.py 참조)
+  MAX_ARTICLES        - 섹션별 최대 크롤링 기사 수 (기본값: 10, naver_crawler.py 참조)
+  NAVER_SECTIONS      - 한 번에 크롤링할 섹션 목록 (기본값: "101/259", naver_crawler.py 참조)
+  CRAWL_SOURCES       - 함께 실행할 크롤링 출처 목록 (기본값: "naver_finance", crawl_runner.py 참조)
   MAX_CRAWL_TIME      - 크롤링 최대 시간(초) (기본값: 300, naver_crawler.py 참조)
+  CRAWL_BUDGET_RATIO  - 마감 시각(deadline)이 주어졌을 때 크롤링 단계에 배정할 시간 비율
+                        (기본값: 0.7, 나머지는 발행 단계 몫)
+  CRAWLER_HANDOFF     - 크롤러 → 발행 전달 방식 "file"(출력 파일 tail) / "fifo"(named pipe)
+                        (기본값: "file")
+  CRAWLER_LOG_LEVEL   - 크롤러 stdout/stderr 중 로그로 전달할 최소 레벨 (기본값: "INFO")
+  CRAWLER_LOG_MAX_BYTES - 실행당 크롤러 로그 전달 한도(바이트), 초과분은 생략 (기본값: 262144)
+
+  # 실패 기사 스풀
+  FAILED_SPOOL_DIR / FAILED_SPOOL_MAX_BYTES / FAILED_SPOOL_OVERFLOW_KEY - failed_spool.py 참조
+  FAILED_SPOOL_REPLAY_BATCH - 스풀 재발행 pipeline 배치 크기 (기본값: 200)
+
+  # 계측
+  MEMORY_PROFILE      - "true"이면 단계별 메모리 계측 + Lambda 메모리 추천 리포트 (memory_report.py 참조)
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
 import subprocess
+import threading
 import time
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+from zoneinfo import ZoneInfo
 
 import redis as redis_lib
 
+import backpressure
+import failed_spool
+import memory_report
+import metrics
+import near_dup
+import stream_codec
+import stream_index
+import stream_retention
+import url_canon
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 환경에서는 표준 json으로 대체
+    _json_loads = json.loads
+
 # ---------------------------------------------------------------------------
 # 로거 설정
 # ---------------------------------------------------------------------------
@@ -38,15 +92,28 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
+# 크롤러 subprocess의 stdout/stderr를 줄 단위로 전달하는 전용 로거
+crawler_logger = logging.getLogger(f"{__name__}.crawler")
 
 # ---------------------------------------------------------------------------
 # 상수
 # ---------------------------------------------------------------------------
 CONTENT_MAX_LEN: int = 50_000
 STREAM_MAXLEN: int = 10_000
-FAILED_ARTICLES_PATH: str = "/tmp/failed_articles.json"
 PUBLISHED_URLS_TTL: int = 7 * 24 * 3600   # 7일 (초)
 MAX_RETRIES: int = 3
+CRAWL_SHUTDOWN_GRACE_SEC: int = 15        # 스파이더 자체 종료(진행 중 요청 마무리·피드 flush) 여유 시간
+CRAWL_STOP_TIMEOUT_SEC: int = 5           # SIGTERM 후 강제 종료까지 대기 시간
+# 스파이더가 기사 timings에 싣는 단계별 시각(epoch ms), 그대로 Stream 메시지 필드가 된다
+TIMING_FIELDS: tuple[str, ...] = ("fetchStartMs", "fetchEndMs", "parseEndMs")
+_READ_CHUNK_SIZE: int = 64 * 1024         # 크롤러 출력 읽기 단위 (바이트)
+_TAIL_POLL_INTERVAL_SEC: float = 0.2      # 새 출력이 없을 때 대기 간격
+_CRAWLER_TIME_LIMIT_EXIT_CODE: int = 3    # 스파이더가 MAX_CRAWL_TIME에 걸려 멈춤 (crawl_runner.TIME_LIMIT_EXIT_CODE)
+CRAWLER_LOG_LINE_MAX: int = 1_000         # 크롤러 로그 한 줄 최대 길이 (문자)
+# Scrapy 기본 로그 형식: "2025-01-01 00:00:00 [scrapy.core.engine] INFO: ..."
+_SCRAPY_LOG_LINE_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \[[^\]]+\] (DEBUG|INFO|WARNING|ERROR|CRITICAL):"
+)
 
 # ---------------------------------------------------------------------------
 # 전역 Redis 클라이언트 (Lambda warm start 재사용)
@@ -157,6 +224,154 @@ def update_last_crawl_time(
         return False
 
 
+def article_scope(article: dict) -> Optional[str]:
+    """
+    기사의 증분 기준 범위. 섹션이 있으면 "<source>:<section>", 섹션 없이 출처만 있으면 "<source>",
+    둘 다 없는 기사(단일 출처 시절 형식)는 None.
+    """
+    source: str = article.get("source") or ""
+    section: Optional[str] = article.get("section")
+    if section:
+        return f"{source}:{section}"
+    return source or None
+
+
+def get_scope_crawl_times(redis_client: redis_lib.Redis) -> dict[str, datetime]:
+    """
+    "<REDIS_LAST_CRAWL_KEY>:scopes" Hash에서 범위별 마지막 크롤링 시각을 읽는다.
+    기록이 없는 범위는 크롤러가 공통 기준 시각(REDIS_LAST_CRAWL_KEY)을 쓴다.
+    """
+    key: str = os.environ.get("REDIS_LAST_CRAWL_KEY", "")
+    if not key:
+        return {}
+    try:
+        raw: dict[str, str] = redis_client.hgetall(f"{key}:scopes")
+    except Exception as exc:
+        logger.warning(f"범위별 last_crawl_time 조회 실패 (공통 기준 시각 사용): {exc}")
+        return {}
+    scopes: dict[str, datetime] = {}
+    for scope, value in raw.items():
+        try:
+            scopes[scope] = datetime.fromisoformat(value)
+        except ValueError:
+            logger.warning(f"범위별 last_crawl_time 형식 오류 무시: {scope}={value}")
+    return scopes
+
+
+def update_scope_crawl_times(
+    redis_client: redis_lib.Redis,
+    times: dict[str, datetime],
+) -> bool:
+    """범위별 마지막 크롤링 기준 시각을 저장한다 (기준 시각이 앞으로 움직인 범위만 전달한다)."""
+    key: str = os.environ.get("REDIS_LAST_CRAWL_KEY", "")
+    if not key or not times:
+        return False
+    try:
+        redis_client.hset(
+            f"{key}:scopes", mapping={scope: dt.isoformat() for scope, dt in times.items()}
+        )
+        return True
+    except Exception as exc:
+        logger.warning(f"범위별 last_crawl_time 업데이트 실패: {exc}")
+        return False
+
+
+# ---------------------------------------------------------------------------
+# 증분 크롤링 — 발행 결과 기반 기준 시각(watermark) 계산
+# ---------------------------------------------------------------------------
+
+_ALL_SCOPES: str = ""   # 범위 구분 없이 전체 기사 (공통 기준 시각 REDIS_LAST_CRAWL_KEY)
+
+
+def _published_at(article: dict) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(article.get("publishedAt") or "")
+    except (TypeError, ValueError):
+        return None
+
+
+def _naive(dt: datetime) -> datetime:
+    """aware/naive가 섞인 비교를 피하기 위해 시간대 정보를 떼어 낸다 (naver_crawler와 같은 기준)."""
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+class _WatermarkProgress:
+    """
+    범위별로 처리를 끝낸(발행·중복) 기사와 끝내지 못한(실패·마감 보류) 기사의 publishedAt을 모은다.
+
+    새 기준 시각은 '끝내지 못한 가장 오래된 기사보다 앞선, 끝낸 기사 중 가장 최근 publishedAt'이다.
+    그보다 최근 구간에 빈틈이 있을 수 있으므로 다음 실행은 그 지점부터 다시 크롤링한다.
+    publishedAt이 없는 기사가 실패하면 위치를 알 수 없으므로 그 범위는 기준 시각을 올리지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._done: dict[str, list[datetime]] = {}
+        self._oldest_pending: dict[str, Optional[datetime]] = {}
+
+    def observe(self, article: dict, done: bool) -> None:
+        published_at: Optional[datetime] = _published_at(article)
+        scope: Optional[str] = article_scope(article)
+        for key in (_ALL_SCOPES, scope) if scope is not None else (_ALL_SCOPES,):
+            if done:
+                if published_at is not None:
+                    self._done.setdefault(key, []).append(published_at)
+            elif published_at is None:
+                self._oldest_pending[key] = None
+            elif key not in self._oldest_pending or (
+                self._oldest_pending[key] is not None
+                and _naive(published_at) < _naive(self._oldest_pending[key])
+            ):
+                self._oldest_pending[key] = published_at
+
+    def scopes(self) -> list[str]:
+        return [key for key in self._done if key != _ALL_SCOPES]
+
+    def watermark(self, scope: str = _ALL_SCOPES) -> Optional[datetime]:
+        done: list[datetime] = self._done.get(scope, [])
+        if scope in self._oldest_pending:
+            pending: Optional[datetime] = self._oldest_pending[scope]
+            if pending is None:
+                return None
+            done = [dt for dt in done if _naive(dt) < _naive(pending)]
+        return max(done, key=_naive, default=None)
+
+
+def _advance_watermarks(
+    redis_client: redis_lib.Redis,
+    progress: _WatermarkProgress,
+    since_dt: Optional[datetime],
+    since_scopes: dict[str, datetime],
+    saturated: set[str],
+    hold_global: bool = False,
+) -> None:
+    """
+    이번 실행에서 끝낸 기사 기준으로 공통·범위별 기준 시각을 올린다 (뒤로 돌리지는 않는다).
+    MAX_ARTICLES 한도까지 수집된 범위(saturated)는 더 오래된 새 기사를 놓쳤을 수 있어 그대로 둔다.
+    hold_global이면 공통 기준 시각은 그대로 두고 이번에 수집한 범위별 기준 시각만 올린다
+    (크롤링하지 않은 범위가 공통 기준 시각으로 다음 실행에서 따라잡도록).
+    """
+    def advanced(candidate: Optional[datetime], current: Optional[datetime]) -> bool:
+        return candidate is not None and (current is None or _naive(candidate) > _naive(current))
+
+    for scope in sorted(saturated):
+        logger.warning(
+            f"범위 {scope or '전체'}가 MAX_ARTICLES 한도까지 수집됨 — 놓친 기사가 있을 수 있어 "
+            f"기준 시각 유지 (MAX_ARTICLES 상향 검토)"
+        )
+
+    new_since: Optional[datetime] = progress.watermark()
+    if not saturated and not hold_global and advanced(new_since, since_dt):
+        update_last_crawl_time(redis_client, new_since)
+        logger.info(f"증분 기준 시각 갱신: {new_since.isoformat()}")
+
+    scope_times: dict[str, datetime] = {}
+    for scope in progress.scopes():
+        candidate: Optional[datetime] = progress.watermark(scope)
+        if scope not in saturated and advanced(candidate, since_scopes.get(scope, since_dt)):
+            scope_times[scope] = candidate
+    update_scope_crawl_times(redis_client, scope_times)
+
+
 # ---------------------------------------------------------------------------
 # 중복 체크
 # ---------------------------------------------------------------------------
@@ -176,41 +391,183 @@ def load_published_urls(redis_client: redis_lib.Redis) -> set[str]:
         return set()
 
 
+def article_url(article: dict) -> str:
+    """
+    기사의 중복 확인·발행용 URL. 네이버 기사는 쿼리·호스트가 달라도 같은 대표 URL이 된다
+    (url_canon.canonical_url). 중복 방지 Set과 Stream 메시지의 url은 모두 이 값이다.
+    """
+    return url_canon.canonical_url(article.get("url", ""))
+
+
 def is_duplicate(url: str, cache: set[str]) -> bool:
-    """메모리 캐시를 이용해 중복 여부를 확인한다."""
+    """메모리 캐시를 이용해 중복 여부를 확인한다 (url은 article_url()로 정규화한 값)."""
     return url in cache
 
 
+# ---------------------------------------------------------------------------
+# 기사 수정 감지 — 발행 버전(내용 해시 + 수정 시각) 기록
+# ---------------------------------------------------------------------------
+
+def _versions_key() -> str:
+    return f"{os.environ['REDIS_PUBLISHED_URLS_KEY']}:versions"
+
+
+def content_hash(article: dict) -> str:
+    """Stream에 실리는 제목·본문(CONTENT_MAX_LEN자까지)의 내용 해시."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((article.get("title") or "").encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update((article.get("content") or "")[:CONTENT_MAX_LEN].encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _version(article: dict) -> str:
+    return f"{content_hash(article)}|{article.get('modifiedAt') or ''}"
+
+
+def _queue_published(pipe, versions: dict[str, str]) -> None:
+    """발행한 기사의 URL(중복 방지 Set)과 버전(versions Hash)을 기록하는 명령을 pipeline에 쌓는다."""
+    urls_key: str = os.environ["REDIS_PUBLISHED_URLS_KEY"]
+    pipe.sadd(urls_key, *versions)
+    pipe.expire(urls_key, PUBLISHED_URLS_TTL)
+    pipe.hset(_versions_key(), mapping=versions)
+    pipe.expire(_versions_key(), PUBLISHED_URLS_TTL)
+
+
+def _index_entry(entry_id, message: dict, article: dict) -> tuple[str, dict, float]:
+    """stream_index.queue_add용 (항목 ID, 메시지 필드, score). publishedAt이 없으면 XADD 시각을 쓴다."""
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode()
+    published: Optional[float] = published_epoch(article)
+    score: float = published * 1000 if published is not None else float(entry_id.partition("-")[0])
+    return entry_id, message, score
+
+
+def _update_events_enabled() -> bool:
+    return os.environ.get("ARTICLE_UPDATE_EVENTS", "true").lower() == "true"
+
+
+def check_revision(redis_client: redis_lib.Redis, url: str, article: dict) -> bool:
+    """
+    이미 발행된 기사가 수정 시각과 함께 다시 수집됐을 때 내용이 실제로 바뀌었는지 확인한다.
+
+    기록된 수정 시각이 같으면 해시 계산 없이 False. 수정 시각만 바뀌고 내용 해시가 같으면
+    기록만 갱신하고 False. 버전 기록이 없으면(기능 도입 전 발행·TTL 만료) 비교할 기준이 없으므로
+    현재 버전을 기준으로 기록하고 False. 내용이 바뀌었으면 True (기록은 재발행 성공 후 갱신).
+    """
+    stored: Optional[str] = redis_client.hget(_versions_key(), url)
+    if isinstance(stored, bytes):
+        stored = stored.decode()
+    stored_hash, _, stored_modified = (stored or "").partition("|")
+    if stored is not None and stored_modified == (article.get("modifiedAt") or ""):
+        return False
+    version: str = _version(article)
+    if stored is None or version.partition("|")[0] == stored_hash:
+        redis_client.hset(_versions_key(), url, version)
+        return False
+    return True
+
+
+def publish_update(redis_client: redis_lib.Redis, article: dict, codec: Optional[str] = None) -> bool:
+    """
+    수정된 기사를 event=update 메시지로 재발행하고 버전 기록을 갱신한다 (pipeline 왕복 1회).
+    색인(stream_index)을 쓰면 XADD 결과 ID로 언론사·섹션 색인에 넣는 왕복이 1회 더 든다.
+    실패 시 False를 반환하며 예외를 전파하지 않는다 (버전이 그대로이므로 다음 수집 때 다시 감지됨).
+    """
+    stream_key: str = os.environ["REDIS_ARTICLE_STREAM_KEY"]
+    url: str = article_url(article)
+    message, content = stream_codec.externalize(_build_message(article, event="update", codec=codec))
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        if content is not None:
+            stream_codec.queue_content_write(pipe, *content)
+        maxlen: Optional[int] = stream_maxlen()
+        pipe.xadd(stream_key, message, maxlen=maxlen, approximate=maxlen is not None)
+        pipe.hset(_versions_key(), url, _version(article))
+        entry_id = pipe.execute()[-2]
+    except Exception as exc:
+        logger.warning(f"수정 기사 재발행 실패 [url={url}]: {exc}")
+        return False
+
+    if stream_index.enabled():
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            stream_index.queue_add(pipe, [_index_entry(entry_id, message, article)])
+            pipe.execute()
+        except Exception as exc:
+            # 재발행은 끝났으므로 실패로 돌리지 않는다 (색인에서만 빠짐)
+            logger.warning(f"수정 기사 색인 실패 [url={url}]: {exc}")
+    return True
+
+
 # ---------------------------------------------------------------------------
 # 기사 발행
 # ---------------------------------------------------------------------------
 
+def stream_maxlen(maxlen: Optional[int] = STREAM_MAXLEN) -> Optional[int]:
+    """
+    XADD MAXLEN 값. 시간 기준 보존(STREAM_RETENTION_SEC)을 쓰면 건수로 자르지 않는다(None) —
+    트리밍은 아카이브를 거쳐 stream_retention.enforce_retention이 한다.
+    """
+    return None if stream_retention.enabled() else maxlen
+
+
+def _build_message(article: dict, event: Optional[str] = None, codec: Optional[str] = None) -> dict:
+    """
+    기사 dict를 Stream 메시지 필드로 변환한다 (본문은 CONTENT_MAX_LEN자로 자름).
+    STREAM_PAYLOAD_CODEC이 설정돼 있거나 codec이 주어지면 본문을 압축해 싣는다
+    (stream_codec.decode_message로 복원). codec은 백프레셔가 이번 실행에 강제한 값이다.
+    수정 기사 재발행은 event="update"를 싣는다 (event 필드가 없는 메시지는 새 기사).
+    스파이더가 실은 단계별 시각(TIMING_FIELDS)과 메시지를 만든 시각(publishMs)을 epoch ms로 싣는다.
+    """
+    message: dict = {
+        "url": article_url(article),
+        "title": article.get("title", ""),
+        "content": (article.get("content") or "")[:CONTENT_MAX_LEN],
+        "publishedAt": article.get("publishedAt") or "",
+        "press": article.get("press", ""),
+    }
+    if article.get("section"):
+        message["section"] = article["section"]
+    if article.get("modifiedAt"):
+        message["modifiedAt"] = article["modifiedAt"]
+    if event:
+        message["event"] = event
+    timings: dict = article.get("timings") or {}
+    for field in TIMING_FIELDS:
+        if timings.get(field) is not None:
+            message[field] = str(timings[field])
+    message["publishMs"] = str(int(time.time() * 1000))
+    return stream_codec.encode_message(message, codec)
+
+
 def publish_article(
     redis_client: redis_lib.Redis,
     article: dict,
     cache: set[str],
+    codec: Optional[str] = None,
 ) -> bool:
     """
     단일 기사를 Redis Stream에 발행한다.
-    성공 시 Set에 URL을 추가하고, TTL을 갱신하며, 메모리 캐시도 업데이트한다.
+    성공 시 Set에 URL을, versions Hash에 버전을, 언론사·섹션 색인에 항목 ID를 기록하고
+    (pipeline 왕복 1회) TTL을 갱신하며, 메모리 캐시도 업데이트한다.
+    본문 참조 모드(STREAM_CONTENT_MODE=ref)면 본문 key를 먼저 저장한 뒤 메시지를 발행한다.
+    codec을 주면 STREAM_PAYLOAD_CODEC 대신 그 codec으로 본문을 압축한다 (백프레셔).
     실패 시 False를 반환하며 예외를 전파하지 않는다.
     """
     stream_key: str = os.environ["REDIS_ARTICLE_STREAM_KEY"]
-    urls_key: str = os.environ["REDIS_PUBLISHED_URLS_KEY"]
-    url: str = article.get("url", "")
-
-    message: dict = {
-        "url": url,
-        "title": article.get("title", ""),
-        "content": (article.get("content") or "")[:CONTENT_MAX_LEN],
-        "publishedAt": article.get("publishedAt") or "",
-        "press": article.get("press", ""),
-    }
+    url: str = article_url(article)
+    message, content = stream_codec.externalize(_build_message(article, codec=codec))
 
     try:
-        redis_client.xadd(stream_key, message, maxlen=STREAM_MAXLEN, approximate=True)
-        redis_client.sadd(urls_key, url)
-        redis_client.expire(urls_key, PUBLISHED_URLS_TTL)
+        if content is not None:
+            stream_codec.write_content(redis_client, *content)
+        maxlen: Optional[int] = stream_maxlen()
+        entry_id = redis_client.xadd(stream_key, message, maxlen=maxlen, approximate=maxlen is not None)
+        pipe = redis_client.pipeline(transaction=False)
+        _queue_published(pipe, {url: _version(article)})
+        stream_index.queue_add(pipe, [_index_entry(entry_id, message, article)])
+        pipe.execute()
         cache.add(url)
         return True
     except Exception as exc:
@@ -218,182 +575,925 @@ def publish_article(
         return False
 
 
+def publish_batch(
+    redis_client: redis_lib.Redis,
+    articles: list[dict],
+    cache: set[str],
+    maxlen: Optional[int] = STREAM_MAXLEN,
+    codec: Optional[str] = None,
+) -> list[dict]:
+    """
+    여러 기사를 pipeline으로 한 번에 발행하고, 발행에 실패한 기사 목록을 반환한다.
+    maxlen이 None이면 Stream을 잘라내지 않는다 (대량 적재용, bulk_loader.py 참조).
+    시간 기준 보존(STREAM_RETENTION_SEC)을 쓰면 maxlen과 관계없이 건수로 자르지 않는다.
+    codec을 주면 STREAM_PAYLOAD_CODEC 대신 그 codec으로 본문을 압축한다 (백프레셔).
+
+    왕복은 배치당 2회다: XADD 묶음을 먼저 보내고, 성공한 기사의 URL·버전·항목 ID만 모아
+    SADD + HSET + 언론사·섹션 색인 ZADD(+ EXPIRE)를 보낸다
+    (Stream에 없는 URL·ID가 중복 방지 Set·색인에 들어가지 않도록).
+    본문 참조 모드면 첫 묶음에서 기사마다 본문 저장 명령을 XADD 앞에 넣고,
+    그중 하나라도 실패한 기사는 실패로 돌린다.
+    메모리 캐시는 성공한 URL로 갱신한다. 예외를 전파하지 않는다.
+    """
+    if not articles:
+        return []
+    stream_key: str = os.environ["REDIS_ARTICLE_STREAM_KEY"]
+    maxlen = stream_maxlen(maxlen)
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        command_counts: list[int] = []
+        messages: list[dict] = []
+        for article in articles:
+            message, content = stream_codec.externalize(_build_message(article, codec=codec))
+            count: int = stream_codec.queue_content_write(pipe, *content) if content else 0
+            pipe.xadd(stream_key, message, maxlen=maxlen, approximate=maxlen is not None)
+            command_counts.append(count + 1)
+            messages.append(message)
+        results: list = pipe.execute(raise_on_error=False)
+    except Exception as exc:
+        logger.warning(f"배치 발행 실패 ({len(articles)}건): {exc}")
+        return list(articles)
+
+    published_urls: dict[str, str] = {}
+    index_entries: list[tuple[str, dict, float]] = []
+    failed: list[dict] = []
+    position: int = 0
+    for article, message, count in zip(articles, messages, command_counts):
+        errors: list = [r for r in results[position:position + count] if isinstance(r, Exception)]
+        position += count
+        if errors:
+            logger.warning(f"기사 발행 실패 [url={article.get('url', '')}]: {errors[0]}")
+            failed.append(article)
+        else:
+            published_urls[article_url(article)] = _version(article)
+            index_entries.append(_index_entry(results[position - 1], message, article))
+
+    if published_urls:
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            _queue_published(pipe, published_urls)
+            stream_index.queue_add(pipe, index_entries)
+            pipe.execute()
+        except Exception as exc:
+            # Stream에는 들어갔으므로 실패로 돌리지 않는다 (다음 실행의 중복 확인만 약해짐)
+            logger.warning(f"발행 URL 기록 실패 ({len(published_urls)}건): {exc}")
+        cache.update(published_urls)
+    return failed
+
+
+def _mark_published(redis_client: redis_lib.Redis, url: str, cache: set[str]) -> None:
+    """
+    Stream에 싣지 않은 기사(유사 기사)의 URL을 중복 방지 Set에 기록해
+    다음 실행부터는 지문 계산 없이 URL 중복으로 걸러지게 한다.
+    """
+    urls_key: str = os.environ["REDIS_PUBLISHED_URLS_KEY"]
+    try:
+        redis_client.sadd(urls_key, url)
+        cache.add(url)
+    except Exception as exc:
+        logger.warning(f"유사 기사 URL 기록 실패 [url={url}]: {exc}")
+
+
+def _check_revision_safely(redis_client: redis_lib.Redis, url: str, article: dict) -> bool:
+    """check_revision 실패 시 변경 없음으로 보고 중복 skip한다 (다음 수집 때 다시 확인)."""
+    try:
+        return check_revision(redis_client, url, article)
+    except Exception as exc:
+        logger.warning(f"수정 여부 확인 실패 (중복 skip) [url={url}]: {exc}")
+        return False
+
+
+def _find_near_duplicate(index: near_dup.NearDupIndex, article: dict) -> Optional[str]:
+    """유사 기사 URL을 반환한다. 색인 조회에 실패하면 기사를 놓치지 않도록 None(발행 진행)."""
+    try:
+        return index.check_and_add(article_url(article), article.get("content") or "")
+    except Exception as exc:
+        logger.warning(f"유사 기사 확인 실패 (발행 진행) [url={article.get('url', '')}]: {exc}")
+        return None
+
+
+# ---------------------------------------------------------------------------
+# 마감 시각(deadline) 관리
+# ---------------------------------------------------------------------------
+
+def _remaining_seconds(deadline: Optional[float]) -> Optional[float]:
+    """
+    deadline(time.monotonic() 기준 절대 시각)까지 남은 시간(초)을 반환한다.
+    deadline이 None이면(로컬 실행 등) None을 반환한다.
+    """
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def _deadline_exceeded(deadline: Optional[float]) -> bool:
+    """deadline이 설정돼 있고 이미 지났으면 True를 반환한다."""
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def _crawl_deadline(deadline: Optional[float]) -> Optional[float]:
+    """
+    전체 deadline 중 크롤링 단계에 배정할 마감 시각을 계산한다.
+    남은 시간의 CRAWL_BUDGET_RATIO 만큼을 크롤링에 쓰고, 나머지는 발행 단계에 남긴다.
+    """
+    remaining: Optional[float] = _remaining_seconds(deadline)
+    if remaining is None:
+        return None
+    ratio: float = float(os.environ.get("CRAWL_BUDGET_RATIO", "0.7"))
+    ratio = min(max(ratio, 0.0), 1.0)
+    return time.monotonic() + remaining * ratio
+
+
 # ---------------------------------------------------------------------------
 # 크롤러 실행
 # ---------------------------------------------------------------------------
 
-def run_crawler(since_dt: Optional[datetime] = None) -> list[dict]:
+def _reap_crawler(proc: subprocess.Popen, output: "CrawlerOutput", timeout: float = 0.0) -> bool:
+    """
+    크롤러 프로세스가 끝났으면 os.wait4로 거둬 종료 코드와 그 프로세스만의 최대 RSS
+    (output.crawler_peak_rss_bytes)를 기록하고 True를 반환한다. timeout초까지 종료를 기다린다.
+    이미 다른 곳에서 거둔 프로세스면 Popen.poll() 결과를 따른다.
+    """
+    if output.crawler_peak_rss_bytes is not None:
+        return True
+    waited_until: float = time.monotonic() + timeout
+    while True:
+        try:
+            reaped: Optional[tuple[int, int]] = memory_report.reap_child(proc.pid)
+        except ChildProcessError:
+            return proc.poll() is not None
+        if reaped is not None:
+            proc.returncode, output.crawler_peak_rss_bytes = reaped
+            return True
+        if time.monotonic() >= waited_until:
+            return False
+        time.sleep(_TAIL_POLL_INTERVAL_SEC)
+
+
+def _stop_crawler(proc: subprocess.Popen, output: "CrawlerOutput") -> None:
+    """
+    크롤러 프로세스에 SIGTERM을 보내 Scrapy가 진행 중 요청과 피드 flush를 마무리하게 하고,
+    CRAWL_STOP_TIMEOUT_SEC 안에 끝나지 않으면 강제 종료한다.
+    """
+    if _reap_crawler(proc, output):
+        return
+    proc.terminate()
+    if not _reap_crawler(proc, output, CRAWL_STOP_TIMEOUT_SEC):
+        logger.warning("크롤러가 종료 요청에 응답하지 않아 강제 종료")
+        proc.kill()
+        _reap_crawler(proc, output, float("inf"))
+
+
+def _parse_jsonl_line(line: bytes) -> Optional[dict]:
+    """JSONL 한 줄을 dict로 변환한다. 빈 줄이나 잘못된 JSON은 None을 반환한다."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return _json_loads(line)
+    except ValueError as exc:
+        logger.warning(f"JSON 파싱 실패 (라인 건너뜀): {exc}")
+        return None
+
+
+def read_jsonl(path: str) -> Iterator[dict]:
+    """이미 완성된 JSONL 파일을 한 줄씩 파싱해 dict를 yield한다 (잘못된 줄은 건너뜀)."""
+    with open(path, "rb") as f:
+        for line in f:
+            article = _parse_jsonl_line(line)
+            if article is not None:
+                yield article
+
+
+def _forward_crawler_output(pipe, stream_name: str, budget: dict) -> None:
+    """
+    크롤러의 stdout/stderr 파이프를 한 줄씩 읽어 즉시 구조화 로그로 남긴다.
+    (별도 스레드에서 실행되며, 파이프가 닫힐 때(EOF)까지 읽는다)
+
+    - stdout 줄은 INFO, stderr 줄은 Scrapy 로그 형식의 레벨을 따른다
+      (레벨 표시가 없는 줄은 traceback 등 직전 줄의 연속으로 보고 같은 레벨을 쓴다).
+    - CRAWLER_LOG_LEVEL 미만 레벨의 줄은 버린다.
+    - 줄은 CRAWLER_LOG_LINE_MAX 자로 자르고, 누적 로그가 CRAWLER_LOG_MAX_BYTES를 넘으면
+      이후 줄은 로그 없이 버린 뒤 개수만 센다. 파이프는 끝까지 읽어 크롤러가 막히지 않게 한다.
+    """
+    min_level: int = logging.getLevelName(os.environ.get("CRAWLER_LOG_LEVEL", "INFO").upper())
+    if not isinstance(min_level, int):
+        min_level = logging.INFO
+    level: int = logging.INFO if stream_name == "stdout" else logging.WARNING
+
+    for raw in iter(lambda: pipe.readline(_READ_CHUNK_SIZE), b""):
+        line: str = raw.decode("utf-8", errors="replace").rstrip()
+        if not line:
+            continue
+        if stream_name == "stderr":
+            match = _SCRAPY_LOG_LINE_RE.match(line)
+            if match:
+                level = logging.getLevelName(match.group(1))
+        if level < min_level:
+            continue
+        if len(line) > CRAWLER_LOG_LINE_MAX:
+            line = line[:CRAWLER_LOG_LINE_MAX] + "…"
+
+        size: int = len(line.encode("utf-8"))
+        with budget["lock"]:
+            if budget["remaining"] < size:
+                budget["dropped"] += 1
+                continue
+            budget["remaining"] -= size
+
+        crawler_logger.log(
+            level, f"[{stream_name}] {line}", extra={"crawler_stream": stream_name}
+        )
+    pipe.close()
+
+
+def _start_output_forwarding(proc: subprocess.Popen) -> tuple[list[threading.Thread], dict]:
+    """크롤러 stdout/stderr 각각에 대해 로그 전달 스레드를 시작한다."""
+    budget: dict = {
+        "lock": threading.Lock(),
+        "remaining": int(os.environ.get("CRAWLER_LOG_MAX_BYTES", str(256 * 1024))),
+        "dropped": 0,
+    }
+    threads: list[threading.Thread] = []
+    for stream_name, pipe in (("stdout", proc.stdout), ("stderr", proc.stderr)):
+        thread = threading.Thread(
+            target=_forward_crawler_output,
+            args=(pipe, stream_name, budget),
+            name=f"crawler-{stream_name}",
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    return threads, budget
+
+
+def _finish_output_forwarding(threads: list[threading.Thread], budget: dict) -> None:
+    """로그 전달 스레드가 남은 출력을 모두 처리할 때까지 기다리고, 버린 줄 수를 알린다."""
+    for thread in threads:
+        thread.join(timeout=CRAWL_STOP_TIMEOUT_SEC)
+    if budget["dropped"]:
+        logger.warning(
+            f"크롤러 로그 한도(CRAWLER_LOG_MAX_BYTES) 초과 — {budget['dropped']}줄 생략"
+        )
+
+
+class CrawlerOutput:
+    """
+    run_crawler의 반환값: 크롤러가 기록하는 기사를 하나씩 내주는 iterator.
+    stopped_by_deadline은 크롤링 마감 시각 때문에 크롤러를 실제로 중단(SIGTERM)했을 때만 True가 된다
+    (끝까지 소비한 뒤에 확정됨). 스스로 끝난 크롤링은 이후 발행이 길어져도 False다.
+    stopped_by_time_limit은 스파이더가 MAX_CRAWL_TIME에 걸려 스스로 멈췄다고 종료 코드로 알렸을 때 True다.
+    """
+
+    def __init__(self) -> None:
+        self.stopped_by_deadline: bool = False
+        self.stopped_by_time_limit: bool = False
+        self.crawler_peak_rss_bytes: Optional[int] = None   # 크롤러 프로세스를 거둔 뒤 기록
+        self._articles: Iterator[dict] = iter(())
+
+    def __iter__(self) -> "CrawlerOutput":
+        return self
+
+    def __next__(self) -> dict:
+        return next(self._articles)
+
+
+def crawler_stopped_by_deadline(articles) -> bool:
+    """run_crawler 결과가 마감 시각으로 크롤러를 중단했는지 (CrawlerOutput이 아닌 iterable이면 False)."""
+    return isinstance(articles, CrawlerOutput) and articles.stopped_by_deadline
+
+
+def crawler_stopped_by_time_limit(articles) -> bool:
+    """run_crawler 결과가 스파이더 자체 시간 제한(MAX_CRAWL_TIME)으로 멈췄는지 (CrawlerOutput이 아니면 False)."""
+    return isinstance(articles, CrawlerOutput) and articles.stopped_by_time_limit
+
+
+def _iter_crawler_output(
+    output: CrawlerOutput,
+    proc: subprocess.Popen,
+    output_path: str,
+    fd: Optional[int],
+    use_fifo: bool,
+    deadline: Optional[float],
+    log_threads: list[threading.Thread],
+    log_budget: dict,
+) -> Iterator[dict]:
+    """
+    크롤러가 OUTPUT_FILE_PATH(일반 파일 또는 FIFO)에 쓰는 JSONL을 줄 단위로 읽어
+    기사 dict를 하나씩 yield한다. 한 번에 _READ_CHUNK_SIZE 바이트만 메모리에 둔다.
+
+    프로세스가 끝나고 남은 데이터를 모두 읽으면 종료한다. 크롤링 마감 시각이 지나면
+    프로세스를 중단하고(output.stopped_by_deadline = True) 그때까지 기록된 기사만 읽는다.
+    소비 측이 도중에 generator를 닫으면 크롤러 프로세스도 함께 정리한다.
     """
-    naver_crawler.py를 subprocess로 실행하고, 출력된 JSONL 파일을 파싱하여
-    기사 dict 목록을 반환한다.
+    pending: bytes = b""
+    count: int = 0
+
+    try:
+        while True:
+            exited: bool = _reap_crawler(proc, output)
+
+            if not exited and _deadline_exceeded(deadline):
+                logger.warning("크롤링 예산 초과 — 크롤러를 중단하고 부분 결과만 사용")
+                _stop_crawler(proc, output)
+                output.stopped_by_deadline = True
+                continue
+
+            if fd is None and os.path.exists(output_path):
+                fd = os.open(output_path, os.O_RDONLY)
+
+            chunk: bytes = b""
+            if fd is not None:
+                try:
+                    chunk = os.read(fd, _READ_CHUNK_SIZE)
+                except BlockingIOError:
+                    chunk = b""  # FIFO에 아직 쓰인 데이터가 없음
+
+            if chunk:
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    article = _parse_jsonl_line(line)
+                    if article is not None:
+                        count += 1
+                        yield article
+                continue
+
+            if exited:
+                break
+            time.sleep(_TAIL_POLL_INTERVAL_SEC)
+
+        # 개행 없이 끝난 마지막 줄
+        article = _parse_jsonl_line(pending)
+        if article is not None:
+            count += 1
+            yield article
+    finally:
+        _stop_crawler(proc, output)
+        if output.crawler_peak_rss_bytes is not None:
+            metrics.current().set_gauge("crawler.peak_rss_bytes", output.crawler_peak_rss_bytes)
+        if fd is not None:
+            os.close(fd)
+        if use_fifo and os.path.exists(output_path):
+            os.remove(output_path)
+        _finish_output_forwarding(log_threads, log_budget)
+
+    if proc.returncode == _CRAWLER_TIME_LIMIT_EXIT_CODE:
+        output.stopped_by_time_limit = True
+    elif proc.returncode != 0 and not output.stopped_by_deadline:
+        raise RuntimeError(f"크롤링 프로세스 비정상 종료: returncode={proc.returncode}")
+
+    if fd is None:
+        logger.warning(f"크롤러 출력 파일 없음: {output_path}")
+    logger.info(f"크롤링 완료: {count}건")
+
+
+def run_crawler(
+    since_dt: Optional[datetime] = None,
+    deadline: Optional[float] = None,
+    since_scopes: Optional[dict[str, datetime]] = None,
+    extra_env: Optional[dict[str, str]] = None,
+) -> CrawlerOutput:
+    """
+    crawl_runner.py(CRAWL_SOURCES의 스파이더들)를 subprocess로 실행하고, 크롤러가 출력하는 JSONL을
+    기사가 기록되는 대로 하나씩 내주는 iterator(CrawlerOutput)를 반환한다.
+    전체 결과를 메모리에 올리지 않으므로 대량 크롤링에서도 RSS가 기사 1건 수준으로 유지된다.
 
     Args:
         since_dt: 이 시각 이후 기사만 수집하는 증분 크롤링 기준 시각.
                   None이면 전체 크롤링(CRAWL_SINCE 환경변수 제거).
-
-    크롤러 실행 실패(비정상 종료) 시 RuntimeError를 발생시킨다.
+        deadline: 크롤링 단계 마감 시각(time.monotonic() 기준).
+                  설정되면 스파이더의 MAX_CRAWL_TIME을 남은 예산에 맞춰 줄이고,
+                  예산을 넘기면 프로세스를 중단한 뒤 그때까지 저장된 기사만 반환한다.
+        since_scopes: 범위("<source>:<section>")별 증분 기준 시각. 크롤러에
+                  CRAWL_SINCE_SCOPES로 전달되며, 없는 범위는 since_dt를 쓴다.
+        extra_env: 크롤러 프로세스에 덮어쓸 환경변수 (백필의 CRAWL_SOURCES·동시 요청 수 등).
+
+    CRAWLER_HANDOFF=fifo이면 OUTPUT_FILE_PATH를 FIFO로 만들어 디스크를 거치지 않고 받는다.
+    프로세스는 호출 즉시 시작되고, 크롤러 실행 실패(비정상 종료) 시
+    반환된 iterator를 끝까지 소비하는 시점에 RuntimeError가 발생한다.
     """
     output_path: str = os.environ.get("OUTPUT_FILE_PATH", "/tmp/output.json")
+    use_fifo: bool = os.environ.get("CRAWLER_HANDOFF", "file").lower() == "fifo"
 
-    if os.path.exists(output_path):
+    if os.path.lexists(output_path):
         os.remove(output_path)
 
     env = os.environ.copy()
     env["OUTPUT_FILE_PATH"] = output_path
+    env["PYTHONUNBUFFERED"] = "1"  # 파이프로 연결된 print도 즉시 흘려보내 로그에 바로 나타나게 함
+    if extra_env:
+        env.update(extra_env)
 
     if since_dt is not None:
         env["CRAWL_SINCE"] = since_dt.isoformat()
     else:
         env.pop("CRAWL_SINCE", None)  # 이전 실행의 잔여 환경변수 제거
 
-    logger.info(f"크롤링 시작: python naver_crawler.py (출력: {output_path})")
+    if since_scopes:
+        env["CRAWL_SINCE_SCOPES"] = json.dumps(
+            {scope: dt.isoformat() for scope, dt in since_scopes.items()}
+        )
+    else:
+        env.pop("CRAWL_SINCE_SCOPES", None)
+
+    # 크롤링 예산: 스파이더가 스스로 멈출 시간(MAX_CRAWL_TIME)
+    remaining: Optional[float] = _remaining_seconds(deadline)
+    if remaining is not None:
+        configured: int = int(env.get("MAX_CRAWL_TIME", "300"))
+        budget: int = max(1, int(remaining) - CRAWL_SHUTDOWN_GRACE_SEC)
+        env["MAX_CRAWL_TIME"] = str(min(configured, budget))
+        logger.info(
+            f"크롤링 예산: {remaining:.1f}초 (스파이더 MAX_CRAWL_TIME={env['MAX_CRAWL_TIME']}초)"
+        )
 
-    result = subprocess.run(
-        ["python", "naver_crawler.py"],
+    # FIFO는 쓰기 측이 열기 전에 읽기 측을 non-blocking으로 먼저 열어 둔다
+    fd: Optional[int] = None
+    if use_fifo:
+        os.mkfifo(output_path)
+        fd = os.open(output_path, os.O_RDONLY | os.O_NONBLOCK)
+
+    logger.info(f"크롤링 시작: python crawl_runner.py (출력: {output_path})")
+
+    proc = subprocess.Popen(
+        ["python", "crawl_runner.py"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
         env=env,
     )
+    log_threads, log_budget = _start_output_forwarding(proc)
 
-    if result.stdout:
-        logger.info(f"크롤러 stdout:\n{result.stdout.strip()}")
-    if result.stderr:
-        logger.warning(f"크롤러 stderr:\n{result.stderr.strip()}")
-
-    if result.returncode != 0:
-        raise RuntimeError(f"크롤링 프로세스 비정상 종료: returncode={result.returncode}")
-
-    if not os.path.exists(output_path):
-        logger.warning(f"크롤러 출력 파일 없음: {output_path}")
-        return []
-
-    articles: list[dict] = []
-    with open(output_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                articles.append(json.loads(line))
-            except json.JSONDecodeError as exc:
-                logger.warning(f"JSON 파싱 실패 (라인 건너뜀): {exc}")
-
-    logger.info(f"크롤링 완료: {len(articles)}건")
-    return articles
+    output = CrawlerOutput()
+    output._articles = _iter_crawler_output(
+        output, proc, output_path, fd, use_fifo, deadline, log_threads, log_budget
+    )
+    return output
 
 
 # ---------------------------------------------------------------------------
-# 실패 기사 저장
+# 실패 기사 스풀 저장·재발행
 # ---------------------------------------------------------------------------
 
-def _save_failed_articles(articles: list[dict]) -> None:
-    """발행 실패 기사를 /tmp/failed_articles.json에 저장한다."""
+def _save_failed_articles(
+    articles: list[dict],
+    redis_client: Optional[redis_lib.Redis] = None,
+) -> None:
+    """
+    발행 실패 기사를 실패 스풀에 새 세그먼트로 저장한다 (이전 실행의 실패 기사는 그대로 남는다).
+    redis_client는 디스크 한도를 넘었을 때 오버플로 List로 넘기는 데만 쓴다.
+    """
     try:
-        with open(FAILED_ARTICLES_PATH, "w", encoding="utf-8") as f:
-            json.dump(articles, f, ensure_ascii=False, default=str, indent=2)
+        path: Optional[str] = failed_spool.write_segment(articles, redis_client)
         logger.warning(
-            f"발행 실패 기사 {len(articles)}건을 {FAILED_ARTICLES_PATH}에 저장"
+            f"발행 실패 기사 {len(articles)}건을 {path or '실패 스풀 오버플로 List'}에 저장"
         )
     except Exception as exc:
-        logger.error(f"실패 기사 파일 저장 오류: {exc}")
+        logger.error(f"실패 기사 스풀 저장 오류: {exc}")
+
+
+def _replay_articles(
+    redis_client: redis_lib.Redis,
+    articles: list[dict],
+    cache: set[str],
+    stats: dict[str, int],
+    codec: Optional[str] = None,
+) -> list[dict]:
+    """스풀에서 꺼낸 기사를 중복 확인 후 배치 발행하고, 다시 실패한 기사를 반환한다."""
+    batch_size: int = int(os.environ.get("FAILED_SPOOL_REPLAY_BATCH", "200"))
+    fresh: list[dict] = []
+    seen: set[str] = set()   # 같은 기사가 여러 번 실패해 세그먼트에 중복 저장된 경우
+    for article in articles:
+        url: str = article_url(article)
+        if is_duplicate(url, cache) or url in seen:
+            stats["skipped"] += 1
+            continue
+        seen.add(url)
+        fresh.append(article)
+
+    failed: list[dict] = []
+    for start in range(0, len(fresh), batch_size):
+        batch: list[dict] = fresh[start:start + batch_size]
+        failed.extend(publish_batch(redis_client, batch, cache, codec=codec))
+    stats["published"] += len(fresh) - len(failed)
+    stats["failed"] += len(failed)
+    return failed
+
+
+def replay_failed_spool(
+    redis_client: redis_lib.Redis,
+    cache: set[str],
+    deadline: Optional[float] = None,
+    codec: Optional[str] = None,
+) -> dict[str, int]:
+    """
+    이전 실행에서 실패 스풀에 남은 기사를 오래된 세그먼트부터 배치로 재발행한다
+    (디스크 세그먼트 다음 Redis 오버플로 List). codec은 백프레셔가 이번 실행에 강제한 본문 압축이다.
+
+    세그먼트 하나를 처리한 뒤 다시 실패한 기사를 새 세그먼트로 남기고 원래 세그먼트를 지운다
+    (오버플로 List 세그먼트는 재발행을 마친 뒤에 지우고, 다시 실패한 기사는 List 맨 앞에 되돌린다).
+    실패가 나오면 Redis가 불안정한 것으로 보고 나머지 세그먼트는 다음 실행으로 미루며,
+    마감 시각에 도달해도 남은 세그먼트를 그대로 둔다.
+
+    반환값: {"segments": 처리한 세그먼트 수, "published", "skipped", "failed"}
+    """
+    stats: dict[str, int] = {"segments": 0, "published": 0, "skipped": 0, "failed": 0}
+
+    for path in failed_spool.list_segments():
+        if _deadline_exceeded(deadline):
+            return stats
+        try:
+            articles: list[dict] = failed_spool.read_segment(path)
+        except (OSError, EOFError) as exc:
+            logger.error(f"실패 스풀 세그먼트 읽기 실패 (삭제) [{path}]: {exc}")
+            failed_spool.remove_segment(path)
+            continue
+        failed: list[dict] = _replay_articles(redis_client, articles, cache, stats, codec)
+        stats["segments"] += 1
+        if failed:
+            _save_failed_articles(failed, redis_client)
+        failed_spool.remove_segment(path)
+        if failed:
+            return stats
+
+    while True:
+        head = failed_spool.peek_overflow(redis_client)
+        if head is None:
+            break
+        raw, articles = head
+        failed = _replay_articles(redis_client, articles, cache, stats, codec)
+        stats["segments"] += 1
+        # 재발행을 마친 뒤에만 List에서 지우고, 다시 실패한 기사는 List 맨 앞에 되돌린다
+        failed_spool.ack_overflow(redis_client, raw, failed)
+        if failed or _deadline_exceeded(deadline):
+            break
+    return stats
 
 
 # ---------------------------------------------------------------------------
 # 메인 오케스트레이터
 # ---------------------------------------------------------------------------
 
-def crawl_and_publish() -> dict:
+def _observe_article_metrics(run_metrics: metrics.RunMetrics, article: dict) -> None:
+    """스파이더가 기사에 실어 보낸 crawlMetrics(다운로드·파싱 지연, 바이트 수)를 집계한다."""
+    crawl_metrics: dict = article.get("crawlMetrics") or {}
+    run_metrics.observe("article.download_ms", crawl_metrics.get("downloadLatencyMs"))
+    run_metrics.observe("article.parse_ms", crawl_metrics.get("parseLatencyMs"))
+    size = crawl_metrics.get("bytes")
+    if size is not None:
+        run_metrics.observe("article.bytes", size)
+        run_metrics.incr("bytes.downloaded", size)
+
+
+def published_epoch(article: dict) -> Optional[float]:
+    """publishedAt을 epoch 초로 바꾼다. 시간대가 없으면 ARTICLE_TZ 시각으로 보고, 파싱할 수 없으면 None."""
+    try:
+        published = datetime.fromisoformat(article.get("publishedAt") or "")
+    except ValueError:
+        return None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=ZoneInfo(os.environ.get("ARTICLE_TZ", "Asia/Seoul")))
+    return published.timestamp()
+
+
+def _observe_latency(run_metrics: metrics.RunMetrics, article: dict, publish_ms: float) -> None:
+    """
+    발행한 기사의 구간별 지연을 집계한다 (timings가 없는 기사는 가능한 구간만).
+      article.discovery_age_ms - publishedAt → 요청 시작: 네이버 노출 지연 + 폴링 간격
+      article.crawl_ms         - 요청 시작 → 파싱 완료: 스케줄러 대기 + 다운로드 + 파싱
+      article.publish_ms       - 파싱 완료 → Stream 발행: 출력 파일 전달 + 중복 확인 + XADD
+    """
+    timings: dict = article.get("timings") or {}
+    fetch_start = timings.get("fetchStartMs") or timings.get("fetchEndMs")
+    parse_end = timings.get("parseEndMs")
+    published: Optional[float] = published_epoch(article)
+    if fetch_start is not None and published is not None:
+        run_metrics.observe("article.discovery_age_ms", fetch_start - published * 1000)
+    if parse_end is not None:
+        if timings.get("fetchStartMs") is not None:
+            run_metrics.observe("article.crawl_ms", parse_end - timings["fetchStartMs"])
+        run_metrics.observe("article.publish_ms", publish_ms - parse_end)
+
+
+def _count_scope(scope_stats: dict[str, dict[str, int]], article: dict, field: str) -> None:
+    """범위(출처·섹션)별 처리 건수를 센다. 범위 정보가 없는 기사는 세지 않는다."""
+    scope: Optional[str] = article_scope(article)
+    if scope is None:
+        return
+    stats: dict[str, int] = scope_stats.setdefault(
+        scope, {"crawled": 0, "published": 0, "skipped": 0, "failed": 0}
+    )
+    stats[field] = stats.get(field, 0) + 1
+
+
+def _finish_run(
+    run_metrics: metrics.RunMetrics,
+    resource_start: memory_report.ResourceSnapshot,
+    result: dict,
+) -> dict:
+    """실행 지표를 EMF로 출력하고(메모리 계측 모드면 리포트도 저장) 결과에 요약을 붙인다."""
+    run_metrics.emit(metrics.default_dimensions())
+    result["metrics"] = run_metrics.summary()
+    if run_metrics.track_memory:
+        report: dict = memory_report.write_report(run_metrics, resource_start)
+        result["memory"] = report["recommendation"]
+    return result
+
+
+def crawl_and_publish(deadline: Optional[float] = None) -> dict:
     """
     크롤링을 실행하고 결과를 Redis Stream에 발행한다.
 
+    Args:
+        deadline: 전체 작업 마감 시각(time.monotonic() 기준). Lambda handler가
+                  남은 실행 시간에서 안전 마진을 뺀 값으로 계산해 넘긴다.
+                  크롤링 단계는 CRAWL_BUDGET_RATIO 만큼만 쓰고, 발행 단계는 마감 시각에
+                  도달하면 남은 기사를 실패 스풀에 저장(체크포인트)한 뒤 멈춘다.
+                  None이면 시간 제한 없이 실행한다.
+
     실행 흐름:
       1. Redis 연결 시도 (증분 크롤링 기준 시각 조회 및 발행을 위해)
-      2. REDIS_LAST_CRAWL_KEY 설정 시 마지막 크롤링 시각(since_dt) 조회
-      3. since_dt를 전달하여 크롤러 실행 (없으면 전체 크롤링)
-      4. Redis 연결 실패 시 전체 기사를 실패 파일로 저장하고 종료
-      5. 중복 URL 캐시 로드 → 기사별 발행 처리
-      6. 크롤링 기사가 1건 이상이면 last_crawl_time 업데이트
+      2. REDIS_LAST_CRAWL_KEY 설정 시 마지막 크롤링 시각(since_dt)과 범위별 기준 시각 조회
+      3. consumer group의 lag·pending으로 백프레셔 단계를 정하고(backpressure.py),
+         since_dt(와 범위별 기준 시각)·조정된 한도를 전달하여 크롤러 실행 (없으면 전체 크롤링)
+      4. Redis 연결 실패 시 전체 기사를 실패 스풀에 저장하고 종료
+      5. 중복 URL 캐시 로드 → 이전 실행의 실패 스풀 재발행(크롤러는 그동안 백그라운드에서 실행)
+         → 크롤러가 기사를 기록하는 대로 하나씩 URL 중복·유사 기사 확인 후 발행 처리
+         (이미 발행된 기사가 수정 시각과 함께 오면 내용이 바뀐 경우만 event=update로 재발행)
+      6. 크롤링이 예산 안에 끝났으면 공통·범위별 기준 시각을 '실패·보류 기사보다 앞선, 발행(또는
+         이미 발행)된 가장 최근 publishedAt'까지 올린다 (_WatermarkProgress 참조).
+         MAX_ARTICLES 한도까지 수집된 범위는 올리지 않고, 다음 실행은 기준 시각에서
+         WATERMARK_OVERLAP_SEC만큼 겹쳐서 크롤링한다
+      7. STREAM_RETENTION_SEC이 설정돼 있으면 보존 기간을 넘은 Stream 항목을 아카이브한 뒤 트리밍한다
+         (마감 시각·실행당 배치 한도 안에서만, 남은 항목은 다음 실행이 처리)
 
     반환값:
         {
             "crawled":   int,  # 크롤링된 전체 기사 수
             "published": int,  # 발행 성공 수
-            "skipped":   int,  # 중복으로 skip된 수
+            "skipped":   int,  # 중복으로 skip된 수 (유사 기사 포함)
             "failed":    int,  # 발행 실패 수
+            "deferred":  int,  # 마감 시각 도달로 발행하지 못하고 저장된 수
+            "metrics":   dict, # 단계별 소요 시간·기사별 지연 분포·Redis 명령 수 요약
+                               # (histograms의 article.discovery_age_ms / crawl_ms / publish_ms는
+                               #  발행한 기사의 발견 시 나이·크롤링 지연·발행 지연 백분위)
+            "scopes":    dict, # 출처·섹션 정보가 있는 기사가 있을 때만: 범위별 crawled/published/skipped/failed
+            "near_duplicates": int, # NEAR_DUP_FILTER=true일 때만: skipped 중 유사 기사로 걸러진 수
+            "updated":   int,  # 수정 기사 재발행이 있었을 때만: event=update로 재발행한 수
+            "update_failed": int, # (updated와 함께) 재발행 실패 수 — 스풀하지 않고 다음 수집 때 재감지
+            "replayed":  dict, # 실패 스풀에 세그먼트가 있었을 때만: 재발행 segments/published/skipped/failed
+            "backpressure": dict, # consumer group이 있을 때만: 단계(level)·backlog·그룹별 lag/pending과
+                               # 적용한 조치(max_articles, deferred_sections, codec)
+            "archived":  int,  # STREAM_RETENTION_SEC으로 아카이브 후 트리밍한 Stream 항목이 있었을 때만
+            "memory":    dict, # MEMORY_PROFILE=true일 때만: Lambda 메모리 설정 추천
         }
     """
-    crawl_start: datetime = datetime.now()
+    # 실행이 예외로 끝나도 이번 실행이 시작한 tracemalloc은 멈춘다
+    with metrics.start_run(track_memory=memory_report.enabled()) as run_metrics:
+        return _crawl_and_publish(run_metrics, deadline)
+
+
+def _crawl_and_publish(run_metrics: metrics.RunMetrics, deadline: Optional[float]) -> dict:
+    """crawl_and_publish의 본문. run_metrics 정리(tracemalloc 중지)는 호출 측 with 블록이 맡는다."""
+    resource_start: memory_report.ResourceSnapshot = memory_report.ResourceSnapshot.take()
 
     # 1. Redis 연결 시도 (실패해도 크롤링은 계속 진행)
     redis_client: Optional[redis_lib.Redis] = None
     try:
-        redis_client = get_redis_client()
+        with run_metrics.stage("redis_connect"):
+            redis_client = metrics.InstrumentedRedis(get_redis_client(), run_metrics)
     except ConnectionError as exc:
         logger.error(f"Redis 연결 불가 — 전체 크롤링으로 진행: {exc}")
 
     # 2. 증분 크롤링 기준 시각 조회
     since_dt: Optional[datetime] = None
+    since_scopes: dict[str, datetime] = {}
     if redis_client is not None:
-        since_dt = get_last_crawl_time(redis_client)
+        with run_metrics.stage("last_crawl_lookup"):
+            since_dt = get_last_crawl_time(redis_client)
+            since_scopes = get_scope_crawl_times(redis_client)
         if since_dt:
             logger.info(f"증분 크롤링 기준: {since_dt.isoformat()} 이후 기사만 수집")
         else:
             logger.info("초기 실행(last_crawl_time 없음): 전체 크롤링")
 
-    # 3. 크롤러 실행
-    articles: list[dict] = run_crawler(since_dt)
-    total: int = len(articles)
+    # consumer가 밀려 있으면 이번 실행의 크롤링 한도·본문 압축·섹션을 조정 (backpressure.py 참조)
+    max_articles: int = int(os.environ.get("MAX_ARTICLES", "10"))
+    pressure: Optional[dict] = None
+    if redis_client is not None:
+        with run_metrics.stage("backpressure"):
+            pressure = backpressure.evaluate(redis_client, max_articles, STREAM_MAXLEN)
+        max_articles = pressure["max_articles"]
+        if pressure["groups"]:
+            run_metrics.observe("consumer.backlog", pressure["backlog"])
+    codec: Optional[str] = pressure["codec"] if pressure else None
+
+    # 발행 시각 정정·늦게 노출된 기사를 놓치지 않도록 기준 시각보다 조금 앞에서부터 크롤링
+    overlap = timedelta(seconds=int(os.environ.get("WATERMARK_OVERLAP_SEC", "600")))
+    crawl_since: Optional[datetime] = since_dt - overlap if since_dt else None
+    crawl_scopes: dict[str, datetime] = {scope: dt - overlap for scope, dt in since_scopes.items()}
+
+    # 3. 크롤러 실행 (기사는 아래에서 기록되는 대로 소비, 크롤러를 기다린 시간만 crawl로 집계)
+    crawl_deadline: Optional[float] = _crawl_deadline(deadline)
+    crawler_output: Iterator[dict] = run_crawler(
+        crawl_since,
+        deadline=crawl_deadline,
+        since_scopes=crawl_scopes,
+        extra_env=backpressure.crawler_env(pressure) if pressure else None,
+    )
+    articles: Iterator[dict] = run_metrics.timed_iter("crawl", crawler_output)
 
     # 4. Redis 연결 실패 시 전체 실패 처리
     if redis_client is None:
-        _save_failed_articles(articles)
-        print(f"[FAILED_ARTICLES_COUNT] {total}")
-        return {"crawled": total, "published": 0, "skipped": 0, "failed": total}
+        all_articles: list[dict] = list(articles)
+        _save_failed_articles(all_articles)
+        print(f"[FAILED_ARTICLES_COUNT] {len(all_articles)}")
+        for article in all_articles:
+            _observe_article_metrics(run_metrics, article)
+        return _finish_run(run_metrics, resource_start, {
+            "crawled": len(all_articles),
+            "published": 0,
+            "skipped": 0,
+            "failed": len(all_articles),
+            "deferred": 0,
+        })
 
     # 5. 중복 URL 캐시 로드
-    published_cache: set[str] = load_published_urls(redis_client)
+    with run_metrics.stage("dedupe_load"):
+        published_cache: set[str] = load_published_urls(redis_client)
+
+    with run_metrics.stage("spool_replay"):
+        replayed: dict[str, int] = replay_failed_spool(redis_client, published_cache, deadline, codec)
+    if replayed["segments"]:
+        logger.info(
+            f"실패 스풀 재발행: 세그먼트 {replayed['segments']}개, 발행 {replayed['published']}건, "
+            f"중복 {replayed['skipped']}건, 실패 {replayed['failed']}건"
+        )
+        run_metrics.incr("articles.replayed", replayed["published"])
+
+    # NEAR_DUP_FILTER=true일 때만 유사 기사 색인 사용 (near_dup.py 참조)
+    near_dup_index: Optional[near_dup.NearDupIndex] = near_dup.NearDupIndex.from_env(redis_client)
+    update_events: bool = _update_events_enabled()
 
     # 6. 기사별 처리
+    total: int = 0
     published: int = 0
     skipped: int = 0
+    near_duplicates: int = 0
+    updated: int = 0
+    update_failed: int = 0
     failed_articles: list[dict] = []
+    deferred_articles: list[dict] = []
+    scope_stats: dict[str, dict[str, int]] = {}
+    watermark = _WatermarkProgress()
 
     for article in articles:
-        url: str = article.get("url", "")
+        total += 1
+        _observe_article_metrics(run_metrics, article)
+        # 수정 확인용 기사(revision)는 스파이더 개수 한도에 들지 않으므로 한도 판단(crawled)에서도 뺀다
+        _count_scope(scope_stats, article, "revisions" if article.get("revision") else "crawled")
+        if _deadline_exceeded(deadline):
+            deferred_articles = [article, *articles]
+            total += len(deferred_articles) - 1
+            logger.warning(
+                f"발행 마감 시각 도달 — 남은 {len(deferred_articles)}건은 실패 스풀에 저장"
+            )
+            break
+
+        url: str = article_url(article)
 
         if is_duplicate(url, published_cache):
+            if update_events and article.get("modifiedAt"):
+                with run_metrics.stage("revision_check"):
+                    changed: bool = _check_revision_safely(redis_client, url, article)
+                if changed:
+                    with run_metrics.stage("publish"):
+                        success = publish_update(redis_client, article, codec)
+                    if success:
+                        updated += 1
+                        _count_scope(scope_stats, article, "updated")
+                        logger.info(f"수정 기사 재발행: {url} (수정 {article['modifiedAt']})")
+                    else:
+                        update_failed += 1
+                    # 실패하면 기준 시각을 올리지 않아 다음 실행에서 다시 수집·감지된다
+                    watermark.observe(article, done=success)
+                    continue
             skipped += 1
+            _count_scope(scope_stats, article, "skipped")
+            watermark.observe(article, done=True)
             logger.info(f"중복 skip: {url}")
             continue
 
-        success: bool = publish_article(redis_client, article, published_cache)
+        if near_dup_index is not None:
+            with run_metrics.stage("near_dup"):
+                similar_url: Optional[str] = _find_near_duplicate(near_dup_index, article)
+            if similar_url:
+                near_duplicates += 1
+                skipped += 1
+                _count_scope(scope_stats, article, "skipped")
+                _mark_published(redis_client, url, published_cache)
+                watermark.observe(article, done=True)
+                logger.info(f"유사 기사 skip: {url} ≈ {similar_url}")
+                continue
+
+        with run_metrics.stage("publish"):
+            success: bool = publish_article(redis_client, article, published_cache, codec)
         if success:
             published += 1
+            _count_scope(scope_stats, article, "published")
+            _observe_latency(run_metrics, article, time.time() * 1000)
         else:
             failed_articles.append(article)
+            _count_scope(scope_stats, article, "failed")
+        watermark.observe(article, done=success)
+
+    for article in deferred_articles:
+        watermark.observe(article, done=False)
 
     failed: int = len(failed_articles)
+    deferred: int = len(deferred_articles)
 
-    # 7. 실패 기사 파일 저장
-    if failed_articles:
-        _save_failed_articles(failed_articles)
+    # 7. 실패·미발행 기사 스풀 저장 (다음 실행 시작 시 재발행되도록 체크포인트)
+    if failed_articles or deferred_articles:
+        _save_failed_articles(failed_articles + deferred_articles, redis_client)
 
-    # 8. last_crawl_time 업데이트 (크롤링 기사가 1건 이상일 때)
-    if total > 0:
-        update_last_crawl_time(redis_client, crawl_start)
+    # 8. 증분 기준 시각 업데이트 (끝낸 기사의 publishedAt 기준)
+    #    크롤링 예산 초과로 크롤러가 중단됐다면 어느 구간을 놓쳤는지 알 수 없으므로 그대로 둔다.
+    #    (발행·재발행이 길어져 크롤링 몫의 시간을 넘겼을 뿐 크롤러가 스스로 끝났다면 올린다)
+    if crawler_stopped_by_deadline(crawler_output):
+        logger.warning("크롤링 예산 초과로 크롤러가 중단됨 — 증분 기준 시각 유지")
+    else:
+        # 백프레셔로 줄인 한도까지 수집된 범위도 놓친 기사가 있을 수 있다
+        saturated: set[str] = {
+            scope for scope, stats in scope_stats.items() if stats["crawled"] >= max_articles
+        }
+        if not scope_stats and total >= max_articles:
+            saturated.add(_ALL_SCOPES)
+        # 백프레셔로 미룬 섹션은 크롤링하지 않았으므로 공통 기준 시각을 올리면 그 구간을 놓친다.
+        # 공통 기준 시각은 두고 수집한 범위의 기준 시각만 올린다 (미룬 섹션은 다음 실행이 따라잡음)
+        deferred_sections: list[str] = pressure["deferred_sections"] if pressure else []
+        if deferred_sections:
+            logger.warning(
+                f"미룬 섹션 {','.join(deferred_sections)} — 공통 증분 기준 시각 유지, 범위별 기준 시각만 갱신"
+            )
+        _advance_watermarks(
+            redis_client, watermark, since_dt, since_scopes, saturated, hold_global=bool(deferred_sections)
+        )
+
+    # 9. 시간 기준 보존: 보존 기간을 넘은 Stream 항목 아카이브 후 트리밍 (STREAM_RETENTION_SEC 설정 시)
+    #    + 언론사·섹션 색인에서 창 밖(XADD 시각 기준) 항목 정리
+    retention: dict[str, int] = {"archived": 0, "segments": 0}
+    if stream_retention.enabled():
+        with run_metrics.stage("retention"):
+            try:
+                retention = stream_retention.enforce_retention(redis_client, deadline=deadline)
+            except Exception as exc:
+                logger.error(f"Stream 보존 트리밍 실패 (다음 실행에서 재시도): {exc}")
+        run_metrics.incr("stream.archived", retention["archived"])
+    if stream_index.enabled():
+        try:
+            run_metrics.incr("stream.index_pruned", stream_index.prune(redis_client))
+        except Exception as exc:
+            logger.warning(f"Stream 색인 정리 실패 (다음 실행에서 재시도): {exc}")
 
-    # 9. 최종 요약 로그
+    # 10. 최종 요약 로그
     summary = (
         f"크롤링: {total}건, 발행성공: {published}건, "
-        f"중복skip: {skipped}건, 실패: {failed}건"
+        f"중복skip: {skipped}건, 실패: {failed}건, 마감보류: {deferred}건"
     )
     logger.info(summary)
     print(f"[FAILED_ARTICLES_COUNT] {failed}")
 
-    return {
+    run_metrics.incr("articles.crawled", total)
+    run_metrics.incr("articles.published", published)
+    run_metrics.incr("articles.skipped", skipped)
+    run_metrics.incr("articles.failed", failed)
+    run_metrics.incr("articles.deferred", deferred)
+    if near_dup_index is not None:
+        run_metrics.incr("articles.near_duplicates", near_duplicates)
+    if updated or update_failed:
+        run_metrics.incr("articles.updated", updated)
+        run_metrics.incr("articles.update_failed", update_failed)
+
+    result: dict = {
         "crawled": total,
         "published": published,
         "skipped": skipped,
         "failed": failed,
+        "deferred": deferred,
     }
+    if near_dup_index is not None:
+        result["near_duplicates"] = near_duplicates
+    if updated or update_failed:
+        result["updated"] = updated
+        result["update_failed"] = update_failed
+    if replayed["segments"]:
+        result["replayed"] = replayed
+    if retention["archived"]:
+        result["archived"] = retention["archived"]
+    if pressure and pressure["groups"]:
+        result["backpressure"] = pressure
+    if scope_stats:
+        for scope, stats in scope_stats.items():
+            logger.info(f"범위 {scope}: " + ", ".join(f"{k} {v}건" for k, v in stats.items()))
+        result["scopes"] = scope_stats
+    return _finish_run(run_metrics, resource_start, result)
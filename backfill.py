@@ -0,0 +1,262 @@
+"""
+backfill.py
+역할: 날짜 범위 과거 기사 백필 (장애 후 Stream 재구성, 새 consumer 초기 적재)
+
+섹션별 날짜 목록 페이지(?date=YYYYMMDD, &page=N으로 마지막 페이지까지)를 NaverFinanceBackfillCrawler로
+높은 동시성으로 크롤링하고, 중복 확인 후 pipeline 배치(publish_batch)로 발행한다. 날짜 묶음 단위로
+Redis Hash에 체크포인트를 남기므로 중단(마감 시각·오류) 후 다시 실행하면 끝난 날짜는 건너뛴다.
+어느 섹션이 BACKFILL_MAX_ARTICLES 한도까지 수집된 묶음은 놓친 기사가 있을 수 있어 완료로 기록하지 않는다
+(BACKFILL_DAYS_PER_CRAWL을 줄이거나 한도를 올려 다시 실행).
+날짜 묶음마다 consumer 지연(backpressure.evaluate)을 확인해 warn 이상이면 그 묶음의 본문을 압축해 싣는다
+(크롤링 한도·섹션은 줄이지 않는다 — 줄이면 놓친 기사가 있는 날짜가 완료로 기록되므로).
+실시간 증분 크롤링의 기준 시각(REDIS_LAST_CRAWL_KEY와 범위별 Hash)은 읽지도 쓰지도 않는다.
+
+실행:
+  Lambda: handler(event={"mode": "backfill", "start": "2025-01-01", "end": "2025-01-07",
+                         "sections": ["101/259", "101/258"]})
+  CLI:    python backfill.py --start 2025-01-01 --end 2025-01-07 --sections 101/259,101/258
+
+환경변수 목록 (Redis·크롤러 공통 설정은 article_publisher.py 참조):
+  BACKFILL_CHECKPOINT_KEY       - 완료 날짜 체크포인트 Hash key
+                                  (기본값: "<REDIS_PUBLISHED_URLS_KEY>:backfill")
+  BACKFILL_DAYS_PER_CRAWL       - 크롤러 프로세스 1회에 묶을 날짜 수 (기본값: 1)
+  BACKFILL_CONCURRENCY          - 백필 스파이더 동시 요청 수 (기본값: 16)
+  BACKFILL_DOWNLOAD_DELAY       - 백필 스파이더 요청 간 지연(초) (기본값: 0.25)
+  BACKFILL_MAX_ARTICLES         - 크롤링 1회(날짜 묶음) 섹션별 최대 기사 수, 안전 한도 (기본값: 10000)
+  BACKFILL_MAX_PAGES            - 섹션·날짜별로 따라갈 최대 목록 페이지 수 (기본값: 100, naver_crawler.py 참조)
+  BACKFILL_BATCH_SIZE           - 발행 pipeline 배치 크기 (기본값: 200)
+  BACKFILL_MAX_ARTICLES_PER_SEC - 발행 속도 상한, 0이면 제한 없음 (기본값: 0)
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import backpressure
+import metrics
+from article_publisher import (
+    STREAM_MAXLEN,
+    _crawl_deadline,
+    _deadline_exceeded,
+    _save_failed_articles,
+    article_url,
+    crawler_stopped_by_deadline,
+    crawler_stopped_by_time_limit,
+    get_redis_client,
+    is_duplicate,
+    load_published_urls,
+    publish_batch,
+    run_crawler,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# 설정
+# ---------------------------------------------------------------------------
+
+def _checkpoint_key() -> str:
+    default: str = f"{os.environ['REDIS_PUBLISHED_URLS_KEY']}:backfill"
+    return os.environ.get("BACKFILL_CHECKPOINT_KEY", default)
+
+
+def date_range(start: date, end: date) -> list[date]:
+    """start~end(포함) 날짜 목록. 최근 날짜부터 채우도록 역순으로 반환한다."""
+    if end < start:
+        start, end = end, start
+    return [end - timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def _chunks(dates: list[date], size: int) -> list[list[date]]:
+    return [dates[i:i + size] for i in range(0, len(dates), max(1, size))]
+
+
+class _RateLimiter:
+    """누적 발행 건수가 rate(건/초)를 넘지 않도록 필요한 만큼 잠든다 (rate <= 0이면 제한 없음)."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate: float = rate
+        self._started: float = time.monotonic()
+        self._count: int = 0
+
+    def acquire(self, count: int) -> None:
+        if self.rate <= 0:
+            return
+        self._count += count
+        wait: float = self._count / self.rate - (time.monotonic() - self._started)
+        if wait > 0:
+            time.sleep(wait)
+
+
+# ---------------------------------------------------------------------------
+# 백필
+# ---------------------------------------------------------------------------
+
+def _crawl_env(chunk: list[date], sections: Optional[list[str]]) -> dict[str, str]:
+    env: dict[str, str] = {
+        "CRAWL_SOURCES": "naver_finance_backfill",
+        "BACKFILL_DATES": ",".join(d.strftime("%Y%m%d") for d in chunk),
+        "MAX_ARTICLES": os.environ.get("BACKFILL_MAX_ARTICLES", "10000"),
+        "CRAWLER_CONCURRENT_REQUESTS": os.environ.get("BACKFILL_CONCURRENCY", "16"),
+        "CRAWLER_DOWNLOAD_DELAY": os.environ.get("BACKFILL_DOWNLOAD_DELAY", "0.25"),
+    }
+    if sections:
+        env["NAVER_SECTIONS"] = ",".join(sections)
+    return env
+
+
+def run_backfill(
+    start: date,
+    end: date,
+    sections: Optional[list[str]] = None,
+    deadline: Optional[float] = None,
+) -> dict:
+    """
+    start~end 날짜의 기사를 크롤링해 발행한다.
+
+    Args:
+        sections: 백필할 섹션 목록 (None이면 NAVER_SECTIONS)
+        deadline: 마감 시각(time.monotonic() 기준). 도달하면 진행 중인 날짜 묶음을 끝내지 않고
+                  멈추며, 그 묶음은 체크포인트에 남지 않아 다음 실행에서 다시 처리된다.
+
+    반환값:
+        {"dates": 전체 날짜 수, "done": 이번에 끝낸 날짜 수, "already_done": 체크포인트로 건너뛴 수,
+         "remaining": 남은 날짜(YYYY-MM-DD) 목록, "crawled", "published", "skipped", "failed",
+         "metrics"}
+    """
+    run_metrics: metrics.RunMetrics = metrics.start_run()
+    redis_client = metrics.InstrumentedRedis(get_redis_client(), run_metrics)
+    checkpoint_key: str = _checkpoint_key()
+    batch_size: int = int(os.environ.get("BACKFILL_BATCH_SIZE", "200"))
+    days_per_crawl: int = int(os.environ.get("BACKFILL_DAYS_PER_CRAWL", "1"))
+    limiter = _RateLimiter(float(os.environ.get("BACKFILL_MAX_ARTICLES_PER_SEC", "0")))
+
+    all_dates: list[date] = date_range(start, end)
+    finished: set[str] = set(redis_client.hkeys(checkpoint_key))
+    pending: list[date] = [d for d in all_dates if d.isoformat() not in finished]
+    logger.info(
+        f"백필 시작: {all_dates[-1]}~{all_dates[0]} {len(all_dates)}일 "
+        f"(체크포인트 완료 {len(all_dates) - len(pending)}일 건너뜀)"
+    )
+
+    with run_metrics.stage("dedupe_load"):
+        published_cache: set[str] = load_published_urls(redis_client)
+
+    totals: dict[str, int] = {"crawled": 0, "published": 0, "skipped": 0, "failed": 0}
+    done: list[date] = []
+    failed_articles: list[dict] = []
+
+    for chunk in _chunks(pending, days_per_crawl):
+        if _deadline_exceeded(deadline):
+            logger.warning("백필 마감 시각 도달 — 남은 날짜는 다음 실행에서 처리")
+            break
+
+        stats: dict[str, int] = {"crawled": 0, "published": 0, "skipped": 0, "failed": 0}
+        batch: list[dict] = []
+        seen: set[str] = set()   # 같은 묶음 안에서 여러 날짜 목록에 걸친 기사
+        crawl_env: dict[str, str] = _crawl_env(chunk, sections)
+        with run_metrics.stage("backpressure"):
+            codec: Optional[str] = backpressure.evaluate(
+                redis_client, int(crawl_env["MAX_ARTICLES"]), STREAM_MAXLEN
+            )["codec"]
+
+        def flush() -> None:
+            limiter.acquire(len(batch))
+            with run_metrics.stage("publish"):
+                failed: list[dict] = publish_batch(redis_client, batch, published_cache, codec=codec)
+            stats["published"] += len(batch) - len(failed)
+            stats["failed"] += len(failed)
+            failed_articles.extend(failed)
+            batch.clear()
+
+        crawl_deadline: Optional[float] = _crawl_deadline(deadline)
+        crawler_output = run_crawler(deadline=crawl_deadline, extra_env=crawl_env)
+        section_counts: dict[str, int] = {}
+        for article in run_metrics.timed_iter("crawl", crawler_output):
+            stats["crawled"] += 1
+            section: str = article.get("section") or ""
+            section_counts[section] = section_counts.get(section, 0) + 1
+            url: str = article_url(article)
+            if is_duplicate(url, published_cache) or url in seen:
+                stats["skipped"] += 1
+                continue
+            seen.add(url)
+            batch.append(article)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+
+        for key, value in stats.items():
+            totals[key] += value
+        label: str = ", ".join(d.isoformat() for d in chunk)
+        logger.info(
+            f"백필 [{label}]: 크롤링 {stats['crawled']}건, 발행 {stats['published']}건, "
+            f"중복 {stats['skipped']}건, 실패 {stats['failed']}건"
+        )
+
+        # 실패 없이, 크롤러가 끝까지 돌았고, 섹션 한도에 걸리지 않은 날짜만 완료로 기록
+        # (아니면 다음 실행에서 다시 크롤링·중복 확인). 끝까지 돌았는지는 크롤러 자신의 결과로만 판단한다:
+        # 마감 시각으로 중단했거나 스파이더가 MAX_CRAWL_TIME에 걸려 멈췄다고 알린 경우.
+        # 경과 시간에는 발행 속도 제한 대기·발행 왕복이 섞이므로 쓰지 않는다
+        saturated: list[str] = sorted(
+            section for section, count in section_counts.items() if count >= int(crawl_env["MAX_ARTICLES"])
+        )
+        if saturated:
+            logger.warning(
+                f"백필 [{label}]: 섹션 {','.join(saturated)}이 BACKFILL_MAX_ARTICLES 한도까지 수집됨 — "
+                f"완료로 기록하지 않음 (BACKFILL_DAYS_PER_CRAWL 축소 또는 한도 상향 검토)"
+            )
+        stopped: bool = (
+            crawler_stopped_by_deadline(crawler_output) or crawler_stopped_by_time_limit(crawler_output)
+        )
+        if stats["failed"] == 0 and not stopped and not saturated:
+            redis_client.hset(checkpoint_key, mapping={
+                d.isoformat(): json.dumps({**stats, "at": datetime.now().isoformat()})
+                for d in chunk
+            })
+            done.extend(chunk)
+
+    if failed_articles:
+        _save_failed_articles(failed_articles)
+
+    remaining: list[str] = sorted(d.isoformat() for d in pending if d not in done)
+    for key, value in totals.items():
+        run_metrics.incr(f"backfill.{key}", value)
+    run_metrics.emit({**metrics.default_dimensions(), "Mode": "backfill"})
+    logger.info(f"백필 종료: 완료 {len(done)}일, 남은 {len(remaining)}일, 발행 {totals['published']}건")
+
+    return {
+        "dates": len(all_dates),
+        "done": len(done),
+        "already_done": len(all_dates) - len(pending),
+        "remaining": remaining,
+        **totals,
+        "metrics": run_metrics.summary(),
+    }
+
+
+def parse_date(value: str) -> date:
+    return datetime.strptime(value.replace("-", ""), "%Y%m%d").date()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="날짜 범위 과거 기사 백필")
+    parser.add_argument("--start", required=True, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="끝 날짜 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--sections", default="", help="섹션 목록, 쉼표 구분 (기본값: NAVER_SECTIONS)")
+    args = parser.parse_args()
+
+    sections: Optional[list[str]] = [s for s in args.sections.split(",") if s] or None
+    result: dict = run_backfill(parse_date(args.start), parse_date(args.end), sections)
+    result.pop("metrics", None)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+backpressure.py
+역할: 기사 Stream consumer group의 밀린 양(lag + pending)을 읽어 이번 실행의 크롤링·발행 강도를 정한다
+
+consumer가 따라오지 못하는데 계속 발행하면 XADD MAXLEN 근사 트리밍이 아직 읽지 않은 항목을 지운다.
+crawl_and_publish는 크롤링 전에 evaluate()로 XINFO GROUPS(그룹별 lag·pending)와 XPENDING(가장 오래된
+미확인 메시지)을 읽고(왕복 2회), 가장 밀린 그룹의 backlog(= lag + pending)에 따라 단계를 정한다.
+
+  ok       - backlog < BACKPRESSURE_WARN_BACKLOG: 평소대로
+  warn     - 섹션별 MAX_ARTICLES를 BACKPRESSURE_THROTTLE_RATIO 배로 줄이고,
+             본문을 압축하지 않는 설정이면 이번 실행은 zlib으로 압축해 싣는다 (Stream 메모리 절감)
+  critical - backlog >= BACKPRESSURE_CRITICAL_BACKLOG: warn 조치 + BACKPRESSURE_LOW_PRIORITY_SECTIONS
+             섹션은 이번 실행에서 크롤링하지 않는다 (그 섹션의 기준 시각은 그대로여서 다음 실행이 따라잡음)
+
+시간 기준 보존(STREAM_RETENTION_SEC, stream_retention.py)을 쓰면 MAXLEN 트리밍이 없으므로 건수가 아니라
+가장 오래된 미처리 항목(아직 읽지 않았거나 읽고 확인하지 않은 항목)의 나이로 판단한다. 이 나이가 보존
+기간을 넘으면 consumer가 처리하기 전에 아카이브·트리밍되므로, 기준은 보존 기간의 비율로 정한다.
+
+Redis 7 미만은 XINFO GROUPS에 lag이 없으므로 pending만으로 판단한다. consumer group이 없거나
+Stream이 없으면 ok. 판단 결과는 실행 결과의 "backpressure"에 실린다.
+
+환경변수 목록:
+  BACKPRESSURE_ENABLED              - "false"이면 판단하지 않음 (기본값: "true")
+  BACKPRESSURE_WARN_BACKLOG         - warn 기준 backlog (기본값: STREAM_MAXLEN의 50%)
+  BACKPRESSURE_CRITICAL_BACKLOG     - critical 기준 backlog (기본값: STREAM_MAXLEN의 80%)
+  BACKPRESSURE_WARN_AGE_SEC         - 시간 기준 보존일 때 warn 기준 미처리 항목 나이(초)
+                                      (기본값: STREAM_RETENTION_SEC의 50%)
+  BACKPRESSURE_CRITICAL_AGE_SEC     - 시간 기준 보존일 때 critical 기준 미처리 항목 나이(초)
+                                      (기본값: STREAM_RETENTION_SEC의 80%)
+  BACKPRESSURE_THROTTLE_RATIO       - warn 이상일 때 MAX_ARTICLES에 곱할 비율 (기본값: 0.5)
+  BACKPRESSURE_LOW_PRIORITY_SECTIONS - critical일 때 미룰 섹션, 쉼표 구분 "sid1/sid2" (기본값: 없음)
+"""
+
+import logging
+import math
+import os
+import time
+from typing import Optional
+
+import redis as redis_lib
+
+import stream_retention
+
+logger = logging.getLogger(__name__)
+
+LEVELS: tuple[str, ...] = ("ok", "warn", "critical")
+
+
+def _csv(raw: str) -> list[str]:
+    return [item.strip().strip("/") for item in raw.split(",") if item.strip()]
+
+
+def _as_str(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _age_sec(entry_id, now_ms: int) -> float:
+    return round(max(0, now_ms - int(_as_str(entry_id).partition("-")[0])) / 1000, 1)
+
+
+def read_groups(redis_client: redis_lib.Redis, stream_key: str) -> dict[str, dict]:
+    """
+    consumer group별 {"lag", "pending", "oldest_pending_sec", "oldest_unread_sec"}를 읽는다
+    (XINFO GROUPS + XPENDING·XRANGE pipeline). oldest_unread_sec은 마지막으로 전달한 항목 다음
+    항목의 나이다. lag을 알 수 없으면(Redis 7 미만 등) None. Stream이 없으면 빈 dict.
+    """
+    try:
+        infos: list[dict] = redis_client.xinfo_groups(stream_key)
+    except redis_lib.ResponseError:
+        return {}   # Stream이 아직 없음
+    if not infos:
+        return {}
+
+    pipe = redis_client.pipeline(transaction=False)
+    for info in infos:
+        pipe.xpending(stream_key, info["name"])
+        pipe.xrange(stream_key, f"({_as_str(info['last-delivered-id'])}", "+", count=1)
+    replies: list = pipe.execute(raise_on_error=False)
+
+    now_ms: int = int(time.time() * 1000)
+    groups: dict[str, dict] = {}
+    for info, summary, unread in zip(infos, replies[0::2], replies[1::2]):
+        oldest: Optional[float] = None
+        if isinstance(summary, dict) and summary.get("min"):
+            oldest = _age_sec(summary["min"], now_ms)
+        groups[_as_str(info["name"])] = {
+            "lag": info.get("lag"),
+            "pending": int(info.get("pending") or 0),
+            "oldest_pending_sec": oldest,
+            "oldest_unread_sec": _age_sec(unread[0][0], now_ms) if isinstance(unread, list) and unread else None,
+        }
+    return groups
+
+
+def _backlog(group: dict) -> int:
+    return (group["lag"] or 0) + group["pending"]
+
+
+def _oldest_sec(group: dict) -> float:
+    return max(group["oldest_pending_sec"] or 0.0, group["oldest_unread_sec"] or 0.0)
+
+
+def evaluate(redis_client: redis_lib.Redis, max_articles: int, stream_maxlen: int) -> dict:
+    """
+    이번 실행의 조치를 정한다. stream_maxlen은 건수 기준 보존일 때만 기본 기준에 쓴다
+    (시간 기준 보존이면 STREAM_RETENTION_SEC으로 정함). 반환값:
+      {"level", "backlog", "oldest_sec", "groups", "max_articles", "deferred_sections", "codec"}
+      oldest_sec        - 가장 오래된 미처리 항목의 나이(초)
+      max_articles      - 이번 실행에 적용할 섹션별 기사 한도
+      deferred_sections - 이번 실행에서 크롤링하지 않을 섹션 목록
+      codec             - 이번 실행에 강제할 본문 압축 codec (None이면 설정 그대로)
+    Redis 조회에 실패하면 ok로 본다 (백프레셔 때문에 수집이 멈추지 않도록).
+    """
+    decision: dict = {
+        "level": "ok",
+        "backlog": 0,
+        "oldest_sec": 0.0,
+        "groups": {},
+        "max_articles": max_articles,
+        "deferred_sections": [],
+        "codec": None,
+    }
+    if os.environ.get("BACKPRESSURE_ENABLED", "true").lower() != "true":
+        return decision
+
+    try:
+        groups: dict[str, dict] = read_groups(redis_client, os.environ["REDIS_ARTICLE_STREAM_KEY"])
+    except Exception as exc:
+        logger.warning(f"consumer group 상태 조회 실패 (백프레셔 없이 진행): {exc}")
+        return decision
+    decision["groups"] = groups
+    if not groups:
+        return decision
+
+    backlog: int = max(_backlog(group) for group in groups.values())
+    decision["backlog"] = backlog
+    decision["oldest_sec"] = max(_oldest_sec(group) for group in groups.values())
+    retention: int = stream_retention.retention_sec()
+    if retention > 0:
+        # 시간 기준 보존: 미처리 항목이 보존 기간을 넘기면 consumer가 읽기 전에 잘려 나간다
+        measure: float = decision["oldest_sec"]
+        warn: float = float(os.environ.get("BACKPRESSURE_WARN_AGE_SEC", str(retention // 2)))
+        critical: float = float(os.environ.get("BACKPRESSURE_CRITICAL_AGE_SEC", str(retention * 4 // 5)))
+        unit: str = "초"
+        by_group = _oldest_sec
+    else:
+        measure = backlog
+        warn = int(os.environ.get("BACKPRESSURE_WARN_BACKLOG", str(stream_maxlen // 2)))
+        critical = int(os.environ.get("BACKPRESSURE_CRITICAL_BACKLOG", str(stream_maxlen * 4 // 5)))
+        unit = "건"
+        by_group = _backlog
+    if measure < warn:
+        return decision
+
+    ratio: float = float(os.environ.get("BACKPRESSURE_THROTTLE_RATIO", "0.5"))
+    decision["level"] = "critical" if measure >= critical else "warn"
+    decision["max_articles"] = max(1, math.ceil(max_articles * ratio))
+    if os.environ.get("STREAM_PAYLOAD_CODEC", "none").strip().lower() in ("", "none"):
+        decision["codec"] = "zlib"
+
+    if decision["level"] == "critical":
+        sections: list[str] = _csv(os.environ.get("NAVER_SECTIONS", "101/259"))
+        low: set[str] = set(_csv(os.environ.get("BACKPRESSURE_LOW_PRIORITY_SECTIONS", "")))
+        if any(section not in low for section in sections):   # 모든 섹션을 미루지는 않는다
+            decision["deferred_sections"] = [section for section in sections if section in low]
+
+    lagging: str = max(groups, key=lambda name: by_group(groups[name]))
+    logger.warning(
+        f"consumer 지연 {decision['level']}: 그룹 {lagging} backlog {backlog}건, "
+        f"가장 오래된 미처리 {decision['oldest_sec']}초 "
+        f"(warn {warn}{unit}, critical {critical}{unit}) — MAX_ARTICLES {max_articles}→{decision['max_articles']}"
+        + (f", 압축 {decision['codec']}" if decision["codec"] else "")
+        + (f", 미룬 섹션 {','.join(decision['deferred_sections'])}" if decision["deferred_sections"] else "")
+    )
+    return decision
+
+
+def crawler_env(decision: dict) -> Optional[dict[str, str]]:
+    """판단 결과를 크롤러 프로세스 환경변수로 바꾼다 (조치가 없으면 None)."""
+    if decision["level"] == "ok":
+        return None
+    env: dict[str, str] = {"MAX_ARTICLES": str(decision["max_articles"])}
+    if decision["deferred_sections"]:
+        sections: list[str] = _csv(os.environ.get("NAVER_SECTIONS", "101/259"))
+        env["NAVER_SECTIONS"] = ",".join(s for s in sections if s not in decision["deferred_sections"])
+    return env
@@ -0,0 +1,116 @@
+"""
+benchmarks/codec_bench.py
+Stream 본문 압축 codec(stream_codec)의 압축률과 CPU 비용을 실제 기사 본문으로 잰다.
+
+--input에 실제 기사 덤프(스파이더 출력 JSONL, 실패 스풀 세그먼트, bulk_loader가 읽는 형식)를 주면
+그 본문으로 측정한다. 입력이 없으면 합성 기사를 쓰는데, 합성 본문은 적은 문장을 반복하므로
+압축률이 실제보다 훨씬 높게 나온다 — 설정 결정에는 반드시 실제 덤프로 잰 값을 쓴다.
+
+출력 항목 (codec·레벨별):
+  ratio        - 평문 UTF-8 바이트 / Stream에 저장되는 바이트(base64 포함)
+  enc_us       - 기사 1건 인코딩 평균(마이크로초, 발행 측 Lambda CPU)
+  dec_us       - 기사 1건 디코딩 평균(마이크로초, consumer CPU)
+  stream_mb    - STREAM_MAXLEN건을 이 평균 크기로 채웠을 때 본문 메모리 추정(MB)
+
+사용 예:
+  python -m benchmarks.codec_bench --input /tmp/output.json --input dumps/2025-01.jsonl.gz
+  python -m benchmarks.codec_bench --articles 500 --content-len 3000
+"""
+
+import argparse
+import base64
+import json
+import time
+from typing import Optional
+
+import article_publisher
+import stream_codec
+from benchmarks.fixtures import synthetic_articles
+from bulk_loader import iter_articles
+
+_LEVELS: dict[str, tuple[int, ...]] = {"zlib": (1, 6, 9), "zstd": (1, 3, 9, 19)}
+
+
+def _load_contents(paths: list[str], limit: int, articles: int, content_len: int) -> list[bytes]:
+    if not paths:
+        return [a["content"].encode("utf-8") for a in synthetic_articles(articles, content_len)]
+    contents: list[bytes] = []
+    for path in paths:
+        for article in iter_articles(path):
+            content: str = (article.get("content") or "")[:article_publisher.CONTENT_MAX_LEN]
+            if content:
+                contents.append(content.encode("utf-8"))
+            if len(contents) >= limit:
+                return contents
+    return contents
+
+
+def _measure(contents: list[bytes], codec: str, level: Optional[int]) -> dict:
+    raw_bytes: int = sum(len(c) for c in contents)
+    if codec == "none":
+        return {"codec": "none", "level": "-", "ratio": 1.0, "enc_us": 0.0, "dec_us": 0.0,
+                "avg_bytes": raw_bytes / len(contents)}
+
+    start: float = time.perf_counter()
+    encoded: list[bytes] = [
+        base64.b64encode(stream_codec.compress(c, codec, level)) for c in contents
+    ]
+    encode_sec: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for blob in encoded:
+        stream_codec.decompress(base64.b64decode(blob), codec)
+    decode_sec: float = time.perf_counter() - start
+
+    stored_bytes: int = sum(len(b) for b in encoded)
+    return {
+        "codec": codec,
+        "level": level,
+        "ratio": raw_bytes / stored_bytes,
+        "enc_us": encode_sec / len(contents) * 1e6,
+        "dec_us": decode_sec / len(contents) * 1e6,
+        "avg_bytes": stored_bytes / len(contents),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--input", action="append", default=[],
+                        help="실제 기사 덤프 경로 (여러 번 지정 가능, 미지정 시 합성 기사)")
+    parser.add_argument("--limit", type=int, default=5_000, help="덤프에서 읽을 최대 기사 수")
+    parser.add_argument("--articles", type=int, default=500, help="합성 기사 수 (--input 미지정 시)")
+    parser.add_argument("--content-len", type=int, default=3_000, help="합성 기사 본문 길이(자)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    contents: list[bytes] = _load_contents(args.input, args.limit, args.articles, args.content_len)
+    if not contents:
+        parser.error("본문이 있는 기사가 없습니다")
+    if not args.input:
+        print("⚠️  합성 기사로 측정 — 압축률이 실제보다 높게 나옵니다 (--input으로 실제 덤프 지정)")
+
+    codecs: list[str] = ["zlib"] + (["zstd"] if stream_codec._zstd is not None else [])
+    if stream_codec._zstd is None:
+        print("⚠️  zstandard 미설치 — zstd 측정 생략")
+    rows: list[dict] = [_measure(contents, "none", None)]
+    for codec in codecs:
+        rows.extend(_measure(contents, codec, level) for level in _LEVELS[codec])
+    for row in rows:
+        row["stream_mb"] = row["avg_bytes"] * article_publisher.STREAM_MAXLEN / 1024 / 1024
+
+    if args.json:
+        print(json.dumps({"articles": len(contents), "results": rows}, ensure_ascii=False, indent=2))
+        return
+
+    avg_raw: float = rows[0]["avg_bytes"]
+    print(f"\n기사 {len(contents)}건, 평균 본문 {avg_raw / 1024:.1f}KB (UTF-8)")
+    print(f"{'codec':<6} {'level':>5} {'ratio':>7} {'enc_us':>9} {'dec_us':>9} {'stream_mb':>10}")
+    for row in rows:
+        print(
+            f"{row['codec']:<6} {row['level']!s:>5} {row['ratio']:>7.2f} "
+            f"{row['enc_us']:>9.1f} {row['dec_us']:>9.1f} {row['stream_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+benchmarks/conftest.py — 발행 경로 마이크로 벤치마크 공통 fixture (pytest-benchmark)
+
+tests/의 정확성 테스트와 분리돼 있어 기본 pytest 실행(testpaths = tests)에는 포함되지 않는다.
+pytest-benchmark가 설치돼 있지 않으면 전체가 skip된다.
+
+환경변수 목록:
+  BENCH_REDIS_URL - 벤치마크 대상 Redis (기본값: redis://localhost:6379/15, docker-compose Redis의 15번 DB)
+                    "fakeredis"이면 프로세스 내 fakeredis 사용 (네트워크 왕복이 없어 수치 비교용으로는 부적합)
+  BENCH_SCALE     - "quick" (기사 1k / URL 10k, 기본값) 또는 "full" (기사 1k~100k / URL 10k~1M)
+
+기준선(baseline) 비교 — 변경 전후 회귀 확인은 이 명령으로 한다:
+  BENCH_REDIS_URL=fakeredis python -m pytest benchmarks --benchmark-storage=benchmarks/baselines \\
+      --benchmark-compare=0001_fakeredis-quick --benchmark-compare-fail=mean:15%
+저장소에 커밋된 기준선은 benchmarks/baselines/Linux-CPython-3.11-64bit/0001_fakeredis-quick.json이다
+(BENCH_REDIS_URL=fakeredis, BENCH_SCALE=quick). 다른 플랫폼·Python이면 파일 경로를 그대로
+--benchmark-compare=benchmarks/baselines/Linux-CPython-3.11-64bit/0001_fakeredis-quick.json로 넘긴다.
+실제 Redis 기준선은 머신마다 다르므로 커밋하지 않고 로컬에서 저장해 비교한다:
+  python -m pytest benchmarks --benchmark-storage=benchmarks/baselines --benchmark-save=baseline
+  python -m pytest benchmarks --benchmark-storage=benchmarks/baselines \\
+      --benchmark-compare --benchmark-compare-fail=mean:15%
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="session")
+def bench_redis():
+    """벤치마크용 Redis 클라이언트. 연결할 수 없으면 벤치마크 전체를 skip한다."""
+    url: str = os.environ.get("BENCH_REDIS_URL", "redis://localhost:6379/15")
+    if url == "fakeredis":
+        import fakeredis
+        return fakeredis.FakeRedis(decode_responses=True)
+
+    import redis
+    client = redis.Redis.from_url(url, decode_responses=True)
+    try:
+        client.ping()
+    except redis.exceptions.ConnectionError as exc:
+        pytest.skip(f"Redis 연결 불가 ({url}): {exc} — docker compose up -d redis")
+    return client
+
+
+@pytest.fixture
+def bench_env(monkeypatch, tmp_path):
+    """발행 함수가 읽는 환경변수를 벤치마크 전용 key로 설정한다."""
+    vars_map = {
+        "REDIS_HOST":               "localhost",
+        "REDIS_ARTICLE_STREAM_KEY": "bench:articles:stream",
+        "REDIS_PUBLISHED_URLS_KEY": "bench:published_urls",
+        "OUTPUT_FILE_PATH":         str(tmp_path / "output.json"),
+        "METRICS_ENABLED":          "false",
+        "FAILED_SPOOL_DIR":         str(tmp_path / "spool"),
+    }
+    for key, value in vars_map.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv("REDIS_LAST_CRAWL_KEY", raising=False)
+    monkeypatch.delenv("MEMORY_PROFILE", raising=False)
+    return vars_map
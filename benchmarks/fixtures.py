@@ -0,0 +1,93 @@
+"""
+benchmarks/fixtures.py
+벤치마크·부하 테스트용 합성 기사 데이터
+
+실제 네이버 금융 기사와 비슷한 길이·문자 구성(한글 UTF-8)의 기사와 URL을 결정적으로 생성한다.
+같은 인덱스는 항상 같은 기사를 만들어 실행 간 비교가 가능하다.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional
+
+_SENTENCES: tuple[str, ...] = (
+    "코스피가 외국인 순매수에 힘입어 2,600선을 회복했다.",
+    "한국은행 금융통화위원회는 기준금리를 연 3.50%로 동결했다.",
+    "원·달러 환율은 전 거래일보다 4.2원 내린 1,338.5원에 마감했다.",
+    "반도체 업황 개선 기대감에 삼성전자와 SK하이닉스가 나란히 강세를 보였다.",
+    "금융당국은 가계부채 관리를 위해 스트레스 DSR 2단계 시행을 예고했다.",
+    "미국 연방준비제도의 금리 인하 기대가 커지면서 국채 금리가 하락했다.",
+    "2차전지 관련주는 차익 실현 매물이 쏟아지며 약세를 면치 못했다.",
+    "정부는 내년 경제성장률 전망치를 2.2%로 하향 조정했다.",
+    "증권가에서는 4분기 실적 시즌을 앞두고 업종별 차별화 장세를 예상했다.",
+    "부동산 PF 부실 우려가 이어지며 건설주 투자심리가 위축됐다.",
+)
+_PRESSES: tuple[str, ...] = (
+    "연합뉴스", "한국경제", "매일경제", "머니투데이", "이데일리", "조선비즈", "서울경제",
+)
+_BASE_TIME = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def article_url(index: int) -> str:
+    """인덱스에 대응하는 네이버 기사 형식 URL (oid 3자리 / aid 10자리)."""
+    oid: int = 1 + index % 50
+    return f"https://n.news.naver.com/mnews/article/{oid:03d}/{index:010d}"
+
+
+def synthetic_article(
+    index: int,
+    content_len: int = 3_000,
+    base_time: Optional[datetime] = None,
+) -> dict:
+    """스파이더 출력과 같은 필드 구성의 합성 기사 1건을 만든다."""
+    rng = random.Random(index)
+    parts: list[str] = []
+    length: int = 0
+    while length < content_len:
+        sentence: str = rng.choice(_SENTENCES)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    published = (base_time or _BASE_TIME) - timedelta(seconds=30 * index)
+    return {
+        "title": f"[합성] {rng.choice(_SENTENCES)[:30]} ({index})",
+        "content": " ".join(parts)[:content_len],
+        "publishedAt": published.isoformat(timespec="seconds"),
+        "url": article_url(index),
+        "press": rng.choice(_PRESSES),
+    }
+
+
+def synthetic_articles(count: int, content_len: int = 3_000, start: int = 0) -> Iterator[dict]:
+    """start부터 count건의 합성 기사를 차례로 만든다 (메모리에 한꺼번에 올리지 않음)."""
+    for index in range(start, start + count):
+        yield synthetic_article(index, content_len)
+
+
+def dedupe_urls(count: int, start: int = 10_000_000) -> Iterator[str]:
+    """중복 방지 Set 시딩용 URL (synthetic_articles 기본 범위와 겹치지 않음)."""
+    for index in range(start, start + count):
+        yield article_url(index)
+
+
+def seed_dedupe_set(client, key: str, size: int, batch_size: int = 10_000) -> None:
+    """중복 방지 Set을 dedupe_urls(size)로 채운다 (SADD 배치)."""
+    client.delete(key)
+    batch: list[str] = []
+    for url in dedupe_urls(size):
+        batch.append(url)
+        if len(batch) >= batch_size:
+            client.sadd(key, *batch)
+            batch.clear()
+    if batch:
+        client.sadd(key, *batch)
+
+
+def write_jsonl(path: str, articles: Iterable[dict]) -> int:
+    """기사들을 스파이더 출력과 같은 JSONL 파일로 저장하고 건수를 반환한다."""
+    count: int = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for article in articles:
+            f.write(json.dumps(article, ensure_ascii=False) + "\n")
+            count += 1
+    return count
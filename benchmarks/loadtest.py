@@ -0,0 +1,153 @@
+"""
+benchmarks/loadtest.py
+로컬 대역 네이버 서버 → 실제 스파이더 subprocess → crawl_and_publish → Redis 종단 간 부하 테스트
+
+benchmarks/naver_stub.py 서버를 띄우고 NAVER_BASE_URL로 NaverFinanceNewsCrawler를 그 서버에 연결한 뒤,
+crawl_and_publish를 한 번 실행해 다음을 출력한다.
+  - 처리량: 발행 기사 수 / 실행 시간 (articles/sec)
+  - 종단 간 지연 p50/p99: 대역 서버가 기사 페이지를 응답한 시각 → Stream 엔트리 ID 시각(ms)
+  - Redis 명령 수: RunMetrics 카운터(클라이언트 측) + INFO commandstats 차이(서버 측, 실제 Redis만)
+
+Redis는 기본으로 docker-compose의 Redis(redis://localhost:6379/0)를 쓴다.
+  docker compose up -d redis
+
+사용 예:
+  python -m benchmarks.loadtest --articles 200 --latency-ms 50 --jitter-ms 20 --concurrency 16
+  python -m benchmarks.loadtest --articles 100 --error-rate 0.05 --redis-url fakeredis
+  python -m benchmarks.loadtest --articles 50 --sections 101/259,101/258,101/261
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+import article_publisher
+import metrics
+from benchmarks.naver_stub import NaverStubServer, StubConfig
+
+
+def _redis_client(url: str):
+    if url == "fakeredis":
+        import fakeredis  # 개발 의존성 (서버 측 명령 통계 없음)
+        return fakeredis.FakeRedis(decode_responses=True)
+    import redis
+    return redis.Redis.from_url(url, decode_responses=True)
+
+
+def _command_calls(client) -> Optional[dict[str, int]]:
+    """INFO commandstats의 명령별 호출 수. 지원하지 않는 서버(fakeredis 등)면 None."""
+    try:
+        stats: dict = client.info("commandstats")
+    except Exception:
+        return None
+    return {
+        name.removeprefix("cmdstat_"): int(value["calls"])
+        for name, value in stats.items()
+        if isinstance(value, dict) and "calls" in value
+    }
+
+
+def _command_delta(before: Optional[dict], after: Optional[dict]) -> Optional[dict[str, int]]:
+    if before is None or after is None:
+        return None
+    delta: dict[str, int] = {
+        name: calls - before.get(name, 0)
+        for name, calls in after.items()
+        if calls - before.get(name, 0) > 0
+    }
+    return dict(sorted(delta.items(), key=lambda kv: -kv[1]))
+
+
+def _end_to_end_latencies(client, stream_key: str, served_at: dict[str, float]) -> list[float]:
+    """Stream 엔트리 ID(ms)와 대역 서버 응답 시각의 차이(ms)를 기사별로 구한다."""
+    latencies: list[float] = []
+    for entry_id, fields in client.xrange(stream_key):
+        path: str = "/" + fields.get("url", "").split("/", 3)[-1]
+        served: Optional[float] = served_at.get(path)
+        if served is None:
+            continue
+        published_ms: int = int(entry_id.split("-", 1)[0])
+        latencies.append(published_ms - served * 1000)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=100, help="섹션별 목록에 노출·수집할 기사 수")
+    parser.add_argument("--sections", default="101/259", help="크롤링할 섹션 (NAVER_SECTIONS)")
+    parser.add_argument("--content-len", type=int, default=3_000, help="기사 본문 길이(자)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="대역 서버 평균 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="응답 지연 편차(±)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 응답 비율")
+    parser.add_argument("--concurrency", type=int, default=8, help="스파이더 동시 요청 수")
+    parser.add_argument("--download-delay", type=float, default=0.0, help="스파이더 요청 간 지연(초)")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0",
+                        help='Redis URL ("fakeredis"이면 프로세스 내 fakeredis)')
+    parser.add_argument("--handoff", choices=("file", "fifo"), default="file",
+                        help="크롤러 → 발행 전달 방식 (CRAWLER_HANDOFF)")
+    args = parser.parse_args()
+
+    client = _redis_client(args.redis_url)
+    stream_key: str = "loadtest:articles:stream"
+    urls_key: str = "loadtest:published_urls"
+    client.delete(stream_key, urls_key)
+
+    config = StubConfig(
+        article_count=args.articles,
+        content_len=args.content_len,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+    )
+
+    with NaverStubServer(config) as stub, tempfile.TemporaryDirectory() as tmp:
+        os.environ.update({
+            "REDIS_HOST": "localhost",
+            "REDIS_ARTICLE_STREAM_KEY": stream_key,
+            "REDIS_PUBLISHED_URLS_KEY": urls_key,
+            "OUTPUT_FILE_PATH": os.path.join(tmp, "output.json"),
+            "NAVER_BASE_URL": stub.base_url,
+            "NAVER_SECTIONS": args.sections,
+            "MAX_ARTICLES": str(args.articles),
+            "CRAWLER_CONCURRENT_REQUESTS": str(args.concurrency),
+            "CRAWLER_DOWNLOAD_DELAY": str(args.download_delay),
+            "CRAWLER_HANDOFF": args.handoff,
+            "METRICS_ENABLED": "false",
+        })
+        os.environ.pop("REDIS_LAST_CRAWL_KEY", None)  # 증분 기준 시각 없이 전체 수집
+
+        # get_redis_client()가 새로 연결하지 않고 이 클라이언트를 재사용하게 한다.
+        article_publisher._redis_client = client
+        commands_before = _command_calls(client)
+
+        started: float = time.perf_counter()
+        result: dict = article_publisher.crawl_and_publish()
+        elapsed: float = time.perf_counter() - started
+
+        commands_after = _command_calls(client)
+        latencies: list[float] = _end_to_end_latencies(client, stream_key, stub.stats.served_at)
+
+    counters: dict = result["metrics"]["counters"]
+    report: dict = {
+        "result": {k: result[k] for k in ("crawled", "published", "skipped", "failed", "deferred")},
+        "elapsed_sec": round(elapsed, 3),
+        "articles_per_sec": round(result["published"] / elapsed, 2) if elapsed else None,
+        "end_to_end_latency_ms": metrics.summarize(latencies),
+        "stub": {"requests": stub.stats.requests, "errors": stub.stats.errors},
+        "redis": {
+            "client_commands": counters.get("redis.commands", 0),
+            "client_roundtrips": counters.get("redis.roundtrips", 0),
+            "server_commands": _command_delta(commands_before, commands_after),
+        },
+        "timings_ms": result["metrics"]["timings_ms"],
+    }
+    if "scopes" in result:
+        report["scopes"] = result["scopes"]
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+benchmarks/memory_bench.py
+로컬 벤치마크 픽스처로 발행 경로의 단계별 메모리를 재고 Lambda 메모리 설정을 추천한다.
+
+스파이더 없이 합성 기사 JSONL → 중복 URL 캐시 로드 → 발행 경로를 crawl_and_publish와 같은
+단계 이름(dedupe_load / crawl / publish)으로 계측하고 memory_report 리포트를 출력한다.
+Redis는 기본으로 fakeredis를 쓰고, --redis-url로 docker-compose Redis 등을 지정할 수 있다.
+(fakeredis는 저장 데이터를 같은 프로세스 힙에 두므로 단계별 힙 최대치에 Stream 내용이 섞인다.
+ 실제 Lambda 수치에 가깝게 보려면 --redis-url을 쓴다.)
+
+사용 예:
+  python -m benchmarks.memory_bench --articles 5000 --dedupe-size 1000000
+  python -m benchmarks.memory_bench --redis-url redis://localhost:6379/15 --target-sec 30
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import article_publisher
+import memory_report
+import metrics
+from benchmarks.fixtures import seed_dedupe_set, synthetic_articles, write_jsonl
+
+
+def _redis_client(url: str):
+    if url:
+        import redis
+        return redis.Redis.from_url(url, decode_responses=True)
+    import fakeredis  # 개발 의존성
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=1_000, help="합성 기사 수")
+    parser.add_argument("--content-len", type=int, default=article_publisher.CONTENT_MAX_LEN,
+                        help="기사 본문 길이(자)")
+    parser.add_argument("--dedupe-size", type=int, default=100_000, help="중복 방지 Set 크기")
+    parser.add_argument("--redis-url", default="", help="미지정 시 fakeredis 사용")
+    parser.add_argument("--target-sec", type=float, default=None, help="목표 소요 시간(초)")
+    parser.add_argument("--report", default=None, help="리포트 저장 경로")
+    args = parser.parse_args()
+
+    os.environ.setdefault("REDIS_ARTICLE_STREAM_KEY", "bench:articles:stream")
+    os.environ.setdefault("REDIS_PUBLISHED_URLS_KEY", "bench:published_urls")
+    os.environ["METRICS_ENABLED"] = "false"
+
+    client = _redis_client(args.redis_url)
+    client.delete(os.environ["REDIS_ARTICLE_STREAM_KEY"])
+    seed_dedupe_set(client, os.environ["REDIS_PUBLISHED_URLS_KEY"], args.dedupe_size)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_path = os.path.join(tmp, "articles.jsonl")
+        write_jsonl(fixture_path, synthetic_articles(args.articles, args.content_len))
+
+        run_metrics = metrics.start_run(track_memory=True)
+        start = memory_report.ResourceSnapshot.take()
+        instrumented = metrics.InstrumentedRedis(client, run_metrics)
+
+        with run_metrics.stage("dedupe_load"):
+            cache = article_publisher.load_published_urls(instrumented)
+        started = time.perf_counter()
+        for article in run_metrics.timed_iter("crawl", article_publisher.read_jsonl(fixture_path)):
+            if article_publisher.is_duplicate(article["url"], cache):
+                continue
+            with run_metrics.stage("publish"):
+                article_publisher.publish_article(instrumented, article, cache)
+        elapsed = time.perf_counter() - started
+
+        report = memory_report.write_report(
+            run_metrics, start, path=args.report, target_sec=args.target_sec
+        )
+
+    report["articles_per_sec"] = round(args.articles / elapsed, 1) if elapsed else None
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+benchmarks/naver_stub.py
+부하 테스트용 네이버 뉴스 대역(stand-in) HTTP 서버
+
+NaverFinanceNewsCrawler가 쓰는 CSS 선택자와 같은 구조의 목록/기사 페이지를 합성 데이터로 제공한다.
+응답 지연(평균 + 지터)과 오류(HTTP 500) 비율을 설정할 수 있고, 기사 페이지를 내보낸 시각을
+기록해 부하 테스트에서 종단 간(기사 응답 → Stream 발행) 지연을 계산할 수 있게 한다.
+
+  GET /breakingnews/section/{sid1}/{sid2}  → 최신순 기사 목록 (섹션마다 겹치지 않는 기사 범위)
+  GET /mnews/article/{oid}/{aid}           → 기사 본문
+"""
+
+import html
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from benchmarks.fixtures import synthetic_article
+
+_ARTICLE_PATH_RE = re.compile(r"^/mnews/article/(\d{3})/(\d{10})$")
+_LIST_PATH_RE = re.compile(r"^/breakingnews/section/\d+/(\d+)$")
+_SECTION_STRIDE = 1_000_000   # 섹션별 기사 인덱스 간격
+
+
+@dataclass
+class StubConfig:
+    article_count: int = 100         # 목록에 노출할 기사 수
+    content_len: int = 3_000         # 기사 본문 길이(자)
+    latency_ms: float = 0.0          # 평균 응답 지연
+    jitter_ms: float = 0.0           # 지연 편차 (균등 분포 ±)
+    error_rate: float = 0.0          # HTTP 500 응답 비율 (0.0 ~ 1.0)
+    seed: int = 0
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    errors: int = 0
+    served_at: dict[str, float] = field(default_factory=dict)  # 기사 경로 → 응답 시각(epoch 초)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def render_listing(base_url: str, config: StubConfig, start: int = 0) -> str:
+    items: str = "\n".join(
+        f'<li class="sa_item"><a class="sa_text_title" '
+        f'href="{base_url}{_article_path(index)}">기사 {index}</a></li>'
+        for index in range(start, start + config.article_count)
+    )
+    return f'<html><body><ul class="sa_list">{items}</ul></body></html>'
+
+
+def render_article(index: int, config: StubConfig) -> str:
+    article: dict = synthetic_article(index, config.content_len)
+    date: str = article["publishedAt"].replace("T", " ")
+    return (
+        "<html><body>"
+        f'<div class="media_end_head_top_logo"><img alt="{html.escape(article["press"])}"></div>'
+        f'<h2 class="media_end_head_headline">{html.escape(article["title"])}</h2>'
+        f'<span class="media_end_head_info_datestamp_time _ARTICLE_DATE_TIME" '
+        f'data-date-time="{date}"></span>'
+        f'<div class="go_trans _article_content">{html.escape(article["content"])}</div>'
+        "</body></html>"
+    )
+
+
+def _article_path(index: int) -> str:
+    return f"/mnews/article/{1 + index % 50:03d}/{index:010d}"
+
+
+class NaverStubServer:
+    """별도 스레드에서 동작하는 대역 서버. with 문 또는 start()/stop()으로 사용한다."""
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config: StubConfig = config or StubConfig()
+        self.stats: StubStats = StubStats()
+        self._rng = random.Random(self.config.seed)
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listing_url(self, section: str = "101/259") -> str:
+        return f"{self.base_url}/breakingnews/section/{section}"
+
+    def start(self) -> "NaverStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "NaverStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _delay(self) -> float:
+        cfg: StubConfig = self.config
+        if cfg.latency_ms <= 0 and cfg.jitter_ms <= 0:
+            return 0.0
+        with self.stats.lock:
+            jitter: float = self._rng.uniform(-cfg.jitter_ms, cfg.jitter_ms)
+        return max(0.0, cfg.latency_ms + jitter) / 1000
+
+    def _should_fail(self) -> bool:
+        if self.config.error_rate <= 0:
+            return False
+        with self.stats.lock:
+            return self._rng.random() < self.config.error_rate
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:  # 요청마다 stderr 출력 방지
+                pass
+
+            def _send(self, status: int, body: str) -> None:
+                payload: bytes = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:
+                with stub.stats.lock:
+                    stub.stats.requests += 1
+                time.sleep(stub._delay())
+                if stub._should_fail():
+                    with stub.stats.lock:
+                        stub.stats.errors += 1
+                    self._send(500, "injected error")
+                    return
+
+                path: str = self.path.split("?", 1)[0]
+                match = _LIST_PATH_RE.match(path)
+                if match:
+                    start: int = (int(match.group(1)) % 1000) * _SECTION_STRIDE
+                    self._send(200, render_listing(stub.base_url, stub.config, start))
+                    return
+                match = _ARTICLE_PATH_RE.match(path)
+                if match:
+                    body: str = render_article(int(match.group(2)), stub.config)
+                    with stub.stats.lock:
+                        stub.stats.served_at[path] = time.time()
+                    self._send(200, body)
+                    return
+                self._send(404, "not found")
+
+        return Handler
@@ -0,0 +1,155 @@
+"""
+benchmarks/test_publisher_bench.py
+발행 경로(publish_article / load_published_urls / is_duplicate / url_canon / near_dup / crawl_and_publish) 마이크로 벤치마크
+본문 압축 codec의 압축률·CPU 비용을 실제 기사 덤프로 비교하려면 benchmarks/codec_bench.py를 쓴다.
+
+  python -m pytest benchmarks                       # BENCH_SCALE=quick, docker-compose Redis DB 15
+  BENCH_SCALE=full python -m pytest benchmarks      # 기사 1k~100k, 중복 방지 Set 최대 1M URL
+
+crawl_and_publish는 스파이더 subprocess 대신 미리 만든 합성 JSONL을 읽도록 run_crawler만 바꿔 끼워
+발행 쪽 비용(중복 확인 + Redis 명령)만 잰다. 크롤링까지 포함한 측정은 benchmarks/loadtest.py를 쓴다.
+"""
+
+import os
+
+import pytest
+
+import article_publisher
+import near_dup
+import url_canon
+from benchmarks.fixtures import (
+    article_url,
+    seed_dedupe_set,
+    synthetic_articles,
+    write_jsonl,
+)
+
+SCALES: dict[str, dict[str, tuple[int, ...]]] = {
+    "quick": {"articles": (1_000,), "dedupe": (10_000,)},
+    "full": {"articles": (1_000, 10_000, 100_000), "dedupe": (10_000, 100_000, 1_000_000)},
+}
+_SCALE: dict[str, tuple[int, ...]] = SCALES.get(os.environ.get("BENCH_SCALE", "quick"), SCALES["quick"])
+_CONTENT_LEN: int = 3_000
+
+
+def _reset(client, env: dict) -> None:
+    client.delete(env["REDIS_ARTICLE_STREAM_KEY"], env["REDIS_PUBLISHED_URLS_KEY"])
+
+
+def _rounds(count: int) -> int:
+    """큰 입력은 라운드 수를 줄여 전체 실행 시간을 제한한다."""
+    return max(3, min(20, 100_000 // count))
+
+
+# ---------------------------------------------------------------------------
+# publish_article
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("codec", ("none", "zlib"))
+@pytest.mark.parametrize("count", _SCALE["articles"])
+def test_publish_article(benchmark, bench_redis, bench_env, monkeypatch, count, codec):
+    """기사 count건을 빈 Stream/Set에 하나씩 발행하는 시간 (STREAM_PAYLOAD_CODEC별)."""
+    monkeypatch.setenv("STREAM_PAYLOAD_CODEC", codec)
+    articles: list[dict] = list(synthetic_articles(count, _CONTENT_LEN))
+
+    def setup():
+        _reset(bench_redis, bench_env)
+        return (set(),), {}
+
+    def publish_all(cache: set[str]) -> None:
+        for article in articles:
+            article_publisher.publish_article(bench_redis, article, cache)
+
+    benchmark.extra_info.update({"articles": count, "codec": codec})
+    benchmark.pedantic(publish_all, setup=setup, rounds=_rounds(count))
+    assert bench_redis.xlen(bench_env["REDIS_ARTICLE_STREAM_KEY"]) == count
+
+
+# ---------------------------------------------------------------------------
+# load_published_urls / is_duplicate
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("size", _SCALE["dedupe"])
+def test_load_published_urls(benchmark, bench_redis, bench_env, size):
+    """중복 방지 Set(size개 URL)을 메모리 캐시로 읽어 오는 시간."""
+    seed_dedupe_set(bench_redis, bench_env["REDIS_PUBLISHED_URLS_KEY"], size)
+
+    benchmark.extra_info["urls"] = size
+    cache = benchmark.pedantic(
+        article_publisher.load_published_urls, args=(bench_redis,), rounds=_rounds(size)
+    )
+    assert len(cache) == size
+
+
+@pytest.mark.parametrize("size", _SCALE["dedupe"])
+def test_is_duplicate(benchmark, size):
+    """캐시(size개 URL)에 대해 기사 1,000건(절반 중복)의 중복 여부를 확인하는 시간."""
+    cache: set[str] = {article_url(10_000_000 + i) for i in range(size)}
+    urls: list[str] = [article_url(10_000_000 + i) for i in range(500)]
+    urls += [article_url(i) for i in range(500)]
+
+    def check_all() -> int:
+        return sum(article_publisher.is_duplicate(url, cache) for url in urls)
+
+    benchmark.extra_info["urls"] = size
+    assert benchmark(check_all) == 500
+
+
+def test_canonical_url(benchmark):
+    """URL 1,000건(대표 URL·쿼리 변형·구형 주소 각 1/3)을 url_canon으로 정규화하는 시간."""
+    urls: list[str] = []
+    for i in range(1_000):
+        url: str = article_url(i)
+        oid, aid = url.rsplit("/", 2)[-2:]
+        urls.append((
+            url,
+            f"{url.replace('n.news', 'm.news')}?sid=101",
+            f"https://news.naver.com/main/read.naver?mode=LSD&mid=sec&oid={oid}&aid={aid}",
+        )[i % 3])
+
+    def canonicalize_all() -> int:
+        return len({url_canon.canonical_url(url) for url in urls})
+
+    assert benchmark(canonicalize_all) == 1_000
+
+
+# ---------------------------------------------------------------------------
+# near_dup (유사 기사 필터)
+# ---------------------------------------------------------------------------
+
+def test_near_dup_simhash(benchmark):
+    """본문 3,000자 기사 100건의 SimHash 지문 계산 시간 (NEAR_DUP_FILTER의 CPU 비용)."""
+    contents: list[str] = [a["content"] for a in synthetic_articles(100, _CONTENT_LEN)]
+
+    def fingerprint_all() -> int:
+        return len({near_dup.simhash(near_dup.features(text)) for text in contents})
+
+    assert benchmark(fingerprint_all) >= 1
+
+
+# ---------------------------------------------------------------------------
+# crawl_and_publish
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("size", _SCALE["dedupe"])
+@pytest.mark.parametrize("count", _SCALE["articles"])
+def test_crawl_and_publish(benchmark, bench_redis, bench_env, monkeypatch, tmp_path, count, size):
+    """크롤링 결과 count건 + 기존 발행 URL size개 상태에서 crawl_and_publish 한 번의 시간."""
+    fixture_path: str = str(tmp_path / "articles.jsonl")
+    write_jsonl(fixture_path, synthetic_articles(count, _CONTENT_LEN))
+    monkeypatch.setattr(
+        article_publisher, "run_crawler",
+        lambda *args, **kwargs: article_publisher.read_jsonl(fixture_path),
+    )
+    monkeypatch.setattr(article_publisher, "get_redis_client", lambda: bench_redis)
+
+    def setup():
+        bench_redis.delete(bench_env["REDIS_ARTICLE_STREAM_KEY"])
+        seed_dedupe_set(bench_redis, bench_env["REDIS_PUBLISHED_URLS_KEY"], size)
+        return (), {}
+
+    benchmark.extra_info.update({"articles": count, "urls": size})
+    result: dict = benchmark.pedantic(
+        article_publisher.crawl_and_publish, setup=setup, rounds=_rounds(max(count, size // 10))
+    )
+    assert result["published"] == count
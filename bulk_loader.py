@@ -0,0 +1,237 @@
+"""
+bulk_loader.py
+역할: 이미 수집된 기사 덤프(스파이더 출력 JSONL, 발행 실패 파일 등)를 Redis Stream에 대량 발행
+
+스파이더를 다시 돌리지 않고 파일에서 바로 적재한다. 파일을 한 줄씩 흘려 읽으며(전체를 메모리에
+올리지 않음) 배치 단위로 REDIS_PUBLISHED_URLS_KEY에 SMISMEMBER로 중복을 확인하고,
+남은 기사를 publish_batch(pipeline)로 발행한다. 배치는 --workers 개 스레드가 동시에 처리한다.
+
+지원 형식 (확장자 앞에 .gz가 붙으면 gzip으로 읽음):
+  *.jsonl / 그 외 - 한 줄에 기사 하나 (스파이더 출력 output.json, 실패 스풀 세그먼트 포함)
+  *.json          - 첫 글자가 '['이면 기사 배열 (이전 형식의 /tmp/failed_articles.json 등),
+                    아니면 JSONL로 읽음
+
+실행:
+  python bulk_loader.py dump1.jsonl dump2.jsonl.gz /tmp/failed_spool/*.jsonl.gz \\
+      --batch-size 500 --workers 8
+
+Redis 연결·Stream key는 article_publisher.py의 환경변수를 그대로 쓴다.
+기본적으로 Stream을 STREAM_MAXLEN으로 잘라내므로 consumer가 따라오지 못하는 대량 적재는
+--no-trim으로 실행한다 (STREAM_RETENTION_SEC을 쓰면 건수로는 자르지 않는다 — stream_retention.py 참조). 발행에 실패한 기사는 실시간 경로와 같은 실패 기사 저장소에 남는다.
+"""
+
+import argparse
+import gzip
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO, Iterator, Optional
+
+import redis as redis_lib
+
+from article_publisher import (
+    STREAM_MAXLEN,
+    _json_loads,
+    _parse_jsonl_line,
+    _save_failed_articles,
+    article_url,
+    get_redis_client,
+    publish_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: int = 500
+DEFAULT_WORKERS: int = 4
+PROGRESS_INTERVAL_SEC: float = 5.0
+
+
+# ---------------------------------------------------------------------------
+# 파일 읽기
+# ---------------------------------------------------------------------------
+
+def _open(path: str) -> IO[bytes]:
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def iter_articles(path: str) -> Iterator[dict]:
+    """
+    파일에서 기사를 하나씩 yield한다. JSON 배열 파일은 통째로 읽고,
+    그 외에는 JSONL로 보고 한 줄씩 읽는다 (잘못된 줄은 건너뜀).
+    """
+    with _open(path) as f:
+        head: bytes = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+        if head == b"[":
+            articles = _json_loads(head + f.read())
+            yield from (a for a in articles if isinstance(a, dict))
+            return
+        for line in itertools.chain([head + f.readline()], f):
+            article = _parse_jsonl_line(line)
+            if article is not None:
+                yield article
+
+
+# ---------------------------------------------------------------------------
+# 적재
+# ---------------------------------------------------------------------------
+
+class _Progress:
+    """워커 스레드가 함께 갱신하는 누적 건수와 주기적인 진행 로그."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.started: float = time.monotonic()
+        self._last_report: float = self.started
+        self.counts: dict[str, int] = {"read": 0, "published": 0, "skipped": 0, "failed": 0}
+
+    def add(self, **deltas: int) -> None:
+        with self.lock:
+            for key, value in deltas.items():
+                self.counts[key] += value
+
+    def rate(self) -> float:
+        elapsed: float = time.monotonic() - self.started
+        return self.counts["published"] / elapsed if elapsed > 0 else 0.0
+
+    def maybe_report(self) -> None:
+        now: float = time.monotonic()
+        if now - self._last_report < PROGRESS_INTERVAL_SEC:
+            return
+        self._last_report = now
+        c = self.counts
+        logger.info(
+            f"진행: 읽음 {c['read']}건, 발행 {c['published']}건, 중복 {c['skipped']}건, "
+            f"실패 {c['failed']}건 ({self.rate():.0f}건/초)"
+        )
+
+
+def _load_batch(
+    redis_client: redis_lib.Redis,
+    batch: list[dict],
+    maxlen: Optional[int],
+    progress: _Progress,
+    failed_articles: list[dict],
+) -> None:
+    """배치 하나를 SMISMEMBER로 중복 확인한 뒤 발행한다 (워커 스레드에서 실행)."""
+    urls_key: str = os.environ["REDIS_PUBLISHED_URLS_KEY"]
+    try:
+        flags: list = redis_client.smismember(urls_key, [article_url(a) for a in batch])
+    except Exception as exc:
+        logger.warning(f"중복 확인 실패 ({len(batch)}건, 발행 보류): {exc}")
+        progress.add(failed=len(batch))
+        with progress.lock:
+            failed_articles.extend(batch)
+        return
+
+    fresh: list[dict] = [a for a, seen in zip(batch, flags) if not seen]
+    # 캐시는 이 배치에서만 쓰고 버린다 (수백만 건 적재 시 메모리 누적 방지)
+    failed: list[dict] = publish_batch(redis_client, fresh, set(), maxlen=maxlen)
+    progress.add(
+        published=len(fresh) - len(failed),
+        skipped=len(batch) - len(fresh),
+        failed=len(failed),
+    )
+    if failed:
+        with progress.lock:
+            failed_articles.extend(failed)
+
+
+def load_files(
+    paths: list[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    trim: bool = True,
+    redis_client: Optional[redis_lib.Redis] = None,
+) -> dict:
+    """
+    paths의 기사를 순서대로 읽어 발행한다.
+
+    URL(네이버 기사는 대표 URL)이 만들고 있는 배치·처리 중인 배치의 기사와 겹치면 Redis에 묻기 전에
+    걸러낸다. 이미 끝난 배치와의 중복은 SMISMEMBER가 잡으므로, 배치가 끝나면 그 URL은 잊는다
+    (동시에 처리 중인 두 배치가 서로의 SADD 전에 같은 기사를 확인하는 경우만 막으면 됨). 처리 중인 배치는
+    workers * 2개로 제한해 파일을 읽는 속도가 발행 속도를 앞질러도 메모리가 늘지 않는다.
+
+    반환값: {"files", "read", "published", "skipped", "failed", "elapsed_sec", "articles_per_sec"}
+    """
+    redis_client = redis_client or get_redis_client()
+    maxlen: Optional[int] = STREAM_MAXLEN if trim else None
+    progress = _Progress()
+    failed_articles: list[dict] = []
+    window: set[str] = set()   # 만들고 있는 배치 + 처리 중인 배치의 URL
+    in_flight: dict[Future, list[str]] = {}
+
+    def retire(done: set[Future]) -> None:
+        for future in done:
+            window.difference_update(in_flight.pop(future))
+
+    def submit(executor: ThreadPoolExecutor, batch: list[dict], urls: list[str]) -> None:
+        retire({future for future in in_flight if future.done()})
+        while len(in_flight) >= workers * 2:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            retire(done)
+        future: Future = executor.submit(_load_batch, redis_client, batch, maxlen, progress, failed_articles)
+        in_flight[future] = urls
+        progress.maybe_report()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        batch: list[dict] = []
+        urls: list[str] = []
+        for path in paths:
+            logger.info(f"적재 시작: {path}")
+            for article in iter_articles(path):
+                progress.add(read=1)
+                url: str = article_url(article)
+                if not url or url in window:
+                    progress.add(skipped=1)
+                    continue
+                window.add(url)
+                batch.append(article)
+                urls.append(url)
+                if len(batch) >= batch_size:
+                    submit(executor, batch, urls)
+                    batch, urls = [], []
+        if batch:
+            submit(executor, batch, urls)
+        for future in in_flight:
+            future.result()
+
+    if failed_articles:
+        _save_failed_articles(failed_articles)
+
+    elapsed: float = time.monotonic() - progress.started
+    result: dict = {
+        "files": len(paths),
+        **progress.counts,
+        "elapsed_sec": round(elapsed, 3),
+        "articles_per_sec": round(progress.rate(), 1),
+    }
+    logger.info(
+        f"적재 완료: 발행 {result['published']}건, 중복 {result['skipped']}건, "
+        f"실패 {result['failed']}건, {result['elapsed_sec']}초 ({result['articles_per_sec']}건/초)"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기사 덤프 파일을 Redis Stream에 대량 발행")
+    parser.add_argument("paths", nargs="+", help="JSONL / JSON 배열 파일 (.gz 가능)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"pipeline 배치 크기 (기본값: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"동시 발행 스레드 수 (기본값: {DEFAULT_WORKERS})")
+    parser.add_argument("--no-trim", action="store_true",
+                        help=f"Stream을 STREAM_MAXLEN({STREAM_MAXLEN})으로 잘라내지 않음")
+    args = parser.parse_args()
+
+    result: dict = load_files(args.paths, args.batch_size, args.workers, trim=not args.no_trim)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+cassette.py
+역할: 스파이더 HTTP 응답 녹화(record) / 재생(replay) Scrapy 다운로더 미들웨어
+
+record 모드는 다운로더가 받은 응답을 전부 압축 아카이브에 순서대로 추가하고, replay 모드는
+네트워크 없이 아카이브의 응답을 돌려준다. 같은 녹화로 스파이더 버전 간 성능을 재현 가능하게
+비교하거나, 느렸던 운영 실행을 오프라인에서 다시 돌려 볼 수 있다.
+
+아카이브 형식:
+  <CASSETTE_PATH>      - 레코드 프레임의 연속. 프레임 = 4바이트(big-endian) 길이 + zlib 압축 레코드
+                         레코드 = 4바이트 헤더 길이 + 헤더 JSON(url, status, headers, latency 등) + 본문
+  <CASSETTE_PATH>.idx  - "METHOD URL" → [[offset, length], ...] JSON 색인 (녹화 종료 시 저장)
+                         색인이 없거나 깨졌으면 아카이브를 처음부터 훑어 다시 만든다.
+
+같은 요청이 여러 번 녹화됐으면(재시도 등) 녹화 순서대로 재생하고, 마지막 응답을 반복한다.
+한 CrawlerProcess에서 여러 스파이더를 함께 돌리면(CRAWL_SOURCES) 스파이더마다 미들웨어가 생기지만,
+녹화는 프로세스 안에서 경로별 CassetteWriter 하나를 함께 쓰고 마지막 스파이더가 끝날 때 닫는다
+(각자 "wb"로 열면 서로의 프레임을 덮어써 아카이브가 깨지므로).
+녹화에 없는 요청은 네트워크로 보내지 않고 IgnoreRequest로 버린다.
+
+Scrapy 설정 (crawl_runner.py가 환경변수에서 채운다):
+  CASSETTE_MODE         - "" (끔, 기본값) / "record" / "replay"
+  CASSETTE_PATH         - 아카이브 파일 경로 (기본값: /tmp/naver.cassette)
+  CASSETTE_REPLAY_SPEED - 재생 속도 배율. 0이면 지연 없이 즉시 (기본값), 1이면 녹화 당시의
+                          시간 흐름 그대로, 2이면 두 배 빠르게. 각 응답은 재생 시작 시각으로부터
+                          녹화 offset / 배율 시점에 돌려준다 (이미 지났으면 즉시). offset이 없는
+                          레코드는 녹화 다운로드 지연 / 배율만큼 기다린다
+"""
+
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from typing import Optional
+
+from scrapy import signals
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.http import Headers, Request, Response
+from scrapy.responsetypes import responsetypes
+from twisted.internet.task import deferLater
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CASSETTE_PATH: str = "/tmp/naver.cassette"
+_FRAME_HEADER = struct.Struct(">I")
+_COMPRESS_LEVEL: int = 6
+
+
+def request_key(request: Request) -> str:
+    return f"{request.method} {request.url}"
+
+
+# ---------------------------------------------------------------------------
+# 레코드 직렬화
+# ---------------------------------------------------------------------------
+
+def encode_record(
+    request: Request,
+    response: Response,
+    latency: Optional[float],
+    offset_sec: float,
+) -> bytes:
+    """응답 1건을 압축 프레임(길이 + zlib 레코드)으로 만든다."""
+    header: dict = {
+        "key": request_key(request),
+        "url": response.url,
+        "status": response.status,
+        "headers": {
+            k.decode("latin-1"): [v.decode("latin-1") for v in values]
+            for k, values in response.headers.items()
+        },
+        "latency": latency,
+        "offset": round(offset_sec, 6),   # 녹화 시작 이후 경과 시간
+    }
+    header_bytes: bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    payload: bytes = zlib.compress(
+        _FRAME_HEADER.pack(len(header_bytes)) + header_bytes + response.body, _COMPRESS_LEVEL
+    )
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def decode_record(payload: bytes) -> tuple[dict, bytes]:
+    """압축 레코드(프레임 길이 제외)를 (헤더, 본문)으로 푼다."""
+    raw: bytes = zlib.decompress(payload)
+    (header_len,) = _FRAME_HEADER.unpack_from(raw)
+    start: int = _FRAME_HEADER.size
+    header: dict = json.loads(raw[start:start + header_len])
+    return header, raw[start + header_len:]
+
+
+def build_response(header: dict, body: bytes, request: Request) -> Response:
+    headers = Headers(header["headers"])
+    cls = responsetypes.from_args(headers=headers, url=header["url"], body=body)
+    return cls(
+        url=header["url"],
+        status=header["status"],
+        headers=headers,
+        body=body,
+        request=request,
+        flags=["cassette"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# 아카이브
+# ---------------------------------------------------------------------------
+
+class CassetteWriter:
+    """레코드를 아카이브 끝에 추가하고, close() 시 색인을 저장한다."""
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.index: dict[str, list[list[int]]] = {}
+        self._file = open(path, "wb")
+        self._started: float = time.monotonic()
+        self.users: int = 0   # 이 writer를 쓰는 미들웨어(스파이더) 수
+
+    def append(self, request: Request, response: Response, latency: Optional[float]) -> None:
+        frame: bytes = encode_record(request, response, latency, time.monotonic() - self._started)
+        offset: int = self._file.tell()
+        self._file.write(frame)
+        self.index.setdefault(request_key(request), []).append([offset, len(frame)])
+
+    def close(self) -> None:
+        self._file.close()
+        with open(f"{self.path}.idx", "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "entries": self.index}, f, ensure_ascii=False)
+        count: int = sum(len(v) for v in self.index.values())
+        logger.info(
+            f"카세트 녹화 완료: 응답 {count}건, {os.path.getsize(self.path):,}바이트 → {self.path}"
+        )
+
+
+# 프로세스 안 경로별 공유 writer (같은 reactor 스레드에서만 쓰므로 잠금 없음)
+_writers: dict[str, CassetteWriter] = {}
+
+
+def acquire_writer(path: str) -> CassetteWriter:
+    """경로의 공유 writer를 돌려준다. 처음 쓰는 경로면 아카이브를 새로 연다."""
+    writer: Optional[CassetteWriter] = _writers.get(path)
+    if writer is None:
+        writer = _writers[path] = CassetteWriter(path)
+    writer.users += 1
+    return writer
+
+
+def release_writer(writer: CassetteWriter) -> None:
+    """writer 사용을 끝낸다. 마지막 사용자가 놓으면 닫고 색인을 저장한다."""
+    writer.users -= 1
+    if writer.users <= 0:
+        _writers.pop(writer.path, None)
+        writer.close()
+
+
+class CassetteReader:
+    """아카이브에서 요청 key별 응답을 녹화 순서대로 꺼낸다."""
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._file = open(path, "rb")
+        self.index: dict[str, list[list[int]]] = self._load_index()
+        self._cursor: dict[str, int] = {}
+
+    def _load_index(self) -> dict[str, list[list[int]]]:
+        try:
+            with open(f"{self.path}.idx", encoding="utf-8") as f:
+                return json.load(f)["entries"]
+        except (OSError, ValueError, KeyError):
+            logger.warning(f"카세트 색인 없음/손상 — 아카이브를 훑어 다시 만듦: {self.path}")
+            return self._scan()
+
+    def _scan(self) -> dict[str, list[list[int]]]:
+        """프레임을 처음부터 읽어 색인을 만든다 (녹화 도중 중단돼 잘린 마지막 프레임은 버림)."""
+        index: dict[str, list[list[int]]] = {}
+        self._file.seek(0)
+        while True:
+            offset: int = self._file.tell()
+            size_bytes: bytes = self._file.read(_FRAME_HEADER.size)
+            if len(size_bytes) < _FRAME_HEADER.size:
+                break
+            (size,) = _FRAME_HEADER.unpack(size_bytes)
+            payload: bytes = self._file.read(size)
+            if len(payload) < size:
+                break
+            header, _ = decode_record(payload)
+            index.setdefault(header["key"], []).append([offset, _FRAME_HEADER.size + size])
+        return index
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self.index.values())
+
+    def next_for(self, key: str) -> Optional[tuple[dict, bytes]]:
+        entries: Optional[list[list[int]]] = self.index.get(key)
+        if not entries:
+            return None
+        position: int = self._cursor.get(key, 0)
+        self._cursor[key] = position + 1
+        offset, length = entries[min(position, len(entries) - 1)]
+        self._file.seek(offset)
+        frame: bytes = self._file.read(length)
+        return decode_record(frame[_FRAME_HEADER.size:])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# ---------------------------------------------------------------------------
+# 다운로더 미들웨어
+# ---------------------------------------------------------------------------
+
+class CassetteMiddleware:
+    """
+    DOWNLOADER_MIDDLEWARES에서 다운로더 바로 앞(950)에 둔다.
+    압축 해제·재시도 미들웨어보다 다운로더 쪽이므로 녹화는 전송 그대로의 응답을, 재생은
+    그 응답을 다시 같은 미들웨어 체인에 흘려보낸다.
+    """
+
+    def __init__(self, mode: str, path: str, speed: float) -> None:
+        self.mode: str = mode
+        self.path: str = path
+        self.speed: float = speed
+        self.writer: Optional[CassetteWriter] = None
+        self.reader: Optional[CassetteReader] = None
+        self.misses: int = 0
+        self._replay_started: Optional[float] = None   # 첫 재생 요청 시각 (offset 기준점)
+        if mode == "record":
+            self.writer = acquire_writer(path)
+        elif mode == "replay":
+            self.reader = CassetteReader(path)
+            logger.info(f"카세트 재생: 응답 {len(self.reader)}건, 속도 배율 {speed} ← {path}")
+        else:
+            raise NotConfigured(f"알 수 없는 CASSETTE_MODE={mode}")
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        mode: str = (crawler.settings.get("CASSETTE_MODE") or "").strip().lower()
+        if not mode:
+            raise NotConfigured
+        middleware = cls(
+            mode,
+            crawler.settings.get("CASSETTE_PATH") or DEFAULT_CASSETTE_PATH,
+            crawler.settings.getfloat("CASSETTE_REPLAY_SPEED", 0.0),
+        )
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def replay_delay(self, offset: Optional[float], latency: Optional[float]) -> float:
+        """
+        이 응답을 돌려주기까지 기다릴 시간(초). 재생 시작 후 offset / speed 시점에 맞추고,
+        offset이 없으면 latency / speed만큼 기다린다.
+        """
+        if self.speed <= 0:
+            return 0.0
+        now: float = time.monotonic()
+        if self._replay_started is None:
+            self._replay_started = now
+        if offset is not None:
+            return max(0.0, offset / self.speed - (now - self._replay_started))
+        return latency / self.speed if latency else 0.0
+
+    def process_request(self, request: Request, spider):
+        if self.reader is None:
+            return None
+        record = self.reader.next_for(request_key(request))
+        if record is None:
+            self.misses += 1
+            raise IgnoreRequest(f"카세트에 없는 요청: {request_key(request)}")
+
+        header, body = record
+        request.meta["download_latency"] = header["latency"]
+        response: Response = build_response(header, body, request)
+        delay: float = self.replay_delay(header.get("offset"), header["latency"])
+        if delay > 0:
+            # 모듈 import 시점이 아닌 여기서 가져와야 Scrapy가 설치한 reactor를 쓴다
+            from twisted.internet import reactor
+            return deferLater(reactor, delay, lambda: response)
+        return response
+
+    def process_response(self, request: Request, response: Response, spider) -> Response:
+        if self.writer is not None and "cassette" not in response.flags:
+            self.writer.append(request, response, request.meta.get("download_latency"))
+        return response
+
+    def spider_closed(self, spider) -> None:
+        if self.writer is not None:
+            release_writer(self.writer)
+            self.writer = None
+        if self.reader is not None:
+            self.reader.close()
+            if self.misses:
+                logger.warning(f"카세트 재생 중 녹화에 없는 요청 {self.misses}건 건너뜀")
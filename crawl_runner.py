@@ -0,0 +1,196 @@
+"""
+crawl_runner.py
+역할: 스파이더 레지스트리 + 여러 BaseNewsSpider 구현체를 한 CrawlerProcess에서 동시 실행
+
+article_publisher.run_crawler()가 subprocess로 실행하는 진입점이다. CRAWL_SOURCES로 고른
+스파이더들을 같은 프로세스(같은 reactor)에서 함께 돌리고, 모든 스파이더의 기사를 하나의
+JSONL 출력(OUTPUT_FILE_PATH, 일반 파일 또는 FIFO)에 기사 단위로 즉시 기록한다.
+새 뉴스 출처를 추가할 때는 BaseNewsSpider 구현체를 만들고 SPIDER_REGISTRY에 등록하면 된다.
+
+종료 코드: 어느 스파이더든 MAX_CRAWL_TIME에 걸려 스스로 멈췄으면(time_limit_reached) 정상 종료 대신
+TIME_LIMIT_EXIT_CODE로 끝낸다. 발행 측(article_publisher.run_crawler)은 이를 오류가 아닌
+"끝까지 크롤링하지 못함"으로 받아 CrawlerOutput.stopped_by_time_limit에 기록한다.
+
+출처별 증분 기준 시각: CRAWL_SINCE_SCOPES에 "<source>" 범위가 있으면 그 스파이더의 since_dt로
+쓴다 (섹션 단위 범위 "<source>:<section>"은 스파이더가 직접 처리, naver_crawler.py 참조).
+
+환경변수 목록:
+  CRAWL_SOURCES      - 실행할 출처(source_name) 목록, 쉼표 구분 (기본값: "naver_finance")
+  OUTPUT_FILE_PATH   - 결과 JSONL 경로 (기본값: output.json)
+  CRAWL_SINCE_SCOPES - 범위별 증분 기준 시각 JSON (article_publisher가 전달)
+  CRAWLER_CONCURRENT_REQUESTS - 스파이더별 Scrapy 동시 요청 수 (기본값: 2)
+  CRAWLER_DOWNLOAD_DELAY      - 요청 간 지연(초)             (기본값: 1)
+  CASSETTE_MODE / CASSETTE_PATH / CASSETTE_REPLAY_SPEED - HTTP 응답 녹화/재생 (cassette.py 참조)
+  PROFILE_SPIDER     - "true"이고 PROFILE_MODE가 설정돼 있으면 크롤링 전체를 프로파일링 (profiling.py 참조)
+"""
+
+import importlib
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+from scrapy import signals
+from scrapy.crawler import CrawlerProcess
+
+from profiling import profile_section
+
+load_dotenv()
+
+# 출처 이름(CRAWL_SOURCES 값) → "모듈:클래스"
+SPIDER_REGISTRY: dict[str, str] = {
+    "naver_finance": "naver_crawler:NaverFinanceNewsCrawler",
+    "naver_finance_backfill": "naver_crawler:NaverFinanceBackfillCrawler",   # backfill.py 전용
+}
+DEFAULT_SOURCES: str = "naver_finance"
+TIME_LIMIT_EXIT_CODE: int = 3   # article_publisher._CRAWLER_TIME_LIMIT_EXIT_CODE와 같은 값
+
+
+def resolve_spider(source: str):
+    """레지스트리에서 출처 이름에 해당하는 스파이더 클래스를 import해 반환한다."""
+    try:
+        target: str = SPIDER_REGISTRY[source]
+    except KeyError:
+        raise ValueError(
+            f"등록되지 않은 크롤링 출처: {source} (등록된 출처: {', '.join(SPIDER_REGISTRY)})"
+        ) from None
+    module_name, class_name = target.split(":", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def configured_sources() -> list[str]:
+    raw: str = os.getenv("CRAWL_SOURCES", DEFAULT_SOURCES)
+    sources: list[str] = [s.strip() for s in raw.split(",") if s.strip()]
+    return sources or [DEFAULT_SOURCES]
+
+
+def crawler_settings() -> dict:
+    """모든 스파이더가 공유하는 Scrapy 설정."""
+    return {
+        "USER_AGENT": (
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        ),
+        "LOG_LEVEL": "INFO",
+        "ITEM_PIPELINES": {"crawl_runner.JsonLinesOutputPipeline": 900},
+        "CONCURRENT_REQUESTS": int(os.getenv("CRAWLER_CONCURRENT_REQUESTS", "2")),
+        "DOWNLOAD_DELAY": float(os.getenv("CRAWLER_DOWNLOAD_DELAY", "1")),
+        "DOWNLOAD_TIMEOUT": 10,
+        "RETRY_TIMES": 2,
+        "ROBOTSTXT_OBEY": False,
+        "DOWNLOADER_MIDDLEWARES": {"cassette.CassetteMiddleware": 950},
+        "CASSETTE_MODE": os.getenv("CASSETTE_MODE", ""),
+        "CASSETTE_PATH": os.getenv("CASSETTE_PATH", "/tmp/naver.cassette"),
+        "CASSETTE_REPLAY_SPEED": float(os.getenv("CASSETTE_REPLAY_SPEED", "0")),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 공유 JSONL 출력
+# ---------------------------------------------------------------------------
+
+class _SharedJsonLinesWriter:
+    """
+    한 프로세스의 모든 스파이더가 같은 출력 파일을 쓰도록 첫 스파이더가 열고 마지막 스파이더가 닫는다.
+    (스파이더별 FEED를 같은 경로로 지정하면 서로 덮어쓰므로 쓰지 않는다)
+    아이템은 reactor 스레드에서만 기록되므로 줄이 섞이지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._file = None
+        self._users: int = 0
+
+    def open(self) -> None:
+        if self._users == 0:
+            path: str = os.getenv("OUTPUT_FILE_PATH", "output.json")
+            self._file = open(path, "w", encoding="utf-8")
+        self._users += 1
+
+    def write(self, item: dict) -> None:
+        self._file.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()  # 발행 측이 tail로 읽으므로 기사 단위로 즉시 내보냄
+
+    def close(self) -> None:
+        self._users -= 1
+        if self._users == 0 and self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_output = _SharedJsonLinesWriter()
+
+
+class JsonLinesOutputPipeline:
+    def open_spider(self, spider) -> None:
+        _output.open()
+
+    def close_spider(self, spider) -> None:
+        _output.close()
+
+    def process_item(self, item, spider):
+        _output.write(dict(item))
+        return item
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def _source_since(source: str) -> Optional[datetime]:
+    raw: str = os.getenv("CRAWL_SINCE_SCOPES", "")
+    if not raw:
+        return None
+    try:
+        value = json.loads(raw).get(source)
+        return datetime.fromisoformat(value) if value else None
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _apply_source_since(spider) -> None:
+    """출처 범위의 기준 시각이 있으면 공통 CRAWL_SINCE 대신 쓴다 (spider_opened 시점)."""
+    since: Optional[datetime] = _source_since(spider.source_name)
+    if since is not None:
+        spider.since_dt = since
+
+
+def time_limited_sources(crawlers) -> list[str]:
+    """MAX_CRAWL_TIME에 걸려 스스로 멈춘 스파이더의 출처 이름 목록."""
+    return [
+        crawler.spider.source_name
+        for crawler in crawlers
+        if getattr(crawler.spider, "time_limit_reached", False)
+    ]
+
+
+def run(sources: Optional[list[str]] = None) -> list[str]:
+    """
+    sources(기본값: CRAWL_SOURCES)의 스파이더를 한 CrawlerProcess에서 함께 실행한다.
+    MAX_CRAWL_TIME에 걸려 스스로 멈춘 출처 목록을 반환한다 (모두 끝까지 크롤링했으면 빈 목록).
+    """
+    spider_classes = [resolve_spider(source) for source in (sources or configured_sources())]
+    process = CrawlerProcess(settings=crawler_settings())
+    crawlers = []
+    for spider_cls in spider_classes:
+        crawler = process.create_crawler(spider_cls)
+        crawler.signals.connect(_apply_source_since, signal=signals.spider_opened)
+        process.crawl(crawler)
+        crawlers.append(crawler)
+    print(f"🕷️  크롤링 출처: {', '.join(cls.source_name for cls in spider_classes)}")
+    with profile_section("spider", spider=True):
+        process.start()
+    return time_limited_sources(crawlers)
+
+
+def main(sources: Optional[list[str]] = None) -> None:
+    """프로세스 진입점: 시간 제한으로 멈춘 출처가 있으면 TIME_LIMIT_EXIT_CODE로 종료한다."""
+    limited: list[str] = run(sources)
+    if limited:
+        print(f"⏰ 시간 제한으로 끝까지 크롤링하지 못한 출처: {', '.join(limited)}")
+        sys.exit(TIME_LIMIT_EXIT_CODE)
+
+
+if __name__ == "__main__":
+    main()
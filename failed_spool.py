@@ -0,0 +1,163 @@
+"""
+failed_spool.py
+역할: 발행 실패 기사 로컬 스풀 (append-only 세그먼트, gzip JSONL)
+
+저장할 때마다 새 세그먼트 파일을 만들므로 이전 실행의 실패 기사를 덮어쓰지 않는다.
+세그먼트는 임시 파일에 다 쓴 뒤 이름을 바꿔 공개하므로, 목록에 보이는 세그먼트는 항상 완전하다.
+Lambda의 /tmp는 warm 컨테이너가 재사용되는 동안 유지되므로, 다음 crawl_and_publish가
+Redis에 연결되면 남은 세그먼트를 오래된 순서로 재발행한다 (article_publisher.replay_failed_spool).
+세그먼트는 gzip JSONL이라 bulk_loader.py로도 그대로 적재할 수 있다.
+
+디스크 한도(FAILED_SPOOL_MAX_BYTES)를 넘으면 FAILED_SPOOL_OVERFLOW_KEY가 설정돼 있고 Redis가
+응답하는 경우 세그먼트를 Redis List로 넘기고, 아니면 가장 오래된 세그먼트부터 지워 자리를 만든다.
+
+환경변수 목록:
+  FAILED_SPOOL_DIR          - 스풀 디렉터리 (기본값: /tmp/failed_spool)
+  FAILED_SPOOL_MAX_BYTES    - 스풀 디스크 사용 한도(바이트) (기본값: 67108864)
+  FAILED_SPOOL_OVERFLOW_KEY - 한도 초과 세그먼트를 넘길 Redis List key (미설정 시 오버플로 비활성화)
+"""
+
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Optional
+
+import redis as redis_lib
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPOOL_DIR: str = "/tmp/failed_spool"
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+SEGMENT_SUFFIX: str = ".jsonl.gz"
+
+
+def spool_dir() -> str:
+    return os.environ.get("FAILED_SPOOL_DIR", DEFAULT_SPOOL_DIR)
+
+
+def list_segments() -> list[str]:
+    """완성된 세그먼트 경로를 오래된 순서로 반환한다 (파일 이름이 생성 시각 순)."""
+    directory: str = spool_dir()
+    if not os.path.isdir(directory):
+        return []
+    names: list[str] = sorted(n for n in os.listdir(directory) if n.endswith(SEGMENT_SUFFIX))
+    return [os.path.join(directory, name) for name in names]
+
+
+def _spool_bytes(segments: list[str]) -> int:
+    total: int = 0
+    for path in segments:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def _encode(articles: list[dict]) -> bytes:
+    lines: str = "".join(
+        json.dumps(article, ensure_ascii=False, default=str) + "\n" for article in articles
+    )
+    return gzip.compress(lines.encode("utf-8"))
+
+
+def _overflow(articles: list[dict], redis_client: Optional[redis_lib.Redis]) -> bool:
+    """한도 초과 세그먼트를 Redis List로 넘긴다. 넘기지 못하면 False."""
+    key: str = os.environ.get("FAILED_SPOOL_OVERFLOW_KEY", "")
+    if not key or redis_client is None:
+        return False
+    try:
+        redis_client.rpush(key, json.dumps(articles, ensure_ascii=False, default=str))
+        return True
+    except Exception as exc:
+        logger.warning(f"실패 기사 오버플로 List 저장 실패: {exc}")
+        return False
+
+
+def write_segment(
+    articles: list[dict],
+    redis_client: Optional[redis_lib.Redis] = None,
+) -> Optional[str]:
+    """
+    기사 목록을 새 세그먼트로 저장하고 경로를 반환한다.
+    디스크 한도를 넘어 Redis 오버플로 List로 넘겼으면 None을 반환한다.
+    """
+    data: bytes = _encode(articles)
+    segments: list[str] = list_segments()
+    max_bytes: int = int(os.environ.get("FAILED_SPOOL_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+
+    if _spool_bytes(segments) + len(data) > max_bytes:
+        if _overflow(articles, redis_client):
+            return None
+        # 오버플로할 곳이 없으면 가장 오래된 세그먼트부터 버려 한도를 지킨다
+        while segments and _spool_bytes(segments) + len(data) > max_bytes:
+            oldest: str = segments.pop(0)
+            logger.error(f"실패 스풀 디스크 한도({max_bytes}바이트) 초과 — 가장 오래된 세그먼트 삭제: {oldest}")
+            remove_segment(oldest)
+
+    directory: str = spool_dir()
+    os.makedirs(directory, exist_ok=True)
+    name: str = f"{time.time_ns():020d}-{os.getpid()}{SEGMENT_SUFFIX}"
+    path: str = os.path.join(directory, name)
+    tmp_path: str = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_segment(path: str) -> list[dict]:
+    """세그먼트의 기사 목록을 읽는다. 잘못된 줄은 건너뛴다."""
+    articles: list[dict] = []
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                articles.append(json.loads(line))
+            except ValueError as exc:
+                logger.warning(f"실패 스풀 줄 파싱 실패 (건너뜀) [{path}]: {exc}")
+    return articles
+
+
+def remove_segment(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def peek_overflow(redis_client: redis_lib.Redis) -> Optional[tuple[str, list[dict]]]:
+    """
+    Redis 오버플로 List에서 가장 오래된 세그먼트를 지우지 않고 (원문, 기사 목록)으로 읽는다.
+    비어 있거나 미설정이면 None. 재발행을 마친 뒤 ack_overflow로 지우므로, 도중에 실패하거나
+    프로세스가 죽어도 세그먼트는 List에 남는다. 파싱할 수 없는 세그먼트는 지우고 다음 것을 읽는다.
+    """
+    key: str = os.environ.get("FAILED_SPOOL_OVERFLOW_KEY", "")
+    if not key:
+        return None
+    while True:
+        raw = redis_client.lindex(key, 0)
+        if not raw:
+            return None
+        try:
+            return raw, json.loads(raw)
+        except ValueError as exc:
+            logger.error(f"실패 기사 오버플로 세그먼트 파싱 실패 (삭제): {exc}")
+            redis_client.lrem(key, 1, raw)
+
+
+def ack_overflow(redis_client: redis_lib.Redis, raw: str, remainder: Optional[list[dict]] = None) -> None:
+    """
+    재발행을 마친 오버플로 세그먼트(peek_overflow의 원문)를 List에서 지운다.
+    다시 실패한 기사(remainder)가 있으면 같은 트랜잭션으로 List 맨 앞에 되돌려 다음 실행이 먼저 재발행한다.
+    """
+    key: str = os.environ.get("FAILED_SPOOL_OVERFLOW_KEY", "")
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.lrem(key, 1, raw)
+    if remainder:
+        pipe.lpush(key, json.dumps(remainder, ensure_ascii=False, default=str))
+    pipe.execute()
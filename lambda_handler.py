@@ -1,14 +1,19 @@
 import json
 import logging
+import time
 import traceback
+from typing import Optional
 
 from article_publisher import crawl_and_publish
+from backfill import parse_date, run_backfill
+from profiling import profile_section
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # Lambda 타임아웃 안전 마진 (밀리초)
-# 남은 시간이 이 값 이하면 조기 종료 경고를 남긴다.
+# 남은 시간이 이 값 이하면 조기 종료 경고를 남기고,
+# 크롤링·발행 단계의 마감 시각(deadline)은 남은 시간에서 이 값을 뺀 시점으로 잡는다.
 _TIMEOUT_SAFETY_MARGIN_MS: int = 15_000
 
 
@@ -16,17 +21,34 @@ def handler(event: dict, context) -> dict:
     """
     AWS Lambda handler — EventBridge 스케줄 또는 수동 호출로 진입한다.
 
+    event["mode"] == "backfill"이면 실시간 크롤링 대신 날짜 범위 백필을 실행한다 (backfill.py 참조).
+      {"mode": "backfill", "start": "YYYY-MM-DD", "end": "YYYY-MM-DD", "sections": [...]}
+
     context.get_remaining_time_in_millis() 를 이용해 타임아웃 임박 여부를 감지하고,
+    남은 시간에서 안전 마진을 뺀 마감 시각을 crawl_and_publish에 전달한다.
     처리 결과를 응답 본문에 포함한다.
     """
     source: str = event.get("source", "manual")
-    logger.info(f"Lambda 시작 — source={source}")
+    mode: str = event.get("mode", "incremental")
+    logger.info(f"Lambda 시작 — source={source}, mode={mode}")
 
     # 타임아웃 임박 경고 (크롤링 시작 전 체크)
     _warn_if_timeout_near(context, phase="시작")
 
+    deadline: Optional[float] = _compute_deadline(context)
+
     try:
-        result: dict = crawl_and_publish()
+        # PROFILE_MODE 설정 시에만 프로파일링 (미설정 시 nullcontext)
+        with profile_section("handler"):
+            if mode == "backfill":
+                result: dict = run_backfill(
+                    parse_date(event["start"]),
+                    parse_date(event["end"]),
+                    sections=event.get("sections"),
+                    deadline=deadline,
+                )
+            else:
+                result = crawl_and_publish(deadline=deadline)
 
         # 크롤링 완료 후 남은 시간 로깅
         _warn_if_timeout_near(context, phase="완료")
@@ -34,7 +56,8 @@ def handler(event: dict, context) -> dict:
         logger.info(
             f"Lambda 정상 종료 — "
             f"crawled={result['crawled']}, published={result['published']}, "
-            f"skipped={result['skipped']}, failed={result['failed']}"
+            f"skipped={result['skipped']}, failed={result['failed']}, "
+            f"deferred={result.get('deferred', 0)}"
         )
 
         return {
@@ -43,6 +66,7 @@ def handler(event: dict, context) -> dict:
                 {
                     "message": "News crawling and publishing completed",
                     "source": source,
+                    "mode": mode,
                     "result": result,
                 },
                 ensure_ascii=False,
@@ -66,6 +90,21 @@ def handler(event: dict, context) -> dict:
         }
 
 
+def _compute_deadline(context) -> Optional[float]:
+    """
+    Lambda context의 남은 실행 시간에서 안전 마진을 뺀 마감 시각을
+    time.monotonic() 기준 절대 시각으로 반환한다.
+    context가 None이거나 메서드가 없는 경우(로컬 실행)는 None(시간 제한 없음)을 반환한다.
+    """
+    try:
+        remaining_ms: int = context.get_remaining_time_in_millis()
+    except (AttributeError, TypeError):
+        return None
+    budget_ms: int = max(0, remaining_ms - _TIMEOUT_SAFETY_MARGIN_MS)
+    logger.info(f"작업 마감까지 {budget_ms}ms (안전 마진 {_TIMEOUT_SAFETY_MARGIN_MS}ms 제외)")
+    return time.monotonic() + budget_ms / 1000
+
+
 def _warn_if_timeout_near(context, phase: str = "") -> None:
     """
     Lambda context가 있고 남은 실행 시간이 안전 마진 이하이면 경고를 출력한다.
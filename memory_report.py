@@ -0,0 +1,241 @@
+"""
+memory_report.py
+역할: 단계별 메모리 사용량 리포트 → Lambda 메모리 설정 추천
+
+Lambda는 메모리 설정에 비례해 CPU를 배정하므로(1,769MB = vCPU 1개), 메모리를 줄이면
+비용은 줄지만 CPU 구간이 느려진다. 실행 한 번의 최대 메모리(부모 프로세스 + 스파이더
+subprocess RSS), 벽시계 시간, CPU 시간을 측정해 목표 소요 시간을 만족하는 가장 싼 메모리
+설정을 추천한다.
+
+ru_maxrss는 프로세스 수명 전체의 최대치라 warm 컨테이너에서는 이전 호출의 값이 남는다. 그래서 실행별로
+  - 발행(부모): 실행 시작 시점 RSS + 이번 실행 중 tracemalloc 힙 최대 증가분
+  - 크롤러: 이번 실행의 스파이더 subprocess를 os.wait4로 거두며 얻은 그 프로세스만의 ru_maxrss
+를 재고, 부모의 수명 전체 최대치는 참고용(publisher_lifetime)으로만 싣는다.
+
+MEMORY_PROFILE=true이면 crawl_and_publish가 tracemalloc으로 단계별(dedupe_load, crawl,
+publish) Python 힙 최대치를 기록하고 실행 종료 시 리포트를 저장한다.
+
+환경변수 목록:
+  MEMORY_PROFILE             - "true"이면 메모리 계측 모드 (기본값: "false")
+  MEMORY_REPORT_PATH         - 리포트 JSON 저장 경로 (기본값: /tmp/memory_report.json)
+  MEMORY_TARGET_DURATION_SEC - 추천 기준 목표 소요 시간(초) (기본값: 60)
+  AWS_LAMBDA_FUNCTION_MEMORY_SIZE - 현재 메모리 설정(MB), Lambda가 자동 설정 (로컬 기본값: 1024)
+"""
+
+import json
+import logging
+import os
+import resource
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# 상수 — Lambda 요금/사양 (arm64, ap-northeast-2 기준)
+# ---------------------------------------------------------------------------
+LAMBDA_MEMORY_TIERS_MB: tuple[int, ...] = (
+    128, 256, 512, 768, 1024, 1536, 1769, 2048, 3008, 3538, 4096, 6144, 8192, 10240,
+)
+MB_PER_VCPU: int = 1769
+PRICE_PER_GB_SECOND: float = 0.0000133334
+MEMORY_HEADROOM: float = 1.25        # 측정 최대치 대비 여유율
+MAX_USEFUL_VCPUS: float = 2.0        # 부모(발행) + 스파이더 subprocess 두 프로세스
+
+
+def enabled() -> bool:
+    return os.environ.get("MEMORY_PROFILE", "false").lower() == "true"
+
+
+# ---------------------------------------------------------------------------
+# 자원 사용량 스냅샷
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ResourceSnapshot:
+    """실행 시작 시점의 벽시계·CPU 시간과 메모리 (리포트에서 차이를 계산)."""
+
+    wall: float
+    cpu_self: float
+    cpu_children: float
+    rss_bytes: Optional[int] = None   # 시작 시점 RSS (/proc을 읽을 수 없으면 None)
+    traced_bytes: int = 0             # 시작 시점 tracemalloc 추적 힙
+
+    @classmethod
+    def take(cls) -> "ResourceSnapshot":
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return cls(
+            wall=time.monotonic(),
+            cpu_self=own.ru_utime + own.ru_stime,
+            cpu_children=children.ru_utime + children.ru_stime,
+            rss_bytes=current_rss_bytes(),
+            traced_bytes=tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+        )
+
+
+def peak_rss_bytes() -> int:
+    """현재 프로세스 수명 전체의 최대 RSS(바이트). Linux의 ru_maxrss는 KB 단위."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def current_rss_bytes() -> Optional[int]:
+    """현재 프로세스의 지금 RSS(바이트). /proc/self/statm이 없으면(Linux 외) None."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def reap_child(pid: int, block: bool = False) -> Optional[tuple[int, int]]:
+    """
+    자식 프로세스를 os.wait4로 거둬 (종료 코드, 그 프로세스의 최대 RSS 바이트)를 반환한다.
+    block=False이고 아직 실행 중이면 None. RUSAGE_CHILDREN과 달리 이 자식만의 값이다.
+    """
+    waited_pid, status, usage = os.wait4(pid, 0 if block else os.WNOHANG)
+    if waited_pid == 0:
+        return None
+    return os.waitstatus_to_exitcode(status), usage.ru_maxrss * 1024
+
+
+def run_peak_rss_bytes(run_metrics: metrics.RunMetrics, start: ResourceSnapshot) -> int:
+    """
+    이번 실행 중 발행(부모) 프로세스의 최대 RSS 추정치: 시작 시점 RSS + tracemalloc 힙 최대 증가분.
+    시작 RSS나 단계별 힙 최대치가 없으면 수명 전체 최대치(ru_maxrss)로 대신한다.
+    """
+    if start.rss_bytes is None or not run_metrics.memory_peaks:
+        return peak_rss_bytes()
+    heap_growth: int = max(0, max(run_metrics.memory_peaks.values()) - start.traced_bytes)
+    return start.rss_bytes + heap_growth
+
+
+# ---------------------------------------------------------------------------
+# 메모리 설정 추천
+# ---------------------------------------------------------------------------
+
+def _vcpus(memory_mb: int) -> float:
+    return min(memory_mb / MB_PER_VCPU, MAX_USEFUL_VCPUS)
+
+
+def estimate_duration(
+    memory_mb: int,
+    wall_sec: float,
+    cpu_sec: float,
+    measured_memory_mb: int,
+) -> float:
+    """
+    측정값(measured_memory_mb에서 wall_sec, cpu_sec)을 바탕으로 memory_mb 설정의 소요 시간을 추정한다.
+    CPU 구간은 배정 vCPU에 반비례하고, 나머지(네트워크 대기 등)는 메모리와 무관하다고 본다.
+    """
+    cpu_wall_measured: float = min(wall_sec, cpu_sec / _vcpus(measured_memory_mb))
+    io_wall: float = max(0.0, wall_sec - cpu_wall_measured)
+    return io_wall + cpu_sec / _vcpus(memory_mb)
+
+
+def recommend_memory(
+    peak_bytes: int,
+    wall_sec: float,
+    cpu_sec: float,
+    measured_memory_mb: int,
+    target_sec: float,
+) -> dict:
+    """
+    최대 메모리 × MEMORY_HEADROOM 이상이면서 목표 소요 시간을 만족하는 가장 싼 메모리 설정을 고른다.
+    만족하는 설정이 없으면 추정 소요 시간이 가장 짧은 설정을 고르고 meets_target=False로 표시한다.
+    """
+    required_mb: float = peak_bytes * MEMORY_HEADROOM / (1024 * 1024)
+    candidates: list[dict] = []
+    for tier in LAMBDA_MEMORY_TIERS_MB:
+        if tier < required_mb:
+            continue
+        duration: float = estimate_duration(tier, wall_sec, cpu_sec, measured_memory_mb)
+        candidates.append({
+            "memory_mb": tier,
+            "estimated_duration_sec": round(duration, 3),
+            "estimated_cost_usd": round(duration * tier / 1024 * PRICE_PER_GB_SECOND, 8),
+        })
+
+    if not candidates:
+        return {"required_mb": round(required_mb, 1), "memory_mb": None, "meets_target": False,
+                "candidates": []}
+
+    meeting: list[dict] = [c for c in candidates if c["estimated_duration_sec"] <= target_sec]
+    if meeting:
+        best: dict = min(meeting, key=lambda c: (c["estimated_cost_usd"], c["memory_mb"]))
+    else:
+        best = min(candidates, key=lambda c: (c["estimated_duration_sec"], c["memory_mb"]))
+    return {
+        "required_mb": round(required_mb, 1),
+        **best,
+        "meets_target": bool(meeting),
+        "candidates": candidates,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 리포트
+# ---------------------------------------------------------------------------
+
+def build_report(
+    run_metrics: metrics.RunMetrics,
+    start: ResourceSnapshot,
+    target_sec: Optional[float] = None,
+) -> dict:
+    """실행 지표와 시작 스냅샷으로 단계별 메모리·소요 시간 리포트와 추천을 만든다."""
+    end: ResourceSnapshot = ResourceSnapshot.take()
+    wall_sec: float = end.wall - start.wall
+    cpu_sec: float = (end.cpu_self - start.cpu_self) + (end.cpu_children - start.cpu_children)
+    parent_peak: int = run_peak_rss_bytes(run_metrics, start)
+    crawler_peak: int = int(run_metrics.gauges.get("crawler.peak_rss_bytes", 0))
+    measured_mb: int = int(os.environ.get("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", "1024"))
+    target: float = target_sec if target_sec is not None else float(
+        os.environ.get("MEMORY_TARGET_DURATION_SEC", "60")
+    )
+
+    return {
+        "wall_sec": round(wall_sec, 3),
+        "cpu_sec": round(cpu_sec, 3),
+        "measured_memory_mb": measured_mb,
+        "target_duration_sec": target,
+        "peak_rss_bytes": {
+            "publisher": parent_peak,
+            "crawler": crawler_peak,
+            "publisher_lifetime": peak_rss_bytes(),
+        },
+        "stage_heap_peak_bytes": dict(run_metrics.memory_peaks),
+        "stage_timings_ms": {k: round(v, 3) for k, v in run_metrics.timings.items()},
+        "recommendation": recommend_memory(
+            parent_peak + crawler_peak, wall_sec, cpu_sec, measured_mb, target
+        ),
+    }
+
+
+def write_report(
+    run_metrics: metrics.RunMetrics,
+    start: ResourceSnapshot,
+    path: Optional[str] = None,
+    target_sec: Optional[float] = None,
+) -> dict:
+    """리포트를 만들어 JSON 파일로 저장하고, 추천 결과를 로그로 남긴 뒤 리포트를 반환한다."""
+    report: dict = build_report(run_metrics, start, target_sec)
+    report_path: str = path or os.environ.get("MEMORY_REPORT_PATH", "/tmp/memory_report.json")
+    try:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except OSError as exc:
+        logger.warning(f"메모리 리포트 저장 실패: {exc}")
+
+    rec: dict = report["recommendation"]
+    logger.info(
+        f"메모리 리포트: 최대 RSS 발행 {report['peak_rss_bytes']['publisher'] // 2**20}MB / "
+        f"크롤러 {report['peak_rss_bytes']['crawler'] // 2**20}MB, "
+        f"추천 메모리 {rec.get('memory_mb')}MB "
+        f"(예상 {rec.get('estimated_duration_sec')}초, 목표 충족={rec['meets_target']}) "
+        f"→ {report_path}"
+    )
+    return report
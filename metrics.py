@@ -0,0 +1,323 @@
+"""
+metrics.py
+역할: 실행 단위 성능 지표 수집 → CloudWatch Embedded Metric Format(EMF) 출력
+
+crawl_and_publish 한 번의 실행 동안 단계별 소요 시간, 기사별 지연 분포, 카운터,
+Redis 명령 수를 모은다. Lambda에서는 stdout이 CloudWatch Logs로 전달되므로
+EMF JSON을 한 줄 출력하는 것만으로 지표가 생성되고, 로컬에서는 그대로 stdout에 보인다.
+
+환경변수 목록:
+  METRICS_NAMESPACE - EMF 네임스페이스 (기본값: "EconoEasy/Crawler")
+  METRICS_ENABLED   - "false"이면 EMF 출력 생략, 응답 본문용 요약은 계속 수집 (기본값: "true")
+"""
+
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+# ---------------------------------------------------------------------------
+# 상수
+# ---------------------------------------------------------------------------
+DEFAULT_NAMESPACE: str = "EconoEasy/Crawler"
+EMF_MAX_VALUES: int = 100       # EMF 지표 하나에 담을 수 있는 값 배열 최대 길이
+PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+
+def _percentile(sorted_values: list[float], pct: int) -> float:
+    """정렬된 값 목록에서 nearest-rank 방식으로 백분위수를 구한다."""
+    if not sorted_values:
+        return 0.0
+    rank: int = max(1, -(-pct * len(sorted_values) // 100))  # ceil
+    return sorted_values[rank - 1]
+
+
+def summarize(values: list[float]) -> dict:
+    """값 목록을 count/sum/max/p50/p90/p99 요약으로 변환한다."""
+    ordered: list[float] = sorted(values)
+    summary: dict = {
+        "count": len(ordered),
+        "sum": round(sum(ordered), 3),
+        "max": round(ordered[-1], 3) if ordered else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}"] = round(_percentile(ordered, pct), 3)
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# 실행 단위 지표
+# ---------------------------------------------------------------------------
+
+class RunMetrics:
+    """
+    한 번의 실행에서 수집한 지표 모음.
+
+    - timings:    단계별 누적 소요 시간(ms). stage() / timed_iter()로 기록한다.
+    - counters:   누적 카운터. incr()로 기록한다.
+    - histograms: 기사별 분포(ms, 바이트 등). observe()로 기록한다.
+    - gauges:     마지막 값만 의미 있는 지표(프로세스 최대 RSS 등). set_gauge()로 기록한다.
+    - memory_peaks: track_memory=True일 때 단계별 Python 힙 최대 사용량(바이트, tracemalloc).
+    """
+
+    def __init__(self, track_memory: bool = False) -> None:
+        self.timings: dict[str, float] = {}
+        self.counters: dict[str, float] = {}
+        self.histograms: dict[str, list[float]] = {}
+        self.gauges: dict[str, float] = {}
+        self.memory_peaks: dict[str, int] = {}
+        self.track_memory: bool = track_memory
+        self._owns_tracing: bool = False   # 이 인스턴스가 tracemalloc을 시작했는지
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def close(self) -> None:
+        """이 인스턴스가 시작한 tracemalloc을 멈춘다. with 블록으로 쓰면 예외로 끝나도 호출된다."""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def __enter__(self) -> "RunMetrics":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add_timing(self, name: str, elapsed_ms: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed_ms
+
+    def _begin_memory(self) -> None:
+        if self.track_memory:
+            tracemalloc.reset_peak()
+
+    def _end_memory(self, name: str) -> None:
+        if self.track_memory:
+            peak: int = tracemalloc.get_traced_memory()[1]
+            self.memory_peaks[name] = max(self.memory_peaks.get(name, 0), peak)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with 블록의 소요 시간(과 track_memory 시 최대 메모리)을 name 단계에 누적한다."""
+        self._begin_memory()
+        started: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_timing(name, (time.perf_counter() - started) * 1000)
+            self._end_memory(name)
+
+    def timed_iter(self, name: str, iterable: Iterable) -> Iterator:
+        """
+        iterable의 다음 항목을 기다린 시간만 name 단계에 누적하며 그대로 yield한다.
+        크롤링과 발행이 겹쳐 실행될 때 크롤러를 기다린 시간만 따로 잴 수 있다.
+        """
+        iterator = iter(iterable)
+        while True:
+            self._begin_memory()
+            started: float = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_timing(name, (time.perf_counter() - started) * 1000)
+                self._end_memory(name)
+                return
+            self.add_timing(name, (time.perf_counter() - started) * 1000)
+            self._end_memory(name)
+            yield item
+
+    def incr(self, name: str, value: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    def observe(self, name: str, value: Optional[float]) -> None:
+        if value is None:
+            return
+        self.histograms.setdefault(name, []).append(float(value))
+
+    def summary(self) -> dict:
+        """응답 본문에 넣을 수 있는 JSON 직렬화 가능한 요약을 반환한다."""
+        summary: dict = {
+            "timings_ms": {k: round(v, 3) for k, v in self.timings.items()},
+            "counters": dict(self.counters),
+            "histograms": {k: summarize(v) for k, v in self.histograms.items()},
+        }
+        if self.gauges:
+            summary["gauges"] = dict(self.gauges)
+        if self.memory_peaks:
+            summary["memory_peak_bytes"] = dict(self.memory_peaks)
+        return summary
+
+    def to_emf(self, dimensions: Optional[dict[str, str]] = None) -> dict:
+        """
+        CloudWatch Embedded Metric Format 문서를 만든다.
+        분포 지표는 값이 EMF_MAX_VALUES개 이하면 값 배열 그대로(CloudWatch가 백분위 집계),
+        초과하면 p50/p90/p99/max 개별 지표로 내보낸다.
+        """
+        dims: dict[str, str] = dimensions or {}
+        document: dict = dict(dims)
+        definitions: list[dict] = []
+
+        def put(name: str, value, unit: str) -> None:
+            document[name] = value
+            definitions.append({"Name": name, "Unit": unit})
+
+        for name, value in self.timings.items():
+            put(f"{name}.duration", round(value, 3), "Milliseconds")
+        for name, value in self.counters.items():
+            put(name, value, "Count")
+        for name, value in self.gauges.items():
+            put(name, value, "Bytes" if name.endswith("bytes") else "None")
+        for name, value in self.memory_peaks.items():
+            put(f"{name}.memory_peak", value, "Bytes")
+        for name, values in self.histograms.items():
+            unit: str = "Bytes" if name.endswith("bytes") else "Milliseconds"
+            if len(values) <= EMF_MAX_VALUES:
+                put(name, [round(v, 3) for v in values], unit)
+            else:
+                stats: dict = summarize(values)
+                for key in ("p50", "p90", "p99", "max"):
+                    put(f"{name}.{key}", stats[key], unit)
+
+        document["_aws"] = {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": os.environ.get("METRICS_NAMESPACE", DEFAULT_NAMESPACE),
+                    "Dimensions": [list(dims.keys())],
+                    "Metrics": definitions,
+                }
+            ],
+        }
+        return document
+
+    def emit(self, dimensions: Optional[dict[str, str]] = None) -> None:
+        """EMF 문서를 stdout에 한 줄 JSON으로 출력한다 (Lambda → CloudWatch Logs)."""
+        if os.environ.get("METRICS_ENABLED", "true").lower() == "false":
+            return
+        print(json.dumps(self.to_emf(dimensions), ensure_ascii=False), flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Redis 명령 수 계측
+# ---------------------------------------------------------------------------
+
+def _command_method(target, name: str, proxy, extra: tuple[str, ...] = ()):
+    """
+    target의 Redis 명령 메서드(redis.commands 정의)를 proxy에 묶어 반환한다 (명령이 아니면 None).
+    명령 구현은 self.execute_command로 보내므로, proxy에 묶으면 proxy.execute_command가 실제 실행만 센다.
+    """
+    if name in getattr(target, "__dict__", {}):
+        return None   # 인스턴스에 직접 붙인 메서드(테스트 spy 등)는 그대로 쓴다
+    attr = getattr(type(target), name, None)
+    if not callable(attr):
+        return None
+    if name in extra or getattr(attr, "__module__", "").startswith("redis.commands"):
+        return functools.partial(attr, proxy)
+    return None
+
+
+def _command_name(args: tuple) -> str:
+    return str(args[0]).lower().replace(" ", "_") if args else "unknown"
+
+
+class _InstrumentedPipeline:
+    """
+    Redis pipeline 래퍼: 쌓인 명령 수와 execute 왕복 횟수를 센다.
+    WATCH 뒤 MULTI 전처럼 즉시 실행되는 명령은 명령마다 왕복 1회로 센다.
+    """
+
+    # redis.client.Pipeline에 정의돼 있지만 execute_command로 보내는 명령
+    _IMMEDIATE_METHODS: tuple[str, ...] = ("watch", "unwatch")
+
+    def __init__(self, pipeline, metrics: RunMetrics) -> None:
+        self._pipeline = pipeline
+        self._metrics = metrics
+
+    def execute_command(self, *args, **kwargs):
+        immediate: bool = (
+            (getattr(self._pipeline, "watching", False) or (args and args[0] == "WATCH"))
+            and not getattr(self._pipeline, "explicit_transaction", False)
+        )
+        self._metrics.incr("redis.commands")
+        self._metrics.incr(f"redis.{_command_name(args)}")
+        if immediate:
+            self._metrics.incr("redis.roundtrips")
+        result = self._pipeline.execute_command(*args, **kwargs)
+        return self if result is self._pipeline else result
+
+    def execute(self, *args, **kwargs):
+        if len(self._pipeline):   # 쌓인 명령이 없으면 redis-py가 서버에 보내지 않음
+            self._metrics.incr("redis.roundtrips")
+        return self._pipeline.execute(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        method = _command_method(self._pipeline, name, self, self._IMMEDIATE_METHODS)
+        return method if method is not None else getattr(self._pipeline, name)
+
+    def __len__(self) -> int:
+        return len(self._pipeline)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._pipeline.__exit__(*exc_info)
+
+
+class InstrumentedRedis:
+    """
+    Redis 클라이언트 래퍼: 실제로 실행된 명령 수를 명령별·전체로 RunMetrics에 기록한다.
+    명령 메서드를 이 래퍼에 묶어 호출하므로 execute_command를 거치는 명령만 세고
+    (scan_iter처럼 여러 번 보내는 명령은 보낸 만큼), close·get_encoder 같은 비명령 메서드는 세지 않는다.
+    명령 자체는 원래 클라이언트에 그대로 위임한다.
+    """
+
+    def __init__(self, client, metrics: RunMetrics) -> None:
+        self._client = client
+        self._metrics = metrics
+
+    @property
+    def wrapped(self):
+        return self._client
+
+    def pipeline(self, *args, **kwargs) -> _InstrumentedPipeline:
+        return _InstrumentedPipeline(self._client.pipeline(*args, **kwargs), self._metrics)
+
+    def execute_command(self, *args, **kwargs):
+        self._metrics.incr("redis.commands")
+        self._metrics.incr("redis.roundtrips")
+        self._metrics.incr(f"redis.{_command_name(args)}")
+        return self._client.execute_command(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        method = _command_method(self._client, name, self)
+        return method if method is not None else getattr(self._client, name)
+
+
+# ---------------------------------------------------------------------------
+# 현재 실행 지표 (모듈 전역)
+# ---------------------------------------------------------------------------
+_current: RunMetrics = RunMetrics()
+
+
+def start_run(track_memory: bool = False) -> RunMetrics:
+    """새 실행의 지표 수집을 시작하고, 이후 current()가 이 인스턴스를 반환하게 한다."""
+    global _current
+    _current = RunMetrics(track_memory=track_memory)
+    return _current
+
+
+def current() -> RunMetrics:
+    """현재 실행의 지표 인스턴스를 반환한다."""
+    return _current
+
+
+def default_dimensions() -> dict[str, str]:
+    """EMF 기본 차원: Lambda 함수 이름 (로컬 실행이면 "local")."""
+    return {"Function": os.environ.get("AWS_LAMBDA_FUNCTION_NAME", "local")}
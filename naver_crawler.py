@@ -2,57 +2,177 @@
 naver_crawler.py
 네이버 금융뉴스 스파이더 (BaseNewsSpider 구현체)
 
-크롤링 대상: https://news.naver.com/breakingnews/section/101/259
+크롤링 대상: https://news.naver.com/breakingnews/section/{sid1}/{sid2} (NAVER_SECTIONS)
+  여러 섹션을 한 프로세스·한 다운로더(같은 스케줄러, CONCURRENT_REQUESTS 공유)에서 함께 크롤링한다.
+  기사 개수 한도(MAX_ARTICLES)와 증분 기준 시각은 섹션별로 적용하고, 기사에 section/source를 싣는다.
+  기사 링크는 url_canon 대표 URL로 바꿔 요청하므로, 쿼리·호스트만 다른 같은 기사는 한 번만 내려받는다
+  (여러 섹션 목록에 함께 실린 기사는 먼저 본 섹션으로 수집).
+  기사 페이지의 수정 시각(data-modify-date-time)을 modifiedAt으로 싣고, 기준 시각 이전에 발행됐지만
+  이후에 수정된 기사는 revision=True로 내보낸다 (개수 한도에 세지 않음, 발행 측이 실제 변경만 재발행).
+  기사마다 timings(요청 시작·응답 수신·파싱 완료 시각, epoch ms)를 싣는다. 요청 시작 시각은 응답 수신
+  시각에서 Scrapy download_latency를 뺀 값이다 (요청과 연결되지 않은 응답이면 None).
 
 환경변수 (BaseNewsSpider 공통):
-  MAX_ARTICLES   - 최대 수집 기사 수        (기본값: 10)
+  MAX_ARTICLES   - 최대 수집 기사 수        (기본값: 10, 섹션별 한도)
   MAX_CRAWL_TIME - 크롤링 제한 시간(초)     (기본값: 300)
   CRAWL_SINCE    - 이 시각 이후 기사만 수집  (ISO 8601, 증분 크롤링용)
-  OUTPUT_FILE_PATH - 결과 JSONL 파일 경로   (기본값: output.json)
+
+환경변수 (섹션):
+  NAVER_SECTIONS     - 크롤링할 섹션 목록, 쉼표 구분 "sid1/sid2" (기본값: "101/259")
+  NAVER_BASE_URL     - 목록 페이지 호스트 (기본값: https://news.naver.com,
+                       부하 테스트에서는 benchmarks/naver_stub.py 주소)
+  CRAWL_SINCE_SCOPES - 범위별 증분 기준 시각 JSON {"<source>:<sid1>/<sid2>": ISO 8601, ...}
+                       (article_publisher가 전달, 없는 범위는 CRAWL_SINCE 사용)
+
+NaverFinanceBackfillCrawler는 같은 파싱 로직으로 날짜별 목록(?date=YYYYMMDD)을 훑는 백필용 스파이더다.
+  목록은 &page=N으로 다음 페이지를 따라가며, 새 기사 링크가 없는 페이지가 나오면 그 섹션·날짜를 끝낸다.
+  BACKFILL_DATES     - 크롤링할 날짜 목록, 쉼표 구분 YYYYMMDD (backfill.py가 전달)
+  BACKFILL_MAX_PAGES - 섹션·날짜별로 따라갈 최대 목록 페이지 수 (기본값: 100)
+
+Scrapy 설정·출력(OUTPUT_FILE_PATH)·응답 녹화/재생·프로파일링은 실행기(crawl_runner.py)가 담당하며,
+이 파일을 직접 실행하면 이 스파이더만 실행기로 돌린다.
 """
 
+import json
 import os
+import re
 import time
+from datetime import datetime
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
 import scrapy
 from dotenv import load_dotenv
-from scrapy.crawler import CrawlerProcess
 
+import url_canon
 from base_spider import BaseNewsSpider
 
 load_dotenv()
 
+DEFAULT_BASE_URL = "https://news.naver.com"
+DEFAULT_SECTION = "101/259"
+_SECTION_URL_RE = re.compile(r"/breakingnews/section/(\d+/\d+)")
+
+
+def configured_sections() -> list[str]:
+    raw = os.getenv("NAVER_SECTIONS", DEFAULT_SECTION)
+    sections = [s.strip().strip("/") for s in raw.split(",") if s.strip()]
+    return sections or [DEFAULT_SECTION]
+
+
+def section_url(section: str) -> str:
+    base = os.getenv("NAVER_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+    return f"{base}/breakingnews/section/{section}"
+
+
+def _naive(dt: datetime) -> datetime:
+    """aware/naive가 섞인 비교를 피하기 위해 시간대 정보를 떼어 낸다."""
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
 
 class NaverFinanceNewsCrawler(BaseNewsSpider):
     name = "naver_news"
     source_name = "naver_finance"
-    start_urls = ["https://news.naver.com/breakingnews/section/101/259"]
+    sections = configured_sections()
+    start_urls = [section_url(section) for section in sections]
 
-    def parse(self, response):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.section_counts: dict[str, int] = {}
+        self.section_skipped: dict[str, int] = {}
+        self.since_by_scope: dict[str, datetime] = {}
+        self.requested_urls: set[str] = set()
+        self.time_limit_reached: bool = False   # MAX_CRAWL_TIME에 걸려 스스로 멈췄는지 (crawl_runner 참조)
+        raw_scopes = os.getenv("CRAWL_SINCE_SCOPES", "")
+        if raw_scopes:
+            try:
+                self.since_by_scope = {
+                    scope: datetime.fromisoformat(value)
+                    for scope, value in json.loads(raw_scopes).items()
+                }
+            except (ValueError, TypeError, AttributeError) as exc:
+                print(f"⚠️  CRAWL_SINCE_SCOPES 해석 실패, CRAWL_SINCE만 사용: {exc}")
+
+    def scope(self, section: str) -> str:
+        """증분 기준 시각·통계를 나누는 단위 ("<source>:<section>")."""
+        return f"{self.source_name}:{section}"
+
+    def _time_limit_hit(self) -> bool:
+        """MAX_CRAWL_TIME을 넘겼으면 time_limit_reached에 기록하고 True를 반환한다."""
         if self._time_exceeded():
+            self.time_limit_reached = True
+        return self.time_limit_reached
+
+    def _count_reached(self) -> bool:
+        # MAX_ARTICLES는 섹션별 한도이므로 전체 한도는 섹션 수만큼
+        return self.count >= self.max_articles * len(self.sections)
+
+    def _section_count_reached(self, section: str) -> bool:
+        return self.section_counts.get(section, 0) >= self.max_articles
+
+    def _should_skip_for_section(self, section: str, published_at: Optional[str]) -> bool:
+        """섹션 범위의 기준 시각이 있으면 그것으로, 없으면 공통 since_dt로 판단한다."""
+        since = self.since_by_scope.get(self.scope(section))
+        if since is None:
+            return self._should_skip_by_date(published_at)
+        if not published_at:
+            return False
+        try:
+            return _naive(datetime.fromisoformat(published_at)) < _naive(since)
+        except ValueError:
+            return False
+
+    def parse(self, response):
+        if self._time_limit_hit():
             print(f"⏰ 시간 제한({self.max_crawl_time}초) 도달, 크롤링 종료")
             return
 
+        match = _SECTION_URL_RE.search(response.url)
+        section = match.group(1) if match else self.sections[0]
+
         links = response.css(
             "ul.sa_list li.sa_item a.sa_text_title::attr(href)"
         ).getall()
         for link in links[: self.max_articles]:
             if not link.startswith("http"):
                 link = "https://n.news.naver.com" + link
-            yield scrapy.Request(link, callback=self.parse_article)
+            link = url_canon.canonical_url(link)
+            if link in self.requested_urls:
+                continue
+            self.requested_urls.add(link)
+            yield scrapy.Request(link, callback=self.parse_article, meta={"section": section})
+
+    @staticmethod
+    def _response_meta(response) -> dict:
+        """요청과 연결되지 않은 응답(테스트에서 직접 만든 응답 등)이면 빈 meta를 반환한다."""
+        try:
+            return response.meta
+        except AttributeError:
+            return {}
 
     def parse_article(self, response):
-        if self._time_exceeded():
+        parse_start = time.perf_counter()
+
+        if self._time_limit_hit():
             print(f"⏰ 시간 제한({self.max_crawl_time}초) 도달, 크롤링 종료")
             return
 
+        section = self._response_meta(response).get("section", self.sections[0])
+
         if self._count_reached():
-            print(f"📊 기사 개수 제한({self.max_articles}개) 도달, 크롤링 종료")
+            print(f"📊 기사 개수 제한({self.max_articles}개 × {len(self.sections)}개 섹션) 도달, 크롤링 종료")
+            return
+
+        if self._section_count_reached(section):
+            print(f"📊 섹션 {section} 기사 개수 제한({self.max_articles}개) 도달, skip — {response.url}")
             return
 
         if self.count == 0:
             print(f"\n🕒 Start: {time.strftime('%X')}")
-            print(f"📊 목표: {self.max_articles}개 기사, 시간 제한: {self.max_crawl_time}초")
+            print(
+                f"📊 목표: 섹션 {', '.join(self.sections)} 각 {self.max_articles}개 기사, "
+                f"시간 제한: {self.max_crawl_time}초"
+            )
             if self.since_dt:
                 print(f"📅 증분 크롤링: {self.since_dt.isoformat()} 이후 기사만 수집")
 
@@ -62,6 +182,9 @@ class NaverFinanceNewsCrawler(BaseNewsSpider):
         date = response.css(
             ".media_end_head_info_datestamp_time._ARTICLE_DATE_TIME::attr(data-date-time)"
         ).get()
+        modified = response.css(
+            ".media_end_head_info_datestamp_time._ARTICLE_MODIFY_DATE_TIME::attr(data-modify-date-time)"
+        ).get()
 
         press = response.css(".media_end_head_top_logo img::attr(alt)").get()
         if not press:
@@ -70,13 +193,23 @@ class NaverFinanceNewsCrawler(BaseNewsSpider):
             press = "알 수 없음"
 
         published_at = self.format_date_iso(date) if date else None
+        modified_at = self.format_date_iso(modified) if modified else None
 
-        # 증분 크롤링: 기준 시각 이전 기사 건너뜀
-        if self._should_skip_by_date(published_at):
+        # 증분 크롤링: 기준 시각 이전 기사 건너뜀 (단, 기준 시각 이후에 수정된 기사는 수정 확인용으로 전달)
+        if self._should_skip_for_section(section, published_at):
+            if modified_at and not self._should_skip_for_section(section, modified_at):
+                print(f"✏️  수정 기사 (기준 이전 발행, 이후 수정 {modified_at}) — {response.url}")
+                yield self._article_item(
+                    response, section, title, content, published_at, modified_at, press, parse_start,
+                    revision=True,
+                )
+                return
+            self.section_skipped[section] = self.section_skipped.get(section, 0) + 1
             print(f"⏭️  증분 skip (기준 이전): {published_at} — {response.url}")
             return
 
-        print(f"\n📄 [{self.count + 1}/{self.max_articles}] {response.url}")
+        section_count = self.section_counts.get(section, 0)
+        print(f"\n📄 [{section} {section_count + 1}/{self.max_articles}] {response.url}")
         print(f"언론사: {press}")
         print(f"제목: {title.strip() if title else '없음'}")
         print(f"본문 길이: {len(content.strip()) if content else 0}자")
@@ -84,37 +217,111 @@ class NaverFinanceNewsCrawler(BaseNewsSpider):
             print(f"날짜: {published_at}")
 
         self.count += 1
+        self.section_counts[section] = section_count + 1
 
-        if self.count >= self.max_articles:
+        if self._count_reached():
             elapsed = round(time.time() - self.start_time, 3)
             print(f"\n✅ 크롤링 완료! {self.count}개 기사, 소요 시간: {elapsed}초")
 
-        yield {
+        yield self._article_item(
+            response, section, title, content, published_at, modified_at, press, parse_start
+        )
+
+    def _article_item(
+        self, response, section, title, content, published_at, modified_at, press, parse_start,
+        revision: bool = False,
+    ) -> dict:
+        download_latency = self._response_meta(response).get("download_latency")
+        parse_ms = (time.perf_counter() - parse_start) * 1000
+        parse_end_ms = time.time() * 1000
+        fetch_end_ms = parse_end_ms - parse_ms
+        item = {
             "title": title.strip() if title else "제목 없음",
             "content": content.strip() if content else "",
             "publishedAt": published_at,
-            "url": response.url,
+            "modifiedAt": modified_at,
+            "url": url_canon.canonical_url(response.url),
             "press": press,
+            "section": section,
+            "source": self.source_name,
+            # 발행 측 지표 집계용 (Stream 메시지에는 포함되지 않음)
+            "crawlMetrics": {
+                "downloadLatencyMs": (
+                    round(download_latency * 1000, 3) if download_latency is not None else None
+                ),
+                "parseLatencyMs": round(parse_ms, 3),
+                "bytes": len(response.body),
+            },
+            # 단계별 시각(epoch ms) — 발행 측이 publishMs를 더해 Stream 메시지에 싣는다
+            "timings": {
+                "fetchStartMs": (
+                    int(fetch_end_ms - download_latency * 1000) if download_latency is not None else None
+                ),
+                "fetchEndMs": int(fetch_end_ms),
+                "parseEndMs": int(parse_end_ms),
+            },
         }
+        if revision:
+            item["revision"] = True
+        return item
+
+    def closed(self, reason):
+        for section in self.sections:
+            print(
+                f"📊 섹션 {section}: 수집 {self.section_counts.get(section, 0)}건, "
+                f"증분 skip {self.section_skipped.get(section, 0)}건"
+            )
+        parent_closed = getattr(super(), "closed", None)
+        if parent_closed is not None:
+            parent_closed(reason)
+
+
+class NaverFinanceBackfillCrawler(NaverFinanceNewsCrawler):
+    """
+    과거 기사 백필용: 섹션 × 날짜별 목록 페이지를 시작점으로 삼는다.
+    증분 기준 시각은 쓰지 않으며(backfill.py가 CRAWL_SINCE를 넘기지 않음), 기사 형식은 실시간 크롤링과 같다.
+    """
+
+    name = "naver_news_backfill"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        dates = [d.strip() for d in os.getenv("BACKFILL_DATES", "").split(",") if d.strip()]
+        self.start_urls = [
+            f"{section_url(section)}?date={date}" for date in dates for section in self.sections
+        ]
+        self.max_pages = int(os.getenv("BACKFILL_MAX_PAGES", "100"))
+
+    @staticmethod
+    def page_url(url: str, page: int) -> str:
+        """목록 URL의 page 쿼리를 바꾼다 (date 등 다른 쿼리는 유지)."""
+        parts = urlsplit(url)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        query["page"] = str(page)
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def parse(self, response):
+        # 이미 요청한 링크만 있는 페이지(마지막 페이지를 넘긴 경우 포함)에서 멈춘다
+        requested_before = len(self.requested_urls)
+        yield from super().parse(response)
+        if len(self.requested_urls) == requested_before or self._time_limit_hit():
+            return
+
+        match = _SECTION_URL_RE.search(response.url)
+        section = match.group(1) if match else self.sections[0]
+        if self._section_count_reached(section):
+            return
+        page = self._response_meta(response).get("page", 1)
+        if page >= self.max_pages:
+            print(f"⚠️  섹션 {section} 목록 {self.max_pages}페이지 도달, 이후 페이지는 건너뜀 — {response.url}")
+            return
+        yield scrapy.Request(
+            self.page_url(response.url, page + 1), callback=self.parse, meta={"page": page + 1}
+        )
 
 
 if __name__ == "__main__":
-    output_path = os.getenv("OUTPUT_FILE_PATH", "output.json")
-    process = CrawlerProcess(
-        settings={
-            "USER_AGENT": (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            ),
-            "LOG_LEVEL": "INFO",
-            "FEED_FORMAT": "jsonlines",
-            "FEED_URI": output_path,
-            "CONCURRENT_REQUESTS": 2,
-            "DOWNLOAD_DELAY": 1,
-            "DOWNLOAD_TIMEOUT": 10,
-            "RETRY_TIMES": 2,
-            "ROBOTSTXT_OBEY": False,
-        }
-    )
-    process.crawl(NaverFinanceNewsCrawler)
-    process.start()
+    # 단독 실행: 이 스파이더만 실행 (여러 출처를 함께 돌릴 때는 crawl_runner.py)
+    import crawl_runner
+
+    crawl_runner.main(["naver_finance"])
@@ -0,0 +1,162 @@
+"""
+near_dup.py
+역할: 유사(near-duplicate) 기사 탐지 — 본문 SimHash 지문 + Redis 밴드 색인
+
+URL 중복 확인(is_duplicate)은 같은 기사를 다른 언론사·다른 기사 ID로 다시 낸 경우를 잡지 못한다.
+본문을 단어 2-gram 집합으로 바꿔 64비트 SimHash 지문을 만들고, 해밍 거리가
+NEAR_DUP_MAX_DISTANCE 이하인 지문이 시간 창(NEAR_DUP_WINDOW_SEC) 안에 있으면 유사 기사로 본다.
+
+색인: 지문을 (거리+1)개 밴드로 나누면 거리 이하인 두 지문은 적어도 한 밴드가 정확히 같다(비둘기집).
+밴드마다 "<prefix>:<밴드 번호>:<밴드 값>" Sorted Set에 "<지문>|<url>"을 발행 시각(score)으로 넣고,
+조회는 같은 밴드 값의 후보만 꺼내 해밍 거리를 잰다. 조회·등록·창 밖 항목 정리를 pipeline
+한 번(기사당 왕복 1회)에 처리하므로 기사 수와 무관하게 기사당 비용이 거의 일정하다.
+자기 자신(같은 URL)은 후보에서 제외하므로 발행 실패 후 재시도해도 스스로와 겹치지 않는다.
+
+환경변수 목록:
+  NEAR_DUP_FILTER       - "true"이면 crawl_and_publish에서 유사 기사를 발행하지 않음 (기본값: "false")
+  NEAR_DUP_MAX_DISTANCE - 유사 기사로 볼 최대 해밍 거리, 0~15 (기본값: 6)
+                          무관한 기사끼리는 보통 20 이상, 머리말·꼬리말만 다른 전재본은 6 이하
+  NEAR_DUP_WINDOW_SEC   - 비교 대상 시간 창(초) (기본값: 172800 = 2일)
+  NEAR_DUP_KEY_PREFIX   - 색인 key 접두어 (기본값: "<REDIS_PUBLISHED_URLS_KEY>:simhash")
+  NEAR_DUP_MIN_FEATURES - 특징(단어 2-gram)이 이보다 적은 짧은 본문은 검사하지 않음 (기본값: 8)
+"""
+
+import hashlib
+import os
+import re
+import time
+from typing import Optional
+
+import redis as redis_lib
+
+FINGERPRINT_BITS: int = 64
+DEFAULT_MAX_DISTANCE: int = 6
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+# ---------------------------------------------------------------------------
+# 지문
+# ---------------------------------------------------------------------------
+
+def features(text: str) -> set[str]:
+    """본문을 정규화한 단어 2-gram 집합 (구두점·공백 차이와 반복 문장에 둔감)."""
+    tokens: list[str] = _TOKEN_RE.findall(text.lower())
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def _feature_hash(feature: str) -> int:
+    # 내장 hash()는 프로세스마다 달라지므로(PYTHONHASHSEED) 실행 간 비교 가능한 해시를 쓴다
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(feats: set[str]) -> int:
+    """
+    특징 집합의 64비트 SimHash. 비트별로 1인 특징이 과반이면 그 비트를 1로 둔다.
+
+    비트별 개수는 64개 카운터 대신 비트 평면(bit-sliced) 덧셈으로 센다: planes[j]의 i번째 비트가
+    i번 비트 개수의 2^j 자리다. 특징 하나를 더하는 비용이 정수 연산 몇 번이라 순수 Python으로도 빠르다.
+    """
+    planes: list[int] = []
+    for feature in feats:
+        carry: int = _feature_hash(feature)
+        j: int = 0
+        while carry:
+            if j == len(planes):
+                planes.append(0)
+            planes[j], carry = planes[j] ^ carry, planes[j] & carry
+            j += 1
+
+    half: int = len(feats) // 2
+    fingerprint: int = 0
+    for bit in range(FINGERPRINT_BITS):
+        count: int = 0
+        for j, plane in enumerate(planes):
+            count |= ((plane >> bit) & 1) << j
+        if count > half:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+# ---------------------------------------------------------------------------
+# Redis 색인
+# ---------------------------------------------------------------------------
+
+class NearDupIndex:
+    """시간 창 안의 지문을 밴드별 Sorted Set으로 색인한다."""
+
+    def __init__(
+        self,
+        redis_client: redis_lib.Redis,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        window_sec: int = 2 * 24 * 3600,
+        prefix: str = "",
+        min_features: int = 8,
+    ) -> None:
+        self.redis = redis_client
+        self.max_distance: int = min(max(max_distance, 0), 15)
+        self.window_sec: int = window_sec
+        self.prefix: str = prefix or f"{os.environ['REDIS_PUBLISHED_URLS_KEY']}:simhash"
+        self.min_features: int = min_features
+        band_count: int = self.max_distance + 1
+        # 64비트를 빠짐없이 밴드로 나눈다 (나누어떨어지지 않으면 밴드 폭이 1비트씩 다름)
+        edges: list[int] = [i * FINGERPRINT_BITS // band_count for i in range(band_count + 1)]
+        self._bands: list[tuple[int, int]] = [
+            (start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])
+        ]
+
+    @classmethod
+    def from_env(cls, redis_client: redis_lib.Redis) -> Optional["NearDupIndex"]:
+        """NEAR_DUP_FILTER=true일 때만 색인을 만든다 (아니면 None)."""
+        if os.environ.get("NEAR_DUP_FILTER", "false").lower() != "true":
+            return None
+        return cls(
+            redis_client,
+            max_distance=int(os.environ.get("NEAR_DUP_MAX_DISTANCE", str(DEFAULT_MAX_DISTANCE))),
+            window_sec=int(os.environ.get("NEAR_DUP_WINDOW_SEC", str(2 * 24 * 3600))),
+            prefix=os.environ.get("NEAR_DUP_KEY_PREFIX", ""),
+            min_features=int(os.environ.get("NEAR_DUP_MIN_FEATURES", "8")),
+        )
+
+    def _band_keys(self, fingerprint: int) -> list[str]:
+        return [
+            f"{self.prefix}:{index}:{(fingerprint >> start) & mask:x}"
+            for index, (start, mask) in enumerate(self._bands)
+        ]
+
+    def check_and_add(self, url: str, text: str) -> Optional[str]:
+        """
+        본문과 유사한 기사가 시간 창 안에 있으면 그 URL을, 없으면 None을 반환하고,
+        어느 쪽이든 이 기사의 지문을 색인에 넣는다 (Redis 왕복 1회).
+        """
+        feats: set[str] = features(text)
+        if len(feats) < self.min_features:
+            return None
+        fingerprint: int = simhash(feats)
+        now: float = time.time()
+        member: str = f"{fingerprint:016x}|{url}"
+
+        pipe = self.redis.pipeline(transaction=False)
+        keys: list[str] = self._band_keys(fingerprint)
+        for key in keys:
+            pipe.zremrangebyscore(key, "-inf", now - self.window_sec)
+            pipe.zrange(key, 0, -1)
+            pipe.zadd(key, {member: now})
+            pipe.expire(key, self.window_sec)
+        results: list = pipe.execute()
+
+        best: Optional[tuple[int, str]] = None
+        for candidates in results[1::4]:
+            for candidate in candidates:
+                if isinstance(candidate, bytes):
+                    candidate = candidate.decode()
+                hex_fp, _, other_url = candidate.partition("|")
+                if other_url == url:
+                    continue
+                distance: int = hamming(fingerprint, int(hex_fp, 16))
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, other_url)
+        return best[1] if best else None
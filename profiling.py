@@ -0,0 +1,175 @@
+"""
+profiling.py
+역할: 환경변수로 켜는 CPU 프로파일링 훅 (handler / 스파이더 subprocess)
+
+PROFILE_MODE가 비어 있으면 profile_section()은 아무 일도 하지 않는 nullcontext를 반환하므로
+평상시 오버헤드는 환경변수 조회 한 번뿐이다.
+
+환경변수 목록:
+  PROFILE_MODE               - "" (끔, 기본값) / "sample" (SIGPROF 샘플링) / "cprofile" (결정적)
+  PROFILE_SPIDER             - "true"이면 스파이더 subprocess(crawl_runner.py)도 프로파일링
+  PROFILE_OUTPUT_DIR         - 프로파일 파일 저장 디렉터리 (기본값: /tmp)
+  PROFILE_TOP_N              - 로그로 요약할 상위 함수 수 (기본값: 15)
+  PROFILE_SAMPLE_INTERVAL_MS - sample 모드 샘플링 간격(CPU 시간 기준, ms) (기본값: 5)
+  PROFILE_S3_BUCKET          - 설정 시 프로파일 파일을 s3://<bucket>/profiles/ 로 업로드
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import signal
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_MAX_STACK_DEPTH: int = 64
+
+
+def _enabled_mode(spider: bool) -> str:
+    mode: str = os.environ.get("PROFILE_MODE", "").strip().lower()
+    if spider and os.environ.get("PROFILE_SPIDER", "false").lower() != "true":
+        return ""
+    return mode
+
+
+def profile_section(name: str, *, spider: bool = False) -> ContextManager:
+    """
+    with 블록을 PROFILE_MODE에 따라 프로파일링하는 컨텍스트 매니저를 반환한다.
+
+    Args:
+        name:   결과 파일 이름과 로그에 쓰는 구간 이름 (예: "handler", "spider")
+        spider: True이면 PROFILE_SPIDER=true일 때만 활성화한다.
+    """
+    mode: str = _enabled_mode(spider)
+    if not mode:
+        return nullcontext()
+    if mode == "sample":
+        if threading.current_thread() is not threading.main_thread():
+            logger.warning("sample 프로파일링은 메인 스레드에서만 가능 — cprofile로 대체")
+            return _cprofile_section(name)
+        return _sample_section(name)
+    if mode == "cprofile":
+        return _cprofile_section(name)
+    logger.warning(f"알 수 없는 PROFILE_MODE={mode} — 프로파일링 생략")
+    return nullcontext()
+
+
+def _output_path(name: str, suffix: str) -> str:
+    directory: str = os.environ.get("PROFILE_OUTPUT_DIR", "/tmp")
+    return os.path.join(directory, f"profile-{name}-{int(time.time())}-{os.getpid()}.{suffix}")
+
+
+def _top_n() -> int:
+    return int(os.environ.get("PROFILE_TOP_N", "15"))
+
+
+# ---------------------------------------------------------------------------
+# sample 모드 — SIGPROF 기반 스택 샘플링 → collapsed stack
+# ---------------------------------------------------------------------------
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+@contextmanager
+def _sample_section(name: str) -> Iterator[None]:
+    """
+    ITIMER_PROF 타이머로 메인 스레드 스택을 주기적으로 샘플링해
+    "root;caller;callee 횟수" 형식(collapsed stack, flamegraph.pl 입력)으로 저장한다.
+    """
+    interval: float = float(os.environ.get("PROFILE_SAMPLE_INTERVAL_MS", "5")) / 1000
+    stacks: dict[str, int] = {}
+
+    def on_sample(signum, frame) -> None:
+        labels: list[str] = []
+        while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        key: str = ";".join(reversed(labels))
+        stacks[key] = stacks.get(key, 0) + 1
+
+    previous = signal.signal(signal.SIGPROF, on_sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, previous)
+        _report_samples(name, stacks)
+
+
+def _report_samples(name: str, stacks: dict[str, int]) -> None:
+    total: int = sum(stacks.values())
+    if total == 0:
+        logger.info(f"[profile:{name}] 샘플 없음 (CPU 사용 시간이 샘플링 간격보다 짧음)")
+        return
+
+    path: str = _output_path(name, "collapsed")
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, count in sorted(stacks.items(), key=lambda kv: -kv[1]):
+            f.write(f"{stack} {count}\n")
+
+    # 자기 시간(self time): 스택 맨 끝 프레임 기준 집계
+    self_counts: dict[str, int] = {}
+    for stack, count in stacks.items():
+        leaf: str = stack.rsplit(";", 1)[-1]
+        self_counts[leaf] = self_counts.get(leaf, 0) + count
+    top = sorted(self_counts.items(), key=lambda kv: -kv[1])[:_top_n()]
+    lines: str = "\n".join(
+        f"  {count / total:6.1%}  {count:6d}  {label}" for label, count in top
+    )
+    logger.info(f"[profile:{name}] 샘플 {total}개, 상위 함수(self):\n{lines}\n저장: {path}")
+    _upload(path)
+
+
+# ---------------------------------------------------------------------------
+# cprofile 모드 — 결정적 프로파일링
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _cprofile_section(name: str) -> Iterator[None]:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path: str = _output_path(name, "prof")
+        profiler.dump_stats(path)
+
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer)
+        stats.sort_stats("cumulative").print_stats(_top_n())
+        logger.info(f"[profile:{name}] 상위 함수(cumulative):\n{buffer.getvalue()}저장: {path}")
+        _upload(path)
+
+
+# ---------------------------------------------------------------------------
+# 업로드
+# ---------------------------------------------------------------------------
+
+def _upload(path: str) -> Optional[str]:
+    """PROFILE_S3_BUCKET이 설정돼 있으면 프로파일 파일을 S3에 올리고 URI를 반환한다."""
+    bucket: str = os.environ.get("PROFILE_S3_BUCKET", "")
+    if not bucket:
+        return None
+    try:
+        import boto3  # Lambda 런타임에 기본 포함, 로컬에서는 선택 설치
+    except ImportError:
+        logger.warning("boto3 미설치 — 프로파일 업로드 생략")
+        return None
+    key: str = f"profiles/{os.path.basename(path)}"
+    try:
+        boto3.client("s3").upload_file(path, bucket, key)
+    except Exception as exc:
+        logger.warning(f"프로파일 업로드 실패: {exc}")
+        return None
+    uri: str = f"s3://{bucket}/{key}"
+    logger.info(f"프로파일 업로드 완료: {uri}")
+    return uri
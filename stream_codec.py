@@ -0,0 +1,213 @@
+"""
+stream_codec.py
+역할: Redis Stream 메시지 본문(content) 압축 인코딩·본문 참조 저장 / consumer용 디코딩
+
+STREAM_MAXLEN(1만 건) × 본문 최대 CONTENT_MAX_LEN(5만 자, 한글 UTF-8 최대 약 150KB)이면 Stream만으로
+ElastiCache 메모리를 수백 MB 쓰므로, 본문을 zlib 또는 zstd로 압축해 싣는 모드를 둔다.
+Redis 클라이언트가 decode_responses=True라 바이너리를 그대로 넣으면 읽는 쪽에서 깨지므로
+압축 결과는 base64 ASCII 문자열로 저장하고, 메시지에 codec 필드(CODEC_FIELD)를 함께 남긴다.
+codec 필드가 없는 메시지는 평문 본문이므로 consumer는 decode_message()만 거치면 두 형식을 모두 읽는다.
+
+  codec 필드 값: "zlib+b64" / "zstd+b64"
+
+본문 참조 모드(STREAM_CONTENT_MODE=ref): 본문(압축했다면 압축된 형태)을 내용 해시(SHA-256) key에
+TTL과 함께 한 번만 저장하고, Stream 메시지에는 본문 대신 해시(REF_FIELD)만 싣는다.
+연합뉴스 전재 기사처럼 본문이 같은 기사는 같은 key를 가리키므로 본문 메모리가 추가로 들지 않고,
+메시지가 작아져 consumer가 XREAD로 큰 배치를 싸게 읽을 수 있다. consumer는 decode_messages로
+배치의 본문을 MGET 한 번에 채운다. TTL은 같은 본문이 다시 발행될 때마다 연장된다.
+
+환경변수 목록:
+  STREAM_PAYLOAD_CODEC     - "none" / "zlib" / "zstd" (기본값: "none")
+                             zstd는 zstandard 패키지가 없으면 zlib으로 대체
+  STREAM_PAYLOAD_LEVEL     - 압축 레벨 (기본값: zlib 6, zstd 3)
+  STREAM_PAYLOAD_MIN_BYTES - 본문이 이 바이트 수보다 짧으면 압축하지 않음 (기본값: 512)
+  STREAM_CONTENT_MODE      - "inline"(본문을 메시지에) / "ref"(내용 해시 key 참조) (기본값: "inline")
+  STREAM_CONTENT_KEY_PREFIX - 본문 key 접두어 (기본값: "<REDIS_ARTICLE_STREAM_KEY>:content")
+  STREAM_CONTENT_TTL_SEC   - 본문 key TTL(초), Stream 항목 보존 기간보다 길게 (기본값: 604800)
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import threading
+import zlib
+from typing import Optional
+
+try:
+    import zstandard as _zstd
+except ImportError:  # zstandard 미설치 환경에서는 zlib으로 대체
+    _zstd = None
+
+logger = logging.getLogger(__name__)
+
+CODEC_FIELD: str = "contentCodec"
+REF_FIELD: str = "contentRef"
+DEFAULT_CONTENT_TTL_SEC: int = 7 * 24 * 3600
+_DEFAULT_LEVELS: dict[str, int] = {"zlib": 6, "zstd": 3}
+
+# zstd 압축·해제 객체는 스레드 간 공유할 수 없으므로 스레드별로 만든다 (bulk_loader 워커 등)
+_local = threading.local()
+_zstd_fallback_warned: bool = False
+
+
+# ---------------------------------------------------------------------------
+# 본문 압축
+# ---------------------------------------------------------------------------
+
+def configured_codec() -> str:
+    """STREAM_PAYLOAD_CODEC 값 ("none" / "zlib" / "zstd"). 쓸 수 없는 값이면 대체 codec을 반환한다."""
+    global _zstd_fallback_warned
+    codec: str = os.environ.get("STREAM_PAYLOAD_CODEC", "none").strip().lower() or "none"
+    if codec == "zstd" and _zstd is None:
+        if not _zstd_fallback_warned:
+            logger.warning("STREAM_PAYLOAD_CODEC=zstd이지만 zstandard 미설치 — zlib으로 대체")
+            _zstd_fallback_warned = True
+        return "zlib"
+    if codec not in ("none", "zlib", "zstd"):
+        logger.warning(f"알 수 없는 STREAM_PAYLOAD_CODEC={codec} — 압축하지 않음")
+        return "none"
+    return codec
+
+
+def _level(codec: str) -> int:
+    return int(os.environ.get("STREAM_PAYLOAD_LEVEL", str(_DEFAULT_LEVELS[codec])))
+
+
+def _zstd_compressor(level: int):
+    cache: dict = _local.__dict__.setdefault("compressors", {})
+    if level not in cache:
+        cache[level] = _zstd.ZstdCompressor(level=level)
+    return cache[level]
+
+
+def _zstd_decompressor():
+    if not hasattr(_local, "decompressor"):
+        _local.decompressor = _zstd.ZstdDecompressor()
+    return _local.decompressor
+
+
+def compress(data: bytes, codec: str, level: Optional[int] = None) -> bytes:
+    level = _level(codec) if level is None else level
+    if codec == "zstd":
+        return _zstd_compressor(level).compress(data)
+    return zlib.compress(data, level)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if _zstd is None:
+            raise RuntimeError("zstd로 압축된 메시지를 읽으려면 zstandard 패키지가 필요합니다")
+        return _zstd_decompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def encode_message(message: dict, codec: Optional[str] = None) -> dict:
+    """
+    메시지의 content를 codec으로 압축·base64 인코딩하고 CODEC_FIELD를 붙인다.
+    codec이 "none"이거나 본문이 STREAM_PAYLOAD_MIN_BYTES보다 짧으면 그대로 반환한다.
+    """
+    codec = configured_codec() if codec is None else codec
+    if codec == "none":
+        return message
+    raw: bytes = (message.get("content") or "").encode("utf-8")
+    if len(raw) < int(os.environ.get("STREAM_PAYLOAD_MIN_BYTES", "512")):
+        return message
+    encoded: str = base64.b64encode(compress(raw, codec)).decode("ascii")
+    return {**message, "content": encoded, CODEC_FIELD: f"{codec}+b64"}
+
+
+# ---------------------------------------------------------------------------
+# 본문 참조 모드
+# ---------------------------------------------------------------------------
+
+def content_mode() -> str:
+    mode: str = os.environ.get("STREAM_CONTENT_MODE", "inline").strip().lower()
+    return "ref" if mode == "ref" else "inline"
+
+
+def content_key(digest: str) -> str:
+    prefix: str = os.environ.get("STREAM_CONTENT_KEY_PREFIX", "") or (
+        f"{os.environ['REDIS_ARTICLE_STREAM_KEY']}:content"
+    )
+    return f"{prefix}:{digest}"
+
+
+def externalize(message: dict) -> tuple[dict, Optional[tuple[str, str]]]:
+    """
+    ref 모드면 메시지에서 본문을 떼어 내고 (본문 없는 메시지, (본문 key, 저장할 본문))을 반환한다.
+    inline 모드이거나 본문이 비어 있으면 (message, None).
+    해시는 저장되는 형태(압축했다면 압축·base64 결과)로 계산하므로 codec이 다른 본문과 섞이지 않는다.
+    """
+    body: str = message.get("content") or ""
+    if content_mode() != "ref" or not body:
+        return message, None
+    digest: str = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    stripped: dict = {k: v for k, v in message.items() if k != "content"}
+    stripped[REF_FIELD] = digest
+    return stripped, (content_key(digest), body)
+
+
+def queue_content_write(pipe, key: str, body: str) -> int:
+    """
+    pipeline에 본문 저장 명령을 쌓고 쌓은 명령 수를 반환한다.
+    이미 있는 본문은 덮어쓰지 않고(SET NX) TTL만 연장한다.
+    """
+    ttl: int = int(os.environ.get("STREAM_CONTENT_TTL_SEC", str(DEFAULT_CONTENT_TTL_SEC)))
+    pipe.set(key, body, ex=ttl, nx=True)
+    pipe.expire(key, ttl)
+    return 2
+
+
+def write_content(redis_client, key: str, body: str) -> None:
+    """본문 하나를 저장한다 (왕복 1회). 실패하면 예외를 전파한다."""
+    pipe = redis_client.pipeline(transaction=False)
+    queue_content_write(pipe, key, body)
+    pipe.execute()
+
+
+# ---------------------------------------------------------------------------
+# consumer용 디코딩
+# ---------------------------------------------------------------------------
+
+def _as_str_fields(fields: dict) -> dict:
+    return {
+        (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+        for k, v in fields.items()
+    }
+
+
+def _decode_content(fields: dict) -> dict:
+    tag: Optional[str] = fields.pop(CODEC_FIELD, None)
+    if not tag:
+        return fields
+    codec, _, transport = tag.partition("+")
+    if transport != "b64" or codec not in _DEFAULT_LEVELS:
+        raise ValueError(f"지원하지 않는 본문 인코딩: {tag}")
+    fields["content"] = decompress(base64.b64decode(fields["content"]), codec).decode("utf-8")
+    return fields
+
+
+def decode_messages(messages: list[dict], redis_client=None) -> list[dict]:
+    """
+    Stream에서 읽은 메시지 필드 목록을 평문 본문 형식으로 되돌린다 (consumer용).
+    본문 참조 메시지가 있으면 redis_client로 본문을 MGET 한 번에 가져온다.
+    bytes 필드(decode_responses=False)도 받는다. TTL 만료 등으로 본문이 없으면 LookupError.
+    """
+    decoded: list[dict] = [_as_str_fields(fields) for fields in messages]
+    refs: list[dict] = [fields for fields in decoded if fields.get(REF_FIELD)]
+    if refs:
+        if redis_client is None:
+            raise ValueError("본문 참조 메시지를 읽으려면 redis_client가 필요합니다")
+        bodies: list = redis_client.mget([content_key(fields[REF_FIELD]) for fields in refs])
+        for fields, body in zip(refs, bodies):
+            if body is None:
+                raise LookupError(f"본문 key 없음 (TTL 만료?): {content_key(fields[REF_FIELD])}")
+            fields.pop(REF_FIELD)
+            fields["content"] = body.decode("utf-8") if isinstance(body, bytes) else body
+    return [_decode_content(fields) for fields in decoded]
+
+
+def decode_message(fields: dict, redis_client=None) -> dict:
+    """메시지 하나를 평문 본문 형식으로 되돌린다 (decode_messages 참조)."""
+    return decode_messages([fields], redis_client)[0]
@@ -0,0 +1,177 @@
+"""
+stream_index.py
+역할: 발행 기사 보조 색인 — 언론사·섹션별 Sorted Set (score = publishedAt, member = Stream 항목 ID)
+
+"최근 1시간 연합뉴스 기사"처럼 언론사·섹션과 시간 범위로 기사를 찾으려면 지금은 Stream 전체를
+XRANGE로 훑어야 한다. 발행할 때 Stream 항목 ID를
+  "<STREAM_INDEX_KEY_PREFIX>:press:<언론사>"   / "<STREAM_INDEX_KEY_PREFIX>:section:<sid1/sid2>"
+Sorted Set에 publishedAt(epoch ms)을 score로 넣어 두면, query()가 ZRANGEBYSCORE로 ID를 찾고
+그 항목만 XRANGE로 읽는다 (O(log N + k), Stream 길이와 무관).
+
+  - 쓰기: XADD 결과 ID가 있어야 하므로 XADD 다음의 발행 기록 pipeline(SADD/HSET)에 ZADD를 함께 싣는다
+    (추가 왕복 없음). XADD에 실패한 기사는 색인에 들어가지 않는다.
+  - 정리: 보존 기간은 publishedAt이 아니라 XADD 시각(항목 ID) 기준이다 — 백필·대량 적재처럼 publishedAt이
+    오래된 기사도 Stream에 있는 동안은 조회되어야 하므로. 색인 key마다 "<key>:added" Sorted Set에
+    XADD 시각을 score로 함께 넣어 두고, prune()이 STREAM_INDEX_WINDOW_SEC보다 오래 전에 XADD된 ID를
+    두 Sorted Set에서 지운다 (crawl_and_publish가 실행마다 한 번 호출). 그 사이에는 query()가
+    창 밖 ID를 건너뛴다. 시간 기준 보존(stream_retention)이 항목을 아카이브·트리밍하면 그 ID를
+    색인에서도 ZREM한다. 건수 트리밍(MAXLEN)으로 먼저 사라진 항목을 가리키는 ID는 query()가 건너뛴다.
+  - 수정 기사 재발행(event=update) 항목도 같은 publishedAt score로 색인한다. query()는 원래 발행 항목과
+    수정 항목을 함께 반환하므로 최신 내용이 필요하면 event 필드로 구분한다. 재발행 pipeline 결과로
+    ID를 받은 뒤 ZADD를 보내므로 수정 기사 한 건당 왕복이 1회 늘어난다.
+
+환경변수 목록:
+  STREAM_INDEX_ENABLED     - "false"이면 색인하지 않음 (기본값: "true")
+  STREAM_INDEX_KEY_PREFIX  - 색인 key 접두어 (기본값: "<REDIS_ARTICLE_STREAM_KEY>:idx")
+  STREAM_INDEX_WINDOW_SEC  - 색인 보존 기간(초, XADD 시각 기준)
+                             (기본값: STREAM_RETENTION_SEC, 미설정이면 604800 = 7일)
+"""
+
+import os
+import time
+from typing import Optional
+
+import redis as redis_lib
+
+DEFAULT_WINDOW_SEC: int = 7 * 24 * 3600
+DIMENSIONS: tuple[str, ...] = ("press", "section")
+_ADDED_SUFFIX: str = ":added"   # 색인 key별 XADD 시각 Sorted Set
+
+
+def enabled() -> bool:
+    return os.environ.get("STREAM_INDEX_ENABLED", "true").lower() == "true"
+
+
+def window_sec() -> int:
+    raw: str = os.environ.get("STREAM_INDEX_WINDOW_SEC", "")
+    if raw:
+        return int(raw)
+    # stream_retention.retention_sec()과 같은 값 (stream_retention이 이 모듈을 쓰므로 직접 읽음)
+    return int(os.environ.get("STREAM_RETENTION_SEC", "0") or 0) or DEFAULT_WINDOW_SEC
+
+
+def _prefix() -> str:
+    return os.environ.get("STREAM_INDEX_KEY_PREFIX", "") or f"{os.environ['REDIS_ARTICLE_STREAM_KEY']}:idx"
+
+
+def index_key(dimension: str, value: str) -> str:
+    return f"{_prefix()}:{dimension}:{value}"
+
+
+def _added_key(key: str) -> str:
+    return key + _ADDED_SUFFIX
+
+
+def _entry_ms(entry_id: str) -> int:
+    """Stream 항목 ID("<ms>-<seq>")에 담긴 XADD 시각(epoch ms)."""
+    return int(entry_id.partition("-")[0])
+
+
+def _cutoff_ms() -> int:
+    return int((time.time() - window_sec()) * 1000)
+
+
+def _keys(fields: dict) -> list[str]:
+    return [
+        index_key(dimension, fields[dimension])
+        for dimension in DIMENSIONS
+        if fields.get(dimension)
+    ]
+
+
+def queue_add(pipe, entries: list[tuple[str, dict, float]]) -> None:
+    """
+    (Stream 항목 ID, 메시지 필드, publishedAt epoch ms) 목록을 색인하는 명령을 pipeline에 쌓는다.
+    key마다 publishedAt·XADD 시각 ZADD 한 번씩 + TTL 갱신 (창 밖 항목 정리는 prune()).
+    """
+    if not enabled() or not entries:
+        return
+    by_key: dict[str, dict[str, float]] = {}
+    for entry_id, fields, score in entries:
+        for key in _keys(fields):
+            by_key.setdefault(key, {})[entry_id] = score
+    window: int = window_sec()
+    for key, members in by_key.items():
+        pipe.zadd(key, members)
+        pipe.zadd(_added_key(key), {entry_id: _entry_ms(entry_id) for entry_id in members})
+        pipe.expire(key, window)
+        pipe.expire(_added_key(key), window)
+
+
+def queue_remove(pipe, entries: list[tuple[str, dict]]) -> None:
+    """트리밍한 Stream 항목(ID, 필드)을 색인에서 지우는 명령을 pipeline에 쌓는다."""
+    by_key: dict[str, list[str]] = {}
+    for entry_id, fields in entries:
+        for key in _keys(fields):
+            by_key.setdefault(key, []).append(entry_id)
+    for key, ids in by_key.items():
+        pipe.zrem(key, *ids)
+        pipe.zrem(_added_key(key), *ids)
+
+
+def prune(redis_client: redis_lib.Redis) -> int:
+    """
+    STREAM_INDEX_WINDOW_SEC보다 오래 전에 XADD된 항목을 모든 색인 key에서 지우고 지운 ID 수를 반환한다.
+    왕복은 SCAN + 창 밖 ID 조회 1회 + (지울 것이 있으면) ZREM 1회.
+    """
+    keys: list[str] = []
+    for added in redis_client.scan_iter(match=f"{_prefix()}:*{_ADDED_SUFFIX}"):
+        if isinstance(added, bytes):
+            added = added.decode()
+        keys.append(added[:-len(_ADDED_SUFFIX)])
+    if not keys:
+        return 0
+    cutoff_ms: int = _cutoff_ms()
+    pipe = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipe.zrangebyscore(_added_key(key), "-inf", f"({cutoff_ms}")
+    expired: list = pipe.execute()
+
+    removed: int = 0
+    pipe = redis_client.pipeline(transaction=False)
+    for key, ids in zip(keys, expired):
+        if ids:
+            pipe.zrem(key, *ids)
+            pipe.zrem(_added_key(key), *ids)
+            removed += len(ids)
+    if removed:
+        pipe.execute()
+    return removed
+
+
+def query(
+    redis_client: redis_lib.Redis,
+    dimension: str,
+    value: str,
+    since_ms: Optional[float] = None,
+    until_ms: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> list[tuple[str, dict]]:
+    """
+    publishedAt이 [since_ms, until_ms]인 색인 기사를 publishedAt 순서로 (항목 ID, 필드) 목록으로 반환한다.
+    dimension은 "press" 또는 "section". 이미 Stream에서 잘려 나간 항목과 아직 prune()되지 않은
+    창 밖(XADD 시각 기준) 항목은 건너뛴다.
+    본문 압축·참조 모드 필드는 그대로 반환한다 (stream_codec.decode_messages로 복원).
+    """
+    if dimension not in DIMENSIONS:
+        raise ValueError(f"지원하지 않는 색인: {dimension}")
+    ids: list = redis_client.zrangebyscore(
+        index_key(dimension, value),
+        since_ms if since_ms is not None else "-inf",
+        until_ms if until_ms is not None else "+inf",
+        start=0 if limit is not None else None,
+        num=limit,
+    )
+    cutoff_ms: int = _cutoff_ms()
+    ids = [
+        entry_id for entry_id in (i.decode() if isinstance(i, bytes) else i for i in ids)
+        if _entry_ms(entry_id) >= cutoff_ms
+    ]
+    if not ids:
+        return []
+    stream_key: str = os.environ["REDIS_ARTICLE_STREAM_KEY"]
+    pipe = redis_client.pipeline(transaction=False)
+    for entry_id in ids:
+        pipe.xrange(stream_key, entry_id, entry_id)
+    found: list = pipe.execute()
+    return [entries[0] for entries in found if entries]
@@ -0,0 +1,273 @@
+"""
+stream_retention.py
+역할: 기사 Stream 시간 기준 보존(MINID 트리밍) + 잘려 나갈 항목의 로컬 아카이브
+
+XADD MAXLEN은 건수로 잘라내므로 장중에는 몇 시간, 주말에는 며칠 치가 남는 식으로 보존 기간이
+들쭉날쭉하고, 잘려 나간 기사는 그대로 사라진다. STREAM_RETENTION_SEC을 설정하면
+  - 발행 시 MAXLEN 트리밍을 끄고 (article_publisher.stream_maxlen)
+  - 실행이 끝날 때 보존 기간보다 오래된 항목을 배치 단위로 XRANGE로 읽어 아카이브에 쓴 뒤,
+    쓴 항목까지만 XTRIM MINID로 정확히 잘라낸다 (아카이브에 쓰지 못한 항목은 지우지 않는다).
+    잘라낸 항목 ID는 같은 pipeline에서 언론사·섹션 색인(stream_index)에서도 지운다.
+Stream 항목 ID의 앞부분이 XADD 시각(ms)이므로 MINID가 곧 시각 기준 보존선이다.
+
+아카이브는 "<STREAM_ARCHIVE_DIR>/<Stream key>/<YYYY-MM-DD>/<첫 ID>_<끝 ID>.jsonl.gz" (날짜는 UTC,
+항목 ID 시각 기준) gzip JSONL 세그먼트로, 한 줄이 {"id": 항목 ID, "fields": 평문 메시지 필드}다.
+본문 압축·참조 모드 메시지는 stream_codec.decode_messages로 평문으로 되돌려 저장하므로 본문 key의
+TTL이 지나도 아카이브에서 읽을 수 있다. 세그먼트는 임시 파일에 다 쓴 뒤 이름을 바꿔 공개한다.
+뒤처진 consumer는 iter_archive(after_id)로 마지막으로 처리한 ID 이후 항목을 순서대로 다시 읽는다.
+
+여러 Lambda가 동시에 끝나도 같은 항목을 두 번 아카이브하지 않도록 "<Stream key>:retention_lock"
+(SET NX EX, 값은 실행마다 무작위 토큰)을 잡은 실행만 트리밍한다. 잠금은 WATCH로 토큰이 그대로인지
+확인한 뒤에만 지우므로, TTL이 지나 다른 실행이 잡은 잠금을 지우지 않는다.
+
+한 번의 실행은 STREAM_ARCHIVE_MAX_BATCHES 배치까지만, 마감 시각(deadline) 전까지만, 그리고 잠금 TTL의
+절반 안에서만 트리밍한다 (남은 항목은 다음 실행이 이어서 처리). 그래서 밀린 양이 많아도 Lambda 제한
+시간을 넘기지 않고, 실행 중에 잠금이 만료되지도 않는다.
+
+잘라낸 항목은 Redis에서 영구히 사라지므로 아카이브 경로(STREAM_ARCHIVE_DIR)를 반드시 지정해야 한다.
+Lambda의 /tmp는 컨테이너와 함께 사라지므로 EFS 등 영속 경로를 쓴다. 지정하지 않았으면 트리밍하지 않고
+RuntimeError를 던진다.
+
+환경변수 목록:
+  STREAM_RETENTION_SEC       - Stream 보존 기간(초). 미설정·0이면 기존 STREAM_MAXLEN 건수 트리밍 (기본값: 미설정)
+  STREAM_ARCHIVE_DIR         - 아카이브 디렉터리 (STREAM_RETENTION_SEC을 쓰면 필수, 기본값 없음)
+  STREAM_ARCHIVE_BATCH       - 아카이브·트리밍 배치 크기 (기본값: 500)
+  STREAM_ARCHIVE_MAX_BATCHES - 실행당 최대 배치 수 (기본값: 20)
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+import redis as redis_lib
+
+import stream_codec
+import stream_index
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH: int = 500
+DEFAULT_MAX_BATCHES: int = 20
+SEGMENT_SUFFIX: str = ".jsonl.gz"
+LOCK_TTL_SEC: int = 300
+_UNSAFE_PATH_RE = re.compile(r"[^0-9A-Za-z_.-]")
+
+
+def retention_sec() -> int:
+    """STREAM_RETENTION_SEC (미설정이면 0 = 시간 기준 보존 비활성화)."""
+    return int(os.environ.get("STREAM_RETENTION_SEC", "0") or 0)
+
+
+def enabled() -> bool:
+    return retention_sec() > 0
+
+
+# ---------------------------------------------------------------------------
+# 아카이브 세그먼트
+# ---------------------------------------------------------------------------
+
+def _parse_id(entry_id: str) -> tuple[int, int]:
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _padded(entry_id: str) -> str:
+    """파일 이름이 ID 순서대로 정렬되도록 ms·seq를 0으로 채운다."""
+    ms, seq = _parse_id(entry_id)
+    return f"{ms:015d}-{seq:06d}"
+
+
+def archive_dir(stream_key: str) -> str:
+    """Stream의 아카이브 디렉터리. STREAM_ARCHIVE_DIR이 없으면 RuntimeError (임시 경로로 대신하지 않음)."""
+    base: str = os.environ.get("STREAM_ARCHIVE_DIR", "")
+    if not base:
+        raise RuntimeError(
+            "STREAM_ARCHIVE_DIR이 설정되지 않음 — 트리밍한 항목을 보관할 영속 경로가 필요합니다"
+        )
+    return os.path.join(base, _UNSAFE_PATH_RE.sub("_", stream_key))
+
+
+def _write_segment(directory: str, entries: list[tuple[str, dict]]) -> str:
+    lines: str = "".join(
+        json.dumps({"id": entry_id, "fields": fields}, ensure_ascii=False) + "\n"
+        for entry_id, fields in entries
+    )
+    os.makedirs(directory, exist_ok=True)
+    path: str = os.path.join(
+        directory, f"{_padded(entries[0][0])}_{_padded(entries[-1][0])}{SEGMENT_SUFFIX}"
+    )
+    tmp_path: str = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(gzip.compress(lines.encode("utf-8")))
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_archive(
+    stream_key: str,
+    entries: list[tuple[str, dict]],
+    redis_client: Optional[redis_lib.Redis] = None,
+) -> list[str]:
+    """
+    Stream 항목을 날짜(UTC)별 세그먼트로 나눠 쓰고 경로 목록을 반환한다.
+    본문은 평문으로 되돌려 저장하며, 참조 본문을 찾을 수 없으면 원래 필드 그대로 저장한다.
+    """
+    raw: list[dict] = [fields for _, fields in entries]
+    try:
+        decoded: list[dict] = stream_codec.decode_messages(raw, redis_client)
+    except (LookupError, ValueError) as exc:
+        logger.warning(f"아카이브 본문 복원 실패 — 원래 필드 그대로 저장: {exc}")
+        decoded = raw
+
+    by_day: dict[str, list[tuple[str, dict]]] = {}
+    for (entry_id, _), fields in zip(entries, decoded):
+        ms, _ = _parse_id(entry_id)
+        day: str = datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+        by_day.setdefault(day, []).append((entry_id, fields))
+
+    base: str = archive_dir(stream_key)
+    return [
+        _write_segment(os.path.join(base, day), day_entries)
+        for day, day_entries in sorted(by_day.items())
+    ]
+
+
+def list_archive(stream_key: str) -> list[str]:
+    """아카이브 세그먼트 경로를 항목 ID 순서로 반환한다."""
+    base: str = archive_dir(stream_key)
+    if not os.path.isdir(base):
+        return []
+    paths: list[str] = []
+    for day in sorted(os.listdir(base)):
+        day_dir: str = os.path.join(base, day)
+        if os.path.isdir(day_dir):
+            paths.extend(
+                os.path.join(day_dir, name)
+                for name in sorted(os.listdir(day_dir))
+                if name.endswith(SEGMENT_SUFFIX)
+            )
+    return paths
+
+
+def iter_archive(stream_key: str, after_id: Optional[str] = None) -> Iterator[tuple[str, dict]]:
+    """
+    아카이브의 (항목 ID, 평문 필드)를 ID 순서로 yield한다.
+    after_id를 주면 그보다 뒤의 항목만 (consumer가 마지막으로 처리한 ID 이후부터 복구).
+    """
+    after: Optional[tuple[int, int]] = _parse_id(after_id) if after_id else None
+    for path in list_archive(stream_key):
+        if after is not None:
+            last_id: str = os.path.basename(path)[: -len(SEGMENT_SUFFIX)].split("_")[1]
+            if _parse_id(last_id) <= after:
+                continue
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record: dict = json.loads(line)
+                if after is None or _parse_id(record["id"]) > after:
+                    yield record["id"], record["fields"]
+
+
+# ---------------------------------------------------------------------------
+# 시간 기준 트리밍
+# ---------------------------------------------------------------------------
+
+def _next_id(entry_id: str) -> str:
+    ms, seq = _parse_id(entry_id)
+    return f"{ms}-{seq + 1}"
+
+
+def _release_lock(redis_client: redis_lib.Redis, lock_key: str, token: str) -> None:
+    """잠금 값이 이 실행의 토큰일 때만 지운다 (WATCH로 확인과 삭제 사이의 변경을 막음)."""
+    with redis_client.pipeline() as pipe:
+        try:
+            pipe.watch(lock_key)
+            if pipe.get(lock_key) != token:
+                pipe.unwatch()
+                logger.warning("Stream 보존 트리밍 잠금이 이미 만료돼 다른 실행이 잡음 — 해제하지 않음")
+                return
+            pipe.multi()
+            pipe.delete(lock_key)
+            pipe.execute()
+        except redis_lib.WatchError:
+            logger.warning("Stream 보존 트리밍 잠금이 해제 중 바뀜 — 해제하지 않음")
+
+
+def enforce_retention(
+    redis_client: redis_lib.Redis,
+    now: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> dict:
+    """
+    보존 기간보다 오래된 Stream 항목을 아카이브한 뒤 잘라낸다.
+
+    Args:
+        deadline: 마감 시각(time.monotonic() 기준). 지나면 배치 사이에서 멈춘다.
+
+    반환값: {"archived": 아카이브·삭제한 항목 수, "segments": 쓴 세그먼트 수}
+            (비활성화됐거나 다른 실행이 트리밍 중이면 둘 다 0)
+    아카이브 쓰기가 실패하면 그 배치는 지우지 않고 멈춘다 (다음 실행에서 다시 시도).
+    STREAM_ARCHIVE_DIR이 없으면 아무것도 지우지 않고 RuntimeError를 던진다.
+    """
+    stats: dict[str, int] = {"archived": 0, "segments": 0}
+    if not enabled():
+        return stats
+    stream_key: str = os.environ["REDIS_ARTICLE_STREAM_KEY"]
+    archive_dir(stream_key)   # 아카이브 경로가 없으면 잠금을 잡기 전에 실패
+    lock_key: str = f"{stream_key}:retention_lock"
+    token: str = secrets.token_hex(16)
+    if not redis_client.set(lock_key, token, nx=True, ex=LOCK_TTL_SEC):
+        logger.info("다른 실행이 Stream 보존 트리밍 중 — 이번 실행은 건너뜀")
+        return stats
+
+    started: float = time.monotonic()
+    stopped: Optional[str] = None
+    try:
+        cutoff_ms: int = int(((now if now is not None else time.time()) - retention_sec()) * 1000)
+        batch: int = int(os.environ.get("STREAM_ARCHIVE_BATCH", str(DEFAULT_BATCH)))
+        max_batches: int = int(os.environ.get("STREAM_ARCHIVE_MAX_BATCHES", str(DEFAULT_MAX_BATCHES)))
+        for done in range(max_batches + 1):
+            if done == max_batches:
+                stopped = f"실행당 최대 {max_batches}배치"
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                stopped = "마감 시각 도달"
+                break
+            if time.monotonic() - started >= LOCK_TTL_SEC / 2:
+                stopped = "잠금 유지 시간 한도"
+                break
+            entries: list = redis_client.xrange(stream_key, "-", f"({cutoff_ms}-0", count=batch)
+            if not entries:
+                break
+            try:
+                paths: list[str] = write_archive(stream_key, entries, redis_client)
+            except OSError as exc:
+                logger.error(f"Stream 아카이브 쓰기 실패 — 트리밍 중단: {exc}")
+                break
+            # 트리밍과 언론사·섹션 색인에서의 삭제를 한 번의 왕복으로
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.xtrim(stream_key, minid=_next_id(entries[-1][0]), approximate=False)
+            stream_index.queue_remove(pipe, entries)
+            pipe.execute()
+            stats["archived"] += len(entries)
+            stats["segments"] += len(paths)
+            if len(entries) < batch:
+                break
+    finally:
+        _release_lock(redis_client, lock_key, token)
+
+    if stats["archived"]:
+        logger.info(
+            f"Stream 보존 기간({retention_sec()}초) 초과 항목 {stats['archived']}건 "
+            f"아카이브 후 삭제 (세그먼트 {stats['segments']}개)"
+        )
+    if stopped:
+        logger.warning(f"Stream 보존 트리밍 중단({stopped}) — 남은 항목은 다음 실행에서 처리")
+    return stats
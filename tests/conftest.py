@@ -22,6 +22,16 @@ def reset_global_redis(monkeypatch):
     monkeypatch.setattr(article_publisher, "_redis_client", None)
 
 
+@pytest.fixture(autouse=True)
+def isolate_failed_spool(monkeypatch, tmp_path):
+    """
+    실패 스풀 디렉터리를 테스트별 tmp_path로 돌려, 실제 /tmp 스풀을 읽거나 남기지 않게 한다.
+    """
+    spool_dir = tmp_path / "failed_spool"
+    monkeypatch.setenv("FAILED_SPOOL_DIR", str(spool_dir))
+    return spool_dir
+
+
 # ---------------------------------------------------------------------------
 # Redis 목(Mock) 관련 fixture
 # ---------------------------------------------------------------------------
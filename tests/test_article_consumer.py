@@ -0,0 +1,122 @@
+"""
+test_article_consumer.py
+article_consumer 모듈(기사 Stream 참조 consumer)의 단위 테스트 (시나리오 CS-01 ~ CS-04)
+"""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import article_consumer
+import article_publisher
+import stream_codec
+
+
+@pytest.fixture
+def consumer_env(monkeypatch, env_vars):
+    monkeypatch.setenv("REDIS_CONSUMER_GROUP", "g")
+    monkeypatch.setenv("CONSUMER_NAME", "c1")
+    monkeypatch.setenv("CONSUMER_BLOCK_MS", "10")
+    monkeypatch.setenv("ARTICLE_TZ", "Asia/Seoul")
+    return env_vars
+
+
+class TestConsume:
+
+    def test_batches_decoded_acked_and_latency_reported(self, monkeypatch, consumer_env, fake_redis, sample_articles):
+        """
+        [CS-01] 압축 발행된 기사를 배치로 읽어 평문으로 handler에 넘기고 모두 ACK해야 하며,
+        publishedAt → 소비, XADD → 소비 지연 분포를 반환해야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("CONSUMER_BATCH", "2")
+        published_at = (datetime.now(ZoneInfo("Asia/Seoul")) - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%S")
+        for article in sample_articles:
+            article_publisher.publish_article(fake_redis, {**article, "publishedAt": published_at}, set(), "zlib")
+        batches: list[list] = []
+
+        # Act
+        result = article_consumer.consume(
+            lambda entries: batches.append(entries), fake_redis, idle_exit_sec=0, start_id="0"
+        )
+
+        # Assert
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[0][0][1]["content"] == "기사 본문 1"
+        assert result["consumed"] == 3 and result["failed_batches"] == 0
+        assert fake_redis.xpending(consumer_env["REDIS_ARTICLE_STREAM_KEY"], "g")["pending"] == 0
+        published = result["latency"]["published_to_consumed_ms"]
+        assert published["count"] == 3 and 290_000 < published["p50"] < 310_000
+        assert result["latency"]["stream_to_consumed_ms"]["count"] == 3
+
+    def test_failed_batch_left_pending_and_reclaimed(self, monkeypatch, consumer_env, fake_redis, sample_articles):
+        """
+        [CS-02] handler가 실패한 배치는 ACK하지 않아야 하고, 방치 시간이 지나면 다음 consumer가
+        XAUTOCLAIM으로 가져와 처리해야 한다. 회수한 항목의 지연은 일반 소비 지연과 따로 집계한다.
+        """
+        # Arrange
+        stream_key = consumer_env["REDIS_ARTICLE_STREAM_KEY"]
+        for article in sample_articles:
+            article_publisher.publish_article(fake_redis, article, set())
+
+        def broken(entries):
+            raise RuntimeError("downstream down")
+
+        # Act
+        failed = article_consumer.consume(broken, fake_redis, idle_exit_sec=0, start_id="0")
+        pending_after_failure = fake_redis.xpending(stream_key, "g")["pending"]
+        monkeypatch.setenv("CONSUMER_NAME", "c2")
+        monkeypatch.setenv("CONSUMER_CLAIM_IDLE_MS", "0")
+        recovered = article_consumer.consume(lambda entries: None, fake_redis, idle_exit_sec=0)
+
+        # Assert
+        assert failed["failed_batches"] == 1 and failed["consumed"] == 0
+        assert pending_after_failure == 3
+        assert recovered["claimed"] == 3 and recovered["consumed"] == 3
+        assert recovered["latency"]["reclaimed_stream_to_consumed_ms"]["count"] == 3
+        assert recovered["latency"]["stream_to_consumed_ms"]["count"] == 0
+        assert recovered["latency"]["published_to_consumed_ms"]["count"] == 0
+        assert fake_redis.xpending(stream_key, "g")["pending"] == 0
+
+    def test_undecodable_message_acked_and_skipped(self, monkeypatch, consumer_env, fake_redis, sample_articles):
+        """
+        [CS-03] 본문 key가 만료돼 복원할 수 없는 메시지는 건너뛰고 ACK해야 하며,
+        같은 배치의 나머지 기사는 정상 처리해야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_CONTENT_MODE", "ref")
+        for article in sample_articles[:2]:
+            article_publisher.publish_article(fake_redis, article, set())
+        first_ref = fake_redis.xrange(consumer_env["REDIS_ARTICLE_STREAM_KEY"])[0][1][stream_codec.REF_FIELD]
+        fake_redis.delete(stream_codec.content_key(first_ref))
+        handled: list = []
+
+        # Act
+        result = article_consumer.consume(
+            lambda entries: handled.extend(entries), fake_redis, idle_exit_sec=0, start_id="0"
+        )
+
+        # Assert
+        assert result["undecodable"] == 1 and result["consumed"] == 1
+        assert handled[0][1]["content"] == "기사 본문 2"
+        assert fake_redis.xpending(consumer_env["REDIS_ARTICLE_STREAM_KEY"], "g")["pending"] == 0
+
+    def test_two_element_xautoclaim_reply(self, mocker, monkeypatch, consumer_env, fake_redis, sample_articles):
+        """
+        [CS-04] 삭제된 ID 목록이 없는 Redis 6.2의 2원소 XAUTOCLAIM 응답도 처리해야 한다.
+        """
+        # Arrange
+        for article in sample_articles:
+            article_publisher.publish_article(fake_redis, article, set())
+        article_consumer.consume(lambda entries: 1 / 0, fake_redis, idle_exit_sec=0, start_id="0")
+        original = fake_redis.xautoclaim
+        mocker.patch.object(fake_redis, "xautoclaim", side_effect=lambda *args, **kwargs: original(*args, **kwargs)[:2])
+        monkeypatch.setenv("CONSUMER_NAME", "c2")
+        monkeypatch.setenv("CONSUMER_CLAIM_IDLE_MS", "0")
+
+        # Act
+        recovered = article_consumer.consume(lambda entries: None, fake_redis, idle_exit_sec=0)
+
+        # Assert
+        assert recovered["claimed"] == 3 and recovered["consumed"] == 3
@@ -1,16 +1,23 @@
 """
 test_article_publisher.py
-article_publisher 모듈의 단위 테스트 (시나리오 AP-01 ~ AP-35)
+article_publisher 모듈의 단위 테스트 (시나리오 AP-01 ~ AP-47)
 """
 
+import io
 import json
+import logging
 import os
-from datetime import datetime
+import stat
+from datetime import datetime, timedelta
 
 import pytest
+import redis
 from unittest.mock import MagicMock, call
 
 import article_publisher
+import failed_spool
+import stream_codec
+import stream_retention
 
 
 # ===========================================================================
@@ -299,12 +306,26 @@ class TestPublishArticle:
 # run_crawler() — 시나리오 15~19
 # ===========================================================================
 
+def _fake_process(returncode=0, stdout: bytes = b"", stderr: bytes = b"") -> MagicMock:
+    """
+    이미 종료된(returncode) 크롤러 프로세스를 흉내 내는 Popen mock을 만든다.
+    stdout/stderr는 주어진 바이트를 내보내고 EOF가 되는 파이프로 대체한다.
+    """
+    proc = MagicMock(returncode=returncode)
+    proc.pid = os.getpid()   # 이 프로세스의 자식이 아니므로 os.wait4는 ChildProcessError → poll()로 판단
+    proc.poll.return_value = returncode
+    proc.wait.return_value = returncode
+    proc.stdout = io.BytesIO(stdout)
+    proc.stderr = io.BytesIO(stderr)
+    return proc
+
+
 class TestRunCrawler:
 
     def test_normal_execution_parses_jsonl(self, mocker, env_vars):
         """
-        [15] subprocess.run이 returncode=0이고 2행 JSONL 파일이 생성되면
-        article dict 목록 2개가 반환되어야 한다.
+        [15] 크롤러가 returncode=0으로 끝나고 2행 JSONL 파일이 생성되면
+        article dict 2개가 yield되어야 한다.
         """
         # Arrange
         output_path = env_vars["OUTPUT_FILE_PATH"]
@@ -313,12 +334,12 @@ class TestRunCrawler:
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write('{"url": "https://example.com/1", "title": "기사 1"}\n')
                 f.write('{"url": "https://example.com/2", "title": "기사 2"}\n')
-            return MagicMock(returncode=0, stdout="done", stderr="")
+            return _fake_process(0)
 
-        mocker.patch("article_publisher.subprocess.run", side_effect=create_output_file)
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=create_output_file)
 
         # Act
-        result = article_publisher.run_crawler()
+        result = list(article_publisher.run_crawler())
 
         # Assert
         assert len(result) == 2, "JSONL 2행에 대응하는 기사 2건이 반환되어야 함"
@@ -326,34 +347,52 @@ class TestRunCrawler:
 
     def test_nonzero_returncode_raises(self, mocker, env_vars):
         """
-        [16] subprocess.run이 returncode=1을 반환하면 RuntimeError가 발생해야 한다.
+        [16] 크롤러가 returncode=1로 끝나면 결과를 소비하는 시점에 RuntimeError가 발생해야 한다.
         """
         # Arrange
-        mocker.patch(
-            "article_publisher.subprocess.run",
-            return_value=MagicMock(returncode=1, stdout="", stderr="spider crash"),
-        )
+        mocker.patch("article_publisher.subprocess.Popen", return_value=_fake_process(1))
 
         # Act & Assert
         with pytest.raises(RuntimeError, match="returncode=1"):
-            article_publisher.run_crawler()
+            list(article_publisher.run_crawler())
+
+    def test_time_limit_exit_code_marks_output(self, mocker, env_vars):
+        """
+        [AP-64] 크롤러가 시간 제한 종료 코드로 끝나면 오류 없이 기사를 내주고
+        stopped_by_time_limit만 True여야 한다 (마감 시각 중단과는 구분).
+        """
+        # Arrange
+        output_path = env_vars["OUTPUT_FILE_PATH"]
+
+        def create_output_file(*args, **kwargs):
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write('{"url": "https://example.com/1", "title": "기사 1"}\n')
+            return _fake_process(article_publisher._CRAWLER_TIME_LIMIT_EXIT_CODE)
+
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=create_output_file)
+
+        # Act
+        output = article_publisher.run_crawler()
+        result = list(output)
+
+        # Assert
+        assert len(result) == 1
+        assert article_publisher.crawler_stopped_by_time_limit(output) is True
+        assert article_publisher.crawler_stopped_by_deadline(output) is False
 
     def test_missing_output_file_returns_empty(self, mocker, env_vars):
         """
-        [17] subprocess.run이 성공했지만 출력 파일이 없으면 빈 리스트를 반환해야 한다.
+        [17] 크롤러가 성공했지만 출력 파일이 없으면 아무것도 yield하지 않아야 한다.
         """
         # Arrange
-        mocker.patch(
-            "article_publisher.subprocess.run",
-            return_value=MagicMock(returncode=0, stdout="", stderr=""),
-        )
+        mocker.patch("article_publisher.subprocess.Popen", return_value=_fake_process(0))
         # 파일을 생성하지 않음
 
         # Act
-        result = article_publisher.run_crawler()
+        result = list(article_publisher.run_crawler())
 
         # Assert
-        assert result == [], "출력 파일 없을 때 빈 리스트를 반환해야 함"
+        assert result == [], "출력 파일 없을 때 빈 결과여야 함"
 
     def test_invalid_json_line_skipped(self, mocker, env_vars):
         """
@@ -368,12 +407,12 @@ class TestRunCrawler:
                 f.write('{"url": "https://example.com/1", "title": "정상1"}\n')
                 f.write('INVALID JSON { broken\n')
                 f.write('{"url": "https://example.com/2", "title": "정상2"}\n')
-            return MagicMock(returncode=0, stdout="", stderr="")
+            return _fake_process(0)
 
-        mocker.patch("article_publisher.subprocess.run", side_effect=create_mixed_output)
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=create_mixed_output)
 
         # Act
-        result = article_publisher.run_crawler()
+        result = list(article_publisher.run_crawler())
 
         # Assert
         assert len(result) == 2, "잘못된 JSON 라인 1건은 건너뛰고 나머지 2건이 파싱되어야 함"
@@ -390,12 +429,12 @@ class TestRunCrawler:
 
         def capture_env(*args, **kwargs):
             captured_envs.append(dict(kwargs.get("env", {})))
-            return MagicMock(returncode=0, stdout="", stderr="")
+            return _fake_process(0)
 
-        mocker.patch("article_publisher.subprocess.run", side_effect=capture_env)
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=capture_env)
 
         # Act
-        article_publisher.run_crawler(since_dt=since)
+        list(article_publisher.run_crawler(since_dt=since))
 
         # Assert
         assert len(captured_envs) == 1
@@ -415,12 +454,12 @@ class TestRunCrawler:
 
         def capture_env(*args, **kwargs):
             captured_envs.append(dict(kwargs.get("env", {})))
-            return MagicMock(returncode=0, stdout="", stderr="")
+            return _fake_process(0)
 
-        mocker.patch("article_publisher.subprocess.run", side_effect=capture_env)
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=capture_env)
 
         # Act
-        article_publisher.run_crawler(since_dt=None)
+        list(article_publisher.run_crawler(since_dt=None))
 
         # Assert
         assert len(captured_envs) == 1
@@ -443,19 +482,163 @@ class TestRunCrawler:
         was_deleted_before_subprocess: list[bool] = []
 
         def check_deletion_then_succeed(*args, **kwargs):
-            # subprocess.run이 호출되는 시점에 파일이 이미 삭제됐는지 확인
+            # 프로세스가 시작되는 시점에 파일이 이미 삭제됐는지 확인
             was_deleted_before_subprocess.append(not os.path.exists(output_path))
-            return MagicMock(returncode=0, stdout="", stderr="")
+            return _fake_process(0)
 
-        mocker.patch("article_publisher.subprocess.run", side_effect=check_deletion_then_succeed)
+        mocker.patch(
+            "article_publisher.subprocess.Popen", side_effect=check_deletion_then_succeed
+        )
 
         # Act
-        article_publisher.run_crawler()
+        list(article_publisher.run_crawler())
 
         # Assert
         assert was_deleted_before_subprocess[0] is True, \
             "subprocess 실행 전에 이전 출력 파일이 삭제되어야 함"
 
+    def test_articles_yielded_while_crawler_still_running(self, mocker, env_vars):
+        """
+        [AP-40] 크롤러가 아직 실행 중이어도 이미 기록된 기사는 즉시 yield되어야 한다.
+        (전체 파일을 다 읽은 뒤 반환하지 않는 스트리밍 전달)
+        """
+        # Arrange
+        output_path = env_vars["OUTPUT_FILE_PATH"]
+        running = {"value": True}
+        proc = _fake_process(0)
+        proc.poll.side_effect = lambda: None if running["value"] else 0
+
+        def start_crawler(*args, **kwargs):
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write('{"url": "https://example.com/1"}\n')
+            return proc
+
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=start_crawler)
+        mocker.patch("article_publisher.time.sleep")
+
+        # Act
+        stream = article_publisher.run_crawler()
+        first = next(stream)
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write('{"url": "https://example.com/2"}')  # 개행 없이 끝난 마지막 줄
+        running["value"] = False
+        rest = list(stream)
+
+        # Assert
+        assert first["url"] == "https://example.com/1", \
+            "프로세스 종료 전에 첫 기사가 yield되어야 함"
+        assert [a["url"] for a in rest] == ["https://example.com/2"], \
+            "종료 후 남은 기사(개행 없는 마지막 줄 포함)가 이어서 yield되어야 함"
+
+    def test_fifo_handoff(self, mocker, env_vars, monkeypatch):
+        """
+        [AP-41] CRAWLER_HANDOFF=fifo이면 OUTPUT_FILE_PATH가 FIFO로 생성되고,
+        크롤러가 FIFO에 쓴 기사를 읽은 뒤 FIFO는 정리되어야 한다.
+        """
+        # Arrange
+        import threading
+
+        monkeypatch.setenv("CRAWLER_HANDOFF", "fifo")
+        output_path = env_vars["OUTPUT_FILE_PATH"]
+        writer_done = threading.Event()
+        proc = _fake_process(0)
+        proc.poll.side_effect = lambda: 0 if writer_done.is_set() else None
+
+        def write_to_fifo():
+            with open(output_path, "wb") as f:
+                f.write(b'{"url": "https://example.com/1"}\n{"url": "https://example.com/2"}\n')
+            writer_done.set()
+
+        def start_crawler(*args, **kwargs):
+            assert stat.S_ISFIFO(os.stat(output_path).st_mode), "출력 경로가 FIFO여야 함"
+            threading.Thread(target=write_to_fifo).start()
+            return proc
+
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=start_crawler)
+
+        # Act
+        result = list(article_publisher.run_crawler())
+
+        # Assert
+        assert [a["url"] for a in result] == ["https://example.com/1", "https://example.com/2"]
+        assert not os.path.exists(output_path), "읽기가 끝난 FIFO는 삭제되어야 함"
+
+
+# ===========================================================================
+# 크롤러 출력 로그 전달 — 시나리오 AP-42 ~ AP-44
+# ===========================================================================
+
+class TestCrawlerOutputForwarding:
+
+    def test_lines_logged_with_stream_and_scrapy_level(self, mocker, env_vars, caplog):
+        """
+        [AP-42] 크롤러 stdout 줄은 INFO로, stderr의 Scrapy 로그 줄은 해당 레벨로
+        crawler_stream 속성과 함께 한 줄씩 기록되어야 한다.
+        """
+        # Arrange
+        proc = _fake_process(
+            0,
+            stdout="📄 [1/10] https://example.com/1\n".encode(),
+            stderr=b"2025-01-01 00:00:00 [scrapy.core.scraper] ERROR: Spider error\n"
+                   b"Traceback (most recent call last):\n",
+        )
+        mocker.patch("article_publisher.subprocess.Popen", return_value=proc)
+
+        # Act
+        with caplog.at_level(logging.INFO, logger="article_publisher.crawler"):
+            list(article_publisher.run_crawler())
+
+        # Assert
+        records = [r for r in caplog.records if r.name == "article_publisher.crawler"]
+        assert len(records) == 3, "출력 줄마다 로그 레코드가 하나씩 생성되어야 함"
+        by_stream = {(r.crawler_stream, r.levelno) for r in records}
+        assert ("stdout", logging.INFO) in by_stream, "stdout 줄은 INFO여야 함"
+        assert ("stderr", logging.ERROR) in by_stream, "Scrapy ERROR 줄은 ERROR여야 함"
+        assert records[-1].levelno == logging.ERROR, \
+            "레벨 표시가 없는 traceback 줄은 직전 줄의 레벨을 이어받아야 함"
+
+    def test_lines_below_configured_level_dropped(self, mocker, env_vars, monkeypatch, caplog):
+        """
+        [AP-43] CRAWLER_LOG_LEVEL=WARNING이면 stdout(INFO) 줄은 기록되지 않아야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("CRAWLER_LOG_LEVEL", "WARNING")
+        proc = _fake_process(
+            0,
+            stdout=b"progress line\n",
+            stderr=b"2025-01-01 00:00:00 [scrapy] WARNING: slow response\n",
+        )
+        mocker.patch("article_publisher.subprocess.Popen", return_value=proc)
+
+        # Act
+        with caplog.at_level(logging.DEBUG, logger="article_publisher.crawler"):
+            list(article_publisher.run_crawler())
+
+        # Assert
+        messages = [r.message for r in caplog.records if r.name == "article_publisher.crawler"]
+        assert messages == ["[stderr] 2025-01-01 00:00:00 [scrapy] WARNING: slow response"], \
+            "설정 레벨 미만의 줄은 버려져야 함"
+
+    def test_log_size_cap(self, mocker, env_vars, monkeypatch, caplog):
+        """
+        [AP-44] 누적 로그가 CRAWLER_LOG_MAX_BYTES를 넘으면 이후 줄은 기록되지 않고
+        생략된 줄 수가 경고로 남아야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("CRAWLER_LOG_MAX_BYTES", "25")
+        proc = _fake_process(0, stdout=b"line-0000001\nline-0000002\nline-0000003\n")
+        mocker.patch("article_publisher.subprocess.Popen", return_value=proc)
+
+        # Act
+        with caplog.at_level(logging.INFO):
+            list(article_publisher.run_crawler())
+
+        # Assert
+        crawler_lines = [r for r in caplog.records if r.name == "article_publisher.crawler"]
+        assert len(crawler_lines) == 2, "한도(25바이트) 안의 2줄만 기록되어야 함"
+        assert any("1줄 생략" in r.message for r in caplog.records), \
+            "생략된 줄 수가 경고로 기록되어야 함"
+
 
 # ===========================================================================
 # crawl_and_publish() — 시나리오 20~23
@@ -477,7 +660,7 @@ class TestCrawlAndPublish:
             return_value={sample_articles[0]["url"]},
         )
         # article[1] 성공, article[2] 실패
-        def publish_side_effect(client, article, cache):
+        def publish_side_effect(client, article, cache, codec=None):
             if article["url"] == sample_articles[1]["url"]:
                 cache.add(article["url"])
                 return True
@@ -488,9 +671,12 @@ class TestCrawlAndPublish:
 
         # Act
         result = article_publisher.crawl_and_publish()
+        result.pop("metrics")
 
         # Assert
-        assert result == {"crawled": 3, "published": 1, "skipped": 1, "failed": 1}, \
+        assert result == {
+            "crawled": 3, "published": 1, "skipped": 1, "failed": 1, "deferred": 0,
+        }, \
             f"예상 카운트와 다름: {result}"
 
     def test_redis_connection_failure_saves_all_as_failed(
@@ -499,11 +685,9 @@ class TestCrawlAndPublish:
         """
         [21] get_redis_client가 ConnectionError를 던지면
         {"crawled":3, "published":0, "skipped":0, "failed":3}을 반환하고
-        실패 파일이 생성되어야 한다.
+        실패 스풀 세그먼트가 생성되어야 한다.
         """
         # Arrange
-        failed_path = str(tmp_path / "failed_articles.json")
-        mocker.patch.object(article_publisher, "FAILED_ARTICLES_PATH", failed_path)
         mocker.patch("article_publisher.run_crawler", return_value=sample_articles)
         mocker.patch(
             "article_publisher.get_redis_client",
@@ -512,21 +696,21 @@ class TestCrawlAndPublish:
 
         # Act
         result = article_publisher.crawl_and_publish()
+        result.pop("metrics")
 
         # Assert
-        assert result == {"crawled": 3, "published": 0, "skipped": 0, "failed": 3}, \
+        assert result == {
+            "crawled": 3, "published": 0, "skipped": 0, "failed": 3, "deferred": 0,
+        }, \
             f"Redis 연결 실패 시 전체 실패 처리되어야 함: {result}"
-        assert os.path.exists(failed_path), \
-            "Redis 연결 실패 시 실패 기사 파일이 생성되어야 함"
+        assert len(failed_spool.list_segments()) == 1, \
+            "Redis 연결 실패 시 실패 스풀 세그먼트가 생성되어야 함"
 
     def test_failed_articles_saved_to_tmp(self, mocker, env_vars, tmp_path):
         """
-        [22] 발행 실패 기사가 1건이면 실패 파일이 생성되고 해당 기사가 포함되어야 한다.
+        [22] 발행 실패 기사가 1건이면 실패 스풀 세그먼트가 생성되고 해당 기사가 포함되어야 한다.
         """
         # Arrange
-        failed_path = str(tmp_path / "failed_articles.json")
-        mocker.patch.object(article_publisher, "FAILED_ARTICLES_PATH", failed_path)
-
         articles = [{
             "url":         "https://example.com/fail",
             "title":       "실패 기사",
@@ -543,21 +727,18 @@ class TestCrawlAndPublish:
         article_publisher.crawl_and_publish()
 
         # Assert
-        assert os.path.exists(failed_path), "실패 기사 파일이 생성되어야 함"
-        with open(failed_path, encoding="utf-8") as f:
-            saved = json.load(f)
-        assert len(saved) == 1, "실패 기사 1건이 파일에 저장되어야 함"
+        segments = failed_spool.list_segments()
+        assert len(segments) == 1, "실패 스풀 세그먼트가 생성되어야 함"
+        saved = failed_spool.read_segment(segments[0])
+        assert len(saved) == 1, "실패 기사 1건이 세그먼트에 저장되어야 함"
         assert saved[0]["url"] == "https://example.com/fail", \
             "저장된 기사의 url이 일치해야 함"
 
     def test_no_failed_file_when_all_success(self, mocker, env_vars, tmp_path):
         """
-        [AP-23] 모든 기사가 성공적으로 발행되면 실패 파일이 생성되지 않아야 한다.
+        [AP-23] 모든 기사가 성공적으로 발행되면 실패 스풀 세그먼트가 생성되지 않아야 한다.
         """
         # Arrange
-        failed_path = str(tmp_path / "failed_articles.json")
-        mocker.patch.object(article_publisher, "FAILED_ARTICLES_PATH", failed_path)
-
         articles = [{
             "url":         "https://example.com/success",
             "title":       "성공 기사",
@@ -574,8 +755,8 @@ class TestCrawlAndPublish:
         article_publisher.crawl_and_publish()
 
         # Assert
-        assert not os.path.exists(failed_path), \
-            "전체 발행 성공 시 실패 파일이 생성되면 안 됨"
+        assert failed_spool.list_segments() == [], \
+            "전체 발행 성공 시 실패 스풀 세그먼트가 생성되면 안 됨"
 
 
 # ===========================================================================
@@ -706,11 +887,11 @@ class TestUpdateLastCrawlTime:
 class TestCrawlAndPublishIncrementalFlow:
 
     def test_since_dt_from_redis_is_passed_to_run_crawler(
-        self, mocker, env_vars_with_last_crawl, fake_redis
+        self, mocker, monkeypatch, env_vars_with_last_crawl, fake_redis
     ):
         """
-        [AP-33] REDIS_LAST_CRAWL_KEY에 저장된 시각이 run_crawler(since_dt=...)로
-        그대로 전달되어야 한다.
+        [AP-33] REDIS_LAST_CRAWL_KEY에 저장된 시각에서 WATERMARK_OVERLAP_SEC만큼 앞당긴 시각이
+        run_crawler(since_dt=...)로 전달되어야 한다.
 
         검증 목적: crawl_and_publish()가 Redis에서 읽은 since_dt를 크롤러에 넘기는
         전체 데이터 흐름이 올바른지 확인한다.
@@ -719,6 +900,7 @@ class TestCrawlAndPublishIncrementalFlow:
         key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
         since = datetime(2025, 2, 1, 0, 0, 0)
         fake_redis.set(key, since.isoformat())
+        monkeypatch.setenv("WATERMARK_OVERLAP_SEC", "120")
 
         mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
         mock_run_crawler = mocker.patch("article_publisher.run_crawler", return_value=[])
@@ -728,14 +910,15 @@ class TestCrawlAndPublishIncrementalFlow:
         article_publisher.crawl_and_publish()
 
         # Assert
-        mock_run_crawler.assert_called_once_with(since), \
-            "Redis에서 읽은 since_dt가 run_crawler에 전달되어야 함"
+        mock_run_crawler.assert_called_once_with(
+            datetime(2025, 1, 31, 23, 58, 0), deadline=None, since_scopes={}, extra_env=None
+        ), "Redis에서 읽은 since_dt(겹침 구간 포함)가 run_crawler에 전달되어야 함"
 
     def test_last_crawl_time_updated_when_articles_crawled(
         self, mocker, env_vars_with_last_crawl, fake_redis, sample_articles
     ):
         """
-        [AP-34] 크롤링 기사가 1건 이상이면 crawl_start 시각으로
+        [AP-34] 발행된 기사가 있으면 그 기사의 publishedAt으로
         last_crawl_time이 업데이트되어야 한다.
 
         검증 목적: 다음 실행 시 증분 크롤링이 올바른 기준 시각을 사용하는지 보장한다.
@@ -757,10 +940,8 @@ class TestCrawlAndPublishIncrementalFlow:
             "크롤링 성공 후 last_crawl_time이 Redis에 저장되어야 함"
         assert "T" in stored, \
             "저장된 시각은 ISO 8601(T 구분자) 형식이어야 함"
-        # 저장된 시각이 파싱 가능한지 검증
-        parsed = datetime.fromisoformat(stored)
-        assert isinstance(parsed, datetime), \
-            "저장된 값이 파싱 가능한 datetime이어야 함"
+        assert datetime.fromisoformat(stored) == datetime.fromisoformat(sample_articles[0]["publishedAt"]), \
+            "기준 시각은 크롤링 시작 시각이 아니라 발행된 기사의 publishedAt이어야 함"
 
     def test_last_crawl_time_not_updated_when_no_articles_crawled(
         self, mocker, env_vars_with_last_crawl, fake_redis
@@ -785,3 +966,734 @@ class TestCrawlAndPublishIncrementalFlow:
         stored = fake_redis.get(key)
         assert stored is None, \
             "기사 0건 시 last_crawl_time이 저장되면 안 됨 — since_dt를 그대로 유지해야 함"
+
+
+# ===========================================================================
+# 마감 시각(deadline) 전파 — 시나리오 AP-36 ~ AP-39
+# ===========================================================================
+
+class TestDeadlinePropagation:
+
+    def test_deadline_caps_spider_time(self, mocker, env_vars, monkeypatch):
+        """
+        [AP-36] deadline이 주어지면 스파이더의 MAX_CRAWL_TIME은
+        남은 예산에서 종료 여유 시간을 뺀 값으로 줄어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("MAX_CRAWL_TIME", "300")
+        captured: list[dict] = []
+
+        def capture(*args, **kwargs):
+            captured.append(kwargs)
+            return _fake_process(0)
+
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=capture)
+        deadline = article_publisher.time.monotonic() + 60
+
+        # Act
+        list(article_publisher.run_crawler(deadline=deadline))
+
+        # Assert
+        max_crawl_time = int(captured[0]["env"]["MAX_CRAWL_TIME"])
+        assert max_crawl_time <= 60 - article_publisher.CRAWL_SHUTDOWN_GRACE_SEC, \
+            "MAX_CRAWL_TIME은 예산에서 종료 여유 시간을 뺀 값 이하여야 함"
+
+    def test_deadline_stops_crawler_and_returns_partial_output(self, mocker, env_vars):
+        """
+        [AP-37] 크롤링 예산을 넘기면 크롤러를 종료(terminate)하고,
+        예외 없이 그때까지 기록된 JSONL 기사를 반환해야 한다.
+        """
+        # Arrange
+        output_path = env_vars["OUTPUT_FILE_PATH"]
+        proc = _fake_process(None)
+        proc.poll.side_effect = lambda: proc.returncode
+
+        def terminate():
+            proc.returncode = -15
+
+        proc.terminate.side_effect = terminate
+
+        def start_crawler(*args, **kwargs):
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write('{"url": "https://example.com/1", "title": "부분 결과"}\n')
+            return proc
+
+        mocker.patch("article_publisher.subprocess.Popen", side_effect=start_crawler)
+
+        # Act
+        output = article_publisher.run_crawler(deadline=article_publisher.time.monotonic() - 1)
+        result = list(output)
+
+        # Assert
+        proc.terminate.assert_called_once(), "예산 초과 시 크롤러를 종료해야 함"
+        assert [a["url"] for a in result] == ["https://example.com/1"], \
+            "종료 전까지 기록된 기사가 반환되어야 함"
+        assert output.stopped_by_deadline, "마감 시각으로 중단했음을 기록해야 함"
+
+    def test_publish_stops_at_deadline_and_checkpoints(
+        self, mocker, env_vars_with_last_crawl, fake_redis, sample_articles
+    ):
+        """
+        [AP-38] 발행 도중 마감 시각에 도달하면 남은 기사를 발행하지 않고
+        실패 스풀에 저장(deferred)해야 하며, last_crawl_time은 보류된 기사보다 앞으로 가면 안 된다.
+        """
+        # Arrange
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=sample_articles)
+        mocker.patch("article_publisher.load_published_urls", return_value=set())
+        mock_publish = mocker.patch("article_publisher.publish_article", return_value=True)
+        mock_save = mocker.patch("article_publisher._save_failed_articles")
+        # 첫 기사 발행 후 두 번째 기사 발행 전에 마감 도달 (크롤링 예산은 넘지 않음)
+        mocker.patch("article_publisher._deadline_exceeded", side_effect=[False, True, False])
+
+        # Act
+        result = article_publisher.crawl_and_publish(
+            deadline=article_publisher.time.monotonic() + 60
+        )
+
+        # Assert
+        assert result["published"] == 1 and result["deferred"] == 2, \
+            f"마감 이후 기사는 deferred로 집계되어야 함: {result}"
+        assert mock_publish.call_count == 1, "마감 이후에는 발행을 시도하면 안 됨"
+        saved = mock_save.call_args.args[0]
+        assert [a["url"] for a in saved] == [a["url"] for a in sample_articles[1:]], \
+            "미발행 기사가 실패 파일로 체크포인트되어야 함"
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        assert fake_redis.get(key) == sample_articles[0]["publishedAt"], \
+            "마감으로 중단된 경우 last_crawl_time은 발행된 기사까지만 갱신되어야 함"
+
+    def test_crawl_gets_budget_share_of_deadline(self, mocker, env_vars, monkeypatch):
+        """
+        [AP-39] CRAWL_BUDGET_RATIO=0.5이면 run_crawler에 전달되는 크롤링 마감 시각은
+        전체 남은 시간의 절반 이내여야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("CRAWL_BUDGET_RATIO", "0.5")
+        mocker.patch("article_publisher.get_redis_client", return_value=MagicMock())
+        mock_run_crawler = mocker.patch("article_publisher.run_crawler", return_value=[])
+        mocker.patch("article_publisher.load_published_urls", return_value=set())
+        now = article_publisher.time.monotonic()
+
+        # Act
+        article_publisher.crawl_and_publish(deadline=now + 100)
+
+        # Assert
+        crawl_deadline = mock_run_crawler.call_args.kwargs["deadline"]
+        assert now < crawl_deadline <= now + 50 + 1, \
+            "크롤링 마감은 남은 시간의 CRAWL_BUDGET_RATIO 비율이어야 함"
+
+
+# ===========================================================================
+# crawl_and_publish() 실행 지표 — 시나리오 AP-45
+# ===========================================================================
+
+class TestCrawlAndPublishMetrics:
+
+    def test_result_contains_stage_timings_and_redis_counts(
+        self, mocker, env_vars, fake_redis, sample_articles, capsys
+    ):
+        """
+        [AP-45] 결과에 단계별 소요 시간, 기사별 지연 분포, Redis 명령 수가 포함되고
+        stdout에 EMF JSON이 출력되어야 한다.
+        """
+        # Arrange
+        for i, article in enumerate(sample_articles):
+            article["crawlMetrics"] = {
+                "downloadLatencyMs": 100.0 + i, "parseLatencyMs": 5.0, "bytes": 1_000,
+            }
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=sample_articles)
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        summary = result["metrics"]
+        for stage in ("redis_connect", "last_crawl_lookup", "crawl", "dedupe_load", "publish"):
+            assert stage in summary["timings_ms"], f"{stage} 단계 소요 시간이 있어야 함"
+        assert summary["histograms"]["article.download_ms"]["count"] == 3
+        assert summary["counters"]["bytes.downloaded"] == 3_000
+        assert summary["counters"]["redis.xadd"] == 3, "기사 3건에 대해 XADD 3회가 집계되어야 함"
+
+        emf_lines = [
+            line for line in capsys.readouterr().out.splitlines() if '"_aws"' in line
+        ]
+        assert len(emf_lines) == 1, "EMF JSON이 stdout에 한 줄 출력되어야 함"
+        assert json.loads(emf_lines[0])["articles.published"] == 3
+
+
+# ===========================================================================
+# 섹션별(범위별) 증분 기준 시각 — 시나리오 AP-46 ~ AP-47
+# ===========================================================================
+
+class TestScopeWatermarks:
+
+    def test_scope_crawl_times_passed_to_run_crawler(
+        self, mocker, env_vars_with_last_crawl, fake_redis
+    ):
+        """
+        [AP-46] "<REDIS_LAST_CRAWL_KEY>:scopes" Hash의 범위별 기준 시각이 WATERMARK_OVERLAP_SEC만큼
+        앞당겨져 run_crawler(since_scopes=...)로 전달되어야 한다.
+        """
+        # Arrange
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        scope_since = datetime(2025, 3, 1, 12, 0, 0)
+        fake_redis.hset(f"{key}:scopes", "naver_finance:101/258", scope_since.isoformat())
+
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mock_run_crawler = mocker.patch("article_publisher.run_crawler", return_value=[])
+        mocker.patch("article_publisher.load_published_urls", return_value=set())
+
+        # Act
+        article_publisher.crawl_and_publish()
+
+        # Assert
+        _, kwargs = mock_run_crawler.call_args
+        assert kwargs["since_scopes"] == {"naver_finance:101/258": scope_since - timedelta(seconds=600)}
+
+    def test_only_crawled_scopes_advance(
+        self, mocker, env_vars_with_last_crawl, fake_redis, sample_articles
+    ):
+        """
+        [AP-47] 기사가 수집된 범위의 기준 시각만 업데이트되고, 결과에 범위별 건수가 포함되어야 한다.
+        다른 섹션의 기존 기준 시각은 그대로 유지되어야 한다.
+        """
+        # Arrange
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        fake_redis.hset(f"{key}:scopes", "naver_finance:101/258", "2025-03-01T12:00:00")
+        articles = [
+            {**sample_articles[0], "section": "101/259", "source": "naver_finance"},
+            {**sample_articles[1], "section": "101/259", "source": "naver_finance"},
+        ]
+
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=articles)
+        mocker.patch("article_publisher.load_published_urls", return_value={articles[0]["url"]})
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        stored = fake_redis.hgetall(f"{key}:scopes")
+        assert stored["naver_finance:101/258"] == "2025-03-01T12:00:00", \
+            "기사가 없던 섹션의 기준 시각은 유지되어야 함"
+        assert "naver_finance:101/259" in stored, "기사가 수집된 섹션의 기준 시각이 저장되어야 함"
+        assert result["scopes"] == {
+            "naver_finance:101/259": {"crawled": 2, "published": 1, "skipped": 1, "failed": 0},
+        }
+        message = fake_redis.xrange(env_vars_with_last_crawl["REDIS_ARTICLE_STREAM_KEY"])[0][1]
+        assert message["section"] == "101/259", "Stream 메시지에 섹션이 포함되어야 함"
+
+
+# ===========================================================================
+# 실패 스풀 재발행 — 시나리오 AP-48 ~ AP-49, AP-65
+# ===========================================================================
+
+class TestFailedSpoolReplay:
+
+    def test_spooled_articles_replayed_on_next_run(
+        self, mocker, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-48] 이전 실행들의 실패 세그먼트는 누적되고, 다음 crawl_and_publish 시작 시
+        중복을 거른 뒤 재발행되며 처리한 세그먼트는 삭제되어야 한다.
+        """
+        # Arrange
+        article_publisher._save_failed_articles(sample_articles[:2])
+        article_publisher._save_failed_articles(sample_articles[1:])
+        assert len(failed_spool.list_segments()) == 2, "저장할 때마다 새 세그먼트가 생겨야 함"
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=[])
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        assert result["replayed"] == {"segments": 2, "published": 3, "skipped": 1, "failed": 0}
+        assert fake_redis.xlen(env_vars["REDIS_ARTICLE_STREAM_KEY"]) == 3
+        assert failed_spool.list_segments() == [], "재발행한 세그먼트는 삭제되어야 함"
+
+    def test_replay_stops_and_respools_on_failure(
+        self, mocker, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-49] 재발행 중 실패가 나오면 실패 기사를 새 세그먼트로 남기고,
+        아직 처리하지 않은 세그먼트는 건드리지 않은 채 멈춰야 한다.
+        """
+        # Arrange
+        article_publisher._save_failed_articles(sample_articles[:1])
+        article_publisher._save_failed_articles(sample_articles[1:])
+        first, second = failed_spool.list_segments()
+        mocker.patch("article_publisher.publish_batch", side_effect=lambda client, batch, cache, codec=None: list(batch))
+
+        # Act
+        stats = article_publisher.replay_failed_spool(fake_redis, set())
+
+        # Assert
+        assert stats == {"segments": 1, "published": 0, "skipped": 0, "failed": 1}
+        segments = failed_spool.list_segments()
+        assert first not in segments and second in segments
+        assert [a["url"] for a in failed_spool.read_segment(segments[-1])] == [sample_articles[0]["url"]]
+
+    def test_overflow_segment_kept_until_replayed(
+        self, mocker, monkeypatch, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-65] Redis 오버플로 List의 세그먼트는 재발행이 끝나기 전에는 List에 남아야 하고
+        (도중에 예외가 나도 유실되지 않음), 다시 실패한 기사만 List 맨 앞에 되돌아가야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("FAILED_SPOOL_OVERFLOW_KEY", "test:failed_spool")
+        fake_redis.rpush("test:failed_spool", json.dumps(sample_articles[:2]), json.dumps(sample_articles[2:]))
+        mocker.patch("article_publisher.publish_batch", side_effect=redis.exceptions.ConnectionError("down"))
+
+        # Act
+        with pytest.raises(redis.exceptions.ConnectionError):
+            article_publisher.replay_failed_spool(fake_redis, set())
+        length_after_crash = fake_redis.llen("test:failed_spool")
+        mocker.patch(
+            "article_publisher.publish_batch",
+            side_effect=lambda client, batch, cache, codec=None: [a for a in batch if a["url"] == sample_articles[1]["url"]],
+        )
+        stats = article_publisher.replay_failed_spool(fake_redis, set())
+
+        # Assert
+        assert length_after_crash == 2
+        assert stats == {"segments": 1, "published": 1, "skipped": 0, "failed": 1}
+        assert [json.loads(raw) for raw in fake_redis.lrange("test:failed_spool", 0, -1)] == [
+            [sample_articles[1]], sample_articles[2:],
+        ]
+
+
+# ===========================================================================
+# 발행 결과 기반 증분 기준 시각 — 시나리오 AP-50 ~ AP-52
+# ===========================================================================
+
+class TestPublishedWatermark:
+
+    def _scoped(self, sample_articles):
+        return [{**a, "section": "101/259", "source": "naver_finance"} for a in sample_articles]
+
+    def test_watermark_stops_before_failed_article(
+        self, mocker, env_vars_with_last_crawl, fake_redis, sample_articles
+    ):
+        """
+        [AP-50] 발행에 실패한 기사가 있으면 기준 시각은 그보다 앞선 발행 기사의 publishedAt까지만
+        올라가야 한다 (실패 기사보다 최근 기사가 발행됐더라도).
+        """
+        # Arrange
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        articles = self._scoped(sample_articles)  # publishedAt 01-01, 01-02, 01-03
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=articles)
+        mocker.patch("article_publisher.load_published_urls", return_value=set())
+        mocker.patch(
+            "article_publisher.publish_article",
+            side_effect=lambda client, article, cache, codec=None: article["url"] != articles[1]["url"],
+        )
+
+        # Act
+        article_publisher.crawl_and_publish()
+
+        # Assert
+        assert fake_redis.get(key) == "2025-01-01T00:00:00"
+        assert fake_redis.hget(f"{key}:scopes", "naver_finance:101/259") == "2025-01-01T00:00:00"
+
+    def test_saturated_scope_keeps_watermark(
+        self, mocker, monkeypatch, env_vars_with_last_crawl, fake_redis, sample_articles
+    ):
+        """
+        [AP-51] 섹션이 MAX_ARTICLES 한도까지 수집되면 더 오래된 새 기사를 놓쳤을 수 있으므로
+        그 범위와 공통 기준 시각을 올리지 않아야 한다.
+        """
+        # Arrange
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        monkeypatch.setenv("MAX_ARTICLES", "3")
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=self._scoped(sample_articles))
+        mocker.patch("article_publisher.load_published_urls", return_value=set())
+        mocker.patch("article_publisher.publish_article", return_value=True)
+
+        # Act
+        article_publisher.crawl_and_publish()
+
+        # Assert
+        assert fake_redis.get(key) is None
+        assert fake_redis.hgetall(f"{key}:scopes") == {}
+
+    def test_watermark_never_moves_backwards(
+        self, mocker, env_vars_with_last_crawl, fake_redis, sample_articles
+    ):
+        """
+        [AP-52] 겹침 구간에서 다시 수집된 기사만 있으면 기준 시각이 뒤로 돌아가면 안 된다.
+        """
+        # Arrange
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        fake_redis.set(key, "2025-01-05T00:00:00")
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=sample_articles[:1])
+        mocker.patch("article_publisher.load_published_urls", return_value={sample_articles[0]["url"]})
+
+        # Act
+        article_publisher.crawl_and_publish()
+
+        # Assert
+        assert fake_redis.get(key) == "2025-01-05T00:00:00"
+
+    def test_watermark_held_only_when_crawler_was_stopped(
+        self, mocker, env_vars_with_last_crawl, fake_redis, sample_articles
+    ):
+        """
+        [AP-62] 발행이 길어져 크롤링 몫의 시간을 넘겼어도 크롤러가 스스로 끝났다면 기준 시각을 올려야 하고,
+        크롤러를 마감 시각으로 실제로 중단했을 때만 유지해야 한다.
+        """
+        # Arrange
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.load_published_urls", return_value=set())
+        mocker.patch("article_publisher.publish_article", return_value=True)
+        mocker.patch(
+            "article_publisher._crawl_deadline", return_value=article_publisher.time.monotonic() - 1
+        )
+        stopped = article_publisher.CrawlerOutput()
+        stopped._articles = iter(sample_articles[:1])
+        stopped.stopped_by_deadline = True
+
+        # Act
+        mocker.patch("article_publisher.run_crawler", return_value=sample_articles[:1])
+        article_publisher.crawl_and_publish()
+        advanced = fake_redis.get(key)
+        fake_redis.delete(key)
+        mocker.patch("article_publisher.run_crawler", return_value=stopped)
+        article_publisher.crawl_and_publish()
+
+        # Assert
+        assert advanced == sample_articles[0]["publishedAt"]
+        assert fake_redis.get(key) is None
+
+
+# ===========================================================================
+# Stream 본문 압축 — 시나리오 AP-53
+# ===========================================================================
+
+class TestCompressedPayload:
+
+    def test_publish_with_codec_roundtrips_through_redis(self, monkeypatch, env_vars, fake_redis):
+        """
+        [AP-53] STREAM_PAYLOAD_CODEC=zlib이면 압축된 본문과 codec 필드가 Stream에 실리고,
+        decode_responses=True 클라이언트로 읽어 stream_codec.decode_message로 원문을 복원할 수 있어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_PAYLOAD_CODEC", "zlib")
+        article = {
+            "url": "https://example.com/compressed",
+            "title": "압축 기사",
+            "content": "원·달러 환율은 전 거래일보다 4.2원 내린 1,338.5원에 마감했다. " * 100,
+            "publishedAt": "2025-01-01T09:00:00",
+            "press": "연합뉴스",
+        }
+
+        # Act
+        assert article_publisher.publish_article(fake_redis, article, set()) is True
+
+        # Assert
+        _, fields = fake_redis.xrange(env_vars["REDIS_ARTICLE_STREAM_KEY"])[0]
+        assert fields["contentCodec"] == "zlib+b64"
+        assert len(fields["content"]) < len(article["content"].encode("utf-8")) / 2
+        assert stream_codec.decode_message(fields)["content"] == article["content"]
+
+
+# ===========================================================================
+# 본문 참조 모드 — 시나리오 AP-54
+# ===========================================================================
+
+class TestContentReferenceMode:
+
+    def test_identical_bodies_stored_once(self, monkeypatch, env_vars, fake_redis, sample_articles):
+        """
+        [AP-54] STREAM_CONTENT_MODE=ref이면 본문이 같은 기사들은 본문 key 하나를 공유하고,
+        Stream 메시지에는 본문 없이 해시만 실려야 한다 (publish_article·publish_batch 공통).
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_CONTENT_MODE", "ref")
+        wire = "[서울=연합뉴스] 한국은행 금융통화위원회는 기준금리를 연 3.50%로 동결했다."
+        articles = [{**a, "content": wire} for a in sample_articles]
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+
+        # Act
+        assert article_publisher.publish_article(fake_redis, articles[0], set()) is True
+        failed = article_publisher.publish_batch(fake_redis, articles[1:], set())
+
+        # Assert
+        assert failed == []
+        entries = [fields for _, fields in fake_redis.xrange(stream_key)]
+        assert len(entries) == 3 and all("content" not in fields for fields in entries)
+        assert len({fields["contentRef"] for fields in entries}) == 1
+        assert fake_redis.keys(f"{stream_key}:content:*") == [f"{stream_key}:content:{entries[0]['contentRef']}"]
+        assert [m["content"] for m in stream_codec.decode_messages(entries, fake_redis)] == [wire] * 3
+
+
+# ===========================================================================
+# 유사 기사 필터 — 시나리오 AP-55
+# ===========================================================================
+
+class TestNearDuplicateFilter:
+
+    def test_wire_copy_skipped_and_marked_published(
+        self, mocker, monkeypatch, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-55] NEAR_DUP_FILTER=true이면 먼저 발행된 기사와 본문이 거의 같은 전재 기사는
+        URL이 달라도 발행하지 않고, 다음 실행에서 다시 검사하지 않도록 발행 URL 집합에 넣어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("NEAR_DUP_FILTER", "true")
+        body = " ".join(f"한국은행 금통위 {i}차 회의 기준금리 결정 배경 설명 {i * 7}" for i in range(60))
+        original = {**sample_articles[0], "content": body}
+        copy = {**sample_articles[1], "content": f"[서울=뉴시스] {body} 무단 전재 금지"}
+        other = sample_articles[2]
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=[original, copy, other])
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        assert result["near_duplicates"] == 1
+        entries = [fields["url"] for _, fields in fake_redis.xrange(env_vars["REDIS_ARTICLE_STREAM_KEY"])]
+        assert entries == [original["url"], other["url"]]
+        assert fake_redis.sismember(env_vars["REDIS_PUBLISHED_URLS_KEY"], copy["url"])
+
+
+# ===========================================================================
+# 기사 URL 정규화 — 시나리오 AP-56
+# ===========================================================================
+
+class TestCanonicalUrlDedupe:
+
+    def test_query_variant_of_published_article_is_duplicate(
+        self, mocker, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-56] 이미 발행된 네이버 기사를 쿼리·호스트만 다른 URL로 다시 수집하면 중복으로 걸러야 하고,
+        새 기사는 대표 URL로 Stream과 발행 URL Set에 기록되어야 한다.
+        """
+        # Arrange
+        urls_key = env_vars["REDIS_PUBLISHED_URLS_KEY"]
+        fake_redis.sadd(urls_key, "https://n.news.naver.com/mnews/article/015/0005012345")
+        variant = {**sample_articles[0], "url": "https://m.news.naver.com/article/015/0005012345?sid=101"}
+        fresh = {**sample_articles[1], "url": "https://news.naver.com/main/read.naver?oid=009&aid=0000000001"}
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=[variant, fresh])
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        assert (result["published"], result["skipped"]) == (1, 1)
+        canonical = "https://n.news.naver.com/mnews/article/009/0000000001"
+        entries = fake_redis.xrange(env_vars["REDIS_ARTICLE_STREAM_KEY"])
+        assert [fields["url"] for _, fields in entries] == [canonical]
+        assert fake_redis.sismember(urls_key, canonical)
+
+
+# ===========================================================================
+# 수정 기사 재발행 — 시나리오 AP-57 ~ AP-58
+# ===========================================================================
+
+class TestArticleRevisions:
+
+    def _run(self, mocker, fake_redis, articles):
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=articles)
+        return article_publisher.crawl_and_publish()
+
+    def test_changed_content_republished_as_update(self, mocker, env_vars, fake_redis, sample_articles):
+        """
+        [AP-57] 발행된 기사가 새 수정 시각과 바뀐 본문으로 다시 수집되면 event=update로 재발행하고,
+        같은 수정 시각으로 다시 오면 중복으로 skip해야 한다.
+        """
+        # Arrange
+        original = {**sample_articles[0], "modifiedAt": None}
+        corrected = {**original, "content": "정정: 영업이익 3조원", "modifiedAt": "2025-01-02T09:00:00", "revision": True}
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+
+        # Act
+        first = self._run(mocker, fake_redis, [original])
+        second = self._run(mocker, fake_redis, [corrected])
+        third = self._run(mocker, fake_redis, [corrected])
+
+        # Assert
+        assert first["published"] == 1 and "updated" not in first
+        assert (second["updated"], second["skipped"]) == (1, 0)
+        assert (third["skipped"], "updated" in third) == (1, False)
+        messages = [fields for _, fields in fake_redis.xrange(stream_key)]
+        assert len(messages) == 2
+        assert "event" not in messages[0]
+        assert messages[1]["event"] == "update"
+        assert messages[1]["content"] == "정정: 영업이익 3조원"
+        assert messages[1]["modifiedAt"] == "2025-01-02T09:00:00"
+
+    def test_modified_time_without_content_change_not_republished(
+        self, mocker, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-58] 수정 시각만 바뀌고 제목·본문이 같으면 재발행하지 않고 기록된 수정 시각만 갱신해야 한다.
+        """
+        # Arrange
+        article = sample_articles[0]
+        article_publisher.publish_article(fake_redis, article, set())
+        touched = {**article, "modifiedAt": "2025-01-02T09:00:00"}
+        versions_key = f"{env_vars['REDIS_PUBLISHED_URLS_KEY']}:versions"
+
+        # Act
+        result = self._run(mocker, fake_redis, [touched])
+
+        # Assert
+        assert result["skipped"] == 1 and "updated" not in result
+        assert fake_redis.xlen(env_vars["REDIS_ARTICLE_STREAM_KEY"]) == 1
+        assert fake_redis.hget(versions_key, article["url"]).endswith("|2025-01-02T09:00:00")
+
+
+# ===========================================================================
+# 시간 기준 Stream 보존 — 시나리오 AP-59
+# ===========================================================================
+
+class TestTimeBasedRetention:
+
+    def test_publish_without_maxlen_and_trim_by_age(
+        self, mocker, monkeypatch, tmp_path, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-59] STREAM_RETENTION_SEC이 설정되면 XADD는 건수로 자르지 않고, 실행이 끝날 때
+        보존 기간을 넘은 항목만 아카이브한 뒤 Stream에서 지워야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_RETENTION_SEC", "3600")
+        monkeypatch.setenv("STREAM_ARCHIVE_DIR", str(tmp_path / "archive"))
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+        fake_redis.xadd(stream_key, {"url": "https://example.com/old", "content": ""}, id="1000-0")
+        spy = mocker.spy(fake_redis, "xadd")
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=sample_articles[:1])
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        assert spy.call_args.kwargs["maxlen"] is None
+        assert result["published"] == 1 and result["archived"] == 1
+        assert [fields["url"] for _, fields in fake_redis.xrange(stream_key)] == [sample_articles[0]["url"]]
+        assert [fields["url"] for _, fields in stream_retention.iter_archive(stream_key)] == ["https://example.com/old"]
+
+
+# ===========================================================================
+# consumer 지연 백프레셔 — 시나리오 AP-60, AP-63
+# ===========================================================================
+
+class TestBackpressure:
+
+    def test_lagging_consumer_throttles_crawl_and_compresses(
+        self, mocker, monkeypatch, env_vars, fake_redis, sample_articles
+    ):
+        """
+        [AP-60] consumer group backlog이 warn 기준을 넘으면 크롤러에 줄인 MAX_ARTICLES를 넘기고,
+        본문을 압축해 발행하며, 판단 결과가 실행 결과에 실려야 한다.
+        """
+        # Arrange
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+        for i in range(3):
+            fake_redis.xadd(stream_key, {"url": f"https://example.com/backlog/{i}"})
+        fake_redis.xgroup_create(stream_key, "summarizer", id="0")
+        monkeypatch.setenv("BACKPRESSURE_WARN_BACKLOG", "3")
+        monkeypatch.setenv("MAX_ARTICLES", "10")
+        monkeypatch.setenv("STREAM_PAYLOAD_MIN_BYTES", "0")
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mock_run_crawler = mocker.patch("article_publisher.run_crawler", return_value=sample_articles[:1])
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        assert mock_run_crawler.call_args.kwargs["extra_env"] == {"MAX_ARTICLES": "5"}
+        decision = result["backpressure"]
+        assert (decision["level"], decision["backlog"], decision["codec"]) == ("warn", 3, "zlib")
+        _, fields = fake_redis.xrange(stream_key)[-1]
+        assert fields["contentCodec"] == "zlib+b64"
+
+    def test_deferred_sections_hold_global_watermark_and_replay_compressed(
+        self, mocker, monkeypatch, env_vars_with_last_crawl, fake_redis, sample_articles
+    ):
+        """
+        [AP-63] critical 단계에서 저우선 섹션을 미루면 공통 기준 시각은 그대로 두고 수집한 섹션의
+        기준 시각만 올려야 하며(미룬 섹션이 다음 실행에서 따라잡도록), 실패 스풀 재발행도
+        백프레셔가 강제한 codec으로 압축해야 한다.
+        """
+        # Arrange
+        key = env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]
+        stream_key = env_vars_with_last_crawl["REDIS_ARTICLE_STREAM_KEY"]
+        for i in range(3):
+            fake_redis.xadd(stream_key, {"url": f"https://example.com/backlog/{i}"})
+        fake_redis.xgroup_create(stream_key, "summarizer", id="0")
+        monkeypatch.setenv("BACKPRESSURE_WARN_BACKLOG", "2")
+        monkeypatch.setenv("BACKPRESSURE_CRITICAL_BACKLOG", "3")
+        monkeypatch.setenv("NAVER_SECTIONS", "101/259,101/262")
+        monkeypatch.setenv("BACKPRESSURE_LOW_PRIORITY_SECTIONS", "101/262")
+        monkeypatch.setenv("STREAM_PAYLOAD_MIN_BYTES", "0")
+        article_publisher._save_failed_articles(sample_articles[2:])
+        crawled = [{**a, "section": "101/259", "source": "naver_finance"} for a in sample_articles[:2]]
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mock_run_crawler = mocker.patch("article_publisher.run_crawler", return_value=crawled)
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        assert mock_run_crawler.call_args.kwargs["extra_env"]["NAVER_SECTIONS"] == "101/259"
+        assert result["backpressure"]["deferred_sections"] == ["101/262"]
+        assert fake_redis.get(key) is None, "미룬 섹션이 있으면 공통 기준 시각을 올리면 안 됨"
+        assert fake_redis.hgetall(f"{key}:scopes") == {"naver_finance:101/259": sample_articles[1]["publishedAt"]}
+        replayed = [f for _, f in fake_redis.xrange(stream_key) if f["url"] == sample_articles[2]["url"]]
+        assert replayed[0]["contentCodec"] == "zlib+b64"
+
+
+# ===========================================================================
+# 단계별 지연 시각 — 시나리오 AP-61
+# ===========================================================================
+
+class TestLatencyTimestamps:
+
+    def test_stage_timestamps_carried_and_aggregated(self, mocker, monkeypatch, env_vars, fake_redis, sample_articles):
+        """
+        [AP-61] 스파이더가 실은 단계별 시각과 발행 시각(publishMs)이 Stream 메시지에 실려야 하고,
+        실행 결과에 발견 시 나이·크롤링 지연·발행 지연 분포가 집계되어야 한다.
+        publishedAt은 시간대가 없으면 ARTICLE_TZ 시각으로 본다.
+        """
+        # Arrange
+        monkeypatch.setenv("ARTICLE_TZ", "UTC")
+        published_ms = datetime.fromisoformat(sample_articles[0]["publishedAt"] + "+00:00").timestamp() * 1000
+        article = {
+            **sample_articles[0],
+            "timings": {
+                "fetchStartMs": int(published_ms + 60_000),
+                "fetchEndMs": int(published_ms + 60_200),
+                "parseEndMs": int(published_ms + 60_250),
+            },
+        }
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=[article])
+        mocker.patch("article_publisher.time.time", return_value=(published_ms + 61_000) / 1000)
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        _, fields = fake_redis.xrange(env_vars["REDIS_ARTICLE_STREAM_KEY"])[-1]
+        assert (fields["fetchStartMs"], fields["parseEndMs"]) == (
+            str(int(published_ms + 60_000)), str(int(published_ms + 60_250))
+        )
+        assert fields["publishMs"] == str(int(published_ms + 61_000))
+        histograms = result["metrics"]["histograms"]
+        assert histograms["article.discovery_age_ms"]["p50"] == 60_000
+        assert histograms["article.crawl_ms"]["p50"] == 250
+        assert histograms["article.publish_ms"]["p50"] == 750
@@ -0,0 +1,136 @@
+"""
+test_backfill.py
+backfill 모듈(날짜 범위 백필)의 단위 테스트 (시나리오 BF-01 ~ BF-05)
+"""
+
+from datetime import date, datetime
+
+import article_publisher
+import backfill
+
+
+def _article(index: int) -> dict:
+    return {
+        "url": f"https://n.news.naver.com/mnews/article/001/{index:010d}",
+        "title": f"기사 {index}",
+        "content": "본문",
+        "publishedAt": "2025-01-01T09:00:00",
+        "press": "연합뉴스",
+        "section": "101/259",
+        "source": "naver_finance",
+    }
+
+
+class TestRunBackfill:
+
+    def test_publishes_in_batches_and_checkpoints(self, mocker, env_vars_with_last_crawl, fake_redis):
+        """
+        [BF-01] 날짜마다 크롤러를 실행해 중복을 거른 기사만 배치 발행하고, 끝난 날짜를 체크포인트에 남긴다.
+        실시간 증분 기준 시각(REDIS_LAST_CRAWL_KEY)은 건드리지 않아야 한다.
+        """
+        # Arrange
+        mocker.patch("backfill.get_redis_client", return_value=fake_redis)
+        fake_redis.sadd(env_vars_with_last_crawl["REDIS_PUBLISHED_URLS_KEY"], _article(0)["url"])
+        mock_run_crawler = mocker.patch(
+            "backfill.run_crawler",
+            side_effect=[[_article(0), _article(1)], [_article(2), _article(2)]],
+        )
+        spy_batch = mocker.spy(backfill, "publish_batch")
+
+        # Act
+        result = backfill.run_backfill(date(2025, 1, 1), date(2025, 1, 2))
+
+        # Assert
+        assert (result["crawled"], result["published"], result["skipped"]) == (4, 2, 2)
+        assert result["done"] == 2 and result["remaining"] == []
+        assert spy_batch.call_count == 2, "날짜별로 한 번씩 배치 발행되어야 함"
+        first_env = mock_run_crawler.call_args_list[0].kwargs["extra_env"]
+        assert first_env["BACKFILL_DATES"] == "20250102", "최근 날짜부터 처리해야 함"
+        assert first_env["CRAWL_SOURCES"] == "naver_finance_backfill"
+        assert set(fake_redis.hkeys("test:published_urls:backfill")) == {"2025-01-01", "2025-01-02"}
+        assert fake_redis.get(env_vars_with_last_crawl["REDIS_LAST_CRAWL_KEY"]) is None
+
+    def test_checkpointed_dates_are_skipped(self, mocker, env_vars, fake_redis):
+        """
+        [BF-02] 체크포인트에 완료로 기록된 날짜는 다시 크롤링하지 않아야 한다.
+        """
+        # Arrange
+        mocker.patch("backfill.get_redis_client", return_value=fake_redis)
+        fake_redis.hset("test:published_urls:backfill", "2025-01-02", "{}")
+        mock_run_crawler = mocker.patch("backfill.run_crawler", return_value=[])
+
+        # Act
+        result = backfill.run_backfill(date(2025, 1, 1), date(2025, 1, 2))
+
+        # Assert
+        assert mock_run_crawler.call_count == 1
+        assert mock_run_crawler.call_args.kwargs["extra_env"]["BACKFILL_DATES"] == "20250101"
+        assert result["already_done"] == 1
+
+    def test_failed_batch_not_checkpointed(self, mocker, env_vars, fake_redis):
+        """
+        [BF-03] 발행 실패가 있는 날짜는 체크포인트에 남기지 않아 다음 실행에서 다시 처리되어야 한다.
+        """
+        # Arrange
+        mocker.patch("backfill.get_redis_client", return_value=fake_redis)
+        mocker.patch("backfill.run_crawler", return_value=[_article(1)])
+        mocker.patch("backfill.publish_batch", side_effect=lambda client, batch, cache, codec=None: list(batch))
+
+        # Act
+        result = backfill.run_backfill(date(2025, 1, 1), date(2025, 1, 1))
+
+        # Assert
+        assert result["failed"] == 1
+        assert result["remaining"] == ["2025-01-01"]
+        assert fake_redis.hkeys("test:published_urls:backfill") == []
+
+    def test_saturated_or_stopped_crawl_not_checkpointed(self, mocker, monkeypatch, env_vars, fake_redis):
+        """
+        [BF-04] 섹션이 BACKFILL_MAX_ARTICLES 한도까지 수집됐거나, 크롤러가 마감 시각으로 중단됐거나,
+        스파이더가 MAX_CRAWL_TIME에 걸려 멈춘 날짜는 놓친 기사가 있을 수 있으므로 완료로 기록하지 않아야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("BACKFILL_MAX_ARTICLES", "2")
+        mocker.patch("backfill.get_redis_client", return_value=fake_redis)
+        stopped = article_publisher.CrawlerOutput()
+        stopped._articles = iter([_article(3)])
+        stopped.stopped_by_deadline = True
+        time_limited = article_publisher.CrawlerOutput()
+        time_limited._articles = iter([_article(5)])
+        time_limited.stopped_by_time_limit = True
+        mocker.patch(
+            "backfill.run_crawler",
+            side_effect=[time_limited, [_article(1), _article(2)], stopped, [_article(4)]],
+        )
+
+        # Act
+        result = backfill.run_backfill(date(2025, 1, 1), date(2025, 1, 4))
+
+        # Assert
+        assert result["published"] == 5
+        assert result["remaining"] == ["2025-01-02", "2025-01-03", "2025-01-04"]
+        assert fake_redis.hkeys("test:published_urls:backfill") == ["2025-01-01"]
+
+    def test_rate_limited_complete_day_checkpointed(self, mocker, monkeypatch, env_vars, fake_redis):
+        """
+        [BF-05] 스파이더가 끝까지 크롤링한 날짜는 발행 속도 제한 대기로 MAX_CRAWL_TIME과
+        크롤링 예산 시각을 넘겨도 완료로 기록되어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("MAX_CRAWL_TIME", "2")
+        monkeypatch.setenv("BACKFILL_MAX_ARTICLES_PER_SEC", "1")
+        clock = [1000.0]
+        mocker.patch("backfill.time.monotonic", side_effect=lambda: clock[0])
+        mock_sleep = mocker.patch("backfill.time.sleep", side_effect=lambda sec: clock.__setitem__(0, clock[0] + sec))
+        mocker.patch("backfill.get_redis_client", return_value=fake_redis)
+        complete = article_publisher.CrawlerOutput()
+        complete._articles = iter([_article(1), _article(2), _article(3)])
+        mocker.patch("backfill.run_crawler", return_value=complete)
+
+        # Act
+        result = backfill.run_backfill(date(2025, 1, 1), date(2025, 1, 1), deadline=clock[0] + 5)
+
+        # Assert
+        assert mock_sleep.call_args.args[0] == 3, "3건을 1건/초로 발행하려면 3초 대기해야 함"
+        assert result["published"] == 3 and result["remaining"] == []
+        assert fake_redis.hkeys("test:published_urls:backfill") == ["2025-01-01"]
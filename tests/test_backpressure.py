@@ -0,0 +1,112 @@
+"""
+test_backpressure.py
+backpressure 모듈(consumer group 지연 기반 크롤링 조절)의 단위 테스트 (시나리오 BP-01 ~ BP-04)
+"""
+
+import backpressure
+
+
+def _lagging_group(client, stream_key: str, entries: int, delivered: int) -> None:
+    """entries건을 넣고 그룹 g가 delivered건만 읽고(미확인) 나머지는 읽지 않은 상태를 만든다."""
+    for i in range(entries):
+        client.xadd(stream_key, {"url": f"u{i}"})
+    client.xgroup_create(stream_key, "g", id="0")
+    if delivered:
+        client.xreadgroup("g", "c1", {stream_key: ">"}, count=delivered)
+
+
+class TestReadGroups:
+
+    def test_lag_and_pending_per_group(self, env_vars, fake_redis):
+        """
+        [BP-01] 그룹별로 읽지 않은 항목 수(lag), 읽고 확인하지 않은 항목 수(pending),
+        가장 오래된 미확인 메시지의 나이를 읽어야 한다. Stream이 없으면 빈 dict.
+        """
+        # Arrange
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+        assert backpressure.read_groups(fake_redis, stream_key) == {}
+        _lagging_group(fake_redis, stream_key, entries=5, delivered=2)
+
+        # Act
+        groups = backpressure.read_groups(fake_redis, stream_key)
+
+        # Assert
+        assert groups["g"]["lag"] == 3
+        assert groups["g"]["pending"] == 2
+        assert groups["g"]["oldest_pending_sec"] is not None
+        assert groups["g"]["oldest_unread_sec"] is not None
+
+
+class TestEvaluate:
+
+    def test_thresholds_throttle_compress_and_defer(self, monkeypatch, env_vars, fake_redis):
+        """
+        [BP-02] backlog이 warn 기준을 넘으면 한도를 줄이고 압축을 켜고, critical 기준을 넘으면
+        저우선 섹션을 미뤄야 한다. 모든 섹션이 저우선이면 미루지 않는다.
+        """
+        # Arrange
+        _lagging_group(fake_redis, env_vars["REDIS_ARTICLE_STREAM_KEY"], entries=6, delivered=1)
+        monkeypatch.setenv("NAVER_SECTIONS", "101/259,101/262")
+        monkeypatch.setenv("BACKPRESSURE_LOW_PRIORITY_SECTIONS", "101/262")
+
+        # Act
+        monkeypatch.setenv("BACKPRESSURE_WARN_BACKLOG", "4")
+        warn = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10_000)
+        monkeypatch.setenv("BACKPRESSURE_CRITICAL_BACKLOG", "6")
+        critical = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10_000)
+        monkeypatch.setenv("BACKPRESSURE_LOW_PRIORITY_SECTIONS", "101/259,101/262")
+        all_low = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10_000)
+
+        # Assert
+        assert (warn["level"], warn["backlog"], warn["max_articles"], warn["codec"]) == ("warn", 6, 5, "zlib")
+        assert warn["deferred_sections"] == []
+        assert critical["level"] == "critical" and critical["deferred_sections"] == ["101/262"]
+        assert backpressure.crawler_env(critical) == {"MAX_ARTICLES": "5", "NAVER_SECTIONS": "101/259"}
+        assert all_low["level"] == "critical" and all_low["deferred_sections"] == []
+
+    def test_ok_without_groups_or_when_disabled(self, monkeypatch, env_vars, fake_redis):
+        """
+        [BP-03] consumer group이 없거나 BACKPRESSURE_ENABLED=false이면 아무 조치도 하지 않아야 한다.
+        """
+        # Arrange
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+        fake_redis.xadd(stream_key, {"url": "u"})
+        monkeypatch.setenv("BACKPRESSURE_WARN_BACKLOG", "0")
+
+        # Act
+        no_groups = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10_000)
+        _lagging_group(fake_redis, stream_key, entries=3, delivered=0)
+        monkeypatch.setenv("BACKPRESSURE_ENABLED", "false")
+        disabled = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10_000)
+
+        # Assert
+        for decision in (no_groups, disabled):
+            assert decision["level"] == "ok" and decision["max_articles"] == 10
+            assert backpressure.crawler_env(decision) is None
+
+    def test_retention_mode_uses_unprocessed_age(self, monkeypatch, env_vars, fake_redis):
+        """
+        [BP-04] 시간 기준 보존(STREAM_RETENTION_SEC)이면 MAXLEN 건수가 아니라 가장 오래된 미처리 항목의
+        나이를 보존 기간의 50%·80% 기준과 비교해야 한다.
+        """
+        # Arrange
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+        monkeypatch.setenv("STREAM_RETENTION_SEC", "1000")
+        now_ms = int(backpressure.time.time() * 1000)
+        for age_sec in (900, 600, 10):
+            fake_redis.xadd(stream_key, {"url": f"u{age_sec}"}, id=f"{now_ms - age_sec * 1000}-0")
+        fake_redis.xgroup_create(stream_key, "g", id="0")
+
+        # Act
+        critical = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10)
+        fake_redis.xreadgroup("g", "c1", {stream_key: ">"}, count=1)
+        fake_redis.xack(stream_key, "g", fake_redis.xrange(stream_key)[0][0])
+        warn = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10)
+        fake_redis.xreadgroup("g", "c1", {stream_key: ">"}, count=1)
+        fake_redis.xack(stream_key, "g", fake_redis.xrange(stream_key)[1][0])
+        ok = backpressure.evaluate(fake_redis, max_articles=10, stream_maxlen=10)
+
+        # Assert
+        assert critical["level"] == "critical" and 895 <= critical["oldest_sec"] <= 905
+        assert warn["level"] == "warn" and 595 <= warn["oldest_sec"] <= 605
+        assert ok["level"] == "ok" and ok["backlog"] == 1, "backlog 건수만으로는 올리지 않아야 함"
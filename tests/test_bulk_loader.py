@@ -0,0 +1,114 @@
+"""
+test_bulk_loader.py
+bulk_loader 모듈(덤프 파일 대량 발행)의 단위 테스트 (시나리오 BL-01 ~ BL-04)
+"""
+
+import gzip
+import json
+
+import bulk_loader
+
+
+def _article(index: int) -> dict:
+    return {
+        "url": f"https://n.news.naver.com/mnews/article/001/{index:010d}",
+        "title": f"기사 {index}",
+        "content": "본문",
+        "publishedAt": "2025-01-01T09:00:00",
+        "press": "연합뉴스",
+    }
+
+
+class TestReadFormats:
+
+    def test_reads_jsonl_gzip_and_json_array(self, tmp_path):
+        """
+        [BL-01] JSONL, gzip JSONL, JSON 배열(실패 기사 파일) 형식을 모두 읽고 잘못된 줄은 건너뛰어야 한다.
+        """
+        # Arrange
+        jsonl = tmp_path / "dump.jsonl"
+        jsonl.write_text(
+            json.dumps(_article(1)) + "\n{broken\n\n" + json.dumps(_article(2)) + "\n",
+            encoding="utf-8",
+        )
+        gz = tmp_path / "dump.jsonl.gz"
+        with gzip.open(gz, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(_article(3)) + "\n")
+        array = tmp_path / "failed_articles.json"
+        array.write_text(json.dumps([_article(4), _article(5)], indent=2), encoding="utf-8")
+
+        # Act
+        urls = [a["url"][-2:] for path in (jsonl, gz, array) for a in bulk_loader.iter_articles(str(path))]
+
+        # Assert
+        assert urls == ["01", "02", "03", "04", "05"]
+
+
+class TestLoadFiles:
+
+    def test_dedupes_against_set_and_within_run(self, env_vars, fake_redis, tmp_path):
+        """
+        [BL-02] 이미 발행된 URL과 같은 실행 안에서 겹치는 URL은 건너뛰고, 나머지만 발행해
+        중복 방지 Set에 기록해야 한다.
+        """
+        # Arrange
+        fake_redis.sadd(env_vars["REDIS_PUBLISHED_URLS_KEY"], _article(0)["url"])
+        dump = tmp_path / "dump.jsonl"
+        dump.write_text(
+            "".join(json.dumps(_article(i)) + "\n" for i in [0, 1, 2, 2, 3, 4]),
+            encoding="utf-8",
+        )
+
+        # Act
+        result = bulk_loader.load_files([str(dump)], batch_size=2, workers=2, redis_client=fake_redis)
+
+        # Assert
+        assert (result["read"], result["published"], result["skipped"], result["failed"]) == (6, 4, 2, 0)
+        assert fake_redis.xlen(env_vars["REDIS_ARTICLE_STREAM_KEY"]) == 4
+        assert fake_redis.scard(env_vars["REDIS_PUBLISHED_URLS_KEY"]) == 5
+
+    def test_failed_batches_are_saved(self, mocker, env_vars, fake_redis, tmp_path):
+        """
+        [BL-03] 발행에 실패한 기사는 실패 기사 저장소에 넘겨야 한다.
+        """
+        # Arrange
+        dump = tmp_path / "dump.jsonl"
+        dump.write_text(json.dumps(_article(1)) + "\n", encoding="utf-8")
+        mocker.patch("bulk_loader.publish_batch", side_effect=lambda client, batch, cache, maxlen: list(batch))
+        mock_save = mocker.patch("bulk_loader._save_failed_articles")
+
+        # Act
+        result = bulk_loader.load_files([str(dump)], redis_client=fake_redis)
+
+        # Assert
+        assert result["failed"] == 1
+        assert [a["url"] for a in mock_save.call_args.args[0]] == [_article(1)["url"]]
+
+    def test_repeat_after_batch_finished_caught_by_set(self, mocker, env_vars, fake_redis, tmp_path):
+        """
+        [BL-04] 이미 끝난 배치의 URL은 메모리에 두지 않고 SMISMEMBER로 걸러야 하며,
+        진행 상황은 배치를 넘길 때마다 확인해야 한다.
+        """
+        # Arrange
+        dump = tmp_path / "dump.jsonl"
+        dump.write_text("".join(json.dumps(_article(i)) + "\n" for i in [1, 2, 1, 3]), encoding="utf-8")
+
+        class InlineExecutor(bulk_loader.ThreadPoolExecutor):
+            """배치를 넘기는 즉시 처리해 앞 배치가 항상 끝난 상태를 만든다."""
+
+            def submit(self, fn, *args):
+                future = bulk_loader.Future()
+                future.set_result(fn(*args))
+                return future
+
+        mocker.patch("bulk_loader.ThreadPoolExecutor", InlineExecutor)
+        load_batch = mocker.spy(bulk_loader, "_load_batch")
+        report = mocker.spy(bulk_loader._Progress, "maybe_report")
+
+        # Act
+        result = bulk_loader.load_files([str(dump)], batch_size=1, workers=1, redis_client=fake_redis)
+
+        # Assert
+        assert (result["read"], result["published"], result["skipped"]) == (4, 3, 1)
+        assert load_batch.call_count == 4, "끝난 배치의 URL은 Redis 중복 확인으로 넘어가야 함"
+        assert report.call_count == 4, "배치를 넘길 때마다 진행 상황을 확인해야 함"
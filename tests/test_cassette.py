@@ -0,0 +1,151 @@
+"""
+test_cassette.py
+cassette 모듈(HTTP 응답 녹화/재생 미들웨어)의 단위 테스트 (시나리오 CS-01 ~ CS-06)
+
+Scrapy 엔진 없이 미들웨어의 process_response / process_request를 직접 호출한다.
+"""
+
+import os
+
+import pytest
+from scrapy.exceptions import IgnoreRequest
+from scrapy.http import HtmlResponse, Request, Response
+
+import cassette
+
+
+def _record(path: str, pages: list[tuple[str, int, str]]) -> None:
+    """(url, status, body) 목록을 녹화 모드 미들웨어로 아카이브에 기록한다."""
+    middleware = cassette.CassetteMiddleware("record", path, 0.0)
+    for url, status, body in pages:
+        request = Request(url, meta={"download_latency": 0.25})
+        response = HtmlResponse(
+            url=url, status=status, body=body.encode("utf-8"), encoding="utf-8",
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+        assert middleware.process_response(request, response, None) is response
+    middleware.spider_closed(None)
+
+
+class TestCassette:
+
+    def test_replay_returns_recorded_response(self, tmp_path):
+        """
+        [CS-01] 녹화한 응답이 본문·상태 코드·헤더·다운로드 지연까지 그대로 재생되어야 한다.
+        """
+        # Arrange
+        path = str(tmp_path / "naver.cassette")
+        _record(path, [("https://n.news.naver.com/a/1", 200, "<h2>제목</h2>")])
+        middleware = cassette.CassetteMiddleware("replay", path, 0.0)
+        request = Request("https://n.news.naver.com/a/1")
+
+        # Act
+        response = middleware.process_request(request, None)
+
+        # Assert
+        assert isinstance(response, HtmlResponse), "Content-Type에 맞는 응답 타입이어야 함"
+        assert response.status == 200
+        assert response.text == "<h2>제목</h2>"
+        assert "cassette" in response.flags
+        assert request.meta["download_latency"] == 0.25
+
+    def test_repeated_request_replays_in_order(self, tmp_path):
+        """
+        [CS-02] 같은 요청이 여러 번 녹화됐으면 녹화 순서대로, 이후에는 마지막 응답을 반복해야 한다.
+        """
+        # Arrange
+        path = str(tmp_path / "naver.cassette")
+        url = "https://n.news.naver.com/a/2"
+        _record(path, [(url, 500, "error"), (url, 200, "ok")])
+        middleware = cassette.CassetteMiddleware("replay", path, 0.0)
+
+        # Act
+        statuses = [middleware.process_request(Request(url), None).status for _ in range(3)]
+
+        # Assert
+        assert statuses == [500, 200, 200]
+
+    def test_missing_request_is_ignored(self, tmp_path):
+        """
+        [CS-03] 녹화에 없는 요청은 네트워크로 보내지 않고 IgnoreRequest를 발생시켜야 한다.
+        """
+        # Arrange
+        path = str(tmp_path / "naver.cassette")
+        _record(path, [("https://n.news.naver.com/a/1", 200, "ok")])
+        middleware = cassette.CassetteMiddleware("replay", path, 0.0)
+
+        # Act & Assert
+        with pytest.raises(IgnoreRequest):
+            middleware.process_request(Request("https://n.news.naver.com/a/404"), None)
+        assert middleware.misses == 1
+
+    def test_index_rebuilt_when_missing(self, tmp_path):
+        """
+        [CS-04] 색인 파일이 없으면 아카이브를 훑어 색인을 다시 만들고 정상 재생해야 한다.
+        """
+        # Arrange
+        path = str(tmp_path / "naver.cassette")
+        _record(path, [("https://n.news.naver.com/a/1", 200, "one"),
+                       ("https://n.news.naver.com/a/2", 200, "two")])
+        os.remove(f"{path}.idx")
+
+        # Act
+        middleware = cassette.CassetteMiddleware("replay", path, 0.0)
+        response = middleware.process_request(Request("https://n.news.naver.com/a/2"), None)
+
+        # Assert
+        assert len(middleware.reader) == 2
+        assert response.body == b"two"
+
+    def test_replay_scheduled_by_recorded_offset(self, mocker, tmp_path):
+        """
+        [CS-05] 재생 응답은 재생 시작으로부터 녹화 offset / 속도 배율 시점에 나가야 하고(이미 지났으면 즉시),
+        offset이 없는 레코드는 녹화 지연 / 배율만큼 기다리며, 배율 0이면 지연 없이 즉시 응답해야 한다.
+        """
+        # Arrange
+        path = str(tmp_path / "naver.cassette")
+        _record(path, [("https://n.news.naver.com/a/1", 200, "ok")])
+        clock = [100.0]
+        mocker.patch("cassette.time.monotonic", side_effect=lambda: clock[0])
+        realtime = cassette.CassetteMiddleware("replay", path, 1.0)
+        double = cassette.CassetteMiddleware("replay", path, 2.0)
+        fast = cassette.CassetteMiddleware("replay", path, 0.0)
+
+        # Act
+        first = realtime.replay_delay(1.0, 0.25)
+        clock[0] += 0.5
+        second = realtime.replay_delay(2.0, 0.25)
+        late = realtime.replay_delay(0.2, 0.25)
+        doubled = double.replay_delay(2.0, 0.25)
+        legacy = double.replay_delay(None, 0.25)
+
+        # Assert
+        assert (first, second, late) == (1.0, 1.5, 0.0)
+        assert (doubled, legacy) == (1.0, 0.125)
+        assert fast.replay_delay(1.0, 0.25) == 0.0
+        assert isinstance(fast.process_request(Request("https://n.news.naver.com/a/1"), None), Response)
+
+    def test_spiders_in_one_process_share_archive(self, tmp_path):
+        """
+        [CS-06] 한 프로세스의 여러 스파이더가 같은 경로로 녹화하면 아카이브를 함께 써야 하고,
+        마지막 스파이더가 끝날 때 두 스파이더의 응답이 모두 색인에 남아야 한다.
+        """
+        # Arrange
+        path = str(tmp_path / "naver.cassette")
+        first = cassette.CassetteMiddleware("record", path, 0.0)
+        second = cassette.CassetteMiddleware("record", path, 0.0)
+        for middleware, url in ((first, "https://n.news.naver.com/a/1"), (second, "https://news.example.com/b/1")):
+            request = Request(url, meta={"download_latency": 0.1})
+            middleware.process_response(request, HtmlResponse(url=url, body=url.encode(), encoding="utf-8"), None)
+
+        # Act
+        first.spider_closed(None)
+        index_after_first = os.path.exists(f"{path}.idx")
+        second.spider_closed(None)
+        reader = cassette.CassetteMiddleware("replay", path, 0.0)
+
+        # Assert
+        assert not index_after_first, "다른 스파이더가 녹화 중이면 아직 닫지 않아야 함"
+        assert len(reader.reader) == 2
+        assert reader.process_request(Request("https://n.news.naver.com/a/1"), None).body == b"https://n.news.naver.com/a/1"
+        assert reader.process_request(Request("https://news.example.com/b/1"), None).body == b"https://news.example.com/b/1"
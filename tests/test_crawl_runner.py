@@ -0,0 +1,94 @@
+"""
+test_crawl_runner.py
+crawl_runner 모듈(스파이더 레지스트리·공유 출력)의 단위 테스트 (시나리오 CR-01 ~ CR-05)
+"""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import crawl_runner
+from naver_crawler import NaverFinanceNewsCrawler
+
+
+class TestRegistry:
+
+    def test_resolve_registered_source(self):
+        """
+        [CR-01] 등록된 출처 이름으로 스파이더 클래스를 찾아야 한다.
+        """
+        assert crawl_runner.resolve_spider("naver_finance") is NaverFinanceNewsCrawler
+
+    def test_unknown_source_raises(self, monkeypatch):
+        """
+        [CR-02] 등록되지 않은 출처는 등록된 목록을 담은 ValueError를 발생시켜야 한다.
+        """
+        monkeypatch.setenv("CRAWL_SOURCES", "naver_finance, unknown_source")
+
+        with pytest.raises(ValueError, match="naver_finance"):
+            [crawl_runner.resolve_spider(s) for s in crawl_runner.configured_sources()]
+
+
+class TestSharedOutput:
+
+    def test_spiders_share_one_jsonl_output(self, monkeypatch, tmp_path):
+        """
+        [CR-03] 여러 스파이더의 파이프라인이 같은 파일에 기록하고, 마지막 스파이더가 닫을 때까지
+        파일이 열려 있어야 한다.
+        """
+        # Arrange
+        output = tmp_path / "output.json"
+        monkeypatch.setenv("OUTPUT_FILE_PATH", str(output))
+        first, second = crawl_runner.JsonLinesOutputPipeline(), crawl_runner.JsonLinesOutputPipeline()
+
+        # Act
+        first.open_spider(None)
+        second.open_spider(None)
+        first.process_item({"url": "a", "source": "naver_finance"}, None)
+        first.close_spider(None)
+        second.process_item({"url": "b", "source": "other"}, None)
+        second.close_spider(None)
+
+        # Assert
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert [line["url"] for line in lines] == ["a", "b"]
+
+    def test_source_scope_overrides_since(self, monkeypatch):
+        """
+        [CR-04] CRAWL_SINCE_SCOPES에 출처 범위가 있으면 스파이더의 since_dt를 그 값으로 바꿔야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("CRAWL_SINCE_SCOPES", json.dumps({"other": "2025-03-01T00:00:00"}))
+        naver = SimpleNamespace(source_name="naver_finance", since_dt=datetime(2025, 1, 1))
+        other = SimpleNamespace(source_name="other", since_dt=datetime(2025, 1, 1))
+
+        # Act
+        crawl_runner._apply_source_since(naver)
+        crawl_runner._apply_source_since(other)
+
+        # Assert
+        assert naver.since_dt == datetime(2025, 1, 1), "범위가 없는 출처는 공통 기준 시각 유지"
+        assert other.since_dt == datetime(2025, 3, 1)
+
+
+class TestExitStatus:
+
+    def test_time_limited_sources(self):
+        """
+        [CR-05] MAX_CRAWL_TIME에 걸려 스스로 멈춘 스파이더의 출처만 보고해야 한다
+        (하나라도 있으면 main()이 TIME_LIMIT_EXIT_CODE로 종료).
+        """
+        # Arrange
+        crawlers = [
+            SimpleNamespace(spider=SimpleNamespace(source_name="naver_finance", time_limit_reached=True)),
+            SimpleNamespace(spider=SimpleNamespace(source_name="other", time_limit_reached=False)),
+            SimpleNamespace(spider=SimpleNamespace(source_name="legacy")),
+        ]
+
+        # Act
+        limited = crawl_runner.time_limited_sources(crawlers)
+
+        # Assert
+        assert limited == ["naver_finance"]
@@ -0,0 +1,87 @@
+"""
+test_failed_spool.py
+failed_spool 모듈(발행 실패 기사 세그먼트 스풀)의 단위 테스트 (시나리오 FS-01 ~ FS-04)
+"""
+
+import gzip
+
+import failed_spool
+
+
+def _article(index: int) -> dict:
+    return {"url": f"https://example.com/article/{index}", "title": f"기사 {index}", "content": "본문" * 50}
+
+
+class TestSegments:
+
+    def test_segments_append_in_order(self):
+        """
+        [FS-01] 저장할 때마다 gzip JSONL 세그먼트가 새로 생기고, 오래된 순서로 나열·복원되어야 한다.
+        """
+        # Act
+        first = failed_spool.write_segment([_article(1)])
+        second = failed_spool.write_segment([_article(2), _article(3)])
+
+        # Assert
+        assert failed_spool.list_segments() == [first, second]
+        with gzip.open(second, "rt", encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == 2, "한 줄에 기사 하나씩 저장되어야 함"
+        assert [a["url"][-1] for a in failed_spool.read_segment(second)] == ["2", "3"]
+
+
+class TestDiskLimit:
+
+    def test_overflow_to_redis_list(self, monkeypatch, fake_redis):
+        """
+        [FS-02] 디스크 한도를 넘고 오버플로 key가 설정돼 있으면 세그먼트를 Redis List로 넘기고,
+        peek_overflow로 오래된 순서대로 읽되 ack_overflow 전에는 List에 남아 있어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("FAILED_SPOOL_MAX_BYTES", "1")
+        monkeypatch.setenv("FAILED_SPOOL_OVERFLOW_KEY", "test:failed_spool")
+
+        # Act
+        path = failed_spool.write_segment([_article(1)], fake_redis)
+
+        # Assert
+        assert path is None and failed_spool.list_segments() == []
+        raw, articles = failed_spool.peek_overflow(fake_redis)
+        assert [a["url"] for a in articles] == [_article(1)["url"]]
+        assert fake_redis.llen("test:failed_spool") == 1, "재발행을 마치기 전에는 지우지 않아야 함"
+        failed_spool.ack_overflow(fake_redis, raw)
+        assert failed_spool.peek_overflow(fake_redis) is None
+
+    def test_overflow_remainder_returned_to_front(self, monkeypatch, fake_redis):
+        """
+        [FS-04] ack_overflow에 다시 실패한 기사를 넘기면 원래 세그먼트 대신 List 맨 앞에 남아야 하고,
+        파싱할 수 없는 세그먼트는 peek_overflow가 지우고 건너뛰어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("FAILED_SPOOL_MAX_BYTES", "1")
+        monkeypatch.setenv("FAILED_SPOOL_OVERFLOW_KEY", "test:failed_spool")
+        fake_redis.rpush("test:failed_spool", "{broken")
+        failed_spool.write_segment([_article(1), _article(2)], fake_redis)
+        failed_spool.write_segment([_article(3)], fake_redis)
+
+        # Act
+        raw, _ = failed_spool.peek_overflow(fake_redis)
+        failed_spool.ack_overflow(fake_redis, raw, [_article(2)])
+
+        # Assert
+        _, remainder = failed_spool.peek_overflow(fake_redis)
+        assert [a["url"] for a in remainder] == [_article(2)["url"]]
+        assert fake_redis.llen("test:failed_spool") == 2
+
+    def test_oldest_segment_dropped_without_overflow(self, monkeypatch):
+        """
+        [FS-03] 오버플로할 곳이 없으면 가장 오래된 세그먼트를 지워 디스크 한도를 지켜야 한다.
+        """
+        # Arrange
+        oldest = failed_spool.write_segment([_article(1)])
+        monkeypatch.setenv("FAILED_SPOOL_MAX_BYTES", str(failed_spool._spool_bytes([oldest]) + 10))
+
+        # Act
+        newest = failed_spool.write_segment([_article(2)])
+
+        # Assert
+        assert failed_spool.list_segments() == [newest]
@@ -1,6 +1,6 @@
 """
 test_lambda_handler.py
-lambda_handler 모듈의 단위 테스트 (시나리오 24~28)
+lambda_handler 모듈의 단위 테스트 (시나리오 24~31)
 """
 
 import json
@@ -12,7 +12,7 @@ import lambda_handler
 
 
 # ===========================================================================
-# handler() — 시나리오 24~28
+# handler() — 시나리오 24~30
 # ===========================================================================
 
 class TestHandler:
@@ -121,3 +121,72 @@ class TestHandler:
         body = json.loads(response["body"])
         assert body["source"] == "aws.events", \
             "이벤트의 source 값이 응답 body에 포함되어야 함"
+
+    def test_deadline_derived_from_remaining_time(self, mocker):
+        """
+        [29] 남은 시간이 60,000ms이면 crawl_and_publish에 전달되는 deadline은
+        안전 마진(15,000ms)을 뺀 약 45초 뒤여야 한다.
+        """
+        # Arrange
+        mock_crawl = mocker.patch(
+            "lambda_handler.crawl_and_publish",
+            return_value={"crawled": 0, "published": 0, "skipped": 0, "failed": 0},
+        )
+        context = self._make_context(remaining_ms=60_000)
+        now = lambda_handler.time.monotonic()
+
+        # Act
+        lambda_handler.handler({}, context)
+
+        # Assert
+        deadline = mock_crawl.call_args.kwargs["deadline"]
+        assert now + 44 <= deadline <= now + 46, \
+            "deadline은 남은 시간에서 안전 마진을 뺀 시각이어야 함"
+
+    def test_deadline_none_without_context(self, mocker):
+        """
+        [30] context=None이면 deadline=None(시간 제한 없음)으로 호출되어야 한다.
+        """
+        # Arrange
+        mock_crawl = mocker.patch(
+            "lambda_handler.crawl_and_publish",
+            return_value={"crawled": 0, "published": 0, "skipped": 0, "failed": 0},
+        )
+
+        # Act
+        lambda_handler.handler({}, None)
+
+        # Assert
+        assert mock_crawl.call_args.kwargs["deadline"] is None, \
+            "로컬 실행(context 없음)에서는 deadline이 None이어야 함"
+
+
+# ===========================================================================
+# 백필 모드 — 시나리오 31
+# ===========================================================================
+
+class TestBackfillMode:
+
+    def test_backfill_event_runs_backfill(self, mocker):
+        """
+        [31] event={"mode": "backfill", ...}이면 crawl_and_publish 대신 run_backfill을
+        날짜 범위·섹션과 함께 호출해야 한다.
+        """
+        # Arrange
+        mock_crawl = mocker.patch("lambda_handler.crawl_and_publish")
+        mock_backfill = mocker.patch(
+            "lambda_handler.run_backfill",
+            return_value={"crawled": 5, "published": 5, "skipped": 0, "failed": 0},
+        )
+        event = {"mode": "backfill", "start": "2025-01-01", "end": "2025-01-03",
+                 "sections": ["101/259"]}
+
+        # Act
+        response = lambda_handler.handler(event, None)
+
+        # Assert
+        mock_crawl.assert_not_called()
+        args, kwargs = mock_backfill.call_args
+        assert [d.isoformat() for d in args] == ["2025-01-01", "2025-01-03"]
+        assert kwargs["sections"] == ["101/259"]
+        assert json.loads(response["body"])["mode"] == "backfill"
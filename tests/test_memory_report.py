@@ -0,0 +1,169 @@
+"""
+test_memory_report.py
+memory_report 모듈의 단위 테스트 (시나리오 MR-01 ~ MR-07)
+"""
+
+import json
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+import article_publisher
+import memory_report
+import metrics
+
+
+# ===========================================================================
+# 메모리 설정 추천 — 시나리오 MR-01 ~ MR-03
+# ===========================================================================
+
+class TestRecommendMemory:
+
+    def test_cheapest_tier_meeting_target(self):
+        """
+        [MR-01] I/O 대기가 대부분인 실행(벽시계 30초, CPU 1초)은 메모리를 늘려도 빨라지지 않으므로
+        최대 메모리 요건을 만족하는 가장 작은 설정이 추천되어야 한다.
+        """
+        # Act
+        rec = memory_report.recommend_memory(
+            peak_bytes=150 * 2**20, wall_sec=30, cpu_sec=1,
+            measured_memory_mb=1024, target_sec=60,
+        )
+
+        # Assert
+        assert rec["required_mb"] == 187.5, "최대 RSS × 1.25 여유율이 요구 메모리여야 함"
+        assert rec["memory_mb"] == 256, "요구 메모리 이상인 가장 작은 설정이어야 함"
+        assert rec["meets_target"] is True
+
+    def test_cpu_bound_run_needs_more_memory_for_target(self):
+        """
+        [MR-02] CPU 위주 실행(1,024MB에서 벽시계 60초 = CPU 34.7초)이 목표 30초를 맞추려면
+        vCPU가 더 많은 설정이 추천되어야 한다.
+        """
+        # Arrange
+        cpu_sec = 60 * 1024 / memory_report.MB_PER_VCPU
+
+        # Act
+        rec = memory_report.recommend_memory(
+            peak_bytes=100 * 2**20, wall_sec=60, cpu_sec=cpu_sec,
+            measured_memory_mb=1024, target_sec=30,
+        )
+
+        # Assert
+        assert rec["meets_target"] is True
+        assert rec["estimated_duration_sec"] <= 30
+        assert rec["memory_mb"] == 2048, "목표를 만족하는 설정 중 가장 싼 설정이어야 함"
+
+    def test_unreachable_target_picks_fastest(self):
+        """
+        [MR-03] 어떤 설정으로도 목표를 만족할 수 없으면 가장 빠른 설정을 고르고
+        meets_target=False로 표시해야 한다.
+        """
+        # Act
+        rec = memory_report.recommend_memory(
+            peak_bytes=100 * 2**20, wall_sec=120, cpu_sec=10,
+            measured_memory_mb=1024, target_sec=5,
+        )
+
+        # Assert
+        assert rec["meets_target"] is False
+        fastest = min(c["estimated_duration_sec"] for c in rec["candidates"])
+        assert rec["estimated_duration_sec"] == fastest
+
+
+# ===========================================================================
+# 리포트 — 시나리오 MR-04 ~ MR-06
+# ===========================================================================
+
+class TestReport:
+
+    def test_stage_heap_peaks_recorded(self, tmp_path):
+        """
+        [MR-04] track_memory=True인 RunMetrics의 단계별 힙 최대치와 크롤러 RSS가
+        리포트 파일에 기록되어야 한다.
+        """
+        # Arrange
+        run = metrics.RunMetrics(track_memory=True)
+        start = memory_report.ResourceSnapshot.take()
+        with run.stage("dedupe_load"):
+            cache = {f"https://example.com/{i}" for i in range(20_000)}
+        run.set_gauge("crawler.peak_rss_bytes", 80 * 2**20)
+        path = tmp_path / "report.json"
+
+        # Act
+        memory_report.write_report(run, start, path=str(path), target_sec=60)
+
+        # Assert
+        report = json.loads(path.read_text(encoding="utf-8"))
+        assert report["stage_heap_peak_bytes"]["dedupe_load"] > 1_000_000, \
+            "URL 2만 건 Set의 힙 사용량이 기록되어야 함"
+        assert report["peak_rss_bytes"]["crawler"] == 80 * 2**20
+        assert report["recommendation"]["memory_mb"] is not None
+        assert len(cache) == 20_000
+        tracemalloc.stop()
+
+    def test_crawl_and_publish_writes_report_in_memory_mode(
+        self, mocker, env_vars, monkeypatch, tmp_path, fake_redis, sample_articles
+    ):
+        """
+        [MR-05] MEMORY_PROFILE=true이면 crawl_and_publish 결과에 memory 추천이 포함되고
+        MEMORY_REPORT_PATH에 리포트가 저장되어야 한다.
+        """
+        # Arrange
+        report_path = tmp_path / "memory_report.json"
+        monkeypatch.setenv("MEMORY_PROFILE", "true")
+        monkeypatch.setenv("MEMORY_REPORT_PATH", str(report_path))
+        mocker.patch("article_publisher.get_redis_client", return_value=fake_redis)
+        mocker.patch("article_publisher.run_crawler", return_value=sample_articles)
+
+        # Act
+        result = article_publisher.crawl_and_publish()
+
+        # Assert
+        assert "memory_mb" in result["memory"], "결과에 메모리 추천이 포함되어야 함"
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert {"dedupe_load", "crawl", "publish"} <= set(report["stage_heap_peak_bytes"])
+
+    def test_peaks_measured_per_run(self):
+        """
+        [MR-06] 크롤러 RSS는 이번 실행의 자식 프로세스를 os.wait4로 거둔 값이어야 하고,
+        발행 프로세스 RSS는 수명 전체 최대치가 아니라 시작 RSS + 이번 실행의 힙 증가분이어야 한다.
+        """
+        # Arrange
+        child = subprocess.Popen([sys.executable, "-c", "buf = bytearray(64 * 2**20)"])
+        output = article_publisher.CrawlerOutput()
+        run = metrics.RunMetrics(track_memory=True)
+        start = memory_report.ResourceSnapshot.take()
+        start.rss_bytes = 10 * 2**20
+        with run.stage("publish"):
+            cache = [bytes(1024) for _ in range(2_000)]
+
+        # Act
+        reaped = article_publisher._reap_crawler(child, output, timeout=30)
+        publisher = memory_report.run_peak_rss_bytes(run, start)
+        tracemalloc.stop()
+
+        # Assert
+        assert reaped and child.returncode == 0
+        assert output.crawler_peak_rss_bytes >= 64 * 2**20
+        assert 10 * 2**20 + 2_000 * 1024 <= publisher < 10 * 2**20 + 16 * 2**20
+        assert len(cache) == 2_000
+
+    def test_tracing_stopped_when_run_raises(self, mocker, env_vars, monkeypatch, tmp_path):
+        """
+        [MR-07] MEMORY_PROFILE=true인 crawl_and_publish가 예외로 끝나도 이번 실행이 시작한
+        tracemalloc은 멈춰야 한다 (warm 컨테이너의 다음 실행이 추적 비용을 떠안지 않도록).
+        """
+        # Arrange
+        monkeypatch.setenv("MEMORY_PROFILE", "true")
+        monkeypatch.setenv("MEMORY_REPORT_PATH", str(tmp_path / "memory_report.json"))
+        mocker.patch("article_publisher.get_redis_client", side_effect=RuntimeError("boom"))
+
+        # Act
+        with pytest.raises(RuntimeError, match="boom"):
+            article_publisher.crawl_and_publish()
+
+        # Assert
+        assert not tracemalloc.is_tracing()
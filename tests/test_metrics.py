@@ -0,0 +1,183 @@
+"""
+test_metrics.py
+metrics 모듈의 단위 테스트 (시나리오 MT-01 ~ MT-08)
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+import metrics
+
+
+# ===========================================================================
+# RunMetrics — 시나리오 MT-01 ~ MT-03, MT-07
+# ===========================================================================
+
+class TestRunMetrics:
+
+    def test_stage_accumulates_timing(self, mocker):
+        """
+        [MT-01] 같은 이름의 stage를 두 번 실행하면 소요 시간이 누적되어야 한다.
+        """
+        # Arrange
+        mocker.patch("metrics.time.perf_counter", side_effect=[0.0, 0.1, 1.0, 1.2])
+        run = metrics.RunMetrics()
+
+        # Act
+        with run.stage("publish"):
+            pass
+        with run.stage("publish"):
+            pass
+
+        # Assert
+        assert round(run.timings["publish"], 3) == 300.0, "두 구간(100ms + 200ms)이 누적되어야 함"
+
+    def test_histogram_summary_percentiles(self):
+        """
+        [MT-02] 1~100 값을 기록하면 p50=50, p99=99, max=100으로 요약되어야 한다.
+        """
+        # Arrange
+        run = metrics.RunMetrics()
+
+        # Act
+        for value in range(1, 101):
+            run.observe("article.download_ms", value)
+        run.observe("article.download_ms", None)  # None은 무시
+
+        # Assert
+        summary = run.summary()["histograms"]["article.download_ms"]
+        assert summary["count"] == 100
+        assert (summary["p50"], summary["p99"], summary["max"]) == (50, 99, 100)
+
+    def test_emf_document_structure(self, monkeypatch):
+        """
+        [MT-03] to_emf()는 _aws.CloudWatchMetrics 정의와 지표 값을 함께 담아야 하며,
+        100개를 넘는 분포는 백분위 지표로 나뉘어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("METRICS_NAMESPACE", "Test/NS")
+        run = metrics.RunMetrics()
+        run.add_timing("crawl", 12.5)
+        run.incr("articles.published", 3)
+        for value in range(150):
+            run.observe("article.parse_ms", value)
+
+        # Act
+        doc = run.to_emf({"Function": "local"})
+
+        # Assert
+        definition = doc["_aws"]["CloudWatchMetrics"][0]
+        assert definition["Namespace"] == "Test/NS"
+        assert definition["Dimensions"] == [["Function"]]
+        names = {m["Name"] for m in definition["Metrics"]}
+        assert {"crawl.duration", "articles.published", "article.parse_ms.p99"} <= names
+        assert doc["crawl.duration"] == 12.5 and doc["Function"] == "local"
+
+    def test_close_stops_only_tracing_it_started(self):
+        """
+        [MT-07] track_memory=True인 RunMetrics를 with 블록으로 쓰면 블록이 예외로 끝나도
+        자기가 시작한 tracemalloc을 멈추고, 이미 추적 중이던 tracemalloc은 건드리지 않아야 한다.
+        """
+        # Act
+        with pytest.raises(ValueError), metrics.RunMetrics(track_memory=True):
+            raise ValueError("실행 실패")
+        stopped_after_owned = not tracemalloc.is_tracing()
+        tracemalloc.start()
+        with metrics.RunMetrics(track_memory=True):
+            pass
+        still_tracing = tracemalloc.is_tracing()
+        tracemalloc.stop()
+
+        # Assert
+        assert stopped_after_owned
+        assert still_tracing, "다른 곳에서 시작한 추적은 유지되어야 함"
+
+
+# ===========================================================================
+# InstrumentedRedis / emit — 시나리오 MT-04 ~ MT-06, MT-08
+# ===========================================================================
+
+class TestInstrumentedRedis:
+
+    def test_counts_commands_and_pipeline_roundtrips(self, fake_redis):
+        """
+        [MT-04] 직접 호출한 명령은 명령·왕복 수로, pipeline 명령은 명령 수로만 세고
+        execute는 왕복 1회로 세야 한다.
+        """
+        # Arrange
+        run = metrics.RunMetrics()
+        client = metrics.InstrumentedRedis(fake_redis, run)
+
+        # Act
+        client.set("k", "v")
+        with client.pipeline() as pipe:
+            pipe.sadd("s", "a").sadd("s", "b")
+            pipe.execute()
+
+        # Assert
+        assert fake_redis.get("k") == "v", "명령은 원래 클라이언트로 위임되어야 함"
+        assert run.counters["redis.commands"] == 3
+        assert run.counters["redis.roundtrips"] == 2
+        assert run.counters["redis.sadd"] == 2
+
+    def test_counts_only_executed_commands(self, fake_redis):
+        """
+        [MT-08] 서버로 보낸 명령만 세야 한다: close·get_encoder·빈 pipeline execute는 세지 않고,
+        scan_iter는 보낸 SCAN 수만큼, WATCH 뒤 즉시 실행되는 명령은 명령마다 왕복으로 센다.
+        """
+        # Arrange
+        run = metrics.RunMetrics()
+        client = metrics.InstrumentedRedis(fake_redis, run)
+        fake_redis.set("lock", "token")
+
+        # Act
+        client.get_encoder()
+        client.pipeline().execute()
+        keys = list(client.scan_iter(match="lock"))
+        with client.pipeline() as pipe:
+            pipe.watch("lock")
+            token = pipe.get("lock")
+            pipe.multi()
+            pipe.delete("lock")
+            pipe.execute()
+        client.close()
+
+        # Assert
+        assert keys == ["lock"] and token == "token"
+        assert fake_redis.get("lock") is None
+        assert run.counters["redis.scan"] >= 1
+        assert run.counters["redis.commands"] == run.counters["redis.scan"] + 3, "WATCH·GET·DEL"
+        assert run.counters["redis.roundtrips"] == run.counters["redis.scan"] + 3, "SCAN들 + WATCH·GET + EXEC"
+
+    def test_emit_disabled(self, monkeypatch, capsys):
+        """
+        [MT-05] METRICS_ENABLED=false이면 emit()이 아무것도 출력하지 않아야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("METRICS_ENABLED", "false")
+        run = metrics.RunMetrics()
+        run.incr("x")
+
+        # Act
+        run.emit()
+
+        # Assert
+        assert capsys.readouterr().out == "", "비활성화 시 EMF가 출력되면 안 됨"
+
+    def test_emit_writes_single_json_line(self, capsys):
+        """
+        [MT-06] emit()은 EMF 문서를 stdout에 JSON 한 줄로 출력해야 한다.
+        """
+        # Arrange
+        run = metrics.RunMetrics()
+        run.incr("articles.crawled", 2)
+
+        # Act
+        run.emit({"Function": "local"})
+
+        # Assert
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["articles.crawled"] == 2
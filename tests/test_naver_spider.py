@@ -1,17 +1,19 @@
 """
 test_naver_spider.py
-NaverFinanceNewsCrawler의 단위 테스트 (시나리오 NS-29~NS-39)
+NaverFinanceNewsCrawler의 단위 테스트 (시나리오 NS-29~NS-50)
 
 Scrapy의 HtmlResponse를 직접 생성하여 실제 HTTP 요청 없이 테스트한다.
 parse_article()의 결과는 generator이므로 list()로 소비한다.
 """
 
+import time
 from datetime import datetime
 
 import pytest
+import scrapy
 from scrapy.http import HtmlResponse
 
-from naver_crawler import NaverFinanceNewsCrawler
+from naver_crawler import NaverFinanceBackfillCrawler, NaverFinanceNewsCrawler
 
 
 # ---------------------------------------------------------------------------
@@ -228,6 +230,28 @@ class TestArticleCountLimit:
         assert len(items) == 0, \
             "max_articles 한도에 도달했을 때 추가 yield가 발생하면 안 됨"
 
+    def test_time_limit_recorded(self):
+        """
+        [NS-50] MAX_CRAWL_TIME을 넘기면 목록·기사 모두 yield 없이 멈추고,
+        time_limit_reached로 스스로 멈췄음을 남겨야 한다 (crawl_runner 종료 코드의 근거).
+        """
+        # Arrange
+        spider = _make_spider()
+        spider.max_crawl_time = 5
+        spider.start_time = time.time() - 10
+        listing = _make_response(
+            "https://news.naver.com/breakingnews/section/101/259",
+            '<ul class="sa_list"><li class="sa_item"><a class="sa_text_title" href="/mnews/article/001/1">t</a></li></ul>',
+        )
+
+        # Act
+        requests = list(spider.parse(listing))
+        items = list(spider.parse_article(_make_response("https://example.com/article/1", _article_html())))
+
+        # Assert
+        assert requests == [] and items == []
+        assert spider.time_limit_reached is True
+
 
 # ===========================================================================
 # 증분 크롤링 (since_dt) — 시나리오 NS-37 ~ NS-39
@@ -294,3 +318,273 @@ class TestIncrementalCrawling:
         assert len(items) == 1, \
             "날짜 정보가 없는 기사는 since_dt와 관계없이 포함되어야 함"
         assert items[0]["publishedAt"] is None
+
+
+# ===========================================================================
+# 기사별 수집 지표 — 시나리오 NS-40, NS-48
+# ===========================================================================
+
+class TestCrawlMetrics:
+
+    def test_crawl_metrics_attached_to_item(self):
+        """
+        [NS-40] yield된 기사에 crawlMetrics(파싱 지연, 응답 바이트 수)가 포함되어야 한다.
+        요청과 연결되지 않은 응답이면 downloadLatencyMs는 None이어야 한다.
+        """
+        # Arrange
+        html = _article_html()
+        response = _make_response("https://example.com/article/metrics", html)
+        spider = _make_spider()
+
+        # Act
+        items = list(spider.parse_article(response))
+
+        # Assert
+        crawl_metrics = items[0]["crawlMetrics"]
+        assert crawl_metrics["bytes"] == len(response.body), "응답 바이트 수가 기록되어야 함"
+        assert crawl_metrics["parseLatencyMs"] >= 0, "파싱 지연이 기록되어야 함"
+        assert crawl_metrics["downloadLatencyMs"] is None
+
+    def test_stage_timestamps_attached_to_item(self):
+        """
+        [NS-48] yield된 기사에 timings(요청 시작·응답 수신·파싱 완료 시각, epoch ms)가 순서대로 실려야 한다.
+        요청 시작 시각은 응답 수신 시각에서 download_latency를 뺀 값이다.
+        """
+        # Arrange
+        request = scrapy.Request("https://example.com/article/timings", meta={"download_latency": 0.25})
+        response = HtmlResponse(url=request.url, body=_article_html(), encoding="utf-8", request=request)
+        spider = _make_spider()
+        before_ms = time.time() * 1000
+
+        # Act
+        items = list(spider.parse_article(response))
+
+        # Assert
+        timings = items[0]["timings"]
+        assert timings["fetchEndMs"] - timings["fetchStartMs"] == pytest.approx(250, abs=1)
+        assert before_ms - 1 <= timings["fetchEndMs"] <= timings["parseEndMs"] <= time.time() * 1000
+
+
+# ===========================================================================
+# 부하 테스트 대역 서버 페이지 호환성 — 시나리오 NS-41~NS-42
+# ===========================================================================
+
+class TestStubPages:
+    """benchmarks/naver_stub.py가 만드는 페이지를 스파이더가 실제 페이지처럼 파싱해야 한다."""
+
+    def test_listing_links_followed(self):
+        """
+        [NS-41] 대역 서버 목록 페이지의 기사 링크를 max_articles개까지 요청해야 한다.
+        """
+        # Arrange
+        from benchmarks.naver_stub import StubConfig, render_listing
+
+        base_url = "http://127.0.0.1:8080"
+        html = render_listing(base_url, StubConfig(article_count=5))
+        response = _make_response(f"{base_url}/breakingnews/section/101/259", html)
+        spider = _make_spider(max_articles=3)
+
+        # Act
+        requests = list(spider.parse(response))
+
+        # Assert
+        assert len(requests) == 3
+        assert requests[0].url == f"{base_url}/mnews/article/001/0000000000"
+
+    def test_article_fields_extracted(self):
+        """
+        [NS-42] 대역 서버 기사 페이지에서 제목·본문·날짜·언론사가 모두 추출되어야 한다.
+        """
+        # Arrange
+        from benchmarks.fixtures import synthetic_article
+        from benchmarks.naver_stub import StubConfig, render_article
+
+        expected = synthetic_article(7, content_len=500)
+        html = render_article(7, StubConfig(content_len=500))
+        response = _make_response("http://127.0.0.1:8080/mnews/article/008/0000000007", html)
+        spider = _make_spider()
+
+        # Act
+        items = list(spider.parse_article(response))
+
+        # Assert
+        assert items[0]["title"] == expected["title"]
+        assert items[0]["content"] == expected["content"].strip()
+        assert items[0]["publishedAt"] == expected["publishedAt"]
+        assert items[0]["press"] == expected["press"]
+
+
+# ===========================================================================
+# 다중 섹션 — 시나리오 NS-43 ~ NS-45
+# ===========================================================================
+
+class TestMultiSection:
+
+    def test_section_propagated_to_item(self):
+        """
+        [NS-43] 목록 URL의 섹션이 기사 요청 meta와 yield된 기사의 section/source로 전달되어야 한다.
+        """
+        # Arrange
+        listing = _make_response(
+            "https://news.naver.com/breakingnews/section/101/258",
+            '<ul class="sa_list"><li class="sa_item">'
+            '<a class="sa_text_title" href="https://n.news.naver.com/a/1">t</a></li></ul>',
+        )
+        spider = _make_spider()
+
+        # Act
+        request = list(spider.parse(listing))[0]
+        article = HtmlResponse(
+            url=request.url, body=_article_html(), encoding="utf-8", request=request
+        )
+        items = list(spider.parse_article(article))
+
+        # Assert
+        assert request.meta["section"] == "101/258"
+        assert items[0]["section"] == "101/258"
+        assert items[0]["source"] == spider.source_name
+
+    def test_count_limit_is_per_section(self):
+        """
+        [NS-44] MAX_ARTICLES는 섹션별 한도여서 한 섹션이 한도에 도달해도 다른 섹션 기사는 수집되어야 한다.
+        """
+        # Arrange
+        spider = _make_spider(max_articles=1)
+        spider.sections = ["101/259", "101/258"]
+
+        def article(section):
+            request = scrapy.Request("https://n.news.naver.com/a/x", meta={"section": section})
+            return HtmlResponse(
+                url=request.url, body=_article_html(), encoding="utf-8", request=request
+            )
+
+        # Act
+        first = list(spider.parse_article(article("101/259")))
+        same_section = list(spider.parse_article(article("101/259")))
+        other_section = list(spider.parse_article(article("101/258")))
+
+        # Assert
+        assert (len(first), len(same_section), len(other_section)) == (1, 0, 1)
+
+    def test_scope_since_overrides_common_since(self):
+        """
+        [NS-45] 범위별 기준 시각(CRAWL_SINCE_SCOPES)이 있는 섹션은 공통 since_dt 대신 그 시각으로 거른다.
+        """
+        # Arrange
+        html = _article_html(date_attr="2025-01-15T10:00:00")
+        response = _make_response("https://example.com/scoped-article", html)
+        spider = _make_spider()
+        spider.since_dt = datetime(2025, 1, 1, 0, 0, 0)
+        spider.since_by_scope = {spider.scope("101/259"): datetime(2025, 2, 1, 0, 0, 0)}
+
+        # Act
+        items = list(spider.parse_article(response))
+
+        # Assert
+        assert items == [], "섹션 기준 시각(2/1) 이전 기사는 공통 기준(1/1)과 관계없이 skip되어야 함"
+
+
+# ===========================================================================
+# 기사 URL 정규화 — 시나리오 NS-46
+# ===========================================================================
+
+class TestCanonicalLinks:
+
+    def test_same_article_requested_once_with_canonical_url(self):
+        """
+        [NS-46] 쿼리·호스트·주소 형식만 다른 같은 기사 링크는 대표 URL로 한 번만 요청해야 하고,
+        다른 섹션 목록에 다시 나와도 요청하지 않아야 한다.
+        """
+        # Arrange
+        links = [
+            "/mnews/article/015/0005012345?sid=101",
+            "https://m.news.naver.com/article/015/0005012345",
+            "https://news.naver.com/main/read.naver?mode=LSD&oid=015&aid=0005012346",
+        ]
+        html = '<ul class="sa_list">' + "".join(
+            f'<li class="sa_item"><a class="sa_text_title" href="{link}">t</a></li>' for link in links
+        ) + "</ul>"
+        spider = _make_spider()
+
+        # Act
+        first = list(spider.parse(_make_response("https://news.naver.com/breakingnews/section/101/259", html)))
+        again = list(spider.parse(_make_response("https://news.naver.com/breakingnews/section/101/258", html)))
+
+        # Assert
+        assert [r.url for r in first] == [
+            "https://n.news.naver.com/mnews/article/015/0005012345",
+            "https://n.news.naver.com/mnews/article/015/0005012346",
+        ]
+        assert again == []
+
+
+# ===========================================================================
+# 수정 기사 감지 — 시나리오 NS-47
+# ===========================================================================
+
+class TestModifiedArticles:
+
+    def test_old_article_modified_after_since_yielded_as_revision(self):
+        """
+        [NS-47] 기준 시각 이전에 발행됐어도 이후에 수정된 기사는 modifiedAt과 revision=True로 내보내야 하고,
+        개수 한도에는 세지 않아야 한다. 수정되지 않은 오래된 기사는 그대로 skip한다.
+        """
+        # Arrange
+        modify_span = (
+            '<span class="media_end_head_info_datestamp_time _ARTICLE_MODIFY_DATE_TIME"'
+            ' data-modify-date-time="2025-02-03 09:15:00"></span>'
+        )
+        modified = _article_html(date_attr="2025-01-15T10:00:00", press_block=modify_span)
+        untouched = _article_html(date_attr="2025-01-15T10:00:00")
+        spider = _make_spider()
+        spider.since_dt = datetime(2025, 2, 1, 0, 0, 0)
+
+        # Act
+        items = list(spider.parse_article(_make_response("https://example.com/modified", modified)))
+        skipped = list(spider.parse_article(_make_response("https://example.com/untouched", untouched)))
+
+        # Assert
+        assert items[0]["modifiedAt"] == "2025-02-03T09:15:00"
+        assert items[0]["revision"] is True
+        assert skipped == []
+        assert spider.count == 0 and spider.section_counts == {}, "수정 확인용 기사는 한도에 세지 않음"
+
+
+# ===========================================================================
+# 백필 목록 페이지 넘기기 — 시나리오 NS-49
+# ===========================================================================
+
+class TestBackfillPaging:
+
+    def test_listing_pages_followed_until_no_new_links(self, monkeypatch):
+        """
+        [NS-49] 백필 스파이더는 날짜별 목록에서 새 기사 링크가 나오면 &page=N+1을 요청하고,
+        새 링크가 없는 페이지(마지막 페이지 반복 포함)에서 멈춰야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("BACKFILL_DATES", "20250101")
+        spider = NaverFinanceBackfillCrawler()
+        spider.max_articles = 100
+
+        def listing(ids, url, page):
+            html = '<ul class="sa_list">' + "".join(
+                f'<li class="sa_item"><a class="sa_text_title" href="/mnews/article/001/{i:010d}">t</a></li>'
+                for i in ids
+            ) + "</ul>"
+            request = scrapy.Request(url, meta={"page": page} if page > 1 else {})
+            return HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
+
+        first_url = spider.start_urls[0]
+
+        # Act
+        first = list(spider.parse(listing([1, 2], first_url, 1)))
+        second_url = first[-1].url
+        second = list(spider.parse(listing([3], second_url, 2)))
+        last = list(spider.parse(listing([3], second[-1].url, 3)))
+
+        # Assert
+        assert first_url.endswith("/breakingnews/section/101/259?date=20250101")
+        assert [r.callback for r in first[:2]] == [spider.parse_article] * 2
+        assert second_url.endswith("?date=20250101&page=2") and first[-1].meta["page"] == 2
+        assert second[-1].url.endswith("?date=20250101&page=3")
+        assert last == [], "새 링크가 없는 페이지에서는 다음 페이지를 요청하지 않아야 함"
@@ -0,0 +1,89 @@
+"""
+test_near_dup.py
+near_dup 모듈(SimHash 유사 기사 색인)의 단위 테스트 (시나리오 ND-01 ~ ND-04)
+"""
+
+import random
+
+import near_dup
+
+_WORDS = (
+    "코스피 코스닥 외국인 기관 순매수 순매도 반도체 환율 금리 동결 인상 인하 한국은행 금통위 "
+    "물가 수출 실적 전망 증권가 투자 심리 위축 회복 강세 약세 마감 거래일 대비 상승 하락"
+).split()
+
+
+def _story(seed: int, length: int = 800) -> str:
+    rng = random.Random(seed)
+    return " ".join(f"{rng.choice(_WORDS)}{rng.randint(0, 50)}" for _ in range(length))
+
+
+def _wire_copy(text: str) -> str:
+    """전재 기사처럼 머리말·꼬리말만 붙인 본문."""
+    return f"[서울=뉴시스] 홍길동 기자 = {text} 무단 전재 및 재배포 금지"
+
+
+class TestFingerprint:
+
+    def test_bit_sliced_simhash_matches_naive_count(self):
+        """
+        [ND-01] 비트 평면 덧셈으로 센 SimHash가 비트별 단순 집계 결과와 같아야 한다.
+        """
+        rng = random.Random(7)
+        for _ in range(20):
+            feats = {str(rng.random()) for _ in range(rng.randint(1, 200))}
+            counts = [0] * 64
+            for feature in feats:
+                h = near_dup._feature_hash(feature)
+                for bit in range(64):
+                    counts[bit] += (h >> bit) & 1
+            expected = sum(1 << bit for bit in range(64) if counts[bit] > len(feats) // 2)
+            assert near_dup.simhash(feats) == expected
+
+    def test_wire_copy_is_close_and_other_story_is_far(self):
+        """
+        [ND-02] 머리말·꼬리말만 다른 전재 기사는 해밍 거리가 작고, 다른 기사는 멀어야 한다.
+        """
+        original = near_dup.simhash(near_dup.features(_story(1)))
+        copy = near_dup.simhash(near_dup.features(_wire_copy(_story(1))))
+        other = near_dup.simhash(near_dup.features(_story(2)))
+
+        assert near_dup.hamming(original, copy) <= near_dup.DEFAULT_MAX_DISTANCE
+        assert near_dup.hamming(original, other) > 2 * near_dup.DEFAULT_MAX_DISTANCE
+
+
+class TestIndex:
+
+    def test_finds_copy_but_not_self_or_other(self, env_vars, fake_redis):
+        """
+        [ND-03] 색인에 든 기사의 전재본은 원본 URL로 찾아야 하고, 같은 URL 재시도와
+        다른 기사는 유사 기사로 보면 안 된다.
+        """
+        # Arrange
+        index = near_dup.NearDupIndex(fake_redis)
+        assert index.check_and_add("https://example.com/a", _story(1)) is None
+
+        # Act / Assert
+        assert index.check_and_add("https://example.com/a", _story(1)) is None, "자기 자신과 겹치면 안 됨"
+        assert index.check_and_add("https://example.com/b", _wire_copy(_story(1))) == "https://example.com/a"
+        assert index.check_and_add("https://example.com/c", _story(2)) is None
+        assert len(index._bands) == near_dup.DEFAULT_MAX_DISTANCE + 1, "거리 d면 밴드 d+1개 (비둘기집)"
+
+    def test_entries_outside_window_are_dropped(self, mocker, env_vars, fake_redis):
+        """
+        [ND-04] 시간 창보다 오래된 지문은 후보에서 빠지고 정리되어야 한다.
+        """
+        # Arrange
+        index = near_dup.NearDupIndex(fake_redis, window_sec=60)
+        mocker.patch("near_dup.time.time", return_value=1_000.0)
+        index.check_and_add("https://example.com/a", _story(1))
+
+        # Act
+        mocker.patch("near_dup.time.time", return_value=1_100.0)
+        match = index.check_and_add("https://example.com/b", _wire_copy(_story(1)))
+
+        # Assert
+        assert match is None
+        assert all(
+            fake_redis.zcard(key) == 1 for key in fake_redis.keys(f"{index.prefix}:*")
+        ), "창 밖 항목은 정리되어야 함"
@@ -0,0 +1,90 @@
+"""
+test_profiling.py
+profiling 모듈의 단위 테스트 (시나리오 PF-01 ~ PF-04)
+"""
+
+import contextlib
+import logging
+import os
+
+import profiling
+
+
+def _busy(seconds: float) -> int:
+    """CPU 시간을 소모하는 헬퍼 (SIGPROF는 CPU 시간 기준으로 발생)."""
+    import time
+    end = time.process_time() + seconds
+    n = 0
+    while time.process_time() < end:
+        n += 1
+    return n
+
+
+class TestProfileSection:
+
+    def test_disabled_returns_nullcontext(self, monkeypatch):
+        """
+        [PF-01] PROFILE_MODE가 없으면 nullcontext를 반환해야 한다 (오버헤드 없음).
+        """
+        # Arrange
+        monkeypatch.delenv("PROFILE_MODE", raising=False)
+
+        # Act
+        section = profiling.profile_section("handler")
+
+        # Assert
+        assert isinstance(section, contextlib.nullcontext), "비활성화 시 nullcontext여야 함"
+
+    def test_spider_requires_profile_spider_flag(self, monkeypatch):
+        """
+        [PF-02] PROFILE_MODE가 있어도 PROFILE_SPIDER가 true가 아니면
+        스파이더 구간은 프로파일링하지 않아야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("PROFILE_MODE", "sample")
+        monkeypatch.delenv("PROFILE_SPIDER", raising=False)
+
+        # Act
+        section = profiling.profile_section("spider", spider=True)
+
+        # Assert
+        assert isinstance(section, contextlib.nullcontext)
+
+    def test_sample_mode_writes_collapsed_stacks(self, monkeypatch, tmp_path, caplog):
+        """
+        [PF-03] sample 모드는 collapsed stack 파일("스택 횟수" 형식)을 남기고
+        상위 함수를 로그로 요약해야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("PROFILE_MODE", "sample")
+        monkeypatch.setenv("PROFILE_OUTPUT_DIR", str(tmp_path))
+        monkeypatch.setenv("PROFILE_SAMPLE_INTERVAL_MS", "1")
+
+        # Act
+        with caplog.at_level(logging.INFO, logger="profiling"):
+            with profiling.profile_section("handler"):
+                _busy(0.2)
+
+        # Assert
+        files = list(tmp_path.glob("profile-handler-*.collapsed"))
+        assert len(files) == 1, "collapsed stack 파일이 1개 생성되어야 함"
+        first = files[0].read_text(encoding="utf-8").splitlines()[0]
+        stack, count = first.rsplit(" ", 1)
+        assert int(count) > 0 and "test_profiling.py:_busy" in stack
+        assert any("상위 함수" in r.message for r in caplog.records)
+
+    def test_cprofile_mode_writes_stats(self, monkeypatch, tmp_path):
+        """
+        [PF-04] cprofile 모드는 pstats로 읽을 수 있는 .prof 파일을 남겨야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("PROFILE_MODE", "cprofile")
+        monkeypatch.setenv("PROFILE_OUTPUT_DIR", str(tmp_path))
+
+        # Act
+        with profiling.profile_section("handler"):
+            _busy(0.01)
+
+        # Assert
+        files = list(tmp_path.glob("profile-handler-*.prof"))
+        assert len(files) == 1 and os.path.getsize(files[0]) > 0
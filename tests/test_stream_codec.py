@@ -0,0 +1,110 @@
+"""
+test_stream_codec.py
+stream_codec 모듈(Stream 본문 압축)의 단위 테스트 (시나리오 SC-01 ~ SC-06)
+"""
+
+import pytest
+
+import stream_codec
+
+_CONTENT = "코스피가 외국인 순매수에 힘입어 2,600선을 회복했다. " * 40
+
+
+def _message(content: str = _CONTENT) -> dict:
+    return {"url": "https://example.com/1", "title": "제목", "content": content, "press": "연합뉴스"}
+
+
+class TestEncodeDecode:
+
+    def test_zlib_roundtrip_is_ascii(self):
+        """
+        [SC-01] zlib 모드는 본문을 base64 ASCII로 싣고 codec 필드를 남기며,
+        decode_message로 원문이 복원되어야 한다.
+        """
+        # Act
+        encoded = stream_codec.encode_message(_message(), codec="zlib")
+
+        # Assert
+        assert encoded[stream_codec.CODEC_FIELD] == "zlib+b64"
+        assert encoded["content"].isascii(), "decode_responses=True에서도 안전한 문자열이어야 함"
+        assert len(encoded["content"]) < len(_CONTENT.encode("utf-8"))
+        assert stream_codec.decode_message(encoded) == _message()
+
+    def test_plain_and_short_messages_untouched(self, monkeypatch):
+        """
+        [SC-02] codec이 none이거나 본문이 STREAM_PAYLOAD_MIN_BYTES보다 짧으면 그대로 두고,
+        codec 필드가 없는 메시지는 decode_message가 그대로 반환해야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_PAYLOAD_CODEC", "zlib")
+        short = _message("짧은 본문")
+
+        # Act / Assert
+        assert stream_codec.encode_message(_message(), codec="none") == _message()
+        assert stream_codec.encode_message(short) == short
+        assert stream_codec.decode_message(short) == short
+
+    def test_bytes_fields_are_decoded(self):
+        """
+        [SC-03] decode_responses=False 클라이언트가 읽은 bytes 필드도 복원해야 한다.
+        """
+        # Arrange
+        encoded = stream_codec.encode_message(_message(), codec="zlib")
+        raw = {k.encode(): v.encode() for k, v in encoded.items()}
+
+        # Act / Assert
+        assert stream_codec.decode_message(raw) == _message()
+
+
+class TestCodecSelection:
+
+    def test_zstd_falls_back_to_zlib_without_package(self, monkeypatch):
+        """
+        [SC-04] zstandard가 없으면 STREAM_PAYLOAD_CODEC=zstd는 zlib으로 대체되고,
+        알 수 없는 값은 압축하지 않아야 한다.
+        """
+        # Arrange
+        monkeypatch.setattr(stream_codec, "_zstd", None)
+
+        # Act / Assert
+        monkeypatch.setenv("STREAM_PAYLOAD_CODEC", "zstd")
+        assert stream_codec.configured_codec() == "zlib"
+        monkeypatch.setenv("STREAM_PAYLOAD_CODEC", "lz4")
+        assert stream_codec.configured_codec() == "none"
+        with pytest.raises(ValueError):
+            stream_codec.decode_message({"content": "x", stream_codec.CODEC_FIELD: "lz4+b64"})
+
+
+class TestContentReference:
+
+    def test_ref_mode_strips_body_and_resolves_with_mget(self, monkeypatch, env_vars, fake_redis):
+        """
+        [SC-05] ref 모드는 본문 대신 내용 해시를 싣고, decode_messages가 본문 key를 MGET으로 채워
+        (압축된 본문이면 압축도 풀어) 원문을 복원해야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_CONTENT_MODE", "ref")
+        message, content = stream_codec.externalize(stream_codec.encode_message(_message(), codec="zlib"))
+        key, body = content
+        stream_codec.write_content(fake_redis, key, body)
+
+        # Act
+        decoded = stream_codec.decode_messages([message, _message("평문")], fake_redis)
+
+        # Assert
+        assert "content" not in message and message[stream_codec.REF_FIELD] in key
+        assert key.startswith(f"{env_vars['REDIS_ARTICLE_STREAM_KEY']}:content:")
+        assert 0 < fake_redis.ttl(key) <= stream_codec.DEFAULT_CONTENT_TTL_SEC
+        assert decoded == [_message(), _message("평문")]
+
+    def test_missing_body_raises_lookup_error(self, monkeypatch, env_vars, fake_redis):
+        """
+        [SC-06] 본문 key가 만료돼 없으면 decode_messages가 LookupError를 발생시켜야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_CONTENT_MODE", "ref")
+        message, _ = stream_codec.externalize(_message())
+
+        # Act / Assert
+        with pytest.raises(LookupError):
+            stream_codec.decode_message(message, fake_redis)
@@ -0,0 +1,153 @@
+"""
+test_stream_index.py
+stream_index 모듈(언론사·섹션별 발행 기사 색인)의 단위 테스트 (시나리오 SI-01 ~ SI-05)
+"""
+
+from datetime import datetime, timezone
+
+import article_publisher
+import stream_index
+import stream_retention
+
+
+def _article(i: int, press: str, section: str, published_at: str) -> dict:
+    return {
+        "url": f"https://example.com/article/{i}",
+        "title": f"기사 제목 {i}",
+        "content": f"기사 본문 {i}",
+        "publishedAt": published_at,
+        "press": press,
+        "section": section,
+    }
+
+
+def _ms(published_at: str) -> float:
+    return datetime.fromisoformat(published_at).replace(tzinfo=timezone.utc).timestamp() * 1000
+
+
+class TestIndexOnPublish:
+
+    def test_publish_paths_index_by_press_and_section(self, monkeypatch, env_vars, fake_redis):
+        """
+        [SI-01] publish_article·publish_batch로 발행한 기사는 언론사·섹션 색인에 Stream 항목 ID로 들어가고,
+        query()는 publishedAt 범위 안의 항목을 publishedAt 순서로 반환해야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("ARTICLE_TZ", "UTC")
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        times = [now.replace(hour=h).isoformat() for h in (1, 3, 2)]
+        article_publisher.publish_article(fake_redis, _article(0, "연합뉴스", "101/259", times[0]), set())
+        article_publisher.publish_batch(fake_redis, [
+            _article(1, "연합뉴스", "101/258", times[1]),
+            _article(2, "조선일보", "101/259", times[2]),
+            _article(3, "연합뉴스", "101/259", times[2]),
+        ], set())
+
+        # Act
+        yonhap = stream_index.query(fake_redis, "press", "연합뉴스")
+        recent = stream_index.query(fake_redis, "press", "연합뉴스", since_ms=_ms(times[2]))
+        first = stream_index.query(fake_redis, "section", "101/259", limit=1)
+
+        # Assert
+        assert [fields["url"] for _, fields in yonhap] == [
+            "https://example.com/article/0", "https://example.com/article/3", "https://example.com/article/1",
+        ]
+        assert [fields["url"] for _, fields in recent] == [
+            "https://example.com/article/3", "https://example.com/article/1",
+        ]
+        assert [fields["url"] for _, fields in first] == ["https://example.com/article/0"]
+
+    def test_update_event_indexed(self, monkeypatch, env_vars, fake_redis):
+        """
+        [SI-04] 수정 기사 재발행(event=update) 항목도 같은 publishedAt으로 색인되어,
+        query()가 원래 발행 항목과 수정 항목을 함께 반환해야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("ARTICLE_TZ", "UTC")
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0).isoformat()
+        article = _article(0, "연합뉴스", "101/259", now)
+        article_publisher.publish_article(fake_redis, article, set())
+
+        # Act
+        updated = article_publisher.publish_update(fake_redis, {**article, "content": "수정된 본문"})
+        found = stream_index.query(fake_redis, "section", "101/259")
+
+        # Assert
+        assert updated is True
+        assert [fields.get("event") for _, fields in found] == [None, "update"]
+        assert found[1][1]["content"] == "수정된 본문"
+
+
+class TestIndexTrimming:
+
+    def test_retention_trim_removes_index_entries(self, monkeypatch, tmp_path, env_vars, fake_redis):
+        """
+        [SI-02] 시간 기준 보존이 Stream 항목을 트리밍하면 색인에서도 그 ID가 지워져야 하고,
+        색인에 남은 ID가 Stream에 없으면 query()는 건너뛰어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("STREAM_RETENTION_SEC", "3600")
+        monkeypatch.setenv("STREAM_ARCHIVE_DIR", str(tmp_path / "archive"))
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+        key = stream_index.index_key("press", "연합뉴스")
+        fake_redis.xadd(stream_key, {"url": "https://example.com/old", "press": "연합뉴스"}, id="1000-0")
+        fake_redis.zadd(key, {"1000-0": 1000, "2000-0": 2000})
+
+        # Act
+        stream_retention.enforce_retention(fake_redis)
+
+        # Assert
+        assert fake_redis.zrange(key, 0, -1) == ["2000-0"]
+        assert stream_index.query(fake_redis, "press", "연합뉴스") == []
+
+    def test_window_pruning_and_disabled(self, monkeypatch, env_vars, fake_redis):
+        """
+        [SI-03] XADD 시각(항목 ID)이 STREAM_INDEX_WINDOW_SEC보다 오래된 색인 항목은 query()가 건너뛰고
+        prune()이 두 Sorted Set에서 지워야 하며, STREAM_INDEX_ENABLED=false이면 색인하지 않아야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("ARTICLE_TZ", "UTC")
+        monkeypatch.setenv("STREAM_INDEX_WINDOW_SEC", "3600")
+        stream_key = env_vars["REDIS_ARTICLE_STREAM_KEY"]
+        key = stream_index.index_key("press", "연합뉴스")
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0).isoformat()
+        old_fields = {"url": "https://example.com/article/0", "press": "연합뉴스"}
+        fake_redis.xadd(stream_key, old_fields, id="1000-0")
+        pipe = fake_redis.pipeline(transaction=False)
+        stream_index.queue_add(pipe, [("1000-0", old_fields, _ms(now))])
+        pipe.execute()
+        article_publisher.publish_article(fake_redis, _article(1, "연합뉴스", "101/259", now), set())
+
+        # Act
+        before = stream_index.query(fake_redis, "press", "연합뉴스")
+        pruned = stream_index.prune(fake_redis)
+        monkeypatch.setenv("STREAM_INDEX_ENABLED", "false")
+        article_publisher.publish_article(fake_redis, _article(2, "연합뉴스", "101/259", now), set())
+
+        # Assert
+        assert [fields["url"] for _, fields in before] == ["https://example.com/article/1"]
+        assert pruned == 1, "섹션 필드 없이 색인한 오래된 항목은 언론사 key에만 있음"
+        assert fake_redis.zcard(key) == 1 and fake_redis.zcard(key + ":added") == 1
+        assert 0 < fake_redis.ttl(key) <= 3600
+
+    def test_old_published_article_stays_queryable(self, monkeypatch, env_vars, fake_redis):
+        """
+        [SI-05] publishedAt이 보존 기간보다 오래된 기사(백필·대량 적재)도 방금 XADD됐으면
+        색인에 남아 query()로 조회되어야 한다.
+        """
+        # Arrange
+        monkeypatch.setenv("ARTICLE_TZ", "UTC")
+        monkeypatch.setenv("STREAM_INDEX_WINDOW_SEC", "3600")
+        article_publisher.publish_batch(
+            fake_redis, [_article(0, "연합뉴스", "101/259", "2020-01-01T09:00:00")], set()
+        )
+
+        # Act
+        pruned = stream_index.prune(fake_redis)
+        found = stream_index.query(
+            fake_redis, "section", "101/259", since_ms=_ms("2020-01-01T00:00:00"), until_ms=_ms("2020-01-02T00:00:00")
+        )
+
+        # Assert
+        assert pruned == 0
+        assert [fields["url"] for _, fields in found] == ["https://example.com/article/0"]
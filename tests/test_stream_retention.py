@@ -0,0 +1,152 @@
+"""
+test_stream_retention.py
+stream_retention 모듈(시간 기준 Stream 보존·아카이브)의 단위 테스트 (시나리오 SR-01 ~ SR-06)
+"""
+
+import time
+
+import pytest
+
+import stream_codec
+import stream_retention
+
+NOW: float = 1_735_700_000.0   # 2025-01-01 02:53:20 UTC
+DAY_MS: int = 24 * 3600 * 1000
+
+
+@pytest.fixture
+def retention_env(monkeypatch, tmp_path, env_vars):
+    monkeypatch.setenv("STREAM_RETENTION_SEC", "3600")
+    monkeypatch.setenv("STREAM_ARCHIVE_DIR", str(tmp_path / "archive"))
+    monkeypatch.setenv("STREAM_ARCHIVE_BATCH", "2")
+    return env_vars
+
+
+def _add(client, stream_key: str, ms: int, url: str, content: str = "본문") -> str:
+    return client.xadd(stream_key, {"url": url, "content": content}, id=f"{ms}-0")
+
+
+class TestEnforceRetention:
+
+    def test_old_entries_archived_then_trimmed(self, monkeypatch, retention_env, fake_redis):
+        """
+        [SR-01] 보존 기간(1시간)보다 오래된 항목은 날짜별 세그먼트에 평문으로 아카이브된 뒤 삭제되고,
+        최근 항목은 남아야 한다. iter_archive는 ID 순서로, after_id 이후 항목만 돌려준다.
+        """
+        # Arrange
+        stream_key = retention_env["REDIS_ARTICLE_STREAM_KEY"]
+        now_ms = int(NOW * 1000)
+        old_ids = [
+            _add(fake_redis, stream_key, now_ms - DAY_MS - 5_000_000, "u0"),
+            _add(fake_redis, stream_key, now_ms - 7_200_000, "u1"),
+        ]
+        monkeypatch.setenv("STREAM_PAYLOAD_CODEC", "zlib")
+        monkeypatch.setenv("STREAM_PAYLOAD_MIN_BYTES", "0")
+        fake_redis.xadd(
+            stream_key, stream_codec.encode_message({"url": "u2", "content": "압축 본문"}),
+            id=f"{now_ms - 3_700_000}-0",
+        )
+        recent_id = _add(fake_redis, stream_key, now_ms - 60_000, "u3")
+
+        # Act
+        stats = stream_retention.enforce_retention(fake_redis, now=NOW)
+
+        # Assert
+        assert stats["archived"] == 3
+        assert [entry_id for entry_id, _ in fake_redis.xrange(stream_key)] == [recent_id]
+        archived = list(stream_retention.iter_archive(stream_key))
+        assert [fields["url"] for _, fields in archived] == ["u0", "u1", "u2"]
+        assert archived[2][1] == {"url": "u2", "content": "압축 본문"}, "아카이브는 평문으로 저장"
+        days = {path.split("/")[-2] for path in stream_retention.list_archive(stream_key)}
+        assert days == {"2024-12-31", "2025-01-01"}
+        assert [fields["url"] for _, fields in stream_retention.iter_archive(stream_key, old_ids[1])] == ["u2"]
+
+    def test_nothing_trimmed_when_archive_write_fails(self, mocker, retention_env, fake_redis):
+        """
+        [SR-02] 아카이브 쓰기가 실패하면 그 배치는 Stream에서 지우지 않아야 한다.
+        """
+        # Arrange
+        stream_key = retention_env["REDIS_ARTICLE_STREAM_KEY"]
+        _add(fake_redis, stream_key, int(NOW * 1000) - 7_200_000, "u0")
+        mocker.patch("stream_retention._write_segment", side_effect=OSError("disk full"))
+
+        # Act
+        stats = stream_retention.enforce_retention(fake_redis, now=NOW)
+
+        # Assert
+        assert stats == {"archived": 0, "segments": 0}
+        assert fake_redis.xlen(stream_key) == 1
+        assert not fake_redis.exists(f"{stream_key}:retention_lock"), "잠금은 해제되어야 함"
+
+    def test_skipped_while_another_run_holds_lock(self, retention_env, fake_redis):
+        """
+        [SR-03] 다른 실행이 트리밍 잠금을 잡고 있으면 아무것도 아카이브·삭제하지 않아야 한다.
+        """
+        # Arrange
+        stream_key = retention_env["REDIS_ARTICLE_STREAM_KEY"]
+        _add(fake_redis, stream_key, int(NOW * 1000) - 7_200_000, "u0")
+        fake_redis.set(f"{stream_key}:retention_lock", "1")
+
+        # Act
+        stats = stream_retention.enforce_retention(fake_redis, now=NOW)
+
+        # Assert
+        assert stats["archived"] == 0
+        assert fake_redis.xlen(stream_key) == 1
+
+    def test_run_bounded_by_batch_cap_and_deadline(self, monkeypatch, retention_env, fake_redis):
+        """
+        [SR-04] 한 번의 실행은 STREAM_ARCHIVE_MAX_BATCHES 배치까지만 트리밍하고,
+        마감 시각이 지났으면 배치를 시작하지 않아야 한다 (남은 항목은 다음 실행에서 처리).
+        """
+        # Arrange
+        stream_key = retention_env["REDIS_ARTICLE_STREAM_KEY"]
+        for i in range(5):
+            _add(fake_redis, stream_key, int(NOW * 1000) - 7_200_000 + i, f"u{i}")
+        monkeypatch.setenv("STREAM_ARCHIVE_MAX_BATCHES", "1")
+
+        # Act
+        capped = stream_retention.enforce_retention(fake_redis, now=NOW)
+        expired = stream_retention.enforce_retention(fake_redis, now=NOW, deadline=time.monotonic() - 1)
+
+        # Assert
+        assert capped["archived"] == 2, "배치 크기 2 × 최대 1배치"
+        assert expired["archived"] == 0
+        assert fake_redis.xlen(stream_key) == 3
+
+    def test_lock_released_only_by_owner(self, mocker, retention_env, fake_redis):
+        """
+        [SR-05] 트리밍 도중 잠금이 만료돼 다른 실행이 잡았다면, 끝날 때 그 잠금을 지우지 않아야 한다.
+        """
+        # Arrange
+        stream_key = retention_env["REDIS_ARTICLE_STREAM_KEY"]
+        lock_key = f"{stream_key}:retention_lock"
+        _add(fake_redis, stream_key, int(NOW * 1000) - 7_200_000, "u0")
+        write_archive = stream_retention.write_archive
+
+        def lock_taken_over(*args, **kwargs):
+            fake_redis.set(lock_key, "other-run")
+            return write_archive(*args, **kwargs)
+
+        mocker.patch("stream_retention.write_archive", side_effect=lock_taken_over)
+
+        # Act
+        stream_retention.enforce_retention(fake_redis, now=NOW)
+
+        # Assert
+        assert fake_redis.get(lock_key) == "other-run"
+
+    def test_refuses_to_trim_without_archive_dir(self, monkeypatch, retention_env, fake_redis):
+        """
+        [SR-06] STREAM_ARCHIVE_DIR이 없으면 임시 경로로 대신하지 않고, 아무것도 지우지 않은 채 실패해야 한다.
+        """
+        # Arrange
+        stream_key = retention_env["REDIS_ARTICLE_STREAM_KEY"]
+        _add(fake_redis, stream_key, int(NOW * 1000) - 7_200_000, "u0")
+        monkeypatch.delenv("STREAM_ARCHIVE_DIR")
+
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            stream_retention.enforce_retention(fake_redis, now=NOW)
+        assert fake_redis.xlen(stream_key) == 1
+        assert not fake_redis.exists(f"{stream_key}:retention_lock")
@@ -0,0 +1,47 @@
+"""
+test_url_canon.py
+url_canon 모듈(네이버 기사 URL 정규화)의 단위 테스트 (시나리오 UC-01 ~ UC-02)
+"""
+
+import pytest
+
+import url_canon
+
+CANONICAL = "https://n.news.naver.com/mnews/article/015/0005012345"
+
+
+@pytest.mark.parametrize("url", [
+    CANONICAL,
+    f"{CANONICAL}?sid=101",
+    f"{CANONICAL}#comment",
+    "http://n.news.naver.com/article/015/0005012345",
+    "https://m.news.naver.com/article/015/0005012345?sid=101",
+    "https://n.news.naver.com/mnews/article/comment/015/0005012345",
+    "https://n.news.naver.com/mnews/hotissue/article/015/0005012345?type=series",
+    "https://news.naver.com/main/read.naver?mode=LSD&mid=sec&sid1=101&oid=015&aid=0005012345",
+    "https://news.naver.com/main/read.nhn?aid=0005012345&oid=015",
+    "https://finance.naver.com/news/news_read.naver?article_id=0005012345&office_id=015&mode=mainnews",
+    "HTTPS://N.NEWS.NAVER.COM/mnews/article/15/5012345",
+])
+def test_naver_article_forms_map_to_one_key(url):
+    """
+    [UC-01] 호스트·쿼리·주소 형식이 달라도 같은 기사는 같은 (oid, aid)와 대표 URL이 되어야 한다.
+    """
+    assert url_canon.article_id(url) == ("015", "0005012345")
+    assert url_canon.canonical_url(url) == CANONICAL
+
+
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1:8080/mnews/article/001/0000000000",   # 부하 테스트 대역 서버
+    "https://example.com/article/1",
+    "https://evilnaver.com/mnews/article/015/0005012345",
+    "https://news.naver.com/breakingnews/section/101/259",
+    "https://news.naver.com/main/read.naver?oid=015",
+    "",
+])
+def test_other_urls_left_unchanged(url):
+    """
+    [UC-02] 네이버 기사 URL이 아니거나 기사 ID를 알 수 없는 URL은 그대로 두어야 한다.
+    """
+    assert url_canon.article_id(url) is None
+    assert url_canon.canonical_url(url) == url
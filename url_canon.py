@@ -0,0 +1,63 @@
+"""
+url_canon.py
+역할: 네이버 기사 URL 정규화 — 같은 기사를 가리키는 여러 URL을 하나의 (oid, aid) 키·대표 URL로
+
+같은 기사가 쿼리 파라미터(?sid=101 등), 모바일/데스크톱 호스트, 구형 주소(read.naver?oid=&aid=),
+금융 뉴스 주소(news_read.naver?office_id=&article_id=)로 각각 다르게 보이면 스파이더는 같은 기사를
+여러 번 내려받고 발행 측은 URL 중복 확인을 통과시켜 두 번 발행한다.
+이 모듈은 그런 URL을 모두 언론사 ID(oid)·기사 ID(aid) 쌍으로 바꾸고, 대표 URL
+"https://n.news.naver.com/mnews/article/{oid}/{aid}"로 통일한다.
+
+대표 URL은 섹션 목록 페이지가 주는 링크 형식과 같으므로 기존 발행 URL Set(REDIS_PUBLISHED_URLS_KEY)의
+항목과 그대로 비교된다. 네이버 기사 URL이 아니면(다른 출처, 부하 테스트 대역 서버 등) 그대로 둔다.
+
+정규식 두세 번으로 끝나는 순수 Python 구현이라 URL 하나에 수 마이크로초 이하다
+(benchmarks/test_publisher_bench.py의 test_canonical_url).
+"""
+
+import re
+from typing import Optional
+
+CANONICAL_PREFIX: str = "https://n.news.naver.com/mnews/article/"
+_CANONICAL_LEN: int = len(CANONICAL_PREFIX) + len("015/0005012345")
+
+# 스킴 + *.naver.com 호스트(포트 허용). 나머지(경로·쿼리)는 match.end() 이후
+_NAVER_HOST_RE = re.compile(r"(?:https?:)?//(?:[0-9a-z-]+\.)*naver\.com(?::\d+)?(?=[/?#]|$)", re.IGNORECASE)
+# /mnews/article/015/0005012345, /article/015/..., /mnews/article/comment/015/..., /mnews/hotissue/article/...
+_PATH_ID_RE = re.compile(r"/(?:mnews/)?(?:hotissue/)?article/(?:comment/)?(\d{1,4})/(\d{1,10})(?=/|$)")
+_QUERY_ID_RE = re.compile(r"(?:^|&)(oid|aid|office_id|article_id)=(\d+)")
+
+
+def article_id(url: str) -> Optional[tuple[str, str]]:
+    """
+    네이버 기사 URL이면 (oid, aid)를 반환한다. oid는 3자리, aid는 10자리로 0을 채운다.
+    네이버 기사 URL이 아니면 None.
+    """
+    url = url.strip()
+    match = _NAVER_HOST_RE.match(url)
+    if match is None:
+        return None
+    rest: str = url[match.end():].partition("#")[0]
+    path, _, query = rest.partition("?")
+
+    found = _PATH_ID_RE.search(path)
+    if found is not None:
+        return found.group(1).zfill(3), found.group(2).zfill(10)
+
+    if query:
+        params: dict[str, str] = dict(_QUERY_ID_RE.findall(query))
+        oid: Optional[str] = params.get("oid") or params.get("office_id")
+        aid: Optional[str] = params.get("aid") or params.get("article_id")
+        if oid and aid:
+            return oid.zfill(3), aid.zfill(10)
+    return None
+
+
+def canonical_url(url: str) -> str:
+    """네이버 기사 URL이면 대표 URL을, 아니면 url을 그대로 반환한다 (여러 번 적용해도 결과가 같다)."""
+    if len(url) == _CANONICAL_LEN and url.startswith(CANONICAL_PREFIX) and url[_CANONICAL_LEN - 11] == "/":
+        return url  # 이미 대표 URL (목록 링크 대부분) — 정규식 없이 통과
+    ids: Optional[tuple[str, str]] = article_id(url)
+    if ids is None:
+        return url
+    return f"{CANONICAL_PREFIX}{ids[0]}/{ids[1]}"